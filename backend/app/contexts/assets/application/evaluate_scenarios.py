@@ -0,0 +1,15 @@
+from app.contexts.assets.domain.repositories.async_assets_list_repository import (
+    AsyncAssetsListRepository,
+)
+from app.contexts.assets.domain.services.what_if.scenarios import (
+    ScenarioDeltas,
+    ScenarioOutcomes,
+)
+
+
+class EvaluateScenariosService:
+    def __init__(self, assets_list_repository: AsyncAssetsListRepository):
+        self.assets_list_repository = assets_list_repository
+
+    async def __call__(self, deltas: ScenarioDeltas) -> ScenarioOutcomes:
+        return await self.assets_list_repository.evaluate_scenarios(deltas)
@@ -0,0 +1,21 @@
+from datetime import datetime
+
+from app.contexts.assets.domain.entities.assets_list_version import (
+    AssetsListVersion,
+)
+from app.contexts.assets.domain.repositories.async_assets_list_repository import (
+    AsyncAssetsListRepository,
+)
+
+
+class GetAssetsListHistoryService:
+    def __init__(self, assets_list_repository: AsyncAssetsListRepository):
+        self.assets_list_repository = assets_list_repository
+
+    async def versions(self) -> list[AssetsListVersion]:
+        return await self.assets_list_repository.get_history()
+
+    async def version(
+        self, version: int | None = None, at: datetime | None = None
+    ) -> AssetsListVersion | None:
+        return await self.assets_list_repository.get_past_version(version, at)
@@ -1,11 +1,15 @@
-from app.contexts.assets.domain.repositories.assets_list_repository import (
-    AssetsListRepository,
+from app.contexts.assets.domain.repositories.async_assets_list_repository import (
+    AsyncAssetsListRepository,
 )
 
 
 class GetAverageInterestRateService:
-    def __init__(self, assets_list_repository: AssetsListRepository):
+    def __init__(self, assets_list_repository: AsyncAssetsListRepository):
         self.assets_list_repository = assets_list_repository
 
-    def __call__(self) -> float | None:
-        return self.assets_list_repository.get_average_interest_rate()
+    async def __call__(self) -> float | None:
+        return await self.assets_list_repository.get_average_interest_rate()
+
+    async def weighted(self) -> float | None:
+        """The average weighted by the assets' principal amounts."""
+        return await self.assets_list_repository.get_weighted_average_interest_rate()
@@ -0,0 +1,12 @@
+from app.contexts.assets.domain.repositories.async_assets_list_repository import (
+    AsyncAssetsListRepository,
+)
+from app.contexts.assets.domain.services.rate_groups.group_tables import RateGroup
+
+
+class GetGroupedInterestRatesService:
+    def __init__(self, assets_list_repository: AsyncAssetsListRepository):
+        self.assets_list_repository = assets_list_repository
+
+    async def __call__(self, tag: str) -> list[RateGroup]:
+        return await self.assets_list_repository.get_rate_groups(tag)
@@ -0,0 +1,14 @@
+from app.contexts.assets.domain.repositories.async_assets_list_repository import (
+    AsyncAssetsListRepository,
+)
+from app.contexts.assets.domain.services.rate_histogram.histograms import (
+    RateHistograms,
+)
+
+
+class GetInterestRateHistogramsService:
+    def __init__(self, assets_list_repository: AsyncAssetsListRepository):
+        self.assets_list_repository = assets_list_repository
+
+    async def __call__(self) -> RateHistograms | None:
+        return await self.assets_list_repository.get_rate_histograms()
@@ -0,0 +1,22 @@
+from datetime import datetime
+
+from app.contexts.assets.domain.repositories.async_assets_list_repository import (
+    AsyncAssetsListRepository,
+)
+from app.contexts.assets.domain.services.rate_rollups.series import (
+    Resolution,
+    RollupPoint,
+)
+
+
+class GetInterestRateSeriesService:
+    def __init__(self, assets_list_repository: AsyncAssetsListRepository):
+        self.assets_list_repository = assets_list_repository
+
+    async def __call__(
+        self,
+        resolution: Resolution,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> list[RollupPoint]:
+        return await self.assets_list_repository.get_rate_series(resolution, start, end)
@@ -0,0 +1,48 @@
+from collections.abc import AsyncIterable, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from app.contexts.assets.domain.entities.assets_list import AssetsList
+from app.contexts.assets.domain.entities.assets_list_builder import (
+    AssetsListBuilder,
+)
+from app.contexts.assets.domain.repositories.async_assets_list_repository import (
+    AsyncAssetsListRepository,
+)
+from app.contexts.assets.domain.services.rate_groups.group_tables import TagValues
+from app.contexts.assets.domain.services.rate_histogram.histograms import (
+    HistogramSpec,
+)
+
+
+class IngestAssetsListService:
+    def __init__(
+        self,
+        assets_list_repository: AsyncAssetsListRepository,
+        histogram_spec: HistogramSpec | None = None,
+    ):
+        self.assets_list_repository = assets_list_repository
+        self.histogram_spec = histogram_spec
+
+    async def __call__(
+        self,
+        chunks: AsyncIterable[
+            tuple[
+                Sequence[str],
+                NDArray[np.float64],
+                NDArray[np.float64] | None,
+                TagValues | None,
+            ]
+        ],
+    ) -> AssetsList:
+        # Fold every chunk into the running aggregate as it arrives
+        builder = AssetsListBuilder(self.histogram_spec)
+        async for asset_ids, interest_rates, amounts, tags in chunks:
+            builder.extend(asset_ids, interest_rates, amounts, tags)
+
+        # Save the assets list once the whole stream was accepted
+        read_models = builder.build_with_read_models()
+        return await self.assets_list_repository.save(
+            read_models.assets_list, read_models
+        )
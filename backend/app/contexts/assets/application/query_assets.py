@@ -0,0 +1,24 @@
+from app.contexts.assets.domain.entities.asset import Asset
+from app.contexts.assets.domain.repositories.async_assets_list_repository import (
+    AsyncAssetsListRepository,
+)
+from app.contexts.assets.domain.services.rate_index.sorted_rate_index import (
+    RateRange,
+)
+
+
+class QueryAssetsService:
+    def __init__(self, assets_list_repository: AsyncAssetsListRepository):
+        self.assets_list_repository = assets_list_repository
+
+    async def get_asset(self, asset_id: str) -> Asset | None:
+        return await self.assets_list_repository.get_asset(asset_id)
+
+    async def rate_range(self, min_rate: float, max_rate: float) -> RateRange:
+        return await self.assets_list_repository.get_rate_range(min_rate, max_rate)
+
+    async def lowest(self, k: int) -> list[Asset]:
+        return await self.assets_list_repository.get_lowest_rate_assets(k)
+
+    async def highest(self, k: int) -> list[Asset]:
+        return await self.assets_list_repository.get_highest_rate_assets(k)
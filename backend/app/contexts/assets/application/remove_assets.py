@@ -0,0 +1,18 @@
+from collections.abc import Sequence
+
+from app.contexts.assets.domain.repositories.async_assets_list_repository import (
+    AsyncAssetsListRepository,
+)
+from app.contexts.assets.domain.services.interest_rate_avg_calculator.errors import (
+    EmptyListError,
+)
+
+
+class RemoveAssetsService:
+    def __init__(self, assets_list_repository: AsyncAssetsListRepository):
+        self.assets_list_repository = assets_list_repository
+
+    async def __call__(self, asset_ids: Sequence[str]) -> float:
+        if len(asset_ids) == 0:
+            raise EmptyListError()
+        return await self.assets_list_repository.remove_assets(asset_ids)
@@ -1,28 +1,219 @@
+import asyncio
+from collections.abc import Sequence
+from concurrent.futures import Executor
+
+import numpy as np
+from numpy.typing import NDArray
+
 from app.contexts.assets.domain.entities.asset import Asset
 from app.contexts.assets.domain.entities.assets_list import AssetsList
-from app.contexts.assets.domain.repositories.assets_list_repository import (
-    AssetsListRepository,
+from app.contexts.assets.domain.entities.assets_list_read_models import (
+    AssetsListReadModels,
+)
+from app.contexts.assets.domain.entities.errors import DuplicateAssetIdError
+from app.contexts.assets.domain.repositories.async_assets_list_repository import (
+    AsyncAssetsListRepository,
+)
+from app.contexts.assets.domain.services.columns_reduction.service import (
+    ColumnsReductionService,
+)
+from app.contexts.assets.domain.services.duplicate_ids_finder.service import (
+    DuplicateIdsFinderService,
+)
+from app.contexts.assets.domain.services.interest_rate_avg_calculator.errors import (
+    EmptyListError,
 )
 from app.contexts.assets.domain.services.interest_rate_avg_calculator.service import (
     InterestRateAvgCalculatorService,
 )
+from app.contexts.assets.domain.services.rate_groups.group_tables import (
+    TagValues,
+    build_group_tables,
+    encode_tags,
+    tag_values,
+)
+from app.contexts.assets.domain.services.rate_histogram.histograms import (
+    HistogramSpec,
+)
+from app.contexts.assets.domain.services.rate_index.sorted_rate_index import (
+    SortedRateIndex,
+)
+from app.contexts.assets.domain.services.rate_statistics.sketches import RateSketch
 
 
 class SaveAssetsListService:
     def __init__(
         self,
-        assets_list_repository: AssetsListRepository,
+        assets_list_repository: AsyncAssetsListRepository,
         interest_rate_avg_calculator_service: InterestRateAvgCalculatorService,
+        executor: Executor | None = None,
+        columns_reduction_service: ColumnsReductionService | None = None,
+        duplicate_ids_finder_service: DuplicateIdsFinderService | None = None,
+        histogram_spec: HistogramSpec | None = None,
     ):
         self.assets_list_repository = assets_list_repository
         self.interest_rate_avg_calculator_service = interest_rate_avg_calculator_service
+        self.executor = executor
+        self.columns_reduction_service = columns_reduction_service
+        self.duplicate_ids_finder_service = duplicate_ids_finder_service
+        self.histogram_spec = histogram_spec or HistogramSpec()
+
+    async def __call__(self, assets: list[Asset]) -> AssetsList:
+        loop = asyncio.get_running_loop()
+        read_models = await loop.run_in_executor(
+            self.executor, self._build_from_assets, assets
+        )
+
+        # Save the assets list to the repository
+        return await self.assets_list_repository.save(
+            read_models.assets_list, read_models
+        )
 
-    def __call__(self, assets: list[Asset]) -> AssetsList:
+    async def save_columns(
+        self,
+        asset_ids: Sequence[str],
+        interest_rates: NDArray[np.float64],
+        amounts: NDArray[np.float64] | None = None,
+        tags: TagValues | None = None,
+    ) -> AssetsList:
+        """Save an assets list given as already type-checked columns.
+
+        This is the trusted path for callers that validated the raw input at the
+        edge: no ``Asset`` objects are built. Averaging, sketching, indexing,
+        bucketing and grouping the rates and checking the ids for duplicates
+        grow with the list size, so they run on ``executor`` instead of the
+        event loop. Lists large enough for
+        ``columns_reduction_service`` are reduced on all cores; otherwise lists
+        too large for ``duplicate_ids_finder_service`` to check in memory are
+        checked with bounded memory. The ids are checked before the rates are
+        sorted, bucketed and grouped.
+        """
+        loop = asyncio.get_running_loop()
+        read_models = await loop.run_in_executor(
+            self.executor,
+            self._build_from_columns,
+            asset_ids,
+            interest_rates,
+            amounts,
+            tags,
+        )
+
+        # Save the assets list to the repository
+        return await self.assets_list_repository.save(
+            read_models.assets_list, read_models
+        )
+
+    def _build_from_assets(self, assets: list[Asset]) -> AssetsListReadModels:
         # Calculate the average interest rate
         avg_interest_rate = self.interest_rate_avg_calculator_service(assets)
 
-        # Create the assets list entity
-        assets_list = AssetsList(assets=assets, avg_interest_rate=avg_interest_rate)
+        # Create the assets list entity, sketching, indexing, bucketing and
+        # grouping its rates for the statistics, queries, histograms and
+        # per-tag averages
+        interest_rates = np.array(
+            [asset.interest_rate for asset in assets], dtype=np.float64
+        )
+        rate_index = SortedRateIndex.from_rates(interest_rates)
+        tag_columns = encode_tags(
+            tag_values([asset.tags for asset in assets]), len(assets)
+        )
+        assets_list = AssetsList(
+            assets=assets,
+            avg_interest_rate=avg_interest_rate,
+            tag_columns=tag_columns,
+        )
+        return AssetsListReadModels(
+            assets_list,
+            rate_sketch=RateSketch.from_values(interest_rates),
+            rate_index=rate_index,
+            rate_histograms=self.histogram_spec.build(rate_index),
+            rate_groups=build_group_tables(tag_columns, interest_rates),
+            histogram_spec=self.histogram_spec,
+        )
 
-        # Save the assets list to the repository
-        return self.assets_list_repository.save(assets_list)
+    def _build_from_columns(
+        self,
+        asset_ids: Sequence[str],
+        interest_rates: NDArray[np.float64],
+        amounts: NDArray[np.float64] | None,
+        tags: TagValues | None,
+    ) -> AssetsListReadModels:
+        interest_rates = np.ascontiguousarray(interest_rates, dtype=np.float64)
+        amounts = _float64_column(amounts)
+
+        # Reject empty and misaligned lists and duplicate ids before building
+        # anything derived from the rates
+        if len(asset_ids) == 0:
+            raise EmptyListError()
+        if len(asset_ids) != len(interest_rates):
+            raise ValueError("asset_ids and interest_rates must be aligned columns")
+        weighted_avg_interest_rate = self._weighted_mean(interest_rates, amounts)
+        reduction = self.columns_reduction_service
+        finder = self.duplicate_ids_finder_service
+        row_index = None
+        if reduction is not None and reduction.applies_to(len(asset_ids)):
+            # Also sums, sketches and sorts the rates on all cores
+            summary = reduction(asset_ids, interest_rates)
+            if summary.duplicate_ids:
+                raise DuplicateAssetIdError(summary.duplicate_ids)
+            avg_interest_rate = summary.rate_sum / summary.asset_count
+            rate_sketch, rate_index = summary.rate_sketch, summary.rate_index
+        else:
+            if finder is not None and finder.spills(len(asset_ids)):
+                duplicate_ids = finder(asset_ids)
+                if duplicate_ids:
+                    raise DuplicateAssetIdError(duplicate_ids)
+            else:
+                row_index = AssetsList.validate_unique_asset_ids(asset_ids)
+            avg_interest_rate = self.interest_rate_avg_calculator_service(
+                interest_rates
+            )
+            rate_sketch = RateSketch.from_values(interest_rates)
+            rate_index = SortedRateIndex.from_rates(interest_rates)
+
+        tag_columns = encode_tags(tags or {}, len(asset_ids))
+        rate_histograms = self.histogram_spec.build(rate_index)
+        rate_groups = build_group_tables(tag_columns, interest_rates)
+        if row_index is None:
+            # Already checked, so the id index is left to be built on first use
+            assets_list = AssetsList.from_trusted_columns(
+                asset_ids,
+                interest_rates,
+                avg_interest_rate,
+                amounts=amounts,
+                weighted_avg_interest_rate=weighted_avg_interest_rate,
+                tag_columns=tag_columns,
+            )
+        else:
+            assets_list = AssetsList.from_columns(
+                asset_ids,
+                interest_rates,
+                avg_interest_rate=avg_interest_rate,
+                row_index=row_index,
+                amounts=amounts,
+                weighted_avg_interest_rate=weighted_avg_interest_rate,
+                tag_columns=tag_columns,
+            )
+        return AssetsListReadModels(
+            assets_list,
+            rate_sketch=rate_sketch,
+            rate_index=rate_index,
+            rate_histograms=rate_histograms,
+            rate_groups=rate_groups,
+            histogram_spec=self.histogram_spec,
+        )
+
+    def _weighted_mean(
+        self, interest_rates: NDArray[np.float64], amounts: NDArray[np.float64] | None
+    ) -> float | None:
+        if amounts is None:
+            return None
+        return self.interest_rate_avg_calculator_service.weighted_mean(
+            interest_rates, amounts
+        )
+
+
+def _float64_column(
+    column: NDArray[np.float64] | None,
+) -> NDArray[np.float64] | None:
+    return None if column is None else np.ascontiguousarray(column, dtype=np.float64)
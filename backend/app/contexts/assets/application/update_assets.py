@@ -0,0 +1,30 @@
+from collections.abc import Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from app.contexts.assets.domain.repositories.async_assets_list_repository import (
+    AsyncAssetsListRepository,
+)
+from app.contexts.assets.domain.services.interest_rate_avg_calculator.errors import (
+    EmptyListError,
+)
+from app.contexts.assets.domain.services.rate_groups.group_tables import TagValues
+
+
+class UpdateAssetsService:
+    def __init__(self, assets_list_repository: AsyncAssetsListRepository):
+        self.assets_list_repository = assets_list_repository
+
+    async def __call__(
+        self,
+        asset_ids: Sequence[str],
+        interest_rates: NDArray[np.float64],
+        amounts: NDArray[np.float64] | None = None,
+        tags: TagValues | None = None,
+    ) -> float:
+        if len(asset_ids) == 0:
+            raise EmptyListError()
+        return await self.assets_list_repository.update_assets(
+            asset_ids, interest_rates, amounts, tags
+        )
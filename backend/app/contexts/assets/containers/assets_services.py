@@ -1,37 +1,209 @@
+from collections.abc import Callable
+from concurrent.futures import Executor
+
 from dependency_injector import containers, providers
 
+from app.contexts.assets.application.add_assets import AddAssetsService
+from app.contexts.assets.application.evaluate_scenarios import EvaluateScenariosService
+from app.contexts.assets.application.get_assets_list_history import (
+    GetAssetsListHistoryService,
+)
 from app.contexts.assets.application.get_average_interest_rate import (
     GetAverageInterestRateService,
 )
+from app.contexts.assets.application.get_grouped_interest_rates import (
+    GetGroupedInterestRatesService,
+)
+from app.contexts.assets.application.get_interest_rate_histograms import (
+    GetInterestRateHistogramsService,
+)
+from app.contexts.assets.application.get_interest_rate_series import (
+    GetInterestRateSeriesService,
+)
+from app.contexts.assets.application.get_interest_rate_statistics import (
+    GetInterestRateStatisticsService,
+)
+from app.contexts.assets.application.ingest_assets_list import (
+    IngestAssetsListService,
+)
+from app.contexts.assets.application.query_assets import QueryAssetsService
+from app.contexts.assets.application.remove_assets import RemoveAssetsService
 from app.contexts.assets.application.save_assets_list import SaveAssetsListService
+from app.contexts.assets.application.update_assets import UpdateAssetsService
 from app.contexts.assets.domain.entities.assets_list import AssetsList
+from app.contexts.assets.domain.repositories.assets_list_repository import (
+    AssetsListRepository,
+)
+from app.contexts.assets.domain.services.columns_reduction.service import (
+    ColumnsReductionService,
+)
+from app.contexts.assets.domain.services.duplicate_ids_finder.service import (
+    DuplicateIdsFinderService,
+)
 from app.contexts.assets.domain.services.interest_rate_avg_calculator.service import (
     InterestRateAvgCalculatorService,
 )
+from app.contexts.assets.domain.services.rate_histogram.histograms import HistogramSpec
+from app.contexts.assets.infrastructure.api.response_cache import (
+    InterestRateResponseCache,
+)
+from app.contexts.assets.infrastructure.persistence.assets_list.executor_repository import (
+    ExecutorAssetsListRepository,
+)
+from app.contexts.assets.infrastructure.persistence.assets_list.history import (
+    AssetsListHistory,
+)
 from app.contexts.assets.infrastructure.persistence.assets_list.in_memory_repository import (
     InMemoryAssetsListRepository,
 )
+from app.contexts.assets.infrastructure.persistence.assets_list.rate_rollups import (
+    AverageRateRollups,
+)
+from app.contexts.assets.infrastructure.persistence.assets_list.read_models import (
+    AssetsListReadModelStore,
+)
+from app.contexts.assets.infrastructure.persistence.assets_list.sqlite_repository import (
+    SqliteAssetsListRepository,
+)
 from app.contexts.shared.infrastructure.in_memory_database import InMemoryDatabase
+from app.contexts.shared.infrastructure.sqlite_database import SqliteDatabase
+
+
+def _async_assets_list_repository(
+    assets_list_repository_factory: Callable[..., AssetsListRepository],
+    executor: Executor,
+    offload_reads: bool,
+    portfolio_id: str | None = None,
+) -> ExecutorAssetsListRepository:
+    return ExecutorAssetsListRepository(
+        assets_list_repository_factory(portfolio_id=portfolio_id),
+        executor=executor,
+        offload_reads=offload_reads,
+    )
 
 
 class AssetsServicesContainer(containers.DeclarativeContainer):
     # Dependencies
+    config = providers.Configuration()
     persistence = providers.Dependency[InMemoryDatabase[AssetsList]]()
+    history = providers.Dependency[AssetsListHistory]()
+    rollups = providers.Dependency[AverageRateRollups]()
+    read_models = providers.Dependency[AssetsListReadModelStore]()
+    sqlite_database = providers.Dependency[SqliteDatabase]()
+    executor = providers.Dependency[Executor]()
+    cpu_executor = providers.Dependency[Executor]()
 
-    assets_list_repository = providers.Factory(
-        InMemoryAssetsListRepository, persistence=persistence
+    histogram_spec = providers.Factory(
+        HistogramSpec,
+        bucket_count=config.histogram_bucket_count,
+        quantile_count=config.histogram_quantile_count,
+    )
+
+    # Repositories, selected by the ``assets_list_backend`` setting
+    assets_list_repository = providers.Selector(
+        config.assets_list_backend,
+        memory=providers.Factory(
+            InMemoryAssetsListRepository,
+            persistence=persistence,
+            history=history,
+            rollups=rollups,
+            read_models=read_models,
+            histogram_spec=histogram_spec,
+        ),
+        sqlite=providers.Factory(SqliteAssetsListRepository, database=sqlite_database),
+    )
+    # Async view of the selected repository; SQLite reads hit the disk, so they
+    # leave the event loop as well. Both are called with ``portfolio_id`` for
+    # a portfolio's list; services default to the unscoped one.
+    async_assets_list_repository = providers.Factory(
+        _async_assets_list_repository,
+        assets_list_repository_factory=assets_list_repository.provider,
+        executor=executor,
+        offload_reads=providers.Selector(
+            config.assets_list_backend,
+            memory=providers.Object(False),
+            sqlite=providers.Object(True),
+        ),
     )
 
     interest_rate_avg_calculator_service = providers.Factory(
-        InterestRateAvgCalculatorService
+        InterestRateAvgCalculatorService,
+        engine=config.avg_calculator_engine,
+        numpy_min_size=config.avg_calculator_numpy_min_size,
+    )
+    duplicate_ids_finder_service = providers.Factory(
+        DuplicateIdsFinderService,
+        max_ids_in_memory=config.duplicate_check_max_ids_in_memory,
+        spill_directory=config.duplicate_check_spill_dir,
+    )
+    columns_reduction_service = providers.Factory(
+        ColumnsReductionService,
+        executor=cpu_executor,
+        min_size=config.parallel_reduction_min_size,
+        chunk_size=config.parallel_reduction_chunk_size,
+        duplicate_ids_finder=duplicate_ids_finder_service,
     )
 
-    # Services
+    # Services, on the async repository so that large writes stay off the
+    # event loop
     save_assets_list_service = providers.Factory(
         SaveAssetsListService,
-        assets_list_repository=assets_list_repository,
+        assets_list_repository=async_assets_list_repository,
         interest_rate_avg_calculator_service=interest_rate_avg_calculator_service,
+        executor=executor,
+        columns_reduction_service=columns_reduction_service,
+        duplicate_ids_finder_service=duplicate_ids_finder_service,
+        histogram_spec=histogram_spec,
+    )
+    ingest_assets_list_service = providers.Factory(
+        IngestAssetsListService,
+        assets_list_repository=async_assets_list_repository,
+        histogram_spec=histogram_spec,
+    )
+    add_assets_service = providers.Factory(
+        AddAssetsService, assets_list_repository=async_assets_list_repository
+    )
+    update_assets_service = providers.Factory(
+        UpdateAssetsService, assets_list_repository=async_assets_list_repository
+    )
+    remove_assets_service = providers.Factory(
+        RemoveAssetsService, assets_list_repository=async_assets_list_repository
     )
     get_average_interest_rate_service = providers.Factory(
-        GetAverageInterestRateService, assets_list_repository=assets_list_repository
+        GetAverageInterestRateService,
+        assets_list_repository=async_assets_list_repository,
+    )
+    get_interest_rate_statistics_service = providers.Factory(
+        GetInterestRateStatisticsService,
+        assets_list_repository=async_assets_list_repository,
+    )
+    get_grouped_interest_rates_service = providers.Factory(
+        GetGroupedInterestRatesService,
+        assets_list_repository=async_assets_list_repository,
+    )
+    get_interest_rate_series_service = providers.Factory(
+        GetInterestRateSeriesService,
+        assets_list_repository=async_assets_list_repository,
+    )
+    get_interest_rate_histograms_service = providers.Factory(
+        GetInterestRateHistogramsService,
+        assets_list_repository=async_assets_list_repository,
+    )
+    evaluate_scenarios_service = providers.Factory(
+        EvaluateScenariosService,
+        assets_list_repository=async_assets_list_repository,
+    )
+    get_assets_list_history_service = providers.Factory(
+        GetAssetsListHistoryService,
+        assets_list_repository=async_assets_list_repository,
+    )
+    query_assets_service = providers.Factory(
+        QueryAssetsService, assets_list_repository=async_assets_list_repository
+    )
+
+    # Caches
+    interest_rate_response_cache = providers.Singleton(
+        InterestRateResponseCache,
+        get_average_interest_rate_service_factory=get_average_interest_rate_service.provider,
+        max_entries=config.interest_rate_cache_max_entries,
     )
@@ -1,9 +1,39 @@
-from typing import Annotated
-
-from pydantic import Field
+from collections.abc import Mapping
+from datetime import datetime
 
 from app.contexts.shared.domain.entity import Entity
 
 
 class Asset(Entity):
-    interest_rate: Annotated[float, Field(description="The interest rate of the asset")]
+    __slots__ = ("_amount", "_interest_rate", "_tags")
+
+    _fields = (*Entity._fields, "interest_rate", "amount", "tags")
+
+    def __init__(
+        self,
+        *,
+        interest_rate: float,
+        amount: float | None = None,
+        tags: Mapping[str, str] | None = None,
+        id: str | None = None,
+        created_at: datetime | None = None,
+    ):
+        super().__init__(id=id, created_at=created_at)
+        self._interest_rate = float(interest_rate)
+        self._amount = None if amount is None else float(amount)
+        self._tags = dict(tags) if tags else {}
+
+    @property
+    def interest_rate(self) -> float:
+        """The interest rate of the asset."""
+        return self._interest_rate
+
+    @property
+    def amount(self) -> float | None:
+        """The principal of the asset, which weighs its rate; None if unknown."""
+        return self._amount
+
+    @property
+    def tags(self) -> dict[str, str]:
+        """Categories of the asset (currency, desk, ...), by tag name."""
+        return self._tags
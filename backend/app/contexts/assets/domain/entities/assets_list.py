@@ -1,33 +1,588 @@
-from typing import Annotated
+import math
+from collections import Counter
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import datetime
+from typing import Any, overload
 
-from pydantic import Field, model_validator
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
 
 from app.contexts.assets.domain.entities.asset import Asset
-from app.contexts.assets.domain.entities.errors import DuplicateAssetIdError
+from app.contexts.assets.domain.entities.errors import (
+    AssetNotFoundError,
+    DuplicateAssetIdError,
+)
+from app.contexts.assets.domain.services.interest_rate_avg_calculator.engines import (
+    weighted_average,
+)
+from app.contexts.assets.domain.services.interest_rate_avg_calculator.errors import (
+    EmptyListError,
+)
+from app.contexts.assets.domain.services.interest_rate_avg_calculator.running_mean import (
+    RunningMean,
+    RunningWeightedMean,
+)
+from app.contexts.assets.domain.services.rate_groups.group_tables import (
+    TagColumn,
+    TagValues,
+    encode_tags,
+    tag_values,
+)
 from app.contexts.shared.domain.entity import Entity
 
 
 class AssetsList(Entity):
-    assets: Annotated[list[Asset], Field(description="The list of assets stored")]
-    avg_interest_rate: Annotated[
-        float, Field(description="The average interest rate of the assets")
-    ]
-
-    @model_validator(mode="after")
-    def validate_unique_asset_ids(self) -> "AssetsList":
-        """Validate that all asset IDs in the list are unique."""
-        asset_ids = [asset.id for asset in self.assets]
-        seen = set()
-        duplicates = []
+    """Assets aggregate stored column-wise.
 
-        for asset_id in asset_ids:
-            if asset_id in seen:
-                if asset_id not in duplicates:
-                    duplicates.append(asset_id)
-            else:
-                seen.add(asset_id)
+    Interest rates live in a contiguous float64 array and asset ids in a parallel
+    list, with an id -> row index on top. Every row shares the list's
+    ``created_at``, so no per-asset objects are kept. ``assets`` exposes the
+    row-by-row ``Asset`` API as a lazy view over the columns.
+
+    A running sum and count are kept next to the columns, so adding, updating or
+    removing assets refreshes ``avg_interest_rate`` in constant time per asset.
+    Removal moves the last row into the freed slot, so row order is only kept
+    until the first removal.
+
+    Principal amounts are an optional third column, NaN where an asset has none;
+    lists without any amount do not allocate it. The sum of the amounts and of
+    the amount-weighted rates are kept running the same way, for a
+    ``weighted_avg_interest_rate`` that is None while no asset has a weight.
+
+    Tags are ``TagColumn``s of int32 codes next to the other columns, one per tag
+    name.
+
+    Trusted columns (see ``from_trusted_columns``) may be read-only, e.g. memory
+    mapped, as are frozen ones (see ``freeze``); they are copied into writable
+    storage on the first change.
+    """
+
+    __slots__ = (
+        "_amounts",
+        "_asset_ids",
+        "_avg_interest_rate",
+        "_interest_rates",
+        "_row_index",
+        "_running_mean",
+        "_tags",
+        "_weighted_avg_interest_rate",
+        "_weighted_mean",
+    )
+
+    _asset_ids: Sequence[str]
+    _interest_rates: NDArray[np.float64]
+    _row_index: dict[str, int] | None
+    _running_mean: RunningMean | None
+    _avg_interest_rate: float
+    _amounts: NDArray[np.float64] | None
+    _weighted_mean: RunningWeightedMean | None
+    _weighted_avg_interest_rate: float | None
+    _tags: dict[str, TagColumn]
+
+    _fields = (
+        *Entity._fields,
+        "count",
+        "avg_interest_rate",
+        "weighted_avg_interest_rate",
+    )
 
-        if duplicates:
+    def __init__(
+        self,
+        assets: Iterable[Asset] = (),
+        avg_interest_rate: float | None = None,
+        tag_columns: dict[str, TagColumn] | None = None,
+        **data: Any,
+    ):
+        super().__init__(**data)
+        asset_ids: list[str] = []
+        interest_rates: list[float] = []
+        amounts: list[float | None] = []
+        asset_tags: list[dict[str, str]] = []
+        for asset in assets:
+            asset_ids.append(asset.id)
+            interest_rates.append(asset.interest_rate)
+            amounts.append(asset.amount)
+            asset_tags.append(asset.tags)
+        self._set_columns(
+            asset_ids,
+            np.array(interest_rates, dtype=np.float64),
+            avg_interest_rate,
+            amounts=(
+                np.array(amounts, dtype=np.float64)
+                if any(amount is not None for amount in amounts)
+                else None
+            ),
+            tag_columns=(
+                encode_tags(tag_values(asset_tags), len(asset_ids))
+                if tag_columns is None
+                else tag_columns
+            ),
+        )
+
+    @classmethod
+    def from_columns(
+        cls,
+        asset_ids: Sequence[str],
+        interest_rates: ArrayLike,
+        avg_interest_rate: float | None = None,
+        row_index: dict[str, int] | None = None,
+        amounts: ArrayLike | None = None,
+        weighted_avg_interest_rate: float | None = None,
+        tag_columns: dict[str, TagColumn] | None = None,
+        **data: Any,
+    ) -> "AssetsList":
+        """Build the aggregate straight from its id and rate columns.
+
+        The columns are adopted without copying when they already are a list and a
+        contiguous float64 array. A ``row_index`` that was built while checking the
+        ids for duplicates can be handed over to skip that check. Without an
+        ``avg_interest_rate`` the average is taken from the running sum, and
+        without a ``weighted_avg_interest_rate`` the weighted one from the
+        ``amounts`` column. ``tag_columns`` (see ``encode_tags``) must have
+        exactly one code per asset.
+        """
+        assets_list = cls(**data)
+        assets_list._set_columns(
+            asset_ids if isinstance(asset_ids, list) else list(asset_ids),
+            np.ascontiguousarray(interest_rates, dtype=np.float64),
+            avg_interest_rate,
+            row_index,
+            None if amounts is None else np.ascontiguousarray(amounts, np.float64),
+            weighted_avg_interest_rate,
+            tag_columns,
+        )
+        return assets_list
+
+    @classmethod
+    def from_trusted_columns(
+        cls,
+        asset_ids: Sequence[str],
+        interest_rates: NDArray[np.float64],
+        avg_interest_rate: float,
+        amounts: NDArray[np.float64] | None = None,
+        weighted_avg_interest_rate: float | None = None,
+        tag_columns: dict[str, TagColumn] | None = None,
+        **data: Any,
+    ) -> "AssetsList":
+        """Adopt columns that were already validated when first stored.
+
+        Nothing is copied or scanned up front: the id index and the running sums
+        are built the first time a lookup or a change needs them, so the weighted
+        average of an ``amounts`` column must be handed over as well.
+        """
+        if interest_rates.ndim != 1 or len(interest_rates) != len(asset_ids):
+            raise ValueError("asset_ids and interest_rates must be aligned columns")
+        if amounts is not None and amounts.shape != interest_rates.shape:
+            raise ValueError("amounts must be aligned with the other columns")
+        _check_tag_columns(tag_columns, len(interest_rates))
+        assets_list = cls(**data)
+        assets_list._asset_ids = asset_ids
+        assets_list._interest_rates = interest_rates
+        assets_list._row_index = None
+        assets_list._running_mean = None
+        assets_list._avg_interest_rate = avg_interest_rate
+        assets_list._amounts = amounts
+        assets_list._weighted_mean = None
+        assets_list._weighted_avg_interest_rate = weighted_avg_interest_rate
+        assets_list._tags = tag_columns or {}
+        return assets_list
+
+    def _set_columns(
+        self,
+        asset_ids: list[str],
+        interest_rates: NDArray[np.float64],
+        avg_interest_rate: float | None,
+        row_index: dict[str, int] | None = None,
+        amounts: NDArray[np.float64] | None = None,
+        weighted_avg_interest_rate: float | None = None,
+        tag_columns: dict[str, TagColumn] | None = None,
+    ) -> None:
+        if interest_rates.ndim != 1 or len(interest_rates) != len(asset_ids):
+            raise ValueError("asset_ids and interest_rates must be aligned columns")
+        if amounts is not None and amounts.shape != interest_rates.shape:
+            raise ValueError("amounts must be aligned with the other columns")
+        _check_tag_columns(tag_columns, len(interest_rates))
+        if row_index is None:
+            row_index = self.validate_unique_asset_ids(asset_ids)
+        self._row_index = row_index
+        self._asset_ids = asset_ids
+        self._interest_rates = interest_rates
+        self._running_mean = None
+        self._avg_interest_rate = (
+            float(np.mean(interest_rates))
+            if avg_interest_rate is None and len(interest_rates)
+            else avg_interest_rate or 0.0
+        )
+        self._amounts = amounts
+        self._weighted_mean = None
+        self._weighted_avg_interest_rate = (
+            weighted_average(interest_rates, amounts)
+            if weighted_avg_interest_rate is None and amounts is not None
+            else weighted_avg_interest_rate
+        )
+        self._tags = tag_columns or {}
+
+    @staticmethod
+    def validate_unique_asset_ids(asset_ids: Sequence[str]) -> dict[str, int]:
+        """Validate that all asset IDs are unique and return the id -> row index."""
+        row_index = dict(zip(asset_ids, range(len(asset_ids)), strict=True))
+        if len(row_index) != len(asset_ids):
+            duplicates = [
+                asset_id for asset_id, count in Counter(asset_ids).items() if count > 1
+            ]
             raise DuplicateAssetIdError(duplicates)
+        return row_index
+
+    @property
+    def asset_ids(self) -> Sequence[str]:
+        return self._asset_ids
+
+    @property
+    def interest_rates(self) -> NDArray[np.float64]:
+        return self._interest_rates[: len(self._asset_ids)]
+
+    @property
+    def avg_interest_rate(self) -> float:
+        return self._avg_interest_rate
+
+    @property
+    def rate_sum(self) -> float:
+        """Sum of the rates, from the running sum once a change kept one."""
+        if self._running_mean is not None:
+            return self._running_mean.total
+        return self.avg_interest_rate * self.count
+
+    @property
+    def amounts(self) -> NDArray[np.float64] | None:
+        """Principal amounts, NaN where unknown; None if no asset has one."""
+        return None if self._amounts is None else self._amounts[: self.count]
+
+    @property
+    def weighted_avg_interest_rate(self) -> float | None:
+        return self._weighted_avg_interest_rate
+
+    @property
+    def tag_columns(self) -> dict[str, TagColumn]:
+        """The tags of the assets, by name."""
+        return {name: column.head(self.count) for name, column in self._tags.items()}
+
+    def tags_at(self, row: int) -> dict[str, str]:
+        tags = {}
+        for name, column in self._tags.items():
+            value = column.value_at(row)
+            if value is not None:
+                tags[name] = value
+        return tags
+
+    @property
+    def count(self) -> int:
+        return len(self._asset_ids)
+
+    @property
+    def assets(self) -> "AssetsView":
+        return AssetsView(self)
+
+    def row_of(self, asset_id: str) -> int | None:
+        return self._index().get(asset_id)
+
+    def get_asset(self, asset_id: str) -> Asset | None:
+        row = self._index().get(asset_id)
+        return None if row is None else self.assets[row]
+
+    def add_assets(
+        self,
+        asset_ids: Sequence[str],
+        interest_rates: NDArray[np.float64],
+        amounts: NDArray[np.float64] | None = None,
+        tags: TagValues | None = None,
+    ) -> None:
+        """Append new assets; every id must be new to the list."""
+        self._check_aligned(asset_ids, interest_rates, amounts, tags)
+        self.validate_unique_asset_ids(asset_ids)
+        row_index, asset_ids_column, running_mean = self._writable()
+        existing = [asset_id for asset_id in asset_ids if asset_id in row_index]
+        if existing:
+            raise DuplicateAssetIdError(existing)
+
+        start = self.count
+        end = start + len(asset_ids)
+        self._reserve(end)
+        self._interest_rates[start:end] = interest_rates
+        if amounts is not None or self._amounts is not None:
+            amounts_column, weighted_mean = self._writable_amounts()
+            amounts_column[start:end] = np.nan if amounts is None else amounts
+            weighted_mean.add_many(
+                self._interest_rates[start:end], amounts_column[start:end]
+            )
+            self._weighted_avg_interest_rate = weighted_mean.mean
+        if tags or self._tags:
+            for name, column in self._writable_tags(tags).items():
+                column.codes[start:end] = (
+                    column.encode(tags[name]) if tags and name in tags else -1
+                )
+        asset_ids_column.extend(asset_ids)
+        row_index.update(zip(asset_ids, range(start, end), strict=True))
+        running_mean.add_many(interest_rates)
+        self._avg_interest_rate = running_mean.mean
+
+    def update_assets(
+        self,
+        asset_ids: Sequence[str],
+        interest_rates: NDArray[np.float64],
+        amounts: NDArray[np.float64] | None = None,
+        tags: TagValues | None = None,
+    ) -> None:
+        """Replace the interest rate of existing assets, and their amount where
+        ``amounts`` has one; NaN or no ``amounts`` keeps the stored amount. Tag
+        values likewise replace the stored ones, None keeping them."""
+        self._check_aligned(asset_ids, interest_rates, amounts, tags)
+        self.validate_unique_asset_ids(asset_ids)
+        rows = self._rows_of(asset_ids)
+        _, _, running_mean = self._writable()
+        weighted = (
+            self._writable_amounts()
+            if amounts is not None or self._amounts is not None
+            else None
+        )
+
+        running_mean.remove_many(self._interest_rates[rows])
+        if tags:
+            self._update_tags(rows, tags)
+        if weighted is not None:
+            amounts_column, weighted_mean = weighted
+            old_amounts = amounts_column[rows]
+            weighted_mean.remove_many(self._interest_rates[rows], old_amounts)
+            if amounts is not None:
+                amounts_column[rows] = np.where(np.isnan(amounts), old_amounts, amounts)
+            weighted_mean.add_many(
+                np.asarray(interest_rates, dtype=np.float64), amounts_column[rows]
+            )
+            self._weighted_avg_interest_rate = weighted_mean.mean
+        self._interest_rates[rows] = interest_rates
+        running_mean.add_many(np.asarray(interest_rates, dtype=np.float64))
+        self._avg_interest_rate = running_mean.mean
+
+    def remove_assets(self, asset_ids: Sequence[str]) -> None:
+        """Remove existing assets; the list cannot be left empty."""
+        asset_ids = list(dict.fromkeys(asset_ids))
+        rows = self._rows_of(asset_ids)
+        if len(asset_ids) >= self.count:
+            raise EmptyListError()
+        row_index, asset_ids_column, running_mean = self._writable()
+        tag_columns = list(self._writable_tags().values())
+        amounts_column = None
+        if self._amounts is not None:
+            amounts_column, weighted_mean = self._writable_amounts()
+            weighted_mean.remove_many(self._interest_rates[rows], amounts_column[rows])
+            self._weighted_avg_interest_rate = weighted_mean.mean
+
+        for asset_id in asset_ids:
+            row = row_index.pop(asset_id)
+            last = self.count - 1
+            running_mean.remove(float(self._interest_rates[row]))
+            if row != last:
+                moved_id = asset_ids_column[last]
+                asset_ids_column[row] = moved_id
+                self._interest_rates[row] = self._interest_rates[last]
+                if amounts_column is not None:
+                    amounts_column[row] = amounts_column[last]
+                for column in tag_columns:
+                    column.codes[row] = column.codes[last]
+                row_index[moved_id] = row
+            asset_ids_column.pop()
+        self._avg_interest_rate = running_mean.mean
+
+    def freeze(self) -> None:
+        """Turn the columns read-only, so that they can be shared as they are;
+        the next change copies them first."""
+        count = self.count
+        if isinstance(self._asset_ids, list):
+            self._asset_ids = tuple(self._asset_ids)
+        self._interest_rates = _read_only(self._interest_rates[:count])
+        if self._amounts is not None:
+            self._amounts = _read_only(self._amounts[:count])
+        for column in self._tags.values():
+            column.codes = _read_only(column.codes[:count])
+
+    def _index(self) -> dict[str, int]:
+        if self._row_index is None:
+            self._row_index = dict(zip(self._asset_ids, range(self.count), strict=True))
+        return self._row_index
+
+    def _writable(self) -> tuple[dict[str, int], list[str], RunningMean]:
+        """Index, id list and running sum, turning trusted columns writable."""
+        if not isinstance(self._asset_ids, list):
+            self._asset_ids = list(self._asset_ids)
+        if not self._interest_rates.flags.writeable:
+            self._interest_rates = self.interest_rates.copy()
+        if self._running_mean is None:
+            self._running_mean = RunningMean()
+            self._running_mean.add_many(self.interest_rates)
+        return self._index(), self._asset_ids, self._running_mean
+
+    def _writable_amounts(self) -> tuple[NDArray[np.float64], RunningWeightedMean]:
+        """Amounts buffer and running weighted sums, allocating the column (all
+        NaN) on the first amount of a list that had none."""
+        if self._amounts is None:
+            self._amounts = np.full(len(self._interest_rates), np.nan)
+        elif not self._amounts.flags.writeable or len(self._amounts) < len(
+            self._interest_rates
+        ):
+            # Trusted columns, or a rates buffer that was copied on its own
+            amounts = np.full(len(self._interest_rates), np.nan)
+            amounts[: self.count] = self._amounts[: self.count]
+            self._amounts = amounts
+        if self._weighted_mean is None:
+            self._weighted_mean = RunningWeightedMean()
+            self._weighted_mean.add_many(
+                self.interest_rates, self._amounts[: self.count]
+            )
+        return self._amounts, self._weighted_mean
+
+    def _writable_tags(self, tags: TagValues | None = None) -> dict[str, TagColumn]:
+        """Tag columns with writable codes as long as the rates buffer, adding
+        a column (all -1) for every new tag name in ``tags``."""
+        size = len(self._interest_rates)
+        for name in tags or ():
+            if name not in self._tags:
+                self._tags[name] = TagColumn(codes=np.full(size, -1, dtype=np.int32))
+        for column in self._tags.values():
+            if not column.codes.flags.writeable or len(column.codes) < size:
+                # Trusted columns, or a rates buffer that was copied on its own
+                codes = np.full(size, -1, dtype=np.int32)
+                codes[: self.count] = column.codes[: self.count]
+                column.codes = codes
+        return self._tags
+
+    def _update_tags(self, rows: list[int], tags: TagValues) -> None:
+        for name, column in self._writable_tags(tags).items():
+            if name in tags:
+                codes = column.encode(tags[name])
+                column.codes[rows] = np.where(codes >= 0, codes, column.codes[rows])
+
+    def _rows_of(self, asset_ids: Sequence[str]) -> list[int]:
+        row_index = self._index()
+        rows = [row_index.get(asset_id, -1) for asset_id in asset_ids]
+        if -1 in rows:
+            missing = [asset_id for asset_id in asset_ids if asset_id not in row_index]
+            raise AssetNotFoundError(missing)
+        return rows
+
+    def _reserve(self, size: int) -> None:
+        # Grow geometrically into a fresh buffer; views handed out earlier keep
+        # pointing at the old one instead of dangling.
+        if size <= len(self._interest_rates):
+            return
+        buffer = np.empty(max(size, 2 * len(self._interest_rates)), dtype=np.float64)
+        buffer[: self.count] = self.interest_rates
+        self._interest_rates = buffer
+        if self._amounts is not None:
+            amounts = np.full(len(buffer), np.nan)
+            amounts[: self.count] = self._amounts[: self.count]
+            self._amounts = amounts
+        for column in self._tags.values():
+            codes = np.full(len(buffer), -1, dtype=np.int32)
+            codes[: self.count] = column.codes[: self.count]
+            column.codes = codes
+
+    @staticmethod
+    def _check_aligned(
+        asset_ids: Sequence[str],
+        interest_rates: NDArray[np.float64],
+        amounts: NDArray[np.float64] | None = None,
+        tags: TagValues | None = None,
+    ) -> None:
+        if len(asset_ids) != len(interest_rates):
+            raise ValueError("asset_ids and interest_rates must be aligned columns")
+        if amounts is not None and len(amounts) != len(interest_rates):
+            raise ValueError("amounts must be aligned with the other columns")
+        for name, values in (tags or {}).items():
+            if len(values) != len(interest_rates):
+                raise ValueError(f"tag {name!r} must be aligned with the other columns")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, AssetsList):
+            return NotImplemented
+        return (
+            self.id == other.id
+            and self.created_at == other.created_at
+            and self._avg_interest_rate == other._avg_interest_rate
+            and list(self._asset_ids) == list(other._asset_ids)
+            and np.array_equal(self.interest_rates, other.interest_rates)
+            and _same_amounts(self.amounts, other.amounts)
+            and self._tag_rows() == other._tag_rows()
+        )
+
+    def _tag_rows(self) -> dict[str, list[str | None]]:
+        # Decoded values of the tags that any asset carries
+        tag_rows = {}
+        for name, column in self.tag_columns.items():
+            if (column.codes >= 0).any():
+                tag_rows[name] = column.decoded()
+        return tag_rows
+
+    __hash__ = Entity.__hash__
+
+
+def _check_tag_columns(tag_columns: dict[str, TagColumn] | None, size: int) -> None:
+    for name, column in (tag_columns or {}).items():
+        if column.codes.shape != (size,):
+            raise ValueError(f"tag {name!r} must be aligned with the other columns")
+
+
+def _read_only[T: np.generic](column: NDArray[T]) -> NDArray[T]:
+    # A view, leaving the flags of the array it was sliced from alone
+    column.flags.writeable = False
+    return column
+
+
+def _same_amounts(
+    amounts: NDArray[np.float64] | None, other: NDArray[np.float64] | None
+) -> bool:
+    if amounts is None or other is None:
+        return amounts is other
+    return np.array_equal(amounts, other, equal_nan=True)
+
+
+class AssetsView(Sequence[Asset]):
+    """Read-only, lazily materialized ``Asset`` rows of an ``AssetsList``."""
+
+    __slots__ = ("_assets_list", "_created_at")
+
+    def __init__(self, assets_list: AssetsList):
+        self._assets_list = assets_list
+        self._created_at: datetime = assets_list.created_at
+
+    def __len__(self) -> int:
+        return self._assets_list.count
+
+    @overload
+    def __getitem__(self, index: int) -> Asset: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Asset]: ...
+
+    def __getitem__(self, index: int | slice) -> Asset | list[Asset]:
+        if isinstance(index, slice):
+            return [self._row(row) for row in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("assets index out of range")
+        return self._row(index)
+
+    def __iter__(self) -> Iterator[Asset]:
+        for row in range(len(self)):
+            yield self._row(row)
 
-        return self
+    def _row(self, row: int) -> Asset:
+        # Every row shares the one timestamp of the list
+        amounts = self._assets_list.amounts
+        amount = None if amounts is None else float(amounts[row])
+        return Asset(
+            id=self._assets_list.asset_ids[row],
+            created_at=self._created_at,
+            interest_rate=self._assets_list.interest_rates[row],
+            amount=None if amount is None or math.isnan(amount) else amount,
+            tags=self._assets_list.tags_at(row),
+        )
@@ -0,0 +1,152 @@
+from collections.abc import Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from app.contexts.assets.domain.entities.assets_list import AssetsList
+from app.contexts.assets.domain.entities.assets_list_read_models import (
+    AssetsListReadModels,
+)
+from app.contexts.assets.domain.entities.errors import DuplicateAssetIdError
+from app.contexts.assets.domain.services.interest_rate_avg_calculator.running_mean import (
+    RunningMean,
+    RunningWeightedMean,
+)
+from app.contexts.assets.domain.services.rate_groups.group_tables import (
+    TagColumn,
+    TagValues,
+    build_group_tables,
+)
+from app.contexts.assets.domain.services.rate_histogram.histograms import (
+    HistogramSpec,
+)
+from app.contexts.assets.domain.services.rate_index.sorted_rate_index import (
+    SortedRateIndex,
+)
+from app.contexts.assets.domain.services.rate_statistics.sketches import RateSketch
+
+
+class AssetsListBuilder:
+    """Incrementally assembles an ``AssetsList`` from chunks of columns.
+
+    Each chunk is appended to a growable float64 buffer and folded into a running
+    mean, and its ids are checked against the index built so far, so callers only
+    ever hold one chunk of input at a time. Principal amounts get a buffer of
+    their own from the first chunk that has any, NaN-filled for earlier rows, and
+    so does every tag name, with -1 codes for the rows without it.
+    Every chunk is folded into a ``RateSketch`` as well, and the rates are
+    indexed, bucketed per ``histogram_spec`` and grouped by tag once the list is
+    complete; ``build_with_read_models`` hands them over with the list.
+    """
+
+    initial_capacity = 1024
+
+    def __init__(self, histogram_spec: HistogramSpec | None = None) -> None:
+        self.histogram_spec = histogram_spec or HistogramSpec()
+        self._asset_ids: list[str] = []
+        self._interest_rates: NDArray[np.float64] = np.empty(
+            self.initial_capacity, dtype=np.float64
+        )
+        self._row_index: dict[str, int] = {}
+        self._duplicates: dict[str, None] = {}
+        self._running_mean = RunningMean()
+        self._amounts: NDArray[np.float64] | None = None
+        self._weighted_mean = RunningWeightedMean()
+        self._rate_sketch = RateSketch()
+        self._tags: dict[str, TagColumn] = {}
+
+    @property
+    def count(self) -> int:
+        return self._running_mean.count
+
+    def extend(
+        self,
+        asset_ids: Sequence[str],
+        interest_rates: NDArray[np.float64],
+        amounts: NDArray[np.float64] | None = None,
+        tags: TagValues | None = None,
+    ) -> None:
+        if len(asset_ids) != len(interest_rates):
+            raise ValueError("asset_ids and interest_rates must be aligned columns")
+        if amounts is not None and len(amounts) != len(interest_rates):
+            raise ValueError("amounts must be aligned with the other columns")
+        for name, values in (tags or {}).items():
+            if len(values) != len(interest_rates):
+                raise ValueError(f"tag {name!r} must be aligned with the other columns")
+
+        start = self.count
+        for offset, asset_id in enumerate(asset_ids):
+            if self._row_index.setdefault(asset_id, start + offset) != start + offset:
+                self._duplicates[asset_id] = None
+        self._asset_ids.extend(asset_ids)
+
+        end = start + len(interest_rates)
+        self._reserve(end)
+        self._interest_rates[start:end] = interest_rates
+        if amounts is not None and self._amounts is None:
+            self._amounts = np.full(len(self._interest_rates), np.nan)
+        if self._amounts is not None:
+            self._amounts[start:end] = np.nan if amounts is None else amounts
+            self._weighted_mean.add_many(interest_rates, self._amounts[start:end])
+        for name in tags or ():
+            if name not in self._tags:
+                self._tags[name] = TagColumn(
+                    codes=np.full(len(self._interest_rates), -1, dtype=np.int32)
+                )
+        for name, column in self._tags.items():
+            column.codes[start:end] = (
+                column.encode(tags[name]) if tags and name in tags else -1
+            )
+        self._running_mean.add_many(interest_rates)
+        self._rate_sketch.add_many(interest_rates)
+
+    def build(self) -> AssetsList:
+        """Return the assembled list, raising the same errors as a one-shot save."""
+        return self.build_with_read_models().assets_list
+
+    def build_with_read_models(self) -> AssetsListReadModels:
+        """Return the read models of the assembled list, which they hold."""
+        if self._duplicates:
+            raise DuplicateAssetIdError(list(self._duplicates))
+        avg_interest_rate = self._running_mean.mean
+
+        count = self.count
+        interest_rates = self._interest_rates[:count]
+        tag_columns = {name: column.head(count) for name, column in self._tags.items()}
+        rate_index = SortedRateIndex.from_rates(interest_rates)
+        assets_list = AssetsList.from_columns(
+            self._asset_ids,
+            interest_rates,
+            avg_interest_rate=avg_interest_rate,
+            row_index=self._row_index,
+            amounts=None if self._amounts is None else self._amounts[:count],
+            weighted_avg_interest_rate=self._weighted_mean.mean,
+            tag_columns=tag_columns,
+        )
+        return AssetsListReadModels(
+            assets_list,
+            rate_sketch=self._rate_sketch,
+            rate_index=rate_index,
+            rate_histograms=self.histogram_spec.build(rate_index),
+            rate_groups=build_group_tables(tag_columns, interest_rates),
+            histogram_spec=self.histogram_spec,
+        )
+
+    def _reserve(self, size: int) -> None:
+        # Grow geometrically into fresh buffers, as ``AssetsList._reserve`` does;
+        # resizing in place would move memory that views may still point at
+        if size <= len(self._interest_rates):
+            return
+        capacity = max(size, 2 * len(self._interest_rates))
+        count = self.count
+        buffer = np.empty(capacity, dtype=np.float64)
+        buffer[:count] = self._interest_rates[:count]
+        self._interest_rates = buffer
+        if self._amounts is not None:
+            amounts = np.full(capacity, np.nan)
+            amounts[:count] = self._amounts[:count]
+            self._amounts = amounts
+        for column in self._tags.values():
+            codes = np.full(capacity, -1, dtype=np.int32)
+            codes[:count] = column.codes[:count]
+            column.codes = codes
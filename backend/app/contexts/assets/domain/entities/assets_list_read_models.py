@@ -0,0 +1,197 @@
+from typing import NamedTuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from app.contexts.assets.domain.entities.asset import Asset
+from app.contexts.assets.domain.entities.assets_list import AssetsList
+from app.contexts.assets.domain.services.rate_groups.group_tables import (
+    GroupTable,
+    RateGroup,
+    build_group_tables,
+)
+from app.contexts.assets.domain.services.rate_histogram.histograms import (
+    HistogramSpec,
+    RateHistograms,
+)
+from app.contexts.assets.domain.services.rate_index.sorted_rate_index import (
+    RateRange,
+    SortedRateIndex,
+)
+from app.contexts.assets.domain.services.rate_statistics.sketches import (
+    RateSketch,
+    RateStatistics,
+)
+
+
+class ChangedRows(NamedTuple):
+    """Rows of a list as they were before a write updated or removed them."""
+
+    rows: list[int]
+    interest_rates: NDArray[np.float64]
+    # Codes of every tag of the list, -1 where a row does not carry it
+    tag_codes: dict[str, NDArray[np.int32]]
+
+
+class AssetsListReadModels:
+    """Models derived from the rates of one ``AssetsList``, for the reads that
+    would otherwise scan its columns.
+
+    They are kept next to the list by its repository, not on the aggregate.
+    Each is handed over by whoever built the list, or else built from the list
+    on first use. Writes report the rows they change, so that every model folds
+    just those rows or is dropped until the next read; updates and removals take
+    the rows as they were with ``changing`` before they change the list.
+
+    A ``RateSketch`` of the rates answers ``rate_statistics``. Added rates are
+    folded into it, while updates and removals drop it, as a sketch cannot take
+    rates out. A ``SortedRateIndex`` answers rate range aggregates and the
+    lowest or highest rates the same way, except that every change drops it.
+    ``RateHistograms`` bucket the rates per ``histogram_spec`` for charts; their
+    edges stay put, so changes only move the changed rates between buckets.
+    A ``GroupTable`` per tag holds the count and sum of the rates of each of its
+    values, and changes fold their old rows out of and their new rows into just
+    their groups.
+    """
+
+    __slots__ = (
+        "_assets_list",
+        "_histogram_spec",
+        "_rate_groups",
+        "_rate_histograms",
+        "_rate_index",
+        "_rate_sketch",
+    )
+
+    def __init__(
+        self,
+        assets_list: AssetsList,
+        rate_sketch: RateSketch | None = None,
+        rate_index: SortedRateIndex | None = None,
+        rate_histograms: RateHistograms | None = None,
+        rate_groups: dict[str, GroupTable] | None = None,
+        histogram_spec: HistogramSpec | None = None,
+    ):
+        self._assets_list = assets_list
+        self._rate_sketch = rate_sketch
+        self._rate_index = rate_index
+        self._rate_histograms = rate_histograms
+        self._rate_groups = rate_groups
+        self._histogram_spec = histogram_spec or HistogramSpec()
+
+    @property
+    def assets_list(self) -> AssetsList:
+        return self._assets_list
+
+    @property
+    def rate_sketch(self) -> RateSketch:
+        if self._rate_sketch is None:
+            self._rate_sketch = RateSketch.from_values(self._assets_list.interest_rates)
+        return self._rate_sketch
+
+    def rate_statistics(self) -> RateStatistics | None:
+        """Count, extremes, mean, standard deviation and quantiles of the rates;
+        None for an empty list."""
+        return self.rate_sketch.statistics()
+
+    @property
+    def rate_index(self) -> SortedRateIndex:
+        if self._rate_index is None:
+            self._rate_index = SortedRateIndex.from_rates(
+                self._assets_list.interest_rates
+            )
+        return self._rate_index
+
+    def rate_range(self, min_rate: float, max_rate: float) -> RateRange:
+        """Count and sum of the rates within ``[min_rate, max_rate]``."""
+        return self.rate_index.range(min_rate, max_rate)
+
+    def lowest_rate_assets(self, k: int) -> list[Asset]:
+        """The ``k`` assets with the lowest rates, lowest first."""
+        assets = self._assets_list.assets
+        return [assets[row] for row in self.rate_index.lowest_rows(k).tolist()]
+
+    def highest_rate_assets(self, k: int) -> list[Asset]:
+        """The ``k`` assets with the highest rates, highest first."""
+        assets = self._assets_list.assets
+        return [assets[row] for row in self.rate_index.highest_rows(k).tolist()]
+
+    @property
+    def rate_histograms(self) -> RateHistograms | None:
+        """Fixed-width and quantile buckets of the rates; None for an empty
+        list."""
+        if self._rate_histograms is None:
+            self._rate_histograms = self._histogram_spec.build(self.rate_index)
+        return self._rate_histograms
+
+    @property
+    def rate_groups(self) -> dict[str, GroupTable]:
+        if self._rate_groups is None:
+            self._rate_groups = build_group_tables(
+                self._assets_list.tag_columns, self._assets_list.interest_rates
+            )
+        return self._rate_groups
+
+    def group_rates(self, tag: str) -> list[RateGroup]:
+        """Count and sum of the rates of the assets carrying each value of
+        ``tag``, by value; empty for a tag that no asset carries."""
+        table = self.rate_groups.get(tag)
+        if table is None:
+            return []
+        return table.groups(self._assets_list.tag_columns[tag].values)
+
+    def changing(self, rows: list[int]) -> ChangedRows:
+        """The ``rows`` as they are, before a write updates or removes them."""
+        return ChangedRows(
+            rows,
+            self._assets_list.interest_rates[rows],
+            {
+                name: column.codes[rows]
+                for name, column in self._assets_list.tag_columns.items()
+            },
+        )
+
+    def added(self, rows: slice) -> None:
+        """Fold in the ``rows`` a write appended."""
+        interest_rates = self._assets_list.interest_rates[rows]
+        if self._rate_sketch is not None:
+            self._rate_sketch.add_many(interest_rates)
+        if self._rate_histograms is not None:
+            self._rate_histograms.add_many(interest_rates)
+        if self._rate_groups is not None:
+            for name, column in self._assets_list.tag_columns.items():
+                self._group_table(name).add_many(column.codes[rows], interest_rates)
+        self._rate_index = None
+
+    def updated(self, changed: ChangedRows) -> None:
+        """Move the ``changed`` rows from their old values to their new ones."""
+        interest_rates = self._assets_list.interest_rates[changed.rows]
+        if self._rate_histograms is not None:
+            self._rate_histograms.remove_many(changed.interest_rates)
+            self._rate_histograms.add_many(interest_rates)
+        if self._rate_groups is not None:
+            # Every group of the rows changes, as their rates do
+            for name, column in self._assets_list.tag_columns.items():
+                table = self._group_table(name)
+                if name in changed.tag_codes:
+                    table.remove_many(changed.tag_codes[name], changed.interest_rates)
+                table.add_many(column.codes[changed.rows], interest_rates)
+        self._rate_sketch = None
+        self._rate_index = None
+
+    def removed(self, changed: ChangedRows) -> None:
+        """Take out the ``changed`` rows a write removed."""
+        if self._rate_histograms is not None:
+            self._rate_histograms.remove_many(changed.interest_rates)
+        if self._rate_groups is not None:
+            for name, codes in changed.tag_codes.items():
+                self._group_table(name).remove_many(codes, changed.interest_rates)
+        self._rate_sketch = None
+        self._rate_index = None
+
+    def _group_table(self, name: str) -> GroupTable:
+        assert self._rate_groups is not None
+        table = self._rate_groups.get(name)
+        if table is None:
+            table = self._rate_groups[name] = GroupTable.empty()
+        return table
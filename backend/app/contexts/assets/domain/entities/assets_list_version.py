@@ -0,0 +1,227 @@
+import math
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import datetime
+from typing import NamedTuple, Self, overload
+
+import numpy as np
+from numpy.typing import NDArray
+
+from app.contexts.assets.domain.entities.asset import Asset
+from app.contexts.assets.domain.entities.assets_list import AssetsList
+from app.contexts.assets.domain.services.rate_groups.group_tables import TagColumn
+
+
+class IdSlice(Sequence[str]):
+    """Rows ``start`` to ``stop`` of an id column that is never changed."""
+
+    __slots__ = ("_asset_ids", "_start", "_stop")
+
+    def __init__(self, asset_ids: Sequence[str], start: int, stop: int):
+        self._asset_ids = asset_ids
+        self._start = start
+        self._stop = stop
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        if isinstance(index, slice):
+            return [self[row] for row in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("asset id index out of range")
+        return self._asset_ids[self._start + index]
+
+    def __iter__(self) -> Iterator[str]:
+        for row in range(self._start, self._stop):
+            yield self._asset_ids[row]
+
+
+class VersionChunk(NamedTuple):
+    """A run of consecutive rows of a list, as they were at some version.
+
+    Chunks are never changed once built, so a version shares with the one
+    before it every chunk its write did not touch.
+    """
+
+    asset_ids: Sequence[str]
+    # Read-only; views of a saved list's columns, or copies of changed rows
+    interest_rates: NDArray[np.float64]
+    # NaN where an asset has no amount; None when the list has no amounts
+    amounts: NDArray[np.float64] | None
+    tags: dict[str, TagColumn]
+
+
+class AssetsListVersion:
+    """An assets list as one of its writes left it: its averages and its assets.
+
+    The rows are split into chunks of ``chunk_size``. A version built from the
+    previous one only copies the chunks holding the rows the write changed and
+    points at the others, so a history of small writes costs a few chunks per
+    write rather than a copy of the list. A version of a whole list, after a
+    save, freezes the list (see ``AssetsList.freeze``) and views its columns
+    instead: nothing is copied until the list is next changed.
+    """
+
+    __slots__ = (
+        "asset_count",
+        "avg_interest_rate",
+        "chunk_size",
+        "chunks",
+        "created_at",
+        "list_created_at",
+        "version",
+        "weighted_avg_interest_rate",
+    )
+
+    def __init__(
+        self,
+        version: int,
+        created_at: datetime,
+        list_created_at: datetime,
+        avg_interest_rate: float,
+        weighted_avg_interest_rate: float | None,
+        chunk_size: int,
+        chunks: tuple[VersionChunk, ...],
+    ):
+        self.version = version
+        # When this version was written
+        self.created_at = created_at
+        # When the list itself was made, which its assets share
+        self.list_created_at = list_created_at
+        self.asset_count = sum(len(chunk.asset_ids) for chunk in chunks)
+        self.avg_interest_rate = avg_interest_rate
+        self.weighted_avg_interest_rate = weighted_avg_interest_rate
+        self.chunk_size = chunk_size
+        self.chunks = chunks
+
+    @classmethod
+    def of(
+        cls,
+        assets_list: AssetsList,
+        version: int,
+        created_at: datetime,
+        chunk_size: int,
+        previous: "AssetsListVersion | None" = None,
+        changed_rows: Iterable[int] | None = None,
+        chunks: tuple[VersionChunk, ...] | None = None,
+    ) -> Self:
+        """The current state of ``assets_list`` as ``version``.
+
+        ``chunks`` may be built ahead with ``chunks_of``; otherwise they are
+        built here.
+        """
+        if chunks is None:
+            chunks = cls.chunks_of(assets_list, chunk_size, previous, changed_rows)
+        return cls(
+            version,
+            created_at,
+            assets_list.created_at,
+            assets_list.avg_interest_rate,
+            assets_list.weighted_avg_interest_rate,
+            chunk_size,
+            chunks,
+        )
+
+    @staticmethod
+    def chunks_of(
+        assets_list: AssetsList,
+        chunk_size: int,
+        previous: "AssetsListVersion | None" = None,
+        changed_rows: Iterable[int] | None = None,
+    ) -> tuple[VersionChunk, ...]:
+        """The rows of ``assets_list`` in chunks of ``chunk_size``.
+
+        ``changed_rows`` are the rows the write since ``previous`` changed;
+        rows past the end of ``previous`` count as changed anyway. Without
+        them, or without ``previous``, the list is frozen and viewed whole.
+        """
+        if previous is not None and previous.chunk_size != chunk_size:
+            previous = None
+        if previous is None or changed_rows is None:
+            assets_list.freeze()
+            return tuple(
+                _chunk(assets_list, start, min(start + chunk_size, assets_list.count))
+                for start in range(0, assets_list.count, chunk_size)
+            )
+        changed = {row // chunk_size for row in changed_rows}
+        count, chunks = assets_list.count, []
+        for index, start in enumerate(range(0, count, chunk_size)):
+            stop = min(start + chunk_size, count)
+            kept = previous.chunks[index] if index < len(previous.chunks) else None
+            if (
+                kept is not None
+                and index not in changed
+                and len(kept.asset_ids) == stop - start
+            ):
+                chunks.append(kept)
+            else:
+                chunks.append(_copied_chunk(assets_list, start, stop))
+        return tuple(chunks)
+
+    def assets(self, offset: int = 0, limit: int | None = None) -> list[Asset]:
+        """The assets from row ``offset`` on, at most ``limit`` of them."""
+        stop = (
+            self.asset_count if limit is None else min(offset + limit, self.asset_count)
+        )
+        assets = []
+        for row in range(max(offset, 0), stop):
+            chunk = self.chunks[row // self.chunk_size]
+            at = row % self.chunk_size
+            amount = None if chunk.amounts is None else float(chunk.amounts[at])
+            assets.append(
+                Asset(
+                    id=chunk.asset_ids[at],
+                    created_at=self.list_created_at,
+                    interest_rate=float(chunk.interest_rates[at]),
+                    amount=None if amount is None or math.isnan(amount) else amount,
+                    tags={
+                        name: value
+                        for name, column in chunk.tags.items()
+                        if (value := column.value_at(at)) is not None
+                    },
+                )
+            )
+        return assets
+
+
+def _chunk(assets_list: AssetsList, start: int, stop: int) -> VersionChunk:
+    # Views of the columns of a frozen list
+    amounts = assets_list.amounts
+    return VersionChunk(
+        IdSlice(assets_list.asset_ids, start, stop),
+        assets_list.interest_rates[start:stop],
+        None if amounts is None else amounts[start:stop],
+        {
+            name: column.rows(start, stop)
+            for name, column in assets_list.tag_columns.items()
+        },
+    )
+
+
+def _copied_chunk(assets_list: AssetsList, start: int, stop: int) -> VersionChunk:
+    amounts = assets_list.amounts
+    tags = {}
+    for name, column in assets_list.tag_columns.items():
+        # Values only ever grow, so the copied codes keep pointing at theirs
+        tags[name] = column.rows(start, stop)
+        tags[name].codes = _frozen_copy(tags[name].codes)
+    return VersionChunk(
+        tuple(assets_list.asset_ids[start:stop]),
+        _frozen_copy(assets_list.interest_rates[start:stop]),
+        None if amounts is None else _frozen_copy(amounts[start:stop]),
+        tags,
+    )
+
+
+def _frozen_copy[T: np.generic](column: NDArray[T]) -> NDArray[T]:
+    copy = column.copy()
+    copy.flags.writeable = False
+    return copy
@@ -9,3 +9,21 @@ class DuplicateAssetIdError(DomainError):
         message = f"Duplicate asset IDs found: {ids_str}"
         super().__init__(message)
         self.duplicate_ids = duplicate_ids
+
+
+class AssetNotFoundError(DomainError):
+    """Error raised when referenced asset IDs are not in the assets list."""
+
+    def __init__(self, missing_ids: list[str]):
+        ids_str = ", ".join(missing_ids)
+        message = f"Assets not found: {ids_str}"
+        super().__init__(message)
+        self.missing_ids = missing_ids
+
+
+class HistoryUnavailableError(DomainError):
+    """Error raised when past versions of assets lists are not kept."""
+
+    def __init__(self, backend: str):
+        super().__init__(f"The {backend} backend keeps no history of assets lists")
+        self.backend = backend
@@ -0,0 +1,142 @@
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from datetime import datetime
+
+import numpy as np
+from numpy.typing import NDArray
+
+from app.contexts.assets.domain.entities.asset import Asset
+from app.contexts.assets.domain.entities.assets_list import AssetsList
+from app.contexts.assets.domain.entities.assets_list_read_models import (
+    AssetsListReadModels,
+)
+from app.contexts.assets.domain.entities.assets_list_version import (
+    AssetsListVersion,
+)
+from app.contexts.assets.domain.services.rate_groups.group_tables import (
+    RateGroup,
+    TagValues,
+)
+from app.contexts.assets.domain.services.rate_histogram.histograms import (
+    RateHistograms,
+)
+from app.contexts.assets.domain.services.rate_index.sorted_rate_index import (
+    RateRange,
+)
+from app.contexts.assets.domain.services.rate_rollups.series import (
+    Resolution,
+    RollupPoint,
+)
+from app.contexts.assets.domain.services.rate_statistics.sketches import (
+    RateStatistics,
+)
+from app.contexts.assets.domain.services.what_if.scenarios import (
+    ScenarioDeltas,
+    ScenarioOutcomes,
+)
+
+
+class AsyncAssetsListRepository(ABC):
+    """Awaitable counterpart of ``AssetsListRepository`` for the async services."""
+
+    @abstractmethod
+    async def get_average_interest_rate(self) -> float | None:
+        pass
+
+    @abstractmethod
+    async def get_weighted_average_interest_rate(self) -> float | None:
+        """Average weighted by the assets' amounts; None without any amount."""
+
+    @abstractmethod
+    async def get_rate_statistics(self) -> RateStatistics | None:
+        """Distribution of the interest rates; None without any asset."""
+
+    @abstractmethod
+    async def get_rate_histograms(self) -> RateHistograms | None:
+        """Fixed-width and quantile buckets of the rates; None without any
+        asset."""
+
+    @abstractmethod
+    async def get_rate_groups(self, tag: str) -> list[RateGroup]:
+        """Count and sum of the rates of every value of ``tag``, by value."""
+
+    @abstractmethod
+    async def evaluate_scenarios(self, deltas: ScenarioDeltas) -> ScenarioOutcomes:
+        """Count and rate sum of the list after each scenario, leaving it
+        unchanged; a missing list counts as empty."""
+
+    @abstractmethod
+    async def get_asset(self, asset_id: str) -> Asset | None:
+        pass
+
+    @abstractmethod
+    async def get_rate_range(self, min_rate: float, max_rate: float) -> RateRange:
+        """Count and sum of the rates within ``[min_rate, max_rate]``."""
+
+    @abstractmethod
+    async def get_lowest_rate_assets(self, k: int) -> list[Asset]:
+        """The ``k`` assets with the lowest rates, lowest first."""
+
+    @abstractmethod
+    async def get_highest_rate_assets(self, k: int) -> list[Asset]:
+        """The ``k`` assets with the highest rates, highest first."""
+
+    @abstractmethod
+    async def get_version(self) -> int:
+        """Counter that changes with every write to the stored assets list."""
+
+    @abstractmethod
+    async def get_history(self) -> list[AssetsListVersion]:
+        """The kept past versions of the list, oldest first."""
+
+    @abstractmethod
+    async def get_rate_series(
+        self,
+        resolution: Resolution,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> list[RollupPoint]:
+        """Rollups of the average rate after every write, in ``resolution``
+        buckets overlapping ``[start, end]``, oldest first."""
+
+    @abstractmethod
+    async def get_past_version(
+        self, version: int | None = None, at: datetime | None = None
+    ) -> AssetsListVersion | None:
+        """The list as ``version``, or as it was at ``at``; the latest version
+        when neither is given. None if that version is not kept."""
+
+    @abstractmethod
+    async def save(
+        self, assets_list: AssetsList, read_models: AssetsListReadModels | None = None
+    ) -> AssetsList:
+        """Replace the stored list with ``assets_list``, keeping the
+        ``read_models`` that were derived from it while it was built."""
+
+    # Incremental writes return the refreshed average interest rate. Their
+    # ``amounts`` are NaN where an asset has none, and their ``tags`` None where
+    # an asset does not carry one; updates keep the stored amount or tag there.
+
+    @abstractmethod
+    async def add_assets(
+        self,
+        asset_ids: Sequence[str],
+        interest_rates: NDArray[np.float64],
+        amounts: NDArray[np.float64] | None = None,
+        tags: TagValues | None = None,
+    ) -> float:
+        pass
+
+    @abstractmethod
+    async def update_assets(
+        self,
+        asset_ids: Sequence[str],
+        interest_rates: NDArray[np.float64],
+        amounts: NDArray[np.float64] | None = None,
+        tags: TagValues | None = None,
+    ) -> float:
+        pass
+
+    @abstractmethod
+    async def remove_assets(self, asset_ids: Sequence[str]) -> float:
+        pass
@@ -0,0 +1,320 @@
+import math
+import os
+from collections.abc import Callable, Sequence
+from concurrent.futures import Executor
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import NamedTuple, Self
+
+import numpy as np
+from numpy.typing import NDArray
+
+from app.contexts.assets.domain.services.duplicate_ids_finder.service import (
+    DuplicateIdsFinderService,
+)
+from app.contexts.assets.domain.services.rate_index.sorted_rate_index import (
+    SortedRateIndex,
+)
+from app.contexts.assets.domain.services.rate_statistics.sketches import RateSketch
+
+# Hash partitions scanned by the second phase, keyed by the top bits of the hash
+_PARTITION_BITS = 4
+_MULTIPLIER = np.uint64(0x100000001B3)
+
+
+class ColumnsSummary(NamedTuple):
+    asset_count: int
+    rate_sum: float
+    duplicate_ids: list[str]
+    rate_sketch: RateSketch
+    rate_index: SortedRateIndex
+
+
+class ColumnsReductionService:
+    """Sums, sketches and sorts the interest rates and finds duplicate asset ids
+    of large uploads.
+
+    Columns of at least ``min_size`` rows are copied once into shared memory and
+    reduced on ``executor`` (a process pool) in two phases:
+
+    1. every chunk of ``chunk_size`` rows yields its partial sum, count and
+       ``RateSketch``, and writes a 64-bit hash per id and its rows in rate
+       order, which are then merged into the ``SortedRateIndex``;
+    2. every hash partition is sorted on its own and yields the hashes seen more
+       than once.
+
+    Only ids whose hash collides are then compared as strings, by
+    ``duplicate_ids_finder``, so the reported duplicates are exact and in
+    first-seen order. Smaller columns, ids with NUL characters and a missing
+    executor use the single-process path.
+    """
+
+    def __init__(
+        self,
+        executor: Executor | None = None,
+        min_size: int = 1_000_000,
+        chunk_size: int = 250_000,
+        duplicate_ids_finder: DuplicateIdsFinderService | None = None,
+    ):
+        self.executor = executor
+        self.min_size = min_size
+        self.chunk_size = chunk_size
+        self.duplicate_ids_finder = duplicate_ids_finder or DuplicateIdsFinderService()
+
+    def applies_to(self, size: int) -> bool:
+        return self.executor is not None and size >= self.min_size
+
+    def __call__(
+        self, asset_ids: Sequence[str], interest_rates: NDArray[np.float64]
+    ) -> ColumnsSummary:
+        if len(asset_ids) != len(interest_rates):
+            raise ValueError("asset_ids and interest_rates must be aligned columns")
+        if self.applies_to(len(asset_ids)):
+            blob = "\0".join(asset_ids).encode()
+            if blob.count(0) == len(asset_ids) - 1:
+                return self._reduce_on_executor(blob, asset_ids, interest_rates)
+        return ColumnsSummary(
+            len(asset_ids),
+            float(np.sum(interest_rates)),
+            self.duplicate_ids_finder(asset_ids),
+            RateSketch.from_values(interest_rates),
+            SortedRateIndex.from_rates(interest_rates),
+        )
+
+    def _reduce_on_executor(
+        self,
+        blob: bytes,
+        asset_ids: Sequence[str],
+        interest_rates: NDArray[np.float64],
+    ) -> ColumnsSummary:
+        size = len(asset_ids)
+        with _SharedColumns(blob, interest_rates) as shared:
+            assert self.executor is not None
+            chunks = range(0, size, self.chunk_size)
+            partials = list(
+                self.executor.map(
+                    _reduce_chunk,
+                    [shared.names] * len(chunks),
+                    chunks,
+                    [min(start + self.chunk_size, size) for start in chunks],
+                )
+            )
+            partitions = range(1 << _PARTITION_BITS)
+            colliding = np.unique(
+                np.concatenate(
+                    list(
+                        self.executor.map(
+                            _colliding_hashes,
+                            [shared.names] * len(partitions),
+                            partitions,
+                        )
+                    )
+                )
+            )
+            rows = np.flatnonzero(np.isin(shared.hashes(), colliding))
+            rate_index = SortedRateIndex.from_sorted_runs(
+                interest_rates, shared.chunk_orders()
+            )
+
+        asset_count = sum(chunk_count for chunk_count, _, _ in partials)
+        rate_sum = math.fsum(chunk_sum for _, chunk_sum, _ in partials)
+        rate_sketch = RateSketch()
+        for _, _, chunk_sketch in partials:
+            rate_sketch.merge(chunk_sketch)
+        duplicates = self.duplicate_ids_finder(asset_ids[row] for row in rows.tolist())
+        return ColumnsSummary(
+            asset_count, rate_sum, duplicates, rate_sketch, rate_index
+        )
+
+
+class _SharedNames(NamedTuple):
+    blob: str
+    bounds: str
+    rates: str
+    hashes: str
+    orders: str
+    size: int
+    # Process that creates and unlinks the segments
+    owner: int
+
+
+class _SharedColumns:
+    """Shared memory copies of the columns, plus room for one hash per id and
+    the rows of every chunk in rate order.
+
+    ``bounds`` holds the start of every NUL separated id in the blob and one past
+    the blob's end, so id ``i`` is ``blob[bounds[i] : bounds[i + 1] - 1]``.
+    """
+
+    def __init__(self, blob: bytes, interest_rates: NDArray[np.float64]):
+        size = len(interest_rates)
+        self._segments: list[SharedMemory] = []
+        try:
+            blob_segment = self._create(len(blob))
+            _buffer(blob_segment)[: len(blob)] = blob
+            bounds_segment = self._create((size + 1) * 8)
+            bounds = np.ndarray(size + 1, np.int64, _buffer(bounds_segment))
+            bounds[0] = 0
+            bounds[1:-1] = np.flatnonzero(np.frombuffer(blob, np.uint8) == 0) + 1
+            bounds[-1] = len(blob) + 1
+            del bounds
+            rates_segment = self._create(size * 8)
+            np.ndarray(size, np.float64, _buffer(rates_segment))[:] = interest_rates
+            self._hashes = self._create(size * 8)
+            self._orders = self._create(size * 8)
+            self.names = _SharedNames(
+                blob_segment.name,
+                bounds_segment.name,
+                rates_segment.name,
+                self._hashes.name,
+                self._orders.name,
+                size,
+                os.getpid(),
+            )
+        except BaseException:
+            self.close()
+            raise
+
+    def _create(self, size: int) -> SharedMemory:
+        segment = SharedMemory(create=True, size=max(size, 1))
+        self._segments.append(segment)
+        return segment
+
+    def hashes(self) -> NDArray[np.uint64]:
+        return np.frombuffer(_buffer(self._hashes), np.uint64, self.names.size).copy()
+
+    def chunk_orders(self) -> NDArray[np.intp]:
+        return np.frombuffer(_buffer(self._orders), np.int64, self.names.size).astype(
+            np.intp
+        )
+
+    def close(self) -> None:
+        for segment in self._segments:
+            segment.close()
+            segment.unlink()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def _buffer(segment: SharedMemory) -> memoryview:
+    assert segment.buf is not None
+    return segment.buf
+
+
+# Worker side: module-level so a process pool can import them
+
+
+_Views = tuple[
+    NDArray[np.uint8],
+    NDArray[np.int64],
+    NDArray[np.float64],
+    NDArray[np.uint64],
+    NDArray[np.int64],
+]
+
+
+def _reduce_chunk(
+    names: _SharedNames, start: int, stop: int
+) -> tuple[int, float, RateSketch]:
+    def reduce(views: _Views) -> tuple[int, float, RateSketch]:
+        blob, bounds, rates, hashes, orders = views
+        hashes[start:stop] = hash_ids(
+            blob, bounds[start:stop], bounds[start + 1 : stop + 1] - 1
+        )
+        chunk = rates[start:stop]
+        orders[start:stop] = np.argsort(chunk, kind="stable")
+        orders[start:stop] += start
+        return stop - start, float(np.sum(chunk)), RateSketch.from_values(chunk)
+
+    return _with_views(names, reduce)
+
+
+def _colliding_hashes(names: _SharedNames, partition: int) -> NDArray[np.uint64]:
+    def collide(views: _Views) -> NDArray[np.uint64]:
+        hashes = views[3]
+        part = np.sort(hashes[(hashes >> np.uint64(64 - _PARTITION_BITS)) == partition])
+        return np.unique(part[1:][part[1:] == part[:-1]])
+
+    return _with_views(names, collide)
+
+
+def _with_views[T](names: _SharedNames, function: Callable[[_Views], T]) -> T:
+    # The views only live in ``function``'s frame, so the segments can be closed
+    # as soon as it returns
+    segments = [
+        _attach(name, names.owner)
+        for name in (names.blob, names.bounds, names.rates, names.hashes, names.orders)
+    ]
+    try:
+        return function(
+            (
+                np.frombuffer(_buffer(segments[0]), np.uint8),
+                np.frombuffer(_buffer(segments[1]), np.int64, names.size + 1),
+                np.frombuffer(_buffer(segments[2]), np.float64, names.size),
+                np.frombuffer(_buffer(segments[3]), np.uint64, names.size),
+                np.frombuffer(_buffer(segments[4]), np.int64, names.size),
+            )
+        )
+    finally:
+        for segment in segments:
+            try:
+                segment.close()
+            except BufferError:
+                # A traceback still references the views; the mapping is released
+                # once it is collected
+                pass
+
+
+def _attach(name: str, owner: int) -> SharedMemory:
+    segment = SharedMemory(name=name)
+    # Attaching registers the segment with this process's resource tracker, which
+    # unlinks what is still registered when the process exits. Spawned workers
+    # share the owner's tracker, so only a worker with a tracker of its own drops
+    # the entry; the owner unlinks the segment.
+    if os.getpid() != owner and _runs_own_tracker():
+        resource_tracker.unregister(segment._name, "shared_memory")  # type: ignore[attr-defined]
+    return segment
+
+
+def _runs_own_tracker() -> bool:
+    # The tracker's pid is only known to the process that launched it
+    tracker = resource_tracker._resource_tracker
+    return tracker._pid is not None  # type: ignore[attr-defined]
+
+
+def hash_ids(
+    blob: NDArray[np.uint8], starts: NDArray[np.intp], ends: NDArray[np.intp]
+) -> NDArray[np.uint64]:
+    """Polynomial hash of every ``blob[start:end]`` id, vectorized.
+
+    Equal ids always hash equally; unequal ids rarely do, which callers confirm.
+    """
+    lengths = ends - starts
+    if len(lengths) == 0:
+        return np.empty(0, dtype=np.uint64)
+    first = int(starts[0])
+    data = blob[first : int(ends[-1])].astype(np.uint64)
+    offsets = starts - first
+    # Every id spans up to the next one's start; its separator is a zero byte and
+    # adds nothing. Powers of the multiplier by position wrap mod 2**64.
+    spans = np.diff(offsets, append=len(data))
+    positions = np.arange(len(data)) - np.repeat(offsets, spans)
+    powers = np.cumprod(np.full(int(spans.max()) + 1, _MULTIPLIER, dtype=np.uint64))
+    # A trailing zero keeps reduceat in range for empty ids at the end
+    sums = np.add.reduceat(np.append(data * powers[positions], np.uint64(0)), offsets)
+    sums[lengths == 0] = 0
+    sums ^= lengths.astype(np.uint64)
+    return _mix(sums)
+
+
+def _mix(values: NDArray[np.uint64]) -> NDArray[np.uint64]:
+    # splitmix64 finalizer, so that the top bits spread over the partitions
+    values = values ^ (values >> np.uint64(30))
+    values = values * np.uint64(0xBF58476D1CE4E5B9)
+    values = values ^ (values >> np.uint64(27))
+    values = values * np.uint64(0x94D049BB133111EB)
+    return values ^ (values >> np.uint64(31))
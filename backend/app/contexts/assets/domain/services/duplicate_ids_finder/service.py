@@ -0,0 +1,123 @@
+import os
+import struct
+import tempfile
+from collections import Counter
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import ExitStack
+from typing import BinaryIO
+
+# Row number and UTF-8 length of every spilled id, followed by its bytes
+_RECORD = struct.Struct("<QI")
+# Salted re-partitioning gives up after this many levels; a partition that is
+# still too large then is checked in memory
+_MAX_DEPTH = 4
+
+
+class DuplicateIdsFinderService:
+    """Finds the ids that occur more than once, in first-seen order.
+
+    Up to ``max_ids_in_memory`` distinct ids are tracked in a dict. Past that,
+    every id is spilled with its row number to one of ``partitions`` temporary
+    files picked by hash, so equal ids always share a file. Each file is then
+    checked on its own, and one still holding too many distinct ids is split
+    again with a salted hash. Memory stays bounded by ``max_ids_in_memory`` and
+    every id is written and read back a constant number of times.
+    """
+
+    def __init__(
+        self,
+        max_ids_in_memory: int = 2_000_000,
+        partitions: int = 64,
+        spill_directory: str | None = None,
+    ):
+        self.max_ids_in_memory = max_ids_in_memory
+        self.partitions = partitions
+        self.spill_directory = spill_directory
+
+    def spills(self, size: int) -> bool:
+        """Whether checking ``size`` ids may spill to disk."""
+        return size > self.max_ids_in_memory
+
+    def __call__(self, asset_ids: Iterable[str]) -> list[str]:
+        if isinstance(asset_ids, Sequence) and not self.spills(len(asset_ids)):
+            # Fits in memory: unique ids, the common case, are confirmed at C speed
+            if len(dict.fromkeys(asset_ids)) == len(asset_ids):
+                return []
+            counts = Counter(asset_ids)
+            return [asset_id for asset_id, seen in counts.items() if seen > 1]
+
+        # First row of every id seen so far, and of every duplicate found
+        first_rows: dict[str, int] = {}
+        duplicates: dict[str, int] = {}
+        ids = enumerate(asset_ids)
+        for row, asset_id in ids:
+            first_row = first_rows.setdefault(asset_id, row)
+            if first_row != row:
+                duplicates.setdefault(asset_id, first_row)
+            elif len(first_rows) > self.max_ids_in_memory:
+                break
+        else:
+            return sorted(duplicates, key=duplicates.__getitem__)
+
+        with tempfile.TemporaryDirectory(dir=self.spill_directory) as directory:
+            # Carry over the ids seen so far, then stream the rest to disk
+            records = _chain_records(first_rows, ids)
+            for path in _partition(records, directory, self.partitions, salt=0):
+                self._find_in_partition(path, duplicates, depth=0)
+        return sorted(duplicates, key=duplicates.__getitem__)
+
+    def _find_in_partition(
+        self, path: str, duplicates: dict[str, int], depth: int
+    ) -> None:
+        first_rows: dict[str, int] = {}
+        records = _read_records(path)
+        for row, asset_id in records:
+            first_row = first_rows.setdefault(asset_id, row)
+            if first_row != row:
+                if first_row < duplicates.get(asset_id, first_row + 1):
+                    duplicates[asset_id] = first_row
+            elif len(first_rows) > self.max_ids_in_memory and depth < _MAX_DEPTH:
+                # Rows are read back in order, so the ids kept so far were seen
+                # first; split them and the rest of the file with a new salt
+                spilled = _chain_records(first_rows, records)
+                for sub_path in _partition(
+                    spilled, os.path.dirname(path), self.partitions, salt=depth + 1
+                ):
+                    self._find_in_partition(sub_path, duplicates, depth + 1)
+                break
+        os.unlink(path)
+
+
+def _chain_records(
+    first_rows: dict[str, int], rest: Iterable[tuple[int, str]]
+) -> Iterator[tuple[int, str]]:
+    for asset_id, row in first_rows.items():
+        yield row, asset_id
+    # Spilled; free the memory before streaming the rest
+    first_rows.clear()
+    yield from rest
+
+
+def _partition(
+    records: Iterable[tuple[int, str]], directory: str, partitions: int, salt: int
+) -> list[str]:
+    target = tempfile.mkdtemp(dir=directory)
+    paths = [os.path.join(target, str(index)) for index in range(partitions)]
+    with ExitStack() as stack:
+        files: list[BinaryIO] = [
+            stack.enter_context(open(path, "wb", buffering=1 << 16)) for path in paths
+        ]
+        pack = _RECORD.pack
+        for row, asset_id in records:
+            encoded = asset_id.encode()
+            file = files[hash((salt, asset_id)) % partitions]
+            file.write(pack(row, len(encoded)) + encoded)
+    return paths
+
+
+def _read_records(path: str) -> Iterator[tuple[int, str]]:
+    with open(path, "rb", buffering=1 << 16) as file:
+        read, unpack, size = file.read, _RECORD.unpack, _RECORD.size
+        while header := read(size):
+            row, length = unpack(header)
+            yield row, read(length).decode()
@@ -0,0 +1,41 @@
+import functools
+import timeit
+
+import numpy as np
+
+from app.contexts.assets.domain.services.interest_rate_avg_calculator.engines import (
+    AverageEngine,
+    NumpyAverageEngine,
+    PythonAverageEngine,
+)
+
+
+def calibrate_numpy_min_size(max_size: int = 1 << 12, repeat: int = 3) -> int:
+    """Smallest power of two input size at which the NumPy engine outruns the
+    pure-Python one on this machine; ``2 * max_size`` if it never does."""
+    rng = np.random.default_rng(0)
+    python_engine, numpy_engine = PythonAverageEngine(), NumpyAverageEngine()
+    size = 1
+    while size <= max_size:
+        interest_rates = rng.random(size)
+        number = max(5, 2000 // size)
+        if _best_time(numpy_engine, interest_rates, number, repeat) < _best_time(
+            python_engine, interest_rates, number, repeat
+        ):
+            return size
+        size *= 2
+    return size
+
+
+@functools.cache
+def calibrated_numpy_min_size() -> int:
+    """``calibrate_numpy_min_size``, measured once per process."""
+    return calibrate_numpy_min_size()
+
+
+def _best_time(
+    engine: AverageEngine, interest_rates: np.ndarray, number: int, repeat: int
+) -> float:
+    return min(
+        timeit.repeat(lambda: engine.mean(interest_rates), number=number, repeat=repeat)
+    )
@@ -0,0 +1,78 @@
+import math
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from app.contexts.assets.domain.entities.asset import Asset
+from app.contexts.assets.domain.services.interest_rate_avg_calculator.running_mean import (
+    positive_weights,
+)
+
+AverageInput = Sequence[Asset] | NDArray[np.float64]
+
+
+class AverageEngine(ABC):
+    """Computes the mean interest rate of a non-empty, validated input."""
+
+    @abstractmethod
+    def mean(self, assets: AverageInput) -> float: ...
+
+
+class PythonAverageEngine(AverageEngine):
+    """Plain ``sum`` over Python floats; no array set-up, so the fastest on tiny
+    lists."""
+
+    def mean(self, assets: AverageInput) -> float:
+        values: list[float] = (
+            assets.tolist()
+            if isinstance(assets, np.ndarray)
+            else [asset.interest_rate for asset in assets]
+        )
+        return sum(values) / len(values)
+
+
+class NumpyAverageEngine(AverageEngine):
+    """Vectorized pairwise summation over a float64 column."""
+
+    def mean(self, assets: AverageInput) -> float:
+        interest_rates = interest_rates_column(assets)
+        return float(interest_rates.sum()) / len(interest_rates)
+
+
+class FsumAverageEngine(AverageEngine):
+    """``math.fsum``: the sum is exactly rounded, whatever the magnitudes and
+    signs of the rates, at pure-Python speed."""
+
+    def mean(self, assets: AverageInput) -> float:
+        if isinstance(assets, np.ndarray):
+            return math.fsum(assets.tolist()) / len(assets)
+        return math.fsum(asset.interest_rate for asset in assets) / len(assets)
+
+
+def interest_rates_column(assets: AverageInput) -> NDArray[np.float64]:
+    if isinstance(assets, np.ndarray):
+        return assets.astype(np.float64, copy=False)
+    return np.fromiter(
+        (asset.interest_rate for asset in assets),
+        dtype=np.float64,
+        count=len(assets),
+    )
+
+
+def weighted_average(
+    interest_rates: NDArray[np.float64], amounts: NDArray[np.float64]
+) -> float | None:
+    """Mean of the rates weighted by ``amounts``; None if nothing has a weight.
+
+    The weight sum and the weighted rate sum come out of a single product of the
+    weights with a ``(1, rate)`` pair per asset.
+    """
+    weights = positive_weights(amounts)
+    if not weights.any():
+        return None
+    weight_sum, weighted_rate_sum = weights @ np.column_stack(
+        (np.ones_like(weights), interest_rates)
+    )
+    return float(weighted_rate_sum / weight_sum)
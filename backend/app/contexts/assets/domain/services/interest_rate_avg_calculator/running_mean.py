@@ -0,0 +1,122 @@
+import numpy as np
+from numpy.typing import NDArray
+
+from app.contexts.assets.domain.services.interest_rate_avg_calculator.errors import (
+    EmptyListError,
+)
+
+
+class RunningMean:
+    """Count and compensated sum of a stream of interest rates.
+
+    Values are folded in with Neumaier's variant of Kahan summation, so the mean
+    stays accurate over millions of additions and removals. Chunks are summed
+    pairwise by NumPy before being folded in.
+    """
+
+    __slots__ = ("_compensation", "_sum", "count")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self._sum = 0.0
+        self._compensation = 0.0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self._fold(value)
+
+    def add_many(self, values: NDArray[np.float64]) -> None:
+        if len(values) == 0:
+            return
+        self.count += len(values)
+        self._fold(float(np.sum(values)))
+
+    def remove(self, value: float) -> None:
+        self.count -= 1
+        self._fold(-value)
+
+    def remove_many(self, values: NDArray[np.float64]) -> None:
+        if len(values) == 0:
+            return
+        self.count -= len(values)
+        self._fold(-float(np.sum(values)))
+
+    @property
+    def total(self) -> float:
+        return self._sum + self._compensation
+
+    @property
+    def mean(self) -> float:
+        if self.count == 0:
+            raise EmptyListError()
+        return self.total / self.count
+
+    def _fold(self, value: float) -> None:
+        self._sum, self._compensation = _neumaier_add(
+            self._sum, self._compensation, value
+        )
+
+
+class RunningWeightedMean:
+    """Sum of weights and sum of weighted interest rates of a stream of assets.
+
+    Weights are the assets' principal amounts; a missing (NaN) amount weighs
+    nothing. Both sums are compensated like ``RunningMean``'s, and ``count``
+    tracks the assets with a positive weight, so the mean is undefined, rather
+    than a rounding residue, once none is left.
+    """
+
+    __slots__ = ("_weighted_rates", "_weights", "count")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self._weights = (0.0, 0.0)
+        self._weighted_rates = (0.0, 0.0)
+
+    def add_many(
+        self, values: NDArray[np.float64], amounts: NDArray[np.float64]
+    ) -> None:
+        self._fold(values, amounts, 1)
+
+    def remove_many(
+        self, values: NDArray[np.float64], amounts: NDArray[np.float64]
+    ) -> None:
+        self._fold(values, amounts, -1)
+
+    @property
+    def total_weight(self) -> float:
+        return sum(self._weights)
+
+    @property
+    def mean(self) -> float | None:
+        if self.count == 0:
+            return None
+        return sum(self._weighted_rates) / sum(self._weights)
+
+    def _fold(
+        self, values: NDArray[np.float64], amounts: NDArray[np.float64], sign: int
+    ) -> None:
+        if len(values) == 0:
+            return
+        weights = positive_weights(amounts)
+        self.count += sign * int(np.count_nonzero(weights))
+        self._weights = _neumaier_add(*self._weights, sign * float(np.sum(weights)))
+        self._weighted_rates = _neumaier_add(
+            *self._weighted_rates, sign * float(np.dot(values, weights))
+        )
+
+
+def positive_weights(amounts: NDArray[np.float64]) -> NDArray[np.float64]:
+    """The amounts as weights: missing (NaN) and non-positive amounts weigh 0."""
+    return np.where(amounts > 0, amounts, 0.0)
+
+
+def _neumaier_add(
+    total: float, compensation: float, value: float
+) -> tuple[float, float]:
+    new_total = total + value
+    if abs(total) >= abs(value):
+        compensation += (total - new_total) + value
+    else:
+        compensation += (value - new_total) + total
+    return new_total, compensation
@@ -1,16 +1,78 @@
-from typing import List
+from collections.abc import Sequence
+
+import numpy as np
+from numpy.typing import NDArray
 
 from app.contexts.assets.domain.entities.asset import Asset
+from app.contexts.assets.domain.services.interest_rate_avg_calculator.calibration import (
+    calibrated_numpy_min_size,
+)
+from app.contexts.assets.domain.services.interest_rate_avg_calculator.engines import (
+    AverageEngine,
+    FsumAverageEngine,
+    NumpyAverageEngine,
+    PythonAverageEngine,
+    weighted_average,
+)
 from app.contexts.assets.domain.services.interest_rate_avg_calculator.errors import (
     EmptyListError,
     InvalidListError,
 )
 
+ENGINES: dict[str, AverageEngine] = {
+    "python": PythonAverageEngine(),
+    "numpy": NumpyAverageEngine(),
+    "fsum": FsumAverageEngine(),
+}
+
 
 class InterestRateAvgCalculatorService:
-    def __call__(self, assets: List[Asset]) -> float:
+    """Averages interest rates with a pluggable engine.
+
+    ``engine`` names one of ``ENGINES``, or is ``"auto"`` to pick by input size:
+    the pure-Python engine below ``numpy_min_size`` rates, the NumPy one from
+    there on. Without a ``numpy_min_size`` the crossover is measured by a short
+    calibration benchmark, once per process. ``"fsum"`` trades speed for an
+    exactly rounded sum.
+
+    ``weighted_mean`` weighs every rate by its asset's principal amount.
+    """
+
+    def __init__(self, engine: str = "auto", numpy_min_size: int | None = None):
+        if engine != "auto" and engine not in ENGINES:
+            raise ValueError(f"Unknown average engine: {engine!r}")
+        self.engine = engine
+        self._numpy_min_size = numpy_min_size
+
+    @property
+    def numpy_min_size(self) -> int:
+        if self._numpy_min_size is None:
+            self._numpy_min_size = calibrated_numpy_min_size()
+        return self._numpy_min_size
+
+    def engine_for(self, size: int) -> AverageEngine:
+        if self.engine != "auto":
+            return ENGINES[self.engine]
+        return ENGINES["numpy" if size >= self.numpy_min_size else "python"]
+
+    def __call__(self, assets: Sequence[Asset] | NDArray[np.float64]) -> float:
         if assets is None:
             raise InvalidListError()
         if len(assets) == 0:
             raise EmptyListError()
-        return sum(asset.interest_rate for asset in assets) / len(assets)
+        if isinstance(assets, np.ndarray) and assets.ndim != 1:
+            raise InvalidListError()
+        return self.engine_for(len(assets)).mean(assets)
+
+    def weighted_mean(
+        self, interest_rates: NDArray[np.float64], amounts: NDArray[np.float64]
+    ) -> float | None:
+        """Average of the rates weighted by ``amounts``, None without any weight.
+
+        Missing (NaN) amounts weigh nothing.
+        """
+        if len(interest_rates) != len(amounts):
+            raise InvalidListError()
+        if len(interest_rates) == 0:
+            raise EmptyListError()
+        return weighted_average(interest_rates, amounts)
@@ -0,0 +1,185 @@
+from collections.abc import Mapping, Sequence
+from itertools import islice
+from typing import NamedTuple, Self
+
+import numpy as np
+from numpy.typing import NDArray
+
+# Tags given by name, each as the value of every asset; None where an asset
+# does not carry the tag
+TagValues = Mapping[str, Sequence[str | None]]
+
+
+class RateGroup(NamedTuple):
+    value: str
+    asset_count: int
+    rate_sum: float
+
+    @property
+    def avg_interest_rate(self) -> float | None:
+        return self.rate_sum / self.asset_count if self.asset_count else None
+
+
+class TagColumn:
+    """One tag of every asset, dictionary encoded.
+
+    Distinct values are numbered in order of appearance and the rows hold their
+    int32 codes, -1 for an asset without the tag. ``values`` only ever grows, so
+    codes stay valid whatever happens to the rows, and ``codes`` may be a buffer
+    longer than the list.
+    """
+
+    __slots__ = ("_code_of", "codes", "values")
+
+    def __init__(
+        self, values: list[str] | None = None, codes: NDArray[np.int32] | None = None
+    ):
+        self.values = [] if values is None else values
+        self.codes = np.empty(0, dtype=np.int32) if codes is None else codes
+        self._code_of = {value: code for code, value in enumerate(self.values)}
+
+    @classmethod
+    def from_values(cls, values: Sequence[str | None]) -> Self:
+        column = cls()
+        column.codes = column.encode(values)
+        return column
+
+    def encode(self, values: Sequence[str | None]) -> NDArray[np.int32]:
+        """Codes of ``values``, numbering the ones not seen before."""
+        code_of = self._code_of
+        codes = np.fromiter(
+            (
+                -1 if value is None else code_of.setdefault(value, len(code_of))
+                for value in values
+            ),
+            dtype=np.int32,
+            count=len(values),
+        )
+        if len(code_of) > len(self.values):
+            self.values.extend(islice(code_of, len(self.values), None))
+        return codes
+
+    def value_at(self, row: int) -> str | None:
+        code = int(self.codes[row])
+        return None if code < 0 else self.values[code]
+
+    def decoded(self) -> list[str | None]:
+        """The value of every row, None where it has none."""
+        values = self.values
+        return [None if code < 0 else values[code] for code in self.codes.tolist()]
+
+    def head(self, count: int) -> "TagColumn":
+        """The first ``count`` rows, sharing this column's values and codes."""
+        return self.rows(0, count)
+
+    def rows(self, start: int, stop: int) -> "TagColumn":
+        """Rows ``start`` to ``stop``, sharing this column's values and codes."""
+        column = TagColumn.__new__(TagColumn)
+        column.values, column._code_of = self.values, self._code_of
+        column.codes = self.codes[start:stop]
+        return column
+
+    def copy(self) -> "TagColumn":
+        return TagColumn(list(self.values), self.codes.copy())
+
+
+class GroupTable:
+    """Number and sum of the rates carrying each value of a tag, by code.
+
+    Tables are built with one ``bincount`` over the codes; changed rows are
+    folded in or out with unbuffered ``np.add.at``, which only touches their
+    groups.
+    """
+
+    __slots__ = ("counts", "sums")
+
+    def __init__(self, counts: NDArray[np.int64], sums: NDArray[np.float64]):
+        self.counts = counts
+        self.sums = sums
+
+    @classmethod
+    def empty(cls) -> Self:
+        return cls(np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float64))
+
+    @classmethod
+    def from_codes(
+        cls,
+        codes: NDArray[np.int32],
+        interest_rates: NDArray[np.float64],
+        group_count: int,
+    ) -> Self:
+        tagged = codes >= 0
+        codes = codes[tagged]
+        return cls(
+            np.bincount(codes, minlength=group_count).astype(np.int64),
+            np.bincount(
+                codes, weights=interest_rates[tagged], minlength=group_count
+            ).astype(np.float64),
+        )
+
+    def add_many(
+        self, codes: NDArray[np.int32], interest_rates: NDArray[np.float64]
+    ) -> None:
+        self._fold(codes, interest_rates, 1)
+
+    def remove_many(
+        self, codes: NDArray[np.int32], interest_rates: NDArray[np.float64]
+    ) -> None:
+        self._fold(codes, interest_rates, -1)
+
+    def groups(self, values: Sequence[str]) -> list[RateGroup]:
+        """The non-empty groups, by value."""
+        counts, sums = self.counts.tolist(), self.sums.tolist()
+        return sorted(
+            RateGroup(values[code], counts[code], sums[code])
+            for code in np.flatnonzero(self.counts).tolist()
+        )
+
+    def _fold(
+        self, codes: NDArray[np.int32], interest_rates: NDArray[np.float64], sign: int
+    ) -> None:
+        tagged = codes >= 0
+        codes = codes[tagged]
+        if len(codes) == 0:
+            return
+        size = int(codes.max()) + 1
+        if size > len(self.counts):
+            # Values first seen in this change
+            self.counts = np.concatenate(
+                (self.counts, np.zeros(size - len(self.counts), np.int64))
+            )
+            self.sums = np.concatenate(
+                (self.sums, np.zeros(size - len(self.sums), np.float64))
+            )
+        np.add.at(self.counts, codes, sign)
+        np.add.at(
+            self.sums, codes, sign * np.asarray(interest_rates, np.float64)[tagged]
+        )
+
+
+def tag_values(asset_tags: Sequence[Mapping[str, str]]) -> dict[str, list[str | None]]:
+    """Tag columns of assets given as one name -> value mapping each."""
+    names = dict.fromkeys(name for tags in asset_tags for name in tags)
+    return {name: [tags.get(name) for tags in asset_tags] for name in names}
+
+
+def encode_tags(tags: TagValues, count: int) -> dict[str, TagColumn]:
+    """Dictionary-encode tag values given for ``count`` assets."""
+    for name, values in tags.items():
+        if len(values) != count:
+            raise ValueError(f"tag {name!r} must be aligned with the other columns")
+    return {name: TagColumn.from_values(values) for name, values in tags.items()}
+
+
+def build_group_tables(
+    tag_columns: Mapping[str, TagColumn], interest_rates: NDArray[np.float64]
+) -> dict[str, GroupTable]:
+    """Per tag, the count and sum of the rates of every value, in one
+    vectorized pass over the codes."""
+    count = len(interest_rates)
+    return {
+        name: GroupTable.from_codes(
+            column.codes[:count], interest_rates, len(column.values)
+        )
+        for name, column in tag_columns.items()
+    }
@@ -0,0 +1,192 @@
+import struct
+from typing import NamedTuple, Self
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from app.contexts.assets.domain.services.rate_index.sorted_rate_index import (
+    SortedRateIndex,
+)
+
+# Number of buckets and the counts of rates below and above the edges, followed
+# by the edges, the counts and the rate sums as little-endian columns
+_HEADER = struct.Struct("<Iqq")
+
+
+class RateHistogram:
+    """Number and sum of the rates in every bucket between ascending ``edges``.
+
+    Buckets are half-open but the last, which includes the top edge. The edges
+    are fixed when the histogram is built; rates added later outside of them are
+    counted in ``below`` and ``above``, so folding rates in or out only locates
+    their buckets.
+    """
+
+    __slots__ = ("above", "below", "counts", "edges", "sums")
+
+    def __init__(
+        self,
+        edges: NDArray[np.float64],
+        counts: NDArray[np.int64],
+        sums: NDArray[np.float64],
+        below: int = 0,
+        above: int = 0,
+    ):
+        if len(edges) != len(counts) + 1 or len(counts) != len(sums):
+            raise ValueError("a histogram needs one more edge than buckets")
+        self.edges = edges
+        self.counts = counts
+        self.sums = sums
+        self.below = below
+        self.above = above
+
+    @classmethod
+    def from_index(cls, rate_index: SortedRateIndex, edges: ArrayLike) -> Self:
+        """Count the indexed rates into buckets between ``edges``.
+
+        Repeated edges are merged, and the sorted rates and their prefix sums
+        give every bucket's count and sum in one binary search per edge.
+        """
+        edges = np.unique(np.asarray(edges, dtype=np.float64))
+        if len(edges) == 1:
+            # All rates are equal: one bucket of zero width
+            edges = np.repeat(edges, 2)
+        sorted_rates = rate_index.sorted_rates
+        positions = np.searchsorted(sorted_rates, edges, side="left")
+        positions[-1] = np.searchsorted(sorted_rates, edges[-1], side="right")
+        prefix_sums = rate_index.prefix_sums[positions]
+        return cls(
+            edges,
+            np.diff(positions).astype(np.int64),
+            np.diff(prefix_sums),
+            int(positions[0]),
+            len(sorted_rates) - int(positions[-1]),
+        )
+
+    @classmethod
+    def fixed_width(cls, rate_index: SortedRateIndex, bucket_count: int) -> Self:
+        """``bucket_count`` buckets of equal width from the lowest to the
+        highest rate."""
+        sorted_rates = rate_index.sorted_rates
+        return cls.from_index(
+            rate_index,
+            np.linspace(sorted_rates[0], sorted_rates[-1], bucket_count + 1),
+        )
+
+    @classmethod
+    def quantiles(cls, rate_index: SortedRateIndex, bucket_count: int) -> Self:
+        """``bucket_count`` buckets holding about as many rates each."""
+        sorted_rates = rate_index.sorted_rates
+        # Linearly interpolated quantiles, read straight off the sorted rates
+        positions = np.linspace(0, len(sorted_rates) - 1, bucket_count + 1)
+        lower = np.floor(positions).astype(np.intp)
+        upper = np.minimum(lower + 1, len(sorted_rates) - 1)
+        edges = sorted_rates[lower] + (positions - lower) * (
+            sorted_rates[upper] - sorted_rates[lower]
+        )
+        return cls.from_index(rate_index, edges)
+
+    def copy(self) -> "RateHistogram":
+        return RateHistogram(
+            self.edges.copy(),
+            self.counts.copy(),
+            self.sums.copy(),
+            self.below,
+            self.above,
+        )
+
+    def add_many(self, values: NDArray[np.float64]) -> None:
+        self._fold(values, 1)
+
+    def remove_many(self, values: NDArray[np.float64]) -> None:
+        self._fold(values, -1)
+
+    def _fold(self, values: NDArray[np.float64], sign: int) -> None:
+        if len(values) == 0:
+            return
+        values = np.asarray(values, dtype=np.float64)
+        bucket_count = len(self.counts)
+        buckets = np.searchsorted(self.edges, values, side="right") - 1
+        buckets[values == self.edges[-1]] = bucket_count - 1
+        below = buckets < 0
+        above = buckets >= bucket_count
+        inside = ~(below | above)
+        self.counts += sign * np.bincount(
+            buckets[inside], minlength=bucket_count
+        ).astype(np.int64)
+        self.sums += sign * np.bincount(
+            buckets[inside], weights=values[inside], minlength=bucket_count
+        )
+        self.below += sign * int(np.count_nonzero(below))
+        self.above += sign * int(np.count_nonzero(above))
+
+    def to_bytes(self) -> bytes:
+        return (
+            _HEADER.pack(len(self.counts), self.below, self.above)
+            + self.edges.astype("<f8").tobytes()
+            + self.counts.astype("<i8").tobytes()
+            + self.sums.astype("<f8").tobytes()
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes, offset: int = 0) -> tuple[Self, int]:
+        """The histogram at ``offset`` and the offset just past it."""
+        bucket_count, below, above = _HEADER.unpack_from(data, offset)
+        offset += _HEADER.size
+        edges = np.frombuffer(data, "<f8", bucket_count + 1, offset)
+        offset += edges.nbytes
+        counts = np.frombuffer(data, "<i8", bucket_count, offset)
+        offset += counts.nbytes
+        sums = np.frombuffer(data, "<f8", bucket_count, offset)
+        offset += sums.nbytes
+        histogram = cls(
+            edges.astype(np.float64),
+            counts.astype(np.int64),
+            sums.astype(np.float64),
+            below,
+            above,
+        )
+        return histogram, offset
+
+
+class RateHistograms(NamedTuple):
+    """The fixed-width and the quantile histogram of one list's rates."""
+
+    fixed_width: RateHistogram
+    quantile: RateHistogram
+
+    def copy(self) -> "RateHistograms":
+        return RateHistograms(self.fixed_width.copy(), self.quantile.copy())
+
+    def add_many(self, values: NDArray[np.float64]) -> None:
+        for histogram in self:
+            histogram.add_many(values)
+
+    def remove_many(self, values: NDArray[np.float64]) -> None:
+        for histogram in self:
+            histogram.remove_many(values)
+
+    def to_bytes(self) -> bytes:
+        return b"".join(histogram.to_bytes() for histogram in self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "RateHistograms":
+        fixed_width, offset = RateHistogram.from_bytes(data)
+        quantile, _ = RateHistogram.from_bytes(data, offset)
+        return cls(fixed_width, quantile)
+
+
+class HistogramSpec(NamedTuple):
+    """How many buckets each histogram of a list gets."""
+
+    bucket_count: int = 20
+    quantile_count: int = 10
+
+    def build(self, rate_index: SortedRateIndex) -> RateHistograms | None:
+        """Both histograms of the indexed rates; None without any rate."""
+        if len(rate_index) == 0:
+            return None
+        return RateHistograms(
+            RateHistogram.fixed_width(rate_index, self.bucket_count),
+            RateHistogram.quantiles(rate_index, self.quantile_count),
+        )
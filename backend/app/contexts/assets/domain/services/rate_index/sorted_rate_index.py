@@ -0,0 +1,84 @@
+from typing import NamedTuple, Self
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+class RateRange(NamedTuple):
+    asset_count: int
+    rate_sum: float
+
+    @property
+    def avg_interest_rate(self) -> float | None:
+        return self.rate_sum / self.asset_count if self.asset_count else None
+
+
+class SortedRateIndex:
+    """Interest rates in ascending order, with their rows and prefix sums;
+    ``prefix_sums[i]`` is the sum of the ``i`` lowest rates.
+
+    Counting and summing the rates within a range takes two binary searches and
+    one subtraction of prefix sums, and the k lowest or highest rates are the
+    ends of the order. Ties keep their row order.
+    """
+
+    __slots__ = ("prefix_sums", "rows", "sorted_rates")
+
+    def __init__(
+        self,
+        rows: NDArray[np.intp],
+        sorted_rates: NDArray[np.float64],
+        prefix_sums: NDArray[np.float64],
+    ):
+        self.rows = rows
+        self.sorted_rates = sorted_rates
+        self.prefix_sums = prefix_sums
+
+    @classmethod
+    def from_rates(cls, interest_rates: NDArray[np.float64]) -> Self:
+        rows = np.argsort(interest_rates, kind="stable")
+        return cls._from_order(rows, interest_rates[rows])
+
+    @classmethod
+    def from_sorted_runs(
+        cls, interest_rates: NDArray[np.float64], rows: NDArray[np.intp]
+    ) -> Self:
+        """Index of ``interest_rates`` given all ``rows`` as consecutive runs, each
+        already in rate order, such as chunks sorted by separate workers.
+
+        A stable sort of sorted runs only merges them, which is several times
+        faster than sorting from scratch, and gives the order of ``from_rates``.
+        """
+        runs = interest_rates[rows]
+        merge = np.argsort(runs, kind="stable")
+        return cls._from_order(rows[merge], runs[merge])
+
+    @classmethod
+    def _from_order(
+        cls, rows: NDArray[np.intp], sorted_rates: NDArray[np.float64]
+    ) -> Self:
+        prefix_sums = np.empty(len(sorted_rates) + 1, dtype=np.float64)
+        prefix_sums[0] = 0.0
+        np.cumsum(sorted_rates, out=prefix_sums[1:])
+        return cls(rows, sorted_rates, prefix_sums)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def range(self, min_rate: float, max_rate: float) -> RateRange:
+        """Count and sum of the rates in ``[min_rate, max_rate]``."""
+        start = int(np.searchsorted(self.sorted_rates, min_rate, side="left"))
+        stop = int(np.searchsorted(self.sorted_rates, max_rate, side="right"))
+        if stop <= start:
+            return RateRange(0, 0.0)
+        return RateRange(
+            stop - start, float(self.prefix_sums[stop] - self.prefix_sums[start])
+        )
+
+    def lowest_rows(self, k: int) -> NDArray[np.intp]:
+        """Rows of the ``k`` lowest rates, lowest first."""
+        return self.rows[: max(k, 0)]
+
+    def highest_rows(self, k: int) -> NDArray[np.intp]:
+        """Rows of the ``k`` highest rates, highest first."""
+        return self.rows[::-1][: max(k, 0)]
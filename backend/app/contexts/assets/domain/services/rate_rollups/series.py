@@ -0,0 +1,106 @@
+from bisect import bisect_left, bisect_right
+from enum import StrEnum
+from typing import NamedTuple
+
+
+class Resolution(StrEnum):
+    MINUTE = "minute"
+    HOUR = "hour"
+    DAY = "day"
+
+    @property
+    def seconds(self) -> int:
+        return _SECONDS[self]
+
+
+_SECONDS = {Resolution.MINUTE: 60, Resolution.HOUR: 3600, Resolution.DAY: 86400}
+
+
+class RollupPoint(NamedTuple):
+    # Unix time the bucket starts at
+    start: float
+    min: float
+    max: float
+    # Of the values recorded in the bucket
+    mean: float
+    last: float
+    value_count: int
+
+
+class RollupSeries:
+    """A stream of values downsampled into buckets of ``width`` seconds, each
+    keeping the min, max, sum, count and last of its values.
+
+    Buckets are aligned on multiples of ``width`` since the Unix epoch and only
+    exist once a value falls in them. Values come in time order, so recording
+    one updates the last bucket or appends the next. The bucket starts are kept
+    sorted next to the statistics, and a range read finds its first and last
+    bucket by binary search and only reads the buckets in between.
+    """
+
+    __slots__ = ("counts", "lasts", "maxs", "mins", "starts", "sums", "width")
+
+    def __init__(self, width: int):
+        self.width = width
+        self.starts: list[float] = []
+        self.mins: list[float] = []
+        self.maxs: list[float] = []
+        self.sums: list[float] = []
+        self.counts: list[int] = []
+        self.lasts: list[float] = []
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def add(self, timestamp: float, value: float) -> None:
+        """Record ``value`` at ``timestamp``, no earlier than the last one."""
+        start = timestamp - timestamp % self.width
+        if self.starts and self.starts[-1] == start:
+            self.mins[-1] = min(self.mins[-1], value)
+            self.maxs[-1] = max(self.maxs[-1], value)
+            self.sums[-1] += value
+            self.counts[-1] += 1
+            self.lasts[-1] = value
+            return
+        if self.starts and start < self.starts[-1]:
+            raise ValueError("values must be recorded in time order")
+        self.starts.append(start)
+        self.mins.append(value)
+        self.maxs.append(value)
+        self.sums.append(value)
+        self.counts.append(1)
+        self.lasts.append(value)
+
+    def points(
+        self, start: float | None = None, end: float | None = None
+    ) -> list[RollupPoint]:
+        """The buckets overlapping ``[start, end]``, oldest first."""
+        first = (
+            0 if start is None else bisect_left(self.starts, start - start % self.width)
+        )
+        stop = len(self.starts) if end is None else bisect_right(self.starts, end)
+        return [
+            RollupPoint(
+                self.starts[i],
+                self.mins[i],
+                self.maxs[i],
+                self.sums[i] / self.counts[i],
+                self.lasts[i],
+                self.counts[i],
+            )
+            for i in range(first, stop)
+        ]
+
+    def prune(self, before: float) -> None:
+        """Drop the buckets that end at or before ``before``."""
+        dropped = bisect_right(self.starts, before - self.width)
+        if dropped:
+            for column in (
+                self.starts,
+                self.mins,
+                self.maxs,
+                self.sums,
+                self.counts,
+                self.lasts,
+            ):
+                del column[:dropped]
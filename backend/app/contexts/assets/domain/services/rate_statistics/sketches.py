@@ -0,0 +1,253 @@
+import math
+import struct
+from typing import NamedTuple, Self
+
+import numpy as np
+from numpy.typing import NDArray
+
+# Count, mean, M2, min and max of the moments, the digest's compression and its
+# number of centroids, whose means and weights follow as float64 columns
+_HEADER = struct.Struct("<QdddddI")
+
+
+class RateStatistics(NamedTuple):
+    asset_count: int
+    min: float
+    max: float
+    mean: float
+    # Population standard deviation
+    std: float
+    median: float
+    p90: float
+    p99: float
+
+
+class Moments:
+    """Count, mean, sum of squared deviations (M2), min and max of a stream.
+
+    Chunks are reduced by NumPy on their own and folded in with Chan's update of
+    Welford's algorithm, which is also how two ``Moments`` merge, so the result
+    does not depend on how the stream was split.
+    """
+
+    __slots__ = ("count", "m2", "max", "mean", "min")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add_many(self, values: NDArray[np.float64]) -> None:
+        if len(values) == 0:
+            return
+        chunk = Moments()
+        chunk.count = len(values)
+        chunk.mean = float(np.mean(values))
+        chunk.m2 = float(np.sum(np.square(values - chunk.mean)))
+        chunk.min = float(np.min(values))
+        chunk.max = float(np.max(values))
+        self.merge(chunk)
+
+    def merge(self, other: "Moments") -> None:
+        if other.count == 0:
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.m2 / self.count) if self.count else math.nan
+
+
+class TDigest:
+    """Merging t-digest: the sorted values summarized as weighted centroids.
+
+    Centroids are small at both tails and larger around the median, following
+    the ``k1`` scale function, so extreme quantiles keep a fine resolution. New
+    values are buffered and merged in sorted batches, one vectorized pass per
+    ``buffer_size`` values, which keeps about ``compression / 2`` centroids
+    whatever the number of values. Two digests merge by pooling their
+    centroids.
+    """
+
+    __slots__ = ("_buffer", "_buffered", "_means", "_weights", "compression")
+
+    def __init__(self, compression: float = 200.0):
+        self.compression = compression
+        self._means: NDArray[np.float64] = np.empty(0)
+        self._weights: NDArray[np.float64] = np.empty(0)
+        # Unmerged (means, weights) batches
+        self._buffer: list[tuple[NDArray[np.float64], NDArray[np.float64]]] = []
+        self._buffered = 0
+
+    @property
+    def buffer_size(self) -> int:
+        return int(10 * self.compression)
+
+    def centroids(self) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """Sorted centroid means and their weights."""
+        self._compress()
+        return self._means, self._weights
+
+    def add_many(self, values: NDArray[np.float64]) -> None:
+        # Copied, since the caller's column may change after this returns
+        values = np.array(values, dtype=np.float64)
+        self._add_centroids(values, np.ones_like(values))
+
+    def merge(self, other: "TDigest") -> None:
+        self.merge_centroids(*other.centroids())
+
+    def merge_centroids(
+        self, means: NDArray[np.float64], weights: NDArray[np.float64]
+    ) -> None:
+        """Merge centroids given as aligned mean and weight columns."""
+        self._add_centroids(means, weights)
+
+    def quantile(self, q: float, min_value: float, max_value: float) -> float:
+        """Estimate of the ``q`` quantile, given the exact extremes.
+
+        Each centroid stands at the middle of the ranks it covers; ranks in
+        between are interpolated, and the extremes pin both ends.
+        """
+        means, weights = self.centroids()
+        if len(means) == 0:
+            return math.nan
+        total = float(np.sum(weights))
+        centres = np.cumsum(weights) - weights / 2
+        return float(
+            np.interp(
+                q * total,
+                np.concatenate(([0.0], centres, [total])),
+                np.concatenate(([min_value], means, [max_value])),
+            )
+        )
+
+    def _add_centroids(
+        self, means: NDArray[np.float64], weights: NDArray[np.float64]
+    ) -> None:
+        if len(means) == 0:
+            return
+        self._buffer.append((means, weights))
+        self._buffered += len(means)
+        if self._buffered >= self.buffer_size:
+            self._compress()
+
+    def _compress(self) -> None:
+        if not self._buffer:
+            return
+        means = np.concatenate([self._means, *(batch for batch, _ in self._buffer)])
+        weights = np.concatenate([self._weights, *(batch for _, batch in self._buffer)])
+        self._buffer, self._buffered = [], 0
+        order = np.argsort(means, kind="stable")
+        means, weights = means[order], weights[order]
+
+        # Centroids whose middle ranks fall in the same unit of the scale
+        # function k(q) = compression / (2 pi) * asin(2q - 1) are pooled
+        total = float(np.sum(weights))
+        q = (np.cumsum(weights) - weights / 2) / total
+        k = self.compression / (2 * math.pi) * np.arcsin(np.clip(2 * q - 1, -1, 1))
+        clusters = np.floor(k)
+        starts = np.flatnonzero(np.diff(clusters, prepend=-math.inf))
+        self._weights = np.add.reduceat(weights, starts)
+        self._means = np.add.reduceat(means * weights, starts) / self._weights
+
+
+class RateSketch:
+    """Mergeable summary of an interest rate column: exact ``Moments`` and a
+    ``TDigest`` for the quantiles.
+
+    Its size does not depend on the number of rates, so statistics are read in
+    constant time, and sketches of separate chunks or shards merge into the
+    sketch of their union. Rates cannot be taken out again: a sketch is rebuilt
+    when rates are updated or removed.
+    """
+
+    __slots__ = ("_statistics", "digest", "moments")
+
+    def __init__(self, compression: float = 200.0):
+        self.moments = Moments()
+        self.digest = TDigest(compression)
+        self._statistics: RateStatistics | None = None
+
+    @classmethod
+    def from_values(
+        cls, values: NDArray[np.float64], compression: float = 200.0
+    ) -> Self:
+        sketch = cls(compression)
+        sketch.add_many(values)
+        return sketch
+
+    @property
+    def count(self) -> int:
+        return self.moments.count
+
+    def add_many(self, values: NDArray[np.float64]) -> None:
+        self.moments.add_many(values)
+        self.digest.add_many(values)
+        self._statistics = None
+
+    def merge(self, other: "RateSketch") -> None:
+        self.moments.merge(other.moments)
+        self.digest.merge(other.digest)
+        self._statistics = None
+
+    def statistics(self) -> RateStatistics | None:
+        """Distribution of the rates; None while there is none."""
+        moments = self.moments
+        if moments.count == 0:
+            return None
+        if self._statistics is None:
+            median, p90, p99 = (
+                self.digest.quantile(q, moments.min, moments.max)
+                for q in (0.5, 0.9, 0.99)
+            )
+            self._statistics = RateStatistics(
+                moments.count,
+                moments.min,
+                moments.max,
+                moments.mean,
+                moments.std,
+                median,
+                p90,
+                p99,
+            )
+        return self._statistics
+
+    def to_bytes(self) -> bytes:
+        means, weights = self.digest.centroids()
+        moments = self.moments
+        return (
+            _HEADER.pack(
+                moments.count,
+                moments.mean,
+                moments.m2,
+                moments.min,
+                moments.max,
+                self.digest.compression,
+                len(means),
+            )
+            + means.astype("<f8").tobytes()
+            + weights.astype("<f8").tobytes()
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self:
+        (count, mean, m2, min_value, max_value, compression, centroids) = (
+            _HEADER.unpack_from(data)
+        )
+        sketch = cls(compression)
+        moments = sketch.moments
+        moments.count, moments.mean, moments.m2 = count, mean, m2
+        moments.min, moments.max = min_value, max_value
+        columns = np.frombuffer(
+            data, dtype="<f8", count=2 * centroids, offset=_HEADER.size
+        ).astype(np.float64)
+        sketch.digest.merge_centroids(columns[:centroids], columns[centroids:])
+        return sketch
@@ -0,0 +1,131 @@
+from collections.abc import Collection, Mapping, Sequence
+from typing import NamedTuple
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from app.contexts.assets.domain.entities.errors import (
+    AssetNotFoundError,
+    DuplicateAssetIdError,
+)
+
+
+class ScenarioDeltas:
+    """Hypothetical changes to a list, for ``scenario_count`` scenarios at once.
+
+    The changes of every scenario are flattened into columns: scenario ``i``
+    adds the assets whose ``added_scenarios`` entry is ``i`` and removes the
+    stored assets whose ``removed_scenarios`` entry is ``i``.
+    """
+
+    __slots__ = (
+        "added_ids",
+        "added_rates",
+        "added_scenarios",
+        "removed_ids",
+        "removed_scenarios",
+        "scenario_count",
+    )
+
+    def __init__(
+        self,
+        scenario_count: int,
+        added_scenarios: ArrayLike,
+        added_ids: Sequence[str],
+        added_rates: ArrayLike,
+        removed_scenarios: ArrayLike,
+        removed_ids: Sequence[str],
+    ):
+        self.scenario_count = scenario_count
+        self.added_scenarios = np.asarray(added_scenarios, dtype=np.intp)
+        self.added_ids = added_ids
+        self.added_rates = np.asarray(added_rates, dtype=np.float64)
+        self.removed_scenarios = np.asarray(removed_scenarios, dtype=np.intp)
+        self.removed_ids = removed_ids
+        if not (
+            len(self.added_scenarios) == len(added_ids) == len(self.added_rates)
+            and len(self.removed_scenarios) == len(removed_ids)
+        ):
+            raise ValueError("scenario columns must be aligned")
+        for scenarios in (self.added_scenarios, self.removed_scenarios):
+            if len(scenarios) and not (
+                0 <= scenarios.min() and scenarios.max() < scenario_count
+            ):
+                raise ValueError("scenarios must be numbered from 0")
+
+    def asset_ids(self) -> set[str]:
+        """Every id added or removed by some scenario."""
+        return {*self.added_ids, *self.removed_ids}
+
+    def validate(self, stored_ids: Collection[str]) -> None:
+        """Check every scenario applies to a list of ``stored_ids``: it only
+        removes stored assets, each once, and only adds ids it leaves free."""
+        missing = [
+            asset_id for asset_id in self.removed_ids if asset_id not in stored_ids
+        ]
+        if missing:
+            raise AssetNotFoundError(list(dict.fromkeys(missing)))
+
+        removed: set[tuple[int, str]] = set()
+        duplicates: dict[str, None] = {}
+        for key in zip(self.removed_scenarios.tolist(), self.removed_ids):
+            if key in removed:
+                duplicates[key[1]] = None
+            removed.add(key)
+        added: set[tuple[int, str]] = set()
+        for key in zip(self.added_scenarios.tolist(), self.added_ids):
+            if key in added or (key[1] in stored_ids and key not in removed):
+                duplicates[key[1]] = None
+            added.add(key)
+        if duplicates:
+            raise DuplicateAssetIdError(list(duplicates))
+
+
+class ScenarioOutcomes(NamedTuple):
+    """Number of assets and rate sum of the list after each scenario."""
+
+    asset_counts: NDArray[np.int64]
+    rate_sums: NDArray[np.float64]
+
+    @property
+    def avg_interest_rates(self) -> NDArray[np.float64]:
+        """Average rate after each scenario, NaN where no asset is left."""
+        counts = self.asset_counts
+        averages = np.full(len(counts), np.nan)
+        np.divide(self.rate_sums, counts, out=averages, where=counts > 0)
+        return averages
+
+
+def evaluate_scenarios(
+    deltas: ScenarioDeltas,
+    asset_count: int,
+    rate_sum: float,
+    stored_rates: Mapping[str, float],
+) -> ScenarioOutcomes:
+    """Count and rate sum of a list of ``asset_count`` rates summing to
+    ``rate_sum`` after each scenario, without applying any of them.
+
+    ``stored_rates`` holds the rates of the ids the scenarios refer to that
+    are in the list. Added and removed rates are summed per scenario with one
+    ``bincount`` each, so the cost grows with the size of the deltas and not
+    with the list's.
+    """
+    deltas.validate(stored_rates)
+    removed_rates = np.fromiter(
+        (stored_rates[asset_id] for asset_id in deltas.removed_ids),
+        dtype=np.float64,
+        count=len(deltas.removed_ids),
+    )
+    size = deltas.scenario_count
+    added, removed = deltas.added_scenarios, deltas.removed_scenarios
+    asset_counts = (
+        asset_count
+        + np.bincount(added, minlength=size)
+        - np.bincount(removed, minlength=size)
+    ).astype(np.int64)
+    rate_sums = (
+        rate_sum
+        + np.bincount(added, weights=deltas.added_rates, minlength=size)
+        - np.bincount(removed, weights=removed_rates, minlength=size)
+    )
+    return ScenarioOutcomes(asset_counts, rate_sums)
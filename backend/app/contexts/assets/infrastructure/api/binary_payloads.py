@@ -0,0 +1,157 @@
+import functools
+import importlib.util
+from typing import Any
+
+import msgspec
+import numpy as np
+from numpy.typing import NDArray
+
+from app.contexts.assets.infrastructure.api.dtos import AssetsChunk
+from app.contexts.assets.infrastructure.api.errors import InvalidPayloadError
+
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+MSGPACK_MEDIA_TYPES = frozenset(
+    {"application/msgpack", "application/x-msgpack", "application/vnd.msgpack"}
+)
+
+
+@functools.cache
+def arrow_available() -> bool:
+    # pyarrow is an optional dependency (the "arrow" extra)
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+class _MsgpackColumns(msgspec.Struct):
+    id: list[str]
+    # Either an array of numbers or the little-endian float64 column as raw bytes
+    interest_rate: bytes | list[float]
+    # Likewise, with nil (or NaN) for an asset without an amount
+    amount: bytes | list[float | None] | None = None
+
+
+_msgpack_decoder = msgspec.msgpack.Decoder(_MsgpackColumns)
+
+
+def parse_msgpack_columns(body: bytes) -> AssetsChunk:
+    """Decode a MessagePack map of an ``id`` and an ``interest_rate`` column,
+    and optionally an ``amount`` column.
+
+    A numeric column sent as ``bin`` is adopted as a float64 array without
+    converting its values.
+    """
+    try:
+        columns = _msgpack_decoder.decode(body)
+    except msgspec.DecodeError as e:
+        raise InvalidPayloadError([_error((), str(e))])
+
+    rates = _msgpack_column("interest_rate", columns.interest_rate)
+    amounts = (
+        None if columns.amount is None else _msgpack_column("amount", columns.amount)
+    )
+    return _aligned(columns.id, rates, amounts)
+
+
+def _msgpack_column(
+    name: str, column: bytes | list[float] | list[float | None]
+) -> NDArray[np.float64]:
+    if not isinstance(column, bytes):
+        # None becomes NaN
+        return np.array(column, dtype=np.float64)
+    if len(column) % 8:
+        raise InvalidPayloadError(
+            [_error((name,), f"Binary {name} values must be 8-byte float64s")]
+        )
+    return np.frombuffer(column, dtype="<f8").astype(np.float64, copy=False)
+
+
+def parse_arrow_columns(body: bytes) -> AssetsChunk:
+    """Read an Arrow IPC stream with a string ``id`` and a numeric
+    ``interest_rate`` column, and optionally a numeric ``amount`` column whose
+    nulls mean no amount.
+
+    The record batches are mapped over the body; a single-chunk float64 rate
+    column without nulls becomes a NumPy array over that same buffer.
+    """
+    import pyarrow as pa
+
+    try:
+        table = pa.ipc.open_stream(pa.py_buffer(body)).read_all()
+    except (pa.ArrowInvalid, OSError) as e:
+        raise InvalidPayloadError([_error((), f"Invalid Arrow IPC stream: {e}")])
+
+    errors = []
+    for name in ("id", "interest_rate"):
+        if name not in table.column_names:
+            errors.append(_error((name,), "Field required", "missing"))
+        elif table.column(name).null_count:
+            errors.append(_error((name,), "Column must not contain nulls"))
+    if errors:
+        raise InvalidPayloadError(errors)
+
+    ids = table.column("id")
+    if not (
+        pa.types.is_string(ids.type)
+        or pa.types.is_large_string(ids.type)
+        or pa.types.is_string_view(ids.type)
+    ):
+        errors.append(_error(("id",), f"Expected a string column, got {ids.type}"))
+    rates = table.column("interest_rate")
+    if not (pa.types.is_floating(rates.type) or pa.types.is_integer(rates.type)):
+        errors.append(
+            _error(("interest_rate",), f"Expected a numeric column, got {rates.type}")
+        )
+    amounts = table.column("amount") if "amount" in table.column_names else None
+    if amounts is not None and not (
+        pa.types.is_floating(amounts.type) or pa.types.is_integer(amounts.type)
+    ):
+        errors.append(
+            _error(("amount",), f"Expected a numeric column, got {amounts.type}")
+        )
+    if errors:
+        raise InvalidPayloadError(errors)
+
+    if rates.type != pa.float64():
+        rates = rates.cast(pa.float64())
+    return _aligned(
+        ids.to_pylist(),
+        rates.to_numpy(),
+        None
+        if amounts is None
+        # Nulls come out as NaN
+        else amounts.cast(pa.float64()).to_numpy(zero_copy_only=False),
+    )
+
+
+def _aligned(
+    asset_ids: list[str],
+    interest_rates: NDArray[np.float64],
+    amounts: NDArray[np.float64] | None = None,
+) -> AssetsChunk:
+    errors = []
+    if len(interest_rates) != len(asset_ids):
+        errors.append(
+            _error(
+                ("interest_rate",),
+                f"Expected {len(asset_ids)} rates, one per id, "
+                f"got {len(interest_rates)}",
+            )
+        )
+    if amounts is not None and len(amounts) != len(asset_ids):
+        errors.append(
+            _error(
+                ("amount",),
+                f"Expected {len(asset_ids)} amounts, one per id, got {len(amounts)}",
+            )
+        )
+    elif amounts is not None and (amounts < 0).any():
+        errors.append(_error(("amount",), "Amounts must not be negative"))
+    if errors:
+        raise InvalidPayloadError(errors)
+    return AssetsChunk(asset_ids, interest_rates, amounts)
+
+
+def _error(
+    loc: tuple[str, ...], msg: str, error_type: str = "value_error"
+) -> dict[str, Any]:
+    # Shaped like pydantic's errors, which FastAPI reports as they are
+    return {"type": error_type, "loc": loc, "msg": msg, "input": None}
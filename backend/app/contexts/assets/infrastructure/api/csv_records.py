@@ -0,0 +1,273 @@
+import asyncio
+import csv
+import io
+import math
+from collections.abc import AsyncIterable, AsyncIterator, Iterator
+from concurrent.futures import Executor
+from typing import NoReturn
+
+import numpy as np
+
+from app.contexts.assets.infrastructure.api.dtos import AssetsChunk
+from app.contexts.assets.infrastructure.api.errors import (
+    InvalidRecordError,
+    InvalidRecordsError,
+)
+
+ID_COLUMN = "id"
+INTEREST_RATE_COLUMN = "interest_rate"
+AMOUNT_COLUMN = "amount"
+
+
+async def iter_csv_asset_chunks(
+    byte_stream: AsyncIterable[bytes],
+    chunk_size: int,
+    max_errors: int = 100,
+    executor: Executor | None = None,
+    block_size: int = 1 << 18,
+) -> AsyncIterator[AssetsChunk]:
+    """Parse a UTF-8 CSV stream of assets into column chunks.
+
+    The first non-blank row is a header naming an ``id`` and an
+    ``interest_rate`` column, and optionally an ``amount`` column whose empty
+    fields mean no amount; other columns are ignored. The stream is cut at
+    line ends outside quoted fields into blocks of at least ``block_size``
+    bytes, which are parsed one at a time on ``executor`` (None: the event
+    loop's default one), as parsing holds the GIL. Only a block and up to
+    ``chunk_size`` parsed rows are held at once. Chunks have exactly
+    ``chunk_size`` rows but the last. Blank lines are skipped.
+
+    Invalid rows are collected with their 1-based line numbers. No chunk is
+    yielded after the first one, and ``InvalidRecordsError`` is raised once
+    the stream ends or ``max_errors`` rows were rejected.
+    """
+    loop = asyncio.get_running_loop()
+    parser = _CsvColumnsParser(max_errors)
+    rows = _RowsBuffer(chunk_size)
+
+    async def parse(data: bytes) -> Iterator[AssetsChunk]:
+        nonlocal parser
+        # A process pool hands back a parsed copy of the parser
+        parser, parsed = await loop.run_in_executor(executor, parser.parse, data)
+        if parser.errors:
+            rows.clear()
+        elif parsed is not None:
+            rows.add(parsed)
+        return rows.full_chunks()
+
+    pending = b""
+    async for data in byte_stream:
+        pending += data
+        end = _records_end(pending) if len(pending) >= block_size else 0
+        if end:
+            for chunk in await parse(pending[:end]):
+                yield chunk
+            pending = pending[end:]
+    for chunk in await parse(pending):
+        yield chunk
+    if parser.errors:
+        raise InvalidRecordsError(parser.errors)
+    for chunk in rows.rest():
+        yield chunk
+
+
+def _records_end(data: bytes) -> int:
+    # Just past the last line end that is not inside a quoted field; an escaped
+    # quote counts twice, so an odd count means a field is still open
+    end = data.rfind(b"\n") + 1
+    quotes = data.count(b'"', 0, end)
+    while end and quotes % 2:
+        start = data.rfind(b"\n", 0, end - 1) + 1
+        quotes -= data.count(b'"', start, end)
+        end = start
+    return end
+
+
+class _CsvColumnsParser:
+    # Sent along with every block, so it only holds the state between blocks
+    def __init__(self, max_errors: int):
+        self.max_errors = max_errors
+        self.errors: list[InvalidRecordError] = []
+        self._columns: tuple[int, int] | None = None
+        self._amount_column: int | None = None
+        self._lines = 0
+        self._asset_ids: list[str] = []
+        self._interest_rates: list[float] = []
+        self._amounts: list[float] = []
+
+    def parse(self, data: bytes) -> tuple["_CsvColumnsParser", AssetsChunk | None]:
+        """Parse complete records; return the parser and their valid rows, None
+        if there are none or some row was invalid."""
+        if not data:
+            return self, None
+        try:
+            text = data.decode()
+        except UnicodeDecodeError as e:
+            line = self._lines + data.count(b"\n", 0, e.start) + 1
+            self._fail(InvalidRecordError(line, "not valid UTF-8"))
+        if self._lines == 0:
+            text = text.removeprefix("\ufeff")
+
+        if self._columns is None or self.errors or not self._read_rows(text):
+            # Header, blank lines or invalid rows: go row by row, keeping track of
+            # line numbers
+            self._read_rows_by_line(text)
+        return self, self._take()
+
+    def _read_rows(self, text: str) -> bool:
+        # Fast path for a run of valid rows: whole columns at a time
+        assert self._columns is not None
+        id_column, rate_column = self._columns
+        reader = csv.reader(io.StringIO(text, newline=""))
+        try:
+            rows = list(reader)
+            asset_ids = [row[id_column] for row in rows]
+            interest_rates = list(map(float, [row[rate_column] for row in rows]))
+            if self._amount_column is not None:
+                amount_column = self._amount_column
+                amounts = list(
+                    map(float, [row[amount_column] or "nan" for row in rows])
+                )
+                if any(amount < 0 for amount in amounts):
+                    return False
+                self._amounts.extend(amounts)
+        except (csv.Error, IndexError, ValueError):
+            return False
+        self._asset_ids.extend(asset_ids)
+        self._interest_rates.extend(interest_rates)
+        self._lines += reader.line_num
+        return True
+
+    def _read_rows_by_line(self, text: str) -> None:
+        reader = csv.reader(io.StringIO(text, newline=""))
+        previous = 0
+        try:
+            for row in reader:
+                line = self._lines + previous + 1
+                previous = reader.line_num
+                if not row or (len(row) == 1 and not row[0].strip()):
+                    continue
+                if self._columns is None:
+                    self._read_header(row, line)
+                else:
+                    self._read_row(row, line)
+        except csv.Error as e:
+            self._fail(InvalidRecordError(self._lines + previous + 1, str(e)))
+        self._lines += reader.line_num
+
+    def _read_header(self, row: list[str], line: int) -> None:
+        names = [name.strip() for name in row]
+        missing = [
+            name for name in (ID_COLUMN, INTEREST_RATE_COLUMN) if name not in names
+        ]
+        if missing:
+            self._fail(
+                InvalidRecordError(line, f"header has no {', '.join(missing)} column")
+            )
+        self._columns = (names.index(ID_COLUMN), names.index(INTEREST_RATE_COLUMN))
+        if AMOUNT_COLUMN in names:
+            self._amount_column = names.index(AMOUNT_COLUMN)
+
+    def _read_row(self, row: list[str], line: int) -> None:
+        assert self._columns is not None
+        id_column, rate_column = self._columns
+        width = max(id_column, rate_column, self._amount_column or 0) + 1
+        if len(row) < width:
+            self._reject(line, f"expected {width} fields, got {len(row)}")
+            return
+        try:
+            interest_rate = float(row[rate_column])
+        except ValueError:
+            self._reject(
+                line, f"{INTEREST_RATE_COLUMN}: {row[rate_column]!r} is not a number"
+            )
+            return
+        amount = math.nan
+        if self._amount_column is not None and row[self._amount_column]:
+            field = row[self._amount_column]
+            try:
+                amount = float(field)
+            except ValueError:
+                self._reject(line, f"{AMOUNT_COLUMN}: {field!r} is not a number")
+                return
+            if amount < 0:
+                self._reject(line, f"{AMOUNT_COLUMN}: {field!r} is negative")
+                return
+        if not self.errors:
+            self._asset_ids.append(row[id_column])
+            self._interest_rates.append(interest_rate)
+            if self._amount_column is not None:
+                self._amounts.append(amount)
+
+    def _reject(self, line: int, reason: str) -> None:
+        self.errors.append(InvalidRecordError(line, reason))
+        # Rows after the first error are only checked, never kept
+        self._asset_ids, self._interest_rates, self._amounts = [], [], []
+        if len(self.errors) >= self.max_errors:
+            raise InvalidRecordsError(self.errors, truncated=True)
+
+    def _fail(self, error: InvalidRecordError) -> NoReturn:
+        # The rest of the stream cannot be read reliably
+        raise InvalidRecordsError([*self.errors, error])
+
+    def _take(self) -> AssetsChunk | None:
+        if self.errors or not self._asset_ids:
+            return None
+        chunk = AssetsChunk(
+            self._asset_ids,
+            np.array(self._interest_rates, dtype=np.float64),
+            np.array(self._amounts, dtype=np.float64)
+            if self._amount_column is not None
+            else None,
+        )
+        self._asset_ids, self._interest_rates, self._amounts = [], [], []
+        return chunk
+
+
+class _RowsBuffer:
+    """Parsed rows waiting to fill a chunk."""
+
+    def __init__(self, chunk_size: int):
+        self.chunk_size = chunk_size
+        self._parts: list[AssetsChunk] = []
+        self._count = 0
+
+    def add(self, rows: AssetsChunk) -> None:
+        self._parts.append(rows)
+        self._count += len(rows.asset_ids)
+
+    def clear(self) -> None:
+        self._parts, self._count = [], 0
+
+    def full_chunks(self) -> Iterator[AssetsChunk]:
+        while self._count >= self.chunk_size:
+            yield self._take(self.chunk_size)
+
+    def rest(self) -> Iterator[AssetsChunk]:
+        if self._count:
+            yield self._take(self._count)
+
+    def _take(self, size: int) -> AssetsChunk:
+        rows = self._parts[0] if len(self._parts) == 1 else _concatenate(self._parts)
+        left = AssetsChunk(
+            rows.asset_ids[size:],
+            rows.interest_rates[size:],
+            None if rows.amounts is None else rows.amounts[size:],
+        )
+        self._parts = [left] if left.asset_ids else []
+        self._count -= size
+        return AssetsChunk(
+            rows.asset_ids[:size],
+            rows.interest_rates[:size],
+            None if rows.amounts is None else rows.amounts[:size],
+        )
+
+
+def _concatenate(parts: list[AssetsChunk]) -> AssetsChunk:
+    # Every part has an amounts column, or none has: the header decides
+    amounts = [part.amounts for part in parts if part.amounts is not None]
+    return AssetsChunk(
+        [asset_id for part in parts for asset_id in part.asset_ids],
+        np.concatenate([part.interest_rates for part in parts]),
+        np.concatenate(amounts) if amounts else None,
+    )
@@ -1,5 +1,8 @@
-from typing import Annotated
+from datetime import datetime
+from typing import Annotated, NamedTuple
 
+import numpy as np
+from numpy.typing import NDArray
 from pydantic import BaseModel, Field
 
 # Post Asset Request
@@ -8,11 +11,87 @@ from pydantic import BaseModel, Field
 class AssetDto(BaseModel):
     id: Annotated[str, Field(description="The id of the asset")]
     interest_rate: Annotated[float, Field(description="The interest rate of the asset")]
+    amount: Annotated[
+        float | None,
+        Field(ge=0, description="The principal of the asset, weighing its rate"),
+    ] = None
+    tags: Annotated[
+        dict[str, str],
+        Field(
+            description="Categories of the asset by tag name, e.g. "
+            '{"currency": "EUR", "desk": "rates"}'
+        ),
+    ] = {}
+
+
+class AssetsChunk(NamedTuple):
+    """Assets as columns: ids, float64 rates, float64 principal amounts and a
+    column of values per tag name."""
+
+    asset_ids: list[str]
+    interest_rates: NDArray[np.float64]
+    # NaN where an asset has no amount; None when none of them has one
+    amounts: NDArray[np.float64] | None = None
+    # None where an asset does not carry the tag; None when none carries any
+    tags: dict[str, list[str | None]] | None = None
+
+
+def assets_to_columns(assets: list[AssetDto]) -> AssetsChunk:
+    """Split validated assets into an id list and float64 rate and amount
+    columns."""
+    asset_ids = [asset.id for asset in assets]
+    interest_rates = np.fromiter(
+        (asset.interest_rate for asset in assets),
+        dtype=np.float64,
+        count=len(assets),
+    )
+    amounts = None
+    if any(asset.amount is not None for asset in assets):
+        amounts = np.fromiter(
+            (np.nan if asset.amount is None else asset.amount for asset in assets),
+            dtype=np.float64,
+            count=len(assets),
+        )
+    names = dict.fromkeys(name for asset in assets for name in asset.tags)
+    tags = {name: [asset.tags.get(name) for asset in assets] for name in names}
+    return AssetsChunk(asset_ids, interest_rates, amounts, tags or None)
 
 
 class SaveAssetsListRequest(BaseModel):
     assets: Annotated[list[AssetDto], Field(description="The list of assets to save")]
 
+    def to_columns(self) -> AssetsChunk:
+        return assets_to_columns(self.assets)
+
+
+# Asset Items Requests
+
+
+class AssetsBatchRequest(BaseModel):
+    assets: Annotated[
+        list[AssetDto], Field(description="The assets to add to or update in the list")
+    ]
+
+    def to_columns(self) -> AssetsChunk:
+        return assets_to_columns(self.assets)
+
+
+class UpdateAssetRequest(BaseModel):
+    interest_rate: Annotated[
+        float, Field(description="The new interest rate of the asset")
+    ]
+    amount: Annotated[
+        float | None,
+        Field(ge=0, description="The new principal of the asset; kept if omitted"),
+    ] = None
+    tags: Annotated[
+        dict[str, str] | None,
+        Field(
+            description="New values of the asset's tags, by tag name; tags left "
+            "out keep their values"
+        ),
+    ] = None
+
 
 # Get Average Interest Rate Response
 
@@ -21,3 +100,238 @@ class GetAverageInterestRateResponse(BaseModel):
     average_interest_rate: Annotated[
         float | None, Field(description="The average interest rate of the assets")
     ]
+    weighted_average_interest_rate: Annotated[
+        float | None,
+        Field(
+            description="The average interest rate weighted by the assets' "
+            "amounts; null when no asset has an amount"
+        ),
+    ] = None
+
+
+# Get Grouped Interest Rates Response
+
+
+class InterestRateGroupDto(BaseModel):
+    value: Annotated[str, Field(description="The tag value shared by the group")]
+    asset_count: Annotated[int, Field(description="The number of assets in it")]
+    average_interest_rate: Annotated[
+        float, Field(description="Their average interest rate")
+    ]
+
+
+class GetGroupedInterestRatesResponse(BaseModel):
+    tag: Annotated[str, Field(description="The tag the assets are grouped by")]
+    groups: Annotated[
+        list[InterestRateGroupDto],
+        Field(description="One group per value of the tag, by value"),
+    ]
+
+
+# Get Interest Rate Statistics Response
+
+
+class GetInterestRateStatisticsResponse(BaseModel):
+    """Distribution of the interest rates; only ``asset_count`` (0) without
+    assets."""
+
+    asset_count: Annotated[int, Field(description="The number of assets")] = 0
+    min: Annotated[float | None, Field(description="The lowest interest rate")] = None
+    max: Annotated[float | None, Field(description="The highest interest rate")] = None
+    mean: Annotated[float | None, Field(description="The mean interest rate")] = None
+    std: Annotated[
+        float | None,
+        Field(description="The population standard deviation of the rates"),
+    ] = None
+    median: Annotated[
+        float | None, Field(description="The estimated median interest rate")
+    ] = None
+    p90: Annotated[
+        float | None, Field(description="The estimated 90th percentile rate")
+    ] = None
+    p99: Annotated[
+        float | None, Field(description="The estimated 99th percentile rate")
+    ] = None
+
+
+# Get Interest Rate Series Response
+
+
+class InterestRatePointDto(BaseModel):
+    start: Annotated[datetime, Field(description="When the bucket starts (UTC)")]
+    min: Annotated[float, Field(description="The lowest average in the bucket")]
+    max: Annotated[float, Field(description="The highest average in the bucket")]
+    mean: Annotated[float, Field(description="The mean of its averages")]
+    last: Annotated[float, Field(description="The average after its last write")]
+    write_count: Annotated[int, Field(description="The number of writes in it")]
+
+
+class GetInterestRateSeriesResponse(BaseModel):
+    resolution: Annotated[str, Field(description="The width of the buckets")]
+    points: Annotated[
+        list[InterestRatePointDto],
+        Field(description="The buckets holding writes, oldest first"),
+    ]
+
+
+# Get Interest Rate Histogram Response
+
+
+class HistogramBucketDto(BaseModel):
+    low: Annotated[float, Field(description="The lowest rate of the bucket")]
+    high: Annotated[
+        float,
+        Field(description="The bucket's upper bound, excluded but for the last bucket"),
+    ]
+    asset_count: Annotated[int, Field(description="The number of assets in it")]
+    average_interest_rate: Annotated[
+        float | None,
+        Field(description="Their average interest rate; null if there is none"),
+    ]
+
+
+class HistogramDto(BaseModel):
+    buckets: Annotated[
+        list[HistogramBucketDto], Field(description="The buckets, by ascending rate")
+    ]
+    below: Annotated[
+        int, Field(description="Assets added later with a rate below the buckets")
+    ]
+    above: Annotated[
+        int, Field(description="Assets added later with a rate above the buckets")
+    ]
+
+
+class GetInterestRateHistogramResponse(BaseModel):
+    """Both histograms of the interest rates; null without assets."""
+
+    fixed_width: Annotated[
+        HistogramDto | None,
+        Field(description="Buckets of equal width between the saved rates' extremes"),
+    ] = None
+    quantile: Annotated[
+        HistogramDto | None,
+        Field(description="Buckets holding as many of the saved rates each"),
+    ] = None
+
+
+# Asset Queries Responses
+
+
+class GetInterestRateRangeResponse(BaseModel):
+    asset_count: Annotated[
+        int, Field(description="The number of assets with a rate in the range")
+    ]
+    average_interest_rate: Annotated[
+        float | None,
+        Field(description="Their average interest rate; null if there is none"),
+    ]
+
+
+class GetAssetsResponse(BaseModel):
+    assets: Annotated[list[AssetDto], Field(description="The assets, in order")]
+
+
+# Assets List History Responses
+
+
+class AssetsListVersionDto(BaseModel):
+    version: Annotated[int, Field(description="The number of the write")]
+    created_at: Annotated[datetime, Field(description="When it was written")]
+    asset_count: Annotated[int, Field(description="The number of assets")]
+    average_interest_rate: Annotated[
+        float, Field(description="The average interest rate of the assets")
+    ]
+    weighted_average_interest_rate: Annotated[
+        float | None,
+        Field(description="Their average weighted by amount; null without amounts"),
+    ] = None
+
+
+class GetAssetsListHistoryResponse(BaseModel):
+    versions: Annotated[
+        list[AssetsListVersionDto],
+        Field(description="The kept versions of the list, oldest first"),
+    ]
+
+
+class GetPastAssetsResponse(AssetsListVersionDto):
+    assets: Annotated[
+        list[AssetDto], Field(description="The requested page of its assets")
+    ]
+
+
+# Evaluate Scenarios Request
+
+
+class ScenarioAssetDto(BaseModel):
+    id: Annotated[str, Field(description="The id of the hypothetical asset")]
+    interest_rate: Annotated[float, Field(description="Its interest rate")]
+
+
+class ScenarioDto(BaseModel):
+    add: Annotated[
+        list[ScenarioAssetDto], Field(description="The assets the scenario adds")
+    ] = []
+    remove: Annotated[
+        list[str], Field(description="The ids of the stored assets it removes")
+    ] = []
+
+
+class ScenarioColumns(NamedTuple):
+    """The changes of every scenario flattened into columns, each change
+    numbered with the position of its scenario."""
+
+    scenario_count: int
+    added_scenarios: list[int]
+    added_ids: list[str]
+    added_rates: list[float]
+    removed_scenarios: list[int]
+    removed_ids: list[str]
+
+
+class EvaluateScenariosRequest(BaseModel):
+    scenarios: Annotated[
+        list[ScenarioDto],
+        Field(min_length=1, description="The changes to evaluate, each on its own"),
+    ]
+
+    def to_columns(self) -> ScenarioColumns:
+        added = [
+            (position, asset)
+            for position, scenario in enumerate(self.scenarios)
+            for asset in scenario.add
+        ]
+        removed = [
+            (position, asset_id)
+            for position, scenario in enumerate(self.scenarios)
+            for asset_id in scenario.remove
+        ]
+        return ScenarioColumns(
+            len(self.scenarios),
+            [position for position, _ in added],
+            [asset.id for _, asset in added],
+            [asset.interest_rate for _, asset in added],
+            [position for position, _ in removed],
+            [asset_id for _, asset_id in removed],
+        )
+
+
+# Evaluate Scenarios Response
+
+
+class ScenarioOutcomeDto(BaseModel):
+    asset_count: Annotated[
+        int, Field(description="The number of assets after the scenario")
+    ]
+    average_interest_rate: Annotated[
+        float | None,
+        Field(description="Their average interest rate; null if none is left"),
+    ]
+
+
+class EvaluateScenariosResponse(BaseModel):
+    scenarios: Annotated[
+        list[ScenarioOutcomeDto],
+        Field(description="The outcome of every scenario, in request order"),
+    ]
@@ -0,0 +1,50 @@
+from typing import Any
+
+
+class InvalidRecordError(ValueError):
+    """Error raised when a record of a streamed upload cannot be parsed.
+
+    Survives pickling, so records can be parsed in a worker process.
+    """
+
+    def __init__(self, line_number: int, reason: str):
+        super().__init__(f"Invalid record at line {line_number}: {reason}")
+        self.line_number = line_number
+        self.reason = reason
+
+    def __reduce__(self) -> tuple[type["InvalidRecordError"], tuple[int, str]]:
+        return type(self), (self.line_number, self.reason)
+
+
+class InvalidRecordsError(ValueError):
+    """Error raised when records of a streamed upload cannot be parsed.
+
+    Lists every invalid record found, in line order, up to a limit. Survives
+    pickling like ``InvalidRecordError``.
+    """
+
+    def __init__(self, errors: list[InvalidRecordError], truncated: bool = False):
+        more = " (first ones only)" if truncated else ""
+        super().__init__(f"{len(errors)} invalid record(s){more}")
+        self.errors = errors
+        self.truncated = truncated
+
+    def __reduce__(
+        self,
+    ) -> tuple[type["InvalidRecordsError"], tuple[list[InvalidRecordError], bool]]:
+        return type(self), (self.errors, self.truncated)
+
+
+class InvalidPayloadError(ValueError):
+    """Error raised when a request body does not match its schema.
+
+    Carries pydantic's error list and survives pickling, so the body can be
+    validated in a worker process.
+    """
+
+    def __init__(self, errors: list[Any]):
+        super().__init__(f"Invalid payload: {len(errors)} validation error(s)")
+        self.errors = errors
+
+    def __reduce__(self) -> tuple[type["InvalidPayloadError"], tuple[list[Any]]]:
+        return type(self), (self.errors,)
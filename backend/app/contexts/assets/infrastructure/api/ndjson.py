@@ -0,0 +1,71 @@
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator
+from concurrent.futures import Executor
+
+from pydantic import ValidationError
+
+from app.contexts.assets.infrastructure.api.dtos import (
+    AssetDto,
+    AssetsChunk,
+    assets_to_columns,
+)
+from app.contexts.assets.infrastructure.api.errors import InvalidRecordError
+
+
+async def iter_ndjson_asset_chunks(
+    byte_stream: AsyncIterable[bytes],
+    chunk_size: int,
+    executor: Executor | None = None,
+) -> AsyncIterator[AssetsChunk]:
+    """Parse an NDJSON stream of ``AssetDto`` records into column chunks.
+
+    Lines are validated ``chunk_size`` at a time on ``executor`` (None: the
+    event loop's default one), as validation holds the GIL, so only the current
+    partial line and up to ``chunk_size`` lines are held at any time. Blank
+    lines are skipped; a malformed line raises ``InvalidRecordError`` with its
+    1-based line number.
+    """
+    loop = asyncio.get_running_loop()
+    lines: list[bytes] = []
+    pending = b""
+    line_number = 1
+
+    async for data in byte_stream:
+        lines += (pending + data).split(b"\n")
+        pending = lines.pop()
+        while len(lines) >= chunk_size:
+            batch = lines[:chunk_size]
+            del lines[:chunk_size]
+            chunk = await loop.run_in_executor(
+                executor, parse_ndjson_lines, batch, line_number
+            )
+            line_number += len(batch)
+            if chunk is not None:
+                yield chunk
+
+    lines.append(pending)
+    chunk = await loop.run_in_executor(executor, parse_ndjson_lines, lines, line_number)
+    if chunk is not None:
+        yield chunk
+
+
+def parse_ndjson_lines(lines: list[bytes], line_number: int) -> AssetsChunk | None:
+    """Validate consecutive NDJSON lines, the first being line ``line_number``,
+    into columns; None if they are all blank."""
+    assets = [
+        _parse_line(line, number)
+        for number, line in enumerate(lines, line_number)
+        if line.strip()
+    ]
+    return assets_to_columns(assets) if assets else None
+
+
+def _parse_line(line: bytes, line_number: int) -> AssetDto:
+    try:
+        return AssetDto.model_validate_json(line)
+    except ValidationError as e:
+        reason = "; ".join(
+            f"{'.'.join(map(str, error['loc'])) or 'record'}: {error['msg']}"
+            for error in e.errors()
+        )
+        raise InvalidRecordError(line_number, reason) from e
@@ -0,0 +1,45 @@
+from pydantic import ValidationError
+
+from app.contexts.assets.infrastructure.api.binary_payloads import (
+    ARROW_STREAM_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPES,
+    parse_arrow_columns,
+    parse_msgpack_columns,
+)
+from app.contexts.assets.infrastructure.api.dtos import (
+    AssetsChunk,
+    SaveAssetsListRequest,
+)
+from app.contexts.assets.infrastructure.api.errors import InvalidPayloadError
+from app.contexts.shared.infrastructure.json_codec import JsonCodec
+
+
+def parse_save_assets_list_body(
+    body: bytes,
+    json_codec: JsonCodec | None = None,
+    media_type: str | None = None,
+) -> AssetsChunk:
+    """Validate a raw ``POST /asset`` body and split it into columns.
+
+    Parsing holds the GIL, so large bodies are parsed by this module-level
+    function on the CPU executor, which may be a process pool; only the columns
+    travel back. Arrow IPC streams and MessagePack columns are recognized by
+    their ``media_type``; anything else is read as JSON. A ``json_codec``
+    decodes well-typed JSON bodies straight into the columns; any other body
+    goes through ``SaveAssetsListRequest`` so that the validation errors stay
+    those of the DTO.
+    """
+    if media_type == ARROW_STREAM_MEDIA_TYPE:
+        return parse_arrow_columns(body)
+    if media_type in MSGPACK_MEDIA_TYPES:
+        return parse_msgpack_columns(body)
+    # The codec decodes records of an id and a rate only; bodies with amounts or
+    # tags take the DTO path
+    if json_codec is not None:
+        columns = json_codec.decode_columns(body, "assets", "id", "interest_rate")
+        if columns is not None:
+            return AssetsChunk(*columns)
+    try:
+        return SaveAssetsListRequest.model_validate_json(body).to_columns()
+    except ValidationError as e:
+        raise InvalidPayloadError(e.errors(include_url=False))
@@ -0,0 +1,90 @@
+import hashlib
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import NamedTuple
+
+from app.contexts.assets.application.get_average_interest_rate import (
+    GetAverageInterestRateService,
+)
+from app.contexts.assets.domain.repositories.async_assets_list_repository import (
+    AsyncAssetsListRepository,
+)
+from app.contexts.assets.infrastructure.api.dtos import GetAverageInterestRateResponse
+
+
+class EncodedResponse(NamedTuple):
+    version: int
+    body: bytes
+    etag: str
+
+
+class InterestRateResponseCache:
+    """Keeps the encoded ``GET /interest_rate`` body of every portfolio until its
+    assets list changes.
+
+    Freshness is checked against the repository version, so a read costs one
+    counter lookup while the stored list is unchanged. Both the check and the
+    rebuild go through the async repository, which keeps backends whose reads
+    block off the event loop. The ETag hashes the body, which keeps it valid
+    across restarts and between workers.
+
+    Portfolio ids come from the URL, so entries are bounded: portfolios
+    without a stored list are answered without being cached, and past
+    ``max_entries`` the least recently read portfolio is dropped.
+    """
+
+    def __init__(
+        self,
+        get_average_interest_rate_service_factory: Callable[
+            ..., GetAverageInterestRateService
+        ],
+        max_entries: int = 1024,
+    ):
+        self.get_average_interest_rate_service_factory = (
+            get_average_interest_rate_service_factory
+        )
+        self.max_entries = max_entries
+        self._cached: OrderedDict[str | None, EncodedResponse] = OrderedDict()
+
+    async def get(
+        self,
+        assets_list_repository: AsyncAssetsListRepository,
+        portfolio_id: str | None = None,
+    ) -> EncodedResponse:
+        """The response for ``portfolio_id``, whose list
+        ``assets_list_repository`` holds."""
+        version = await assets_list_repository.get_version()
+        cached = self._cached.get(portfolio_id)
+        if cached is not None and cached.version == version:
+            self._cached.move_to_end(portfolio_id)
+        else:
+            service = self.get_average_interest_rate_service_factory(
+                assets_list_repository=assets_list_repository
+            )
+            body = (
+                GetAverageInterestRateResponse(
+                    average_interest_rate=await service(),
+                    weighted_average_interest_rate=await service.weighted(),
+                )
+                .model_dump_json()
+                .encode()
+            )
+            etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+            cached = EncodedResponse(version, body, etag)
+            # Version 0: nothing was ever stored under this portfolio
+            if version:
+                self._cached[portfolio_id] = cached
+                self._cached.move_to_end(portfolio_id)
+                if len(self._cached) > self.max_entries:
+                    self._cached.popitem(last=False)
+        return cached
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether an ``If-None-Match`` header value matches ``etag`` (weakly)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag in candidates
@@ -1,41 +1,289 @@
+import asyncio
+import math
+from collections.abc import Callable
+from concurrent.futures import Executor
+from datetime import UTC, datetime
+
+import numpy as np
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Path,
+    Query,
+    Request,
+    Response,
+)
+from fastapi.exceptions import RequestValidationError
 from pydantic import ValidationError
 
-from app.contexts.assets.application.get_average_interest_rate import (
-    GetAverageInterestRateService,
+from app.contexts.assets.application.add_assets import AddAssetsService
+from app.contexts.assets.application.evaluate_scenarios import EvaluateScenariosService
+from app.contexts.assets.application.get_assets_list_history import (
+    GetAssetsListHistoryService,
+)
+from app.contexts.assets.application.get_grouped_interest_rates import (
+    GetGroupedInterestRatesService,
+)
+from app.contexts.assets.application.get_interest_rate_histograms import (
+    GetInterestRateHistogramsService,
+)
+from app.contexts.assets.application.get_interest_rate_series import (
+    GetInterestRateSeriesService,
+)
+from app.contexts.assets.application.get_interest_rate_statistics import (
+    GetInterestRateStatisticsService,
+)
+from app.contexts.assets.application.ingest_assets_list import (
+    IngestAssetsListService,
 )
+from app.contexts.assets.application.query_assets import QueryAssetsService
+from app.contexts.assets.application.remove_assets import RemoveAssetsService
 from app.contexts.assets.application.save_assets_list import SaveAssetsListService
+from app.contexts.assets.application.update_assets import UpdateAssetsService
 from app.contexts.assets.domain.entities.asset import Asset
-from app.contexts.assets.domain.entities.errors import DuplicateAssetIdError
+from app.contexts.assets.domain.entities.assets_list_version import (
+    AssetsListVersion,
+)
+from app.contexts.assets.domain.entities.errors import (
+    AssetNotFoundError,
+    DuplicateAssetIdError,
+    HistoryUnavailableError,
+)
+from app.contexts.assets.domain.repositories.async_assets_list_repository import (
+    AsyncAssetsListRepository,
+)
 from app.contexts.assets.domain.services.interest_rate_avg_calculator.errors import (
     EmptyListError,
     InvalidListError,
 )
+from app.contexts.assets.domain.services.rate_histogram.histograms import (
+    RateHistogram,
+)
+from app.contexts.assets.domain.services.rate_rollups.series import Resolution
+from app.contexts.assets.domain.services.what_if.scenarios import ScenarioDeltas
+from app.contexts.assets.infrastructure.api.binary_payloads import (
+    ARROW_STREAM_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPES,
+    arrow_available,
+)
+from app.contexts.assets.infrastructure.api.csv_records import iter_csv_asset_chunks
 from app.contexts.assets.infrastructure.api.dtos import (
+    AssetDto,
+    AssetsBatchRequest,
+    AssetsListVersionDto,
+    EvaluateScenariosRequest,
+    EvaluateScenariosResponse,
+    GetAssetsListHistoryResponse,
+    GetAssetsResponse,
     GetAverageInterestRateResponse,
+    GetGroupedInterestRatesResponse,
+    GetInterestRateHistogramResponse,
+    GetInterestRateRangeResponse,
+    GetInterestRateSeriesResponse,
+    GetInterestRateStatisticsResponse,
+    GetPastAssetsResponse,
+    HistogramBucketDto,
+    HistogramDto,
+    InterestRateGroupDto,
+    InterestRatePointDto,
     SaveAssetsListRequest,
+    ScenarioOutcomeDto,
+    UpdateAssetRequest,
+)
+from app.contexts.assets.infrastructure.api.errors import (
+    InvalidPayloadError,
+    InvalidRecordError,
+    InvalidRecordsError,
 )
+from app.contexts.assets.infrastructure.api.ndjson import (
+    AssetsChunk,
+    iter_ndjson_asset_chunks,
+)
+from app.contexts.assets.infrastructure.api.payloads import (
+    parse_save_assets_list_body,
+)
+from app.contexts.assets.infrastructure.api.response_cache import (
+    InterestRateResponseCache,
+    etag_matches,
+)
+from app.contexts.shared.infrastructure.api.json_codec_routing import JsonCodecRoute
+from app.contexts.shared.infrastructure.json_codec import JsonCodec
 from app.core.containers.container import Container
 
-router = APIRouter(tags=["assets"])
+
+def _portfolio_id_param(
+    portfolio_id: str = Path(description="The id of the portfolio"),
+) -> str:
+    return portfolio_id
+
+
+def get_portfolio_id(request: Request) -> str | None:
+    """Portfolio addressed by the request; None for the unscoped routes."""
+    return request.path_params.get("portfolio_id")
 
 
-@router.post("/asset")
+@inject
+def get_assets_list_repository(
+    portfolio_id: str | None = Depends(get_portfolio_id),
+    assets_list_repository_factory: Callable[..., AsyncAssetsListRepository] = Depends(
+        Provide[Container.assets_list_services.async_assets_list_repository.provider]
+    ),
+) -> AsyncAssetsListRepository:
+    """Async repository of the portfolio addressed by the request; services get
+    it in place of their default, unscoped one."""
+    return assets_list_repository_factory(portfolio_id=portfolio_id)
+
+
+def _asset_dto(asset: Asset) -> AssetDto:
+    return AssetDto(
+        id=asset.id,
+        interest_rate=asset.interest_rate,
+        amount=asset.amount,
+        tags=asset.tags,
+    )
+
+
+def _version_dto(version: AssetsListVersion) -> AssetsListVersionDto:
+    return AssetsListVersionDto(
+        version=version.version,
+        created_at=version.created_at,
+        asset_count=version.asset_count,
+        average_interest_rate=version.avg_interest_rate,
+        weighted_average_interest_rate=version.weighted_avg_interest_rate,
+    )
+
+
+async def _past_version(
+    history_service: GetAssetsListHistoryService,
+    version: int | None,
+    at: datetime | None,
+) -> AssetsListVersion:
+    if version is not None and at is not None:
+        raise HTTPException(
+            status_code=422, detail="Give either a version or a time, not both"
+        )
+    try:
+        past_version = await history_service.version(version, at)
+    except HistoryUnavailableError as e:
+        raise HTTPException(status_code=501, detail=str(e))
+    if past_version is None:
+        raise HTTPException(
+            status_code=404, detail="No such version of the assets list is kept"
+        )
+    return past_version
+
+
+def _histogram_dto(histogram: RateHistogram) -> HistogramDto:
+    edges = histogram.edges.tolist()
+    return HistogramDto(
+        buckets=[
+            HistogramBucketDto(
+                low=low,
+                high=high,
+                asset_count=asset_count,
+                average_interest_rate=rate_sum / asset_count if asset_count else None,
+            )
+            for low, high, asset_count, rate_sum in zip(
+                edges[:-1],
+                edges[1:],
+                histogram.counts.tolist(),
+                histogram.sums.tolist(),
+            )
+        ],
+        below=histogram.below,
+        above=histogram.above,
+    )
+
+
+async def _raw_body(request: Request) -> bytes:
+    return await request.body()
+
+
+def _media_type(content_type: str | None = Header(default=None)) -> str | None:
+    if content_type is None:
+        return None
+    return content_type.partition(";")[0].strip().lower()
+
+
+@inject
+async def parse_save_assets_list_request(
+    body: bytes = Depends(_raw_body),
+    media_type: str | None = Depends(_media_type),
+    cpu_executor: Executor = Depends(Provide[Container.cpu_executor]),
+    json_codec: JsonCodec = Depends(Provide[Container.json_codec]),
+) -> AssetsChunk:
+    """Validate the ``POST /asset`` body into columns on the CPU executor.
+
+    Parsing a large list holds the GIL, so it is kept out of the event loop's
+    process instead of running as a regular body parameter. The body format is
+    negotiated through its Content-Type.
+    """
+    if media_type == ARROW_STREAM_MEDIA_TYPE and not arrow_available():
+        raise HTTPException(status_code=415, detail="Arrow IPC uploads require pyarrow")
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(
+            cpu_executor, parse_save_assets_list_body, body, json_codec, media_type
+        )
+    except InvalidPayloadError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors],
+            body=body,
+        )
+
+
+# The body is parsed by a dependency, so its schema is documented by hand. Its
+# nested models are referenced from the components that other routes register.
+_save_assets_list_openapi = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "application/json": {
+                "schema": {
+                    key: value
+                    for key, value in SaveAssetsListRequest.model_json_schema(
+                        ref_template="#/components/schemas/{model}"
+                    ).items()
+                    if key != "$defs"
+                }
+            },
+            # An ``id`` and an ``interest_rate`` column, the rates as float64, and
+            # optionally an ``amount`` column
+            ARROW_STREAM_MEDIA_TYPE: {"schema": {"type": "string", "format": "binary"}},
+            **{
+                media_type: {"schema": {"type": "string", "format": "binary"}}
+                for media_type in sorted(MSGPACK_MEDIA_TYPES)
+            },
+        },
+    }
+}
+
+
+# Every endpoint is served both unscoped (the default portfolio) and, through
+# ``portfolio_router`` below, under /portfolios/{portfolio_id}.
+router = APIRouter(tags=["assets"], route_class=JsonCodecRoute)
+
+
+@router.post("/asset", openapi_extra=_save_assets_list_openapi)
 @inject
 async def save_assets_list(
-    payload: SaveAssetsListRequest,
-    save_assets_list_service: SaveAssetsListService = Depends(
-        Provide[Container.assets_list_services.save_assets_list_service]
+    columns: AssetsChunk = Depends(parse_save_assets_list_request),
+    save_assets_list_service: Callable[..., SaveAssetsListService] = Depends(
+        Provide[Container.assets_list_services.save_assets_list_service.provider]
+    ),
+    assets_list_repository: AsyncAssetsListRepository = Depends(
+        get_assets_list_repository
     ),
 ):
     try:
-        save_assets_list_service(
-            assets=[
-                Asset(id=asset.id, interest_rate=asset.interest_rate)
-                for asset in payload.assets
-            ]
-        )
+        # The payload was type-checked when it was parsed into columns; hand
+        # them straight to the domain instead of re-validating each asset.
+        await save_assets_list_service(
+            assets_list_repository=assets_list_repository
+        ).save_columns(*columns)
         return {"message": "Assets list saved successfully"}
     except ValidationError as e:
         raise HTTPException(status_code=422, detail=f"Validation error: {str(e)}")
@@ -47,12 +295,507 @@ async def save_assets_list(
         raise HTTPException(status_code=422, detail=str(e))
 
 
-@router.get("/interest_rate")
+@router.post("/asset/ndjson")
+@inject
+async def ingest_assets_list(
+    request: Request,
+    chunk_size: int = Depends(Provide[Container.config.ingest_chunk_size]),
+    cpu_executor: Executor = Depends(Provide[Container.cpu_executor]),
+    ingest_assets_list_service: Callable[..., IngestAssetsListService] = Depends(
+        Provide[Container.assets_list_services.ingest_assets_list_service.provider]
+    ),
+    assets_list_repository: AsyncAssetsListRepository = Depends(
+        get_assets_list_repository
+    ),
+):
+    try:
+        await ingest_assets_list_service(assets_list_repository=assets_list_repository)(
+            iter_ndjson_asset_chunks(request.stream(), chunk_size, cpu_executor)
+        )
+        return {"message": "Assets list saved successfully"}
+    except InvalidRecordError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except DuplicateAssetIdError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except EmptyListError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+
+@router.post("/asset/csv")
+@inject
+async def import_assets_list_csv(
+    request: Request,
+    chunk_size: int = Depends(Provide[Container.config.ingest_chunk_size]),
+    max_errors: int = Depends(Provide[Container.config.csv_import_max_errors]),
+    cpu_executor: Executor = Depends(Provide[Container.cpu_executor]),
+    ingest_assets_list_service: Callable[..., IngestAssetsListService] = Depends(
+        Provide[Container.assets_list_services.ingest_assets_list_service.provider]
+    ),
+    assets_list_repository: AsyncAssetsListRepository = Depends(
+        get_assets_list_repository
+    ),
+):
+    try:
+        await ingest_assets_list_service(assets_list_repository=assets_list_repository)(
+            iter_csv_asset_chunks(
+                request.stream(), chunk_size, max_errors, cpu_executor
+            )
+        )
+        return {"message": "Assets list saved successfully"}
+    except InvalidRecordsError as e:
+        raise HTTPException(
+            status_code=422,
+            detail=[
+                {"line": error.line_number, "msg": error.reason} for error in e.errors
+            ],
+        )
+    except DuplicateAssetIdError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except EmptyListError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+
+@router.post("/asset/items")
+@inject
+async def add_assets(
+    payload: AssetsBatchRequest,
+    add_assets_service: Callable[..., AddAssetsService] = Depends(
+        Provide[Container.assets_list_services.add_assets_service.provider]
+    ),
+    assets_list_repository: AsyncAssetsListRepository = Depends(
+        get_assets_list_repository
+    ),
+):
+    try:
+        await add_assets_service(assets_list_repository=assets_list_repository)(
+            *payload.to_columns()
+        )
+        return {"message": "Assets added successfully"}
+    except DuplicateAssetIdError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except EmptyListError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+
+@router.patch("/asset/items")
+@inject
+async def update_assets(
+    payload: AssetsBatchRequest,
+    update_assets_service: Callable[..., UpdateAssetsService] = Depends(
+        Provide[Container.assets_list_services.update_assets_service.provider]
+    ),
+    assets_list_repository: AsyncAssetsListRepository = Depends(
+        get_assets_list_repository
+    ),
+):
+    try:
+        await update_assets_service(assets_list_repository=assets_list_repository)(
+            *payload.to_columns()
+        )
+        return {"message": "Assets updated successfully"}
+    except AssetNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except DuplicateAssetIdError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except EmptyListError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+
+@router.get("/asset/items/{asset_id}", response_model=AssetDto)
+@inject
+async def get_asset(
+    asset_id: str,
+    query_assets_service: Callable[..., QueryAssetsService] = Depends(
+        Provide[Container.assets_list_services.query_assets_service.provider]
+    ),
+    assets_list_repository: AsyncAssetsListRepository = Depends(
+        get_assets_list_repository
+    ),
+) -> AssetDto:
+    asset = await query_assets_service(
+        assets_list_repository=assets_list_repository
+    ).get_asset(asset_id)
+    if asset is None:
+        raise HTTPException(status_code=404, detail=str(AssetNotFoundError([asset_id])))
+    return _asset_dto(asset)
+
+
+@router.put("/asset/items/{asset_id}")
+@inject
+async def update_asset(
+    asset_id: str,
+    payload: UpdateAssetRequest,
+    update_assets_service: Callable[..., UpdateAssetsService] = Depends(
+        Provide[Container.assets_list_services.update_assets_service.provider]
+    ),
+    assets_list_repository: AsyncAssetsListRepository = Depends(
+        get_assets_list_repository
+    ),
+):
+    try:
+        await update_assets_service(assets_list_repository=assets_list_repository)(
+            [asset_id],
+            np.array([payload.interest_rate]),
+            None if payload.amount is None else np.array([payload.amount]),
+            None
+            if payload.tags is None
+            else {name: [value] for name, value in payload.tags.items()},
+        )
+        return {"message": "Asset updated successfully"}
+    except AssetNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@router.delete("/asset/items")
+@inject
+async def remove_assets(
+    ids: list[str] = Query(description="The ids of the assets to remove"),
+    remove_assets_service: Callable[..., RemoveAssetsService] = Depends(
+        Provide[Container.assets_list_services.remove_assets_service.provider]
+    ),
+    assets_list_repository: AsyncAssetsListRepository = Depends(
+        get_assets_list_repository
+    ),
+):
+    try:
+        await remove_assets_service(assets_list_repository=assets_list_repository)(ids)
+        return {"message": "Assets removed successfully"}
+    except AssetNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except EmptyListError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+
+@router.delete("/asset/items/{asset_id}")
+@inject
+async def remove_asset(
+    asset_id: str,
+    remove_assets_service: Callable[..., RemoveAssetsService] = Depends(
+        Provide[Container.assets_list_services.remove_assets_service.provider]
+    ),
+    assets_list_repository: AsyncAssetsListRepository = Depends(
+        get_assets_list_repository
+    ),
+):
+    try:
+        await remove_assets_service(assets_list_repository=assets_list_repository)(
+            [asset_id]
+        )
+        return {"message": "Asset removed successfully"}
+    except AssetNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except EmptyListError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+
+@router.get(
+    "/interest_rate",
+    response_model=GetAverageInterestRateResponse,
+    responses={304: {"description": "The average interest rate has not changed"}},
+)
 @inject
 async def get_average_interest_rate(
-    get_average_interest_rate_service: GetAverageInterestRateService = Depends(
-        Provide[Container.assets_list_services.get_average_interest_rate_service]
+    if_none_match: str | None = Header(default=None),
+    portfolio_id: str | None = Depends(get_portfolio_id),
+    assets_list_repository: AsyncAssetsListRepository = Depends(
+        get_assets_list_repository
+    ),
+    interest_rate_response_cache: InterestRateResponseCache = Depends(
+        Provide[Container.assets_list_services.interest_rate_response_cache]
+    ),
+) -> Response:
+    cached = await interest_rate_response_cache.get(
+        assets_list_repository, portfolio_id
+    )
+    headers = {"ETag": cached.etag, "Cache-Control": "no-cache"}
+    if etag_matches(if_none_match, cached.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=cached.body, media_type="application/json", headers=headers)
+
+
+@router.get("/interest_rate/groups", response_model=GetGroupedInterestRatesResponse)
+@inject
+async def get_grouped_interest_rates(
+    by: str = Query(min_length=1, description="The tag to group the assets by"),
+    get_grouped_interest_rates_service: Callable[
+        ..., GetGroupedInterestRatesService
+    ] = Depends(
+        Provide[
+            Container.assets_list_services.get_grouped_interest_rates_service.provider
+        ]
+    ),
+    assets_list_repository: AsyncAssetsListRepository = Depends(
+        get_assets_list_repository
+    ),
+) -> GetGroupedInterestRatesResponse:
+    groups = await get_grouped_interest_rates_service(
+        assets_list_repository=assets_list_repository
+    )(by)
+    return GetGroupedInterestRatesResponse(
+        tag=by,
+        groups=[
+            InterestRateGroupDto(
+                value=group.value,
+                asset_count=group.asset_count,
+                average_interest_rate=group.rate_sum / group.asset_count,
+            )
+            for group in groups
+        ],
+    )
+
+
+@router.get(
+    "/interest_rate/statistics", response_model=GetInterestRateStatisticsResponse
+)
+@inject
+async def get_interest_rate_statistics(
+    get_interest_rate_statistics_service: Callable[
+        ..., GetInterestRateStatisticsService
+    ] = Depends(
+        Provide[
+            Container.assets_list_services.get_interest_rate_statistics_service.provider
+        ]
+    ),
+    assets_list_repository: AsyncAssetsListRepository = Depends(
+        get_assets_list_repository
+    ),
+) -> GetInterestRateStatisticsResponse:
+    statistics = await get_interest_rate_statistics_service(
+        assets_list_repository=assets_list_repository
+    )()
+    if statistics is None:
+        return GetInterestRateStatisticsResponse()
+    return GetInterestRateStatisticsResponse(**statistics._asdict())
+
+
+@router.get("/interest_rate/histogram", response_model=GetInterestRateHistogramResponse)
+@inject
+async def get_interest_rate_histogram(
+    get_interest_rate_histograms_service: Callable[
+        ..., GetInterestRateHistogramsService
+    ] = Depends(
+        Provide[
+            Container.assets_list_services.get_interest_rate_histograms_service.provider
+        ]
+    ),
+    assets_list_repository: AsyncAssetsListRepository = Depends(
+        get_assets_list_repository
     ),
-) -> GetAverageInterestRateResponse:
-    average_interest_rate = get_average_interest_rate_service()
-    return GetAverageInterestRateResponse(average_interest_rate=average_interest_rate)
+) -> GetInterestRateHistogramResponse:
+    histograms = await get_interest_rate_histograms_service(
+        assets_list_repository=assets_list_repository
+    )()
+    if histograms is None:
+        return GetInterestRateHistogramResponse()
+    return GetInterestRateHistogramResponse(
+        fixed_width=_histogram_dto(histograms.fixed_width),
+        quantile=_histogram_dto(histograms.quantile),
+    )
+
+
+@router.get("/interest_rate/series", response_model=GetInterestRateSeriesResponse)
+@inject
+async def get_interest_rate_series(
+    resolution: Resolution = Query(
+        default=Resolution.HOUR, description="The width of the buckets"
+    ),
+    start: datetime | None = Query(default=None, description="The earliest time"),
+    end: datetime | None = Query(default=None, description="The latest time"),
+    get_interest_rate_series_service: Callable[
+        ..., GetInterestRateSeriesService
+    ] = Depends(
+        Provide[
+            Container.assets_list_services.get_interest_rate_series_service.provider
+        ]
+    ),
+    assets_list_repository: AsyncAssetsListRepository = Depends(
+        get_assets_list_repository
+    ),
+) -> GetInterestRateSeriesResponse:
+    if start is not None and end is not None and start > end:
+        raise HTTPException(status_code=422, detail="start must not be after end")
+    try:
+        points = await get_interest_rate_series_service(
+            assets_list_repository=assets_list_repository
+        )(resolution, start, end)
+    except HistoryUnavailableError as e:
+        raise HTTPException(status_code=501, detail=str(e))
+    return GetInterestRateSeriesResponse(
+        resolution=resolution,
+        points=[
+            InterestRatePointDto(
+                start=datetime.fromtimestamp(point.start, UTC),
+                min=point.min,
+                max=point.max,
+                mean=point.mean,
+                last=point.last,
+                write_count=point.value_count,
+            )
+            for point in points
+        ],
+    )
+
+
+@router.get("/interest_rate/range", response_model=GetInterestRateRangeResponse)
+@inject
+async def get_interest_rate_range(
+    min_rate: float = Query(description="The lowest rate in the range"),
+    max_rate: float = Query(description="The highest rate in the range"),
+    query_assets_service: Callable[..., QueryAssetsService] = Depends(
+        Provide[Container.assets_list_services.query_assets_service.provider]
+    ),
+    assets_list_repository: AsyncAssetsListRepository = Depends(
+        get_assets_list_repository
+    ),
+) -> GetInterestRateRangeResponse:
+    if min_rate > max_rate:
+        raise HTTPException(
+            status_code=422, detail="min_rate must not be greater than max_rate"
+        )
+    rate_range = await query_assets_service(
+        assets_list_repository=assets_list_repository
+    ).rate_range(min_rate, max_rate)
+    return GetInterestRateRangeResponse(
+        asset_count=rate_range.asset_count,
+        average_interest_rate=rate_range.avg_interest_rate,
+    )
+
+
+@router.post("/interest_rate/what_if", response_model=EvaluateScenariosResponse)
+@inject
+async def evaluate_scenarios(
+    payload: EvaluateScenariosRequest,
+    evaluate_scenarios_service: Callable[..., EvaluateScenariosService] = Depends(
+        Provide[Container.assets_list_services.evaluate_scenarios_service.provider]
+    ),
+    assets_list_repository: AsyncAssetsListRepository = Depends(
+        get_assets_list_repository
+    ),
+) -> EvaluateScenariosResponse:
+    try:
+        outcomes = await evaluate_scenarios_service(
+            assets_list_repository=assets_list_repository
+        )(ScenarioDeltas(*payload.to_columns()))
+    except AssetNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except DuplicateAssetIdError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    return EvaluateScenariosResponse(
+        scenarios=[
+            ScenarioOutcomeDto(
+                asset_count=asset_count,
+                average_interest_rate=None if math.isnan(average) else average,
+            )
+            for asset_count, average in zip(
+                outcomes.asset_counts.tolist(),
+                outcomes.avg_interest_rates.tolist(),
+            )
+        ]
+    )
+
+
+@router.get("/interest_rate/lowest", response_model=GetAssetsResponse)
+@inject
+async def get_lowest_rate_assets(
+    k: int = Query(default=10, ge=1, le=1000, description="How many assets"),
+    query_assets_service: Callable[..., QueryAssetsService] = Depends(
+        Provide[Container.assets_list_services.query_assets_service.provider]
+    ),
+    assets_list_repository: AsyncAssetsListRepository = Depends(
+        get_assets_list_repository
+    ),
+) -> GetAssetsResponse:
+    assets = await query_assets_service(
+        assets_list_repository=assets_list_repository
+    ).lowest(k)
+    return GetAssetsResponse(assets=[_asset_dto(asset) for asset in assets])
+
+
+@router.get("/interest_rate/highest", response_model=GetAssetsResponse)
+@inject
+async def get_highest_rate_assets(
+    k: int = Query(default=10, ge=1, le=1000, description="How many assets"),
+    query_assets_service: Callable[..., QueryAssetsService] = Depends(
+        Provide[Container.assets_list_services.query_assets_service.provider]
+    ),
+    assets_list_repository: AsyncAssetsListRepository = Depends(
+        get_assets_list_repository
+    ),
+) -> GetAssetsResponse:
+    assets = await query_assets_service(
+        assets_list_repository=assets_list_repository
+    ).highest(k)
+    return GetAssetsResponse(assets=[_asset_dto(asset) for asset in assets])
+
+
+@router.get("/history", response_model=GetAssetsListHistoryResponse)
+@inject
+async def get_assets_list_history(
+    history_service: Callable[..., GetAssetsListHistoryService] = Depends(
+        Provide[Container.assets_list_services.get_assets_list_history_service.provider]
+    ),
+    assets_list_repository: AsyncAssetsListRepository = Depends(
+        get_assets_list_repository
+    ),
+) -> GetAssetsListHistoryResponse:
+    try:
+        versions = await history_service(
+            assets_list_repository=assets_list_repository
+        ).versions()
+    except HistoryUnavailableError as e:
+        raise HTTPException(status_code=501, detail=str(e))
+    return GetAssetsListHistoryResponse(
+        versions=[_version_dto(version) for version in versions]
+    )
+
+
+@router.get("/history/interest_rate", response_model=AssetsListVersionDto)
+@inject
+async def get_past_average_interest_rate(
+    version: int | None = Query(default=None, ge=1, description="A past version"),
+    at: datetime | None = Query(default=None, description="A past point in time"),
+    history_service: Callable[..., GetAssetsListHistoryService] = Depends(
+        Provide[Container.assets_list_services.get_assets_list_history_service.provider]
+    ),
+    assets_list_repository: AsyncAssetsListRepository = Depends(
+        get_assets_list_repository
+    ),
+) -> AssetsListVersionDto:
+    past_version = await _past_version(
+        history_service(assets_list_repository=assets_list_repository), version, at
+    )
+    return _version_dto(past_version)
+
+
+@router.get("/history/assets", response_model=GetPastAssetsResponse)
+@inject
+async def get_past_assets(
+    version: int | None = Query(default=None, ge=1, description="A past version"),
+    at: datetime | None = Query(default=None, description="A past point in time"),
+    offset: int = Query(default=0, ge=0, description="How many assets to skip"),
+    limit: int = Query(default=100, ge=1, le=1000, description="How many assets"),
+    history_service: Callable[..., GetAssetsListHistoryService] = Depends(
+        Provide[Container.assets_list_services.get_assets_list_history_service.provider]
+    ),
+    assets_list_repository: AsyncAssetsListRepository = Depends(
+        get_assets_list_repository
+    ),
+) -> GetPastAssetsResponse:
+    past_version = await _past_version(
+        history_service(assets_list_repository=assets_list_repository), version, at
+    )
+    return GetPastAssetsResponse(
+        **_version_dto(past_version).model_dump(),
+        assets=[_asset_dto(asset) for asset in past_version.assets(offset, limit)],
+    )
+
+
+# The same handlers under the portfolio prefix; included once every route above
+# is declared
+portfolio_router = APIRouter(
+    prefix="/portfolios/{portfolio_id}",
+    tags=["portfolios"],
+    route_class=JsonCodecRoute,
+    dependencies=[Depends(_portfolio_id_param)],
+)
+portfolio_router.include_router(router)
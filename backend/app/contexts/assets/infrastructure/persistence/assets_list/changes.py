@@ -0,0 +1,137 @@
+from collections.abc import Sequence
+
+import msgspec
+import numpy as np
+from numpy.typing import NDArray
+
+from app.contexts.assets.domain.entities.assets_list import AssetsList
+from app.contexts.assets.domain.entities.errors import AssetNotFoundError
+from app.contexts.assets.domain.services.rate_groups.group_tables import (
+    TagValues,
+    encode_tags,
+)
+from app.contexts.assets.infrastructure.persistence.assets_list.snapshot_store import (
+    decode_assets_list,
+    encode_assets_list,
+)
+from app.contexts.shared.infrastructure.in_memory_database import Change, SetValue
+
+# First byte of an encoded change
+_SET, _ADD, _UPDATE, _REMOVE = b"S", b"A", b"U", b"R"
+
+
+class _RowsChange(Change[AssetsList]):
+    __slots__ = ("amounts", "asset_ids", "interest_rates", "tags")
+
+    def __init__(
+        self,
+        asset_ids: Sequence[str],
+        interest_rates: NDArray[np.float64],
+        amounts: NDArray[np.float64] | None = None,
+        tags: TagValues | None = None,
+    ):
+        self.asset_ids = asset_ids
+        self.interest_rates = interest_rates
+        self.amounts = amounts
+        self.tags = tags
+
+
+class AddAssets(_RowsChange):
+    """Appends rows, or creates the list from them when there is none."""
+
+    __slots__ = ()
+
+    def apply(self, value: AssetsList | None) -> AssetsList:
+        if value is None:
+            return AssetsList.from_columns(
+                self.asset_ids,
+                self.interest_rates,
+                amounts=self.amounts,
+                tag_columns=encode_tags(self.tags or {}, len(self.asset_ids)),
+            )
+        value.add_assets(self.asset_ids, self.interest_rates, self.amounts, self.tags)
+        return value
+
+
+class UpdateAssets(_RowsChange):
+    """Replaces the rates, amounts and tags of existing rows."""
+
+    __slots__ = ()
+
+    def apply(self, value: AssetsList | None) -> AssetsList:
+        if value is None:
+            raise AssetNotFoundError(list(self.asset_ids))
+        value.update_assets(
+            self.asset_ids, self.interest_rates, self.amounts, self.tags
+        )
+        return value
+
+
+class RemoveAssets(Change[AssetsList]):
+    """Removes rows by id."""
+
+    __slots__ = ("asset_ids",)
+
+    def __init__(self, asset_ids: Sequence[str]):
+        self.asset_ids = asset_ids
+
+    def apply(self, value: AssetsList | None) -> AssetsList:
+        if value is None:
+            raise AssetNotFoundError(list(self.asset_ids))
+        value.remove_assets(self.asset_ids)
+        return value
+
+
+class _Rows(msgspec.Struct, array_like=True):
+    id: list[str]
+    # Little-endian float64 columns as raw bytes
+    interest_rate: bytes | None = None
+    amount: bytes | None = None
+    tags: dict[str, list[str | None]] | None = None
+
+
+_rows_encoder = msgspec.msgpack.Encoder()
+_rows_decoder = msgspec.msgpack.Decoder(_Rows)
+
+
+def encode_assets_list_change(change: Change[AssetsList]) -> bytes:
+    """``change`` as a write-ahead log value: a whole list in the snapshot
+    format, or the columns of the rows it adds, updates or removes."""
+    if isinstance(change, SetValue):
+        return _SET + encode_assets_list(change.value)
+    if isinstance(change, _RowsChange):
+        rows = _Rows(
+            list(change.asset_ids),
+            _column_bytes(change.interest_rates),
+            _column_bytes(change.amounts),
+            None
+            if change.tags is None
+            else {name: list(values) for name, values in change.tags.items()},
+        )
+        kind = _UPDATE if isinstance(change, UpdateAssets) else _ADD
+        return kind + _rows_encoder.encode(rows)
+    if isinstance(change, RemoveAssets):
+        return _REMOVE + _rows_encoder.encode(_Rows(list(change.asset_ids)))
+    raise TypeError(f"cannot encode {type(change).__name__}")
+
+
+def decode_assets_list_change(data: bytes) -> Change[AssetsList]:
+    kind, payload = data[:1], data[1:]
+    if kind == _SET:
+        return SetValue(decode_assets_list(payload))
+    rows = _rows_decoder.decode(payload)
+    if kind == _REMOVE:
+        return RemoveAssets(rows.id)
+    if kind not in (_ADD, _UPDATE) or rows.interest_rate is None:
+        raise ValueError("not an assets list change")
+    change_type = UpdateAssets if kind == _UPDATE else AddAssets
+    return change_type(
+        rows.id,
+        np.frombuffer(rows.interest_rate, "<f8"),
+        None if rows.amount is None else np.frombuffer(rows.amount, "<f8"),
+        rows.tags,
+    )
+
+
+def _column_bytes(column: NDArray[np.float64] | None) -> bytes | None:
+    return None if column is None else np.asarray(column, "<f8").tobytes()
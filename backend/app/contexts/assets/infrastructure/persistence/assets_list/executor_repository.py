@@ -0,0 +1,157 @@
+import asyncio
+from collections.abc import Callable, Sequence
+from concurrent.futures import Executor
+from datetime import datetime
+from typing import Any, TypeVar
+
+import numpy as np
+from numpy.typing import NDArray
+
+from app.contexts.assets.domain.entities.asset import Asset
+from app.contexts.assets.domain.entities.assets_list import AssetsList
+from app.contexts.assets.domain.entities.assets_list_read_models import (
+    AssetsListReadModels,
+)
+from app.contexts.assets.domain.entities.assets_list_version import (
+    AssetsListVersion,
+)
+from app.contexts.assets.domain.repositories.assets_list_repository import (
+    AssetsListRepository,
+)
+from app.contexts.assets.domain.repositories.async_assets_list_repository import (
+    AsyncAssetsListRepository,
+)
+from app.contexts.assets.domain.services.rate_groups.group_tables import (
+    RateGroup,
+    TagValues,
+)
+from app.contexts.assets.domain.services.rate_histogram.histograms import (
+    RateHistograms,
+)
+from app.contexts.assets.domain.services.rate_index.sorted_rate_index import (
+    RateRange,
+)
+from app.contexts.assets.domain.services.rate_rollups.series import (
+    Resolution,
+    RollupPoint,
+)
+from app.contexts.assets.domain.services.rate_statistics.sketches import (
+    RateStatistics,
+)
+from app.contexts.assets.domain.services.what_if.scenarios import (
+    ScenarioDeltas,
+    ScenarioOutcomes,
+)
+
+R = TypeVar("R")
+
+
+class ExecutorAssetsListRepository(AsyncAssetsListRepository):
+    """Serves a blocking ``AssetsListRepository`` to async callers.
+
+    Writes validate and fold whole batches, so they always run on ``executor``
+    and the event loop keeps serving other requests meanwhile. Reads run on it
+    only with ``offload_reads``, for backends whose reads do I/O; in-memory reads
+    are a dict lookup and are answered inline.
+    """
+
+    def __init__(
+        self,
+        repository: AssetsListRepository,
+        executor: Executor | None = None,
+        offload_reads: bool = False,
+    ):
+        self.repository = repository
+        self.executor = executor
+        self.offload_reads = offload_reads
+
+    async def get_average_interest_rate(self) -> float | None:
+        return await self._read(self.repository.get_average_interest_rate)
+
+    async def get_weighted_average_interest_rate(self) -> float | None:
+        return await self._read(self.repository.get_weighted_average_interest_rate)
+
+    async def get_rate_statistics(self) -> RateStatistics | None:
+        # Answered from a sketch, unless a write dropped it and the next read
+        # rebuilds it from every rate, so it never runs on the event loop
+        return await self._run(self.repository.get_rate_statistics)
+
+    # Queries are answered from indexes, unless a write dropped them and the
+    # next query rebuilds them, so they never run on the event loop either
+
+    async def get_rate_histograms(self) -> RateHistograms | None:
+        return await self._run(self.repository.get_rate_histograms)
+
+    async def get_rate_groups(self, tag: str) -> list[RateGroup]:
+        return await self._run(self.repository.get_rate_groups, tag)
+
+    async def evaluate_scenarios(self, deltas: ScenarioDeltas) -> ScenarioOutcomes:
+        return await self._run(self.repository.evaluate_scenarios, deltas)
+
+    async def get_asset(self, asset_id: str) -> Asset | None:
+        return await self._run(self.repository.get_asset, asset_id)
+
+    async def get_rate_range(self, min_rate: float, max_rate: float) -> RateRange:
+        return await self._run(self.repository.get_rate_range, min_rate, max_rate)
+
+    async def get_lowest_rate_assets(self, k: int) -> list[Asset]:
+        return await self._run(self.repository.get_lowest_rate_assets, k)
+
+    async def get_highest_rate_assets(self, k: int) -> list[Asset]:
+        return await self._run(self.repository.get_highest_rate_assets, k)
+
+    async def get_version(self) -> int:
+        return await self._read(self.repository.get_version)
+
+    async def get_history(self) -> list[AssetsListVersion]:
+        return await self._read(self.repository.get_history)
+
+    async def get_rate_series(
+        self,
+        resolution: Resolution,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> list[RollupPoint]:
+        return await self._run(self.repository.get_rate_series, resolution, start, end)
+
+    async def get_past_version(
+        self, version: int | None = None, at: datetime | None = None
+    ) -> AssetsListVersion | None:
+        return await self._run(self.repository.get_past_version, version, at)
+
+    async def save(
+        self, assets_list: AssetsList, read_models: AssetsListReadModels | None = None
+    ) -> AssetsList:
+        return await self._run(self.repository.save, assets_list, read_models)
+
+    async def add_assets(
+        self,
+        asset_ids: Sequence[str],
+        interest_rates: NDArray[np.float64],
+        amounts: NDArray[np.float64] | None = None,
+        tags: TagValues | None = None,
+    ) -> float:
+        return await self._run(
+            self.repository.add_assets, asset_ids, interest_rates, amounts, tags
+        )
+
+    async def update_assets(
+        self,
+        asset_ids: Sequence[str],
+        interest_rates: NDArray[np.float64],
+        amounts: NDArray[np.float64] | None = None,
+        tags: TagValues | None = None,
+    ) -> float:
+        return await self._run(
+            self.repository.update_assets, asset_ids, interest_rates, amounts, tags
+        )
+
+    async def remove_assets(self, asset_ids: Sequence[str]) -> float:
+        return await self._run(self.repository.remove_assets, asset_ids)
+
+    async def _read(self, read: Callable[[], R]) -> R:
+        return await self._run(read) if self.offload_reads else read()
+
+    async def _run(self, function: Callable[..., R], *args: Any) -> R:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, function, *args)
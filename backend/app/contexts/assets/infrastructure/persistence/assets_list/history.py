@@ -0,0 +1,154 @@
+import threading
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable
+from datetime import datetime, timedelta
+
+from app.contexts.assets.domain.entities.assets_list import AssetsList
+from app.contexts.assets.domain.entities.assets_list_version import (
+    AssetsListVersion,
+    VersionChunk,
+)
+
+
+class _Timeline:
+    __slots__ = ("lock", "numbers", "timestamps", "versions")
+
+    def __init__(self) -> None:
+        self.versions: list[AssetsListVersion] = []
+        # Parallel to ``versions``, both ascending, for binary searches
+        self.numbers: list[int] = []
+        self.timestamps: list[float] = []
+        self.lock = threading.Lock()
+
+
+class AssetsListHistory:
+    """Past versions of every assets list, by storage key.
+
+    Every write records the version it leaves, sharing the unchanged chunks of
+    rows with the version before (see ``AssetsListVersion``). A key's versions
+    are kept in write order next to their numbers and write times, so a
+    point-in-time read is a binary search over either.
+
+    Versions beyond the retention policy, past the ``max_versions`` latest of a
+    key or older than ``max_age_seconds``, are dropped as new ones come in; the
+    latest version always stays. ``max_versions`` 0 keeps no history at all.
+
+    A saved list shares nothing with the version before, so its chunks can be
+    built with ``chunks_of`` before the write takes its lock.
+    """
+
+    def __init__(
+        self,
+        max_versions: int = 0,
+        max_age_seconds: float | None = None,
+        chunk_size: int = 1024,
+        clock: Callable[[], datetime] = datetime.now,
+    ):
+        self.max_versions = max_versions
+        self.max_age = (
+            None if max_age_seconds is None else timedelta(seconds=max_age_seconds)
+        )
+        self.chunk_size = chunk_size
+        self.clock = clock
+        self._timelines: dict[str, _Timeline] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_versions > 0
+
+    def chunks_of(self, assets_list: AssetsList) -> tuple[VersionChunk, ...] | None:
+        """The chunks of a whole new list, freezing it; None with no history."""
+        if not self.enabled:
+            return None
+        return AssetsListVersion.chunks_of(assets_list, self.chunk_size)
+
+    def record(
+        self,
+        key: str,
+        assets_list: AssetsList,
+        version: int,
+        changed_rows: Iterable[int] | None = None,
+        chunks: tuple[VersionChunk, ...] | None = None,
+    ) -> None:
+        """Keep ``assets_list`` as ``version`` of ``key``; ``changed_rows`` are
+        the rows changed since the previous version, None if unknown, and
+        ``chunks`` its rows if already built."""
+        if not self.enabled:
+            return
+        timeline = self._timeline(key)
+        with timeline.lock:
+            previous = timeline.versions[-1] if timeline.versions else None
+            created_at = self.clock()
+            if previous is not None:
+                # Keep the write times ascending if the clock steps back
+                created_at = max(created_at, previous.created_at)
+            timeline.versions.append(
+                AssetsListVersion.of(
+                    assets_list,
+                    version,
+                    created_at,
+                    self.chunk_size,
+                    previous=previous,
+                    changed_rows=changed_rows,
+                    chunks=chunks,
+                )
+            )
+            timeline.numbers.append(version)
+            timeline.timestamps.append(created_at.timestamp())
+            self._prune(timeline, created_at)
+
+    def versions(self, key: str) -> list[AssetsListVersion]:
+        """The kept versions of ``key``, oldest first."""
+        timeline = self._timelines.get(key)
+        if timeline is None:
+            return []
+        with timeline.lock:
+            return list(timeline.versions)
+
+    def latest(self, key: str) -> AssetsListVersion | None:
+        timeline = self._timelines.get(key)
+        if timeline is None:
+            return None
+        with timeline.lock:
+            return timeline.versions[-1] if timeline.versions else None
+
+    def at_version(self, key: str, version: int) -> AssetsListVersion | None:
+        """Version ``version`` of ``key``; None if it was not kept."""
+        timeline = self._timelines.get(key)
+        if timeline is None:
+            return None
+        with timeline.lock:
+            index = bisect_left(timeline.numbers, version)
+            if index < len(timeline.numbers) and timeline.numbers[index] == version:
+                return timeline.versions[index]
+            return None
+
+    def at_time(self, key: str, at: datetime) -> AssetsListVersion | None:
+        """The version of ``key`` current at ``at``: the last written at or
+        before it; None if there is none, or it was not kept."""
+        timeline = self._timelines.get(key)
+        if timeline is None:
+            return None
+        with timeline.lock:
+            index = bisect_right(timeline.timestamps, at.timestamp()) - 1
+            return timeline.versions[index] if index >= 0 else None
+
+    def _timeline(self, key: str) -> _Timeline:
+        timeline = self._timelines.get(key)
+        if timeline is None:
+            with self._lock:
+                timeline = self._timelines.setdefault(key, _Timeline())
+        return timeline
+
+    def _prune(self, timeline: _Timeline, now: datetime) -> None:
+        dropped = max(len(timeline.versions) - self.max_versions, 0)
+        if self.max_age is not None:
+            oldest_kept = (now - self.max_age).timestamp()
+            dropped = max(dropped, bisect_left(timeline.timestamps, oldest_kept))
+        # The latest version stays whatever its age
+        dropped = min(dropped, len(timeline.versions) - 1)
+        if dropped:
+            del timeline.versions[:dropped]
+            del timeline.numbers[:dropped]
+            del timeline.timestamps[:dropped]
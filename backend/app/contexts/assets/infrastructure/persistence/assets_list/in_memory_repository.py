@@ -1,20 +1,343 @@
+from collections.abc import Iterable, Sequence
+from datetime import datetime
+
+import numpy as np
+from numpy.typing import NDArray
+
+from app.contexts.assets.domain.entities.asset import Asset
 from app.contexts.assets.domain.entities.assets_list import AssetsList
+from app.contexts.assets.domain.entities.assets_list_read_models import (
+    AssetsListReadModels,
+)
+from app.contexts.assets.domain.entities.assets_list_version import (
+    AssetsListVersion,
+    VersionChunk,
+)
+from app.contexts.assets.domain.entities.errors import (
+    AssetNotFoundError,
+    HistoryUnavailableError,
+)
 from app.contexts.assets.domain.repositories.assets_list_repository import (
     AssetsListRepository,
 )
-from app.contexts.shared.infrastructure.in_memory_database import InMemoryDatabase
+from app.contexts.assets.domain.services.rate_groups.group_tables import (
+    RateGroup,
+    TagValues,
+)
+from app.contexts.assets.domain.services.rate_histogram.histograms import (
+    HistogramSpec,
+    RateHistograms,
+)
+from app.contexts.assets.domain.services.rate_index.sorted_rate_index import (
+    RateRange,
+)
+from app.contexts.assets.domain.services.rate_rollups.series import (
+    Resolution,
+    RollupPoint,
+)
+from app.contexts.assets.domain.services.rate_statistics.sketches import (
+    RateStatistics,
+)
+from app.contexts.assets.domain.services.what_if.scenarios import (
+    ScenarioDeltas,
+    ScenarioOutcomes,
+    evaluate_scenarios,
+)
+from app.contexts.assets.infrastructure.persistence.assets_list.changes import (
+    AddAssets,
+    RemoveAssets,
+    UpdateAssets,
+)
+from app.contexts.assets.infrastructure.persistence.assets_list.history import (
+    AssetsListHistory,
+)
+from app.contexts.assets.infrastructure.persistence.assets_list.rate_rollups import (
+    AverageRateRollups,
+)
+from app.contexts.assets.infrastructure.persistence.assets_list.read_models import (
+    AssetsListReadModelStore,
+)
+from app.contexts.shared.infrastructure.in_memory_database import (
+    InMemoryDatabase,
+    SetValue,
+)
+from app.contexts.shared.infrastructure.write_ahead_log import LogRecord
 
 
 class InMemoryAssetsListRepository(AssetsListRepository):
+    """Assets lists kept in an ``InMemoryDatabase`` and changed in place.
+
+    With a ``history``, every write also records the version it leaves, passing
+    on the rows it changed so that the version shares all other rows with the
+    one before. With ``rollups``, it records the average it leaves.
+
+    The read models of the list (see ``AssetsListReadModels``) are kept in
+    ``read_models`` by version: every write folds the rows it changes into them,
+    and a list that changed otherwise, e.g. on restart, gets new ones. Those
+    bucket the rates per ``histogram_spec``.
+
+    A saved or created list is logged whole, while added, updated and removed
+    rows are logged as such, encoded before taking the lock.
+    """
+
     storage_key = "assets_list"
 
-    def __init__(self, persistence: InMemoryDatabase[AssetsList]):
+    def __init__(
+        self,
+        persistence: InMemoryDatabase[AssetsList],
+        portfolio_id: str | None = None,
+        history: AssetsListHistory | None = None,
+        rollups: AverageRateRollups | None = None,
+        read_models: AssetsListReadModelStore | None = None,
+        histogram_spec: HistogramSpec | None = None,
+    ):
         self.persistence = persistence
+        self.portfolio_id = portfolio_id
+        self.history = history
+        self.rollups = rollups
+        self.read_models = read_models or AssetsListReadModelStore()
+        self.histogram_spec = histogram_spec
+        # The unscoped repository keeps the original single-portfolio key
+        self.key = (
+            self.storage_key
+            if portfolio_id is None
+            else f"portfolios/{portfolio_id}/{self.storage_key}"
+        )
 
     def get_average_interest_rate(self) -> float | None:
-        assets_list = self.persistence.get(self.storage_key)
+        assets_list = self.persistence.get(self.key)
         return assets_list.avg_interest_rate if assets_list else None
 
-    def save(self, assets_list: AssetsList) -> AssetsList:
-        self.persistence.set(self.storage_key, assets_list)
+    def get_weighted_average_interest_rate(self) -> float | None:
+        assets_list = self.persistence.get(self.key)
+        return assets_list.weighted_avg_interest_rate if assets_list else None
+
+    def get_rate_statistics(self) -> RateStatistics | None:
+        # A sketch dropped by an update is rebuilt from the columns, which
+        # writers must not change meanwhile
+        with self.persistence.lock(self.key):
+            assets_list = self.persistence.get(self.key)
+            if assets_list is None:
+                return None
+            return self._read_models(assets_list).rate_statistics()
+
+    # Queries lock as well: indexes dropped by a write are rebuilt on first use
+
+    def get_rate_histograms(self) -> RateHistograms | None:
+        with self.persistence.lock(self.key):
+            assets_list = self.persistence.get(self.key)
+            if assets_list is None:
+                return None
+            rate_histograms = self._read_models(assets_list).rate_histograms
+            # Writers keep adjusting the stored buckets in place
+            return rate_histograms.copy() if rate_histograms else None
+
+    def get_rate_groups(self, tag: str) -> list[RateGroup]:
+        with self.persistence.lock(self.key):
+            assets_list = self.persistence.get(self.key)
+            if assets_list is None:
+                return []
+            return self._read_models(assets_list).group_rates(tag)
+
+    def evaluate_scenarios(self, deltas: ScenarioDeltas) -> ScenarioOutcomes:
+        with self.persistence.lock(self.key):
+            assets_list = self.persistence.get(self.key)
+            if assets_list is None:
+                return evaluate_scenarios(deltas, 0, 0.0, {})
+            interest_rates = assets_list.interest_rates
+            stored_rates = {
+                asset_id: float(interest_rates[row])
+                for asset_id in deltas.asset_ids()
+                if (row := assets_list.row_of(asset_id)) is not None
+            }
+            return evaluate_scenarios(
+                deltas, assets_list.count, assets_list.rate_sum, stored_rates
+            )
+
+    def get_asset(self, asset_id: str) -> Asset | None:
+        with self.persistence.lock(self.key):
+            assets_list = self.persistence.get(self.key)
+            return assets_list.get_asset(asset_id) if assets_list else None
+
+    def get_rate_range(self, min_rate: float, max_rate: float) -> RateRange:
+        with self.persistence.lock(self.key):
+            assets_list = self.persistence.get(self.key)
+            if assets_list is None:
+                return RateRange(0, 0.0)
+            return self._read_models(assets_list).rate_range(min_rate, max_rate)
+
+    def get_lowest_rate_assets(self, k: int) -> list[Asset]:
+        with self.persistence.lock(self.key):
+            assets_list = self.persistence.get(self.key)
+            if assets_list is None:
+                return []
+            return self._read_models(assets_list).lowest_rate_assets(k)
+
+    def get_highest_rate_assets(self, k: int) -> list[Asset]:
+        with self.persistence.lock(self.key):
+            assets_list = self.persistence.get(self.key)
+            if assets_list is None:
+                return []
+            return self._read_models(assets_list).highest_rate_assets(k)
+
+    def get_version(self) -> int:
+        return self.persistence.get_version(self.key)
+
+    def get_history(self) -> list[AssetsListVersion]:
+        return self._history().versions(self.key)
+
+    def get_rate_series(
+        self,
+        resolution: Resolution,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> list[RollupPoint]:
+        if self.rollups is None:
+            raise HistoryUnavailableError("memory")
+        return self.rollups.points(
+            self.key,
+            resolution,
+            None if start is None else start.timestamp(),
+            None if end is None else end.timestamp(),
+        )
+
+    def get_past_version(
+        self, version: int | None = None, at: datetime | None = None
+    ) -> AssetsListVersion | None:
+        history = self._history()
+        if version is not None:
+            return history.at_version(self.key, version)
+        if at is not None:
+            return history.at_time(self.key, at)
+        return history.latest(self.key)
+
+    def save(
+        self, assets_list: AssetsList, read_models: AssetsListReadModels | None = None
+    ) -> AssetsList:
+        record = self.persistence.log_record(self.key, SetValue(assets_list))
+        # The list is not shared yet, so its version is built before the lock
+        chunks = None if self.history is None else self.history.chunks_of(assets_list)
+        return self._store(
+            assets_list,
+            read_models or self._new_read_models(assets_list),
+            record=record,
+            chunks=chunks,
+        )
+
+    def add_assets(
+        self,
+        asset_ids: Sequence[str],
+        interest_rates: NDArray[np.float64],
+        amounts: NDArray[np.float64] | None = None,
+        tags: TagValues | None = None,
+    ) -> float:
+        change = AddAssets(asset_ids, interest_rates, amounts, tags)
+        record = self.persistence.log_record(self.key, change)
+        with self.persistence.lock(self.key):
+            assets_list = self.persistence.get(self.key)
+            if assets_list is None:
+                # Logged whole, as a restored snapshot may hold the key by the
+                # time the log is replayed
+                assets_list = change.apply(None)
+                record = self.persistence.log_record(self.key, SetValue(assets_list))
+                return self._store(
+                    assets_list, self._new_read_models(assets_list), record=record
+                ).avg_interest_rate
+            read_models = self._read_models(assets_list)
+            start = assets_list.count
+            change.apply(assets_list)
+            read_models.added(slice(start, assets_list.count))
+            return self._store(
+                assets_list, read_models, range(start, assets_list.count), record
+            ).avg_interest_rate
+
+    def update_assets(
+        self,
+        asset_ids: Sequence[str],
+        interest_rates: NDArray[np.float64],
+        amounts: NDArray[np.float64] | None = None,
+        tags: TagValues | None = None,
+    ) -> float:
+        change = UpdateAssets(asset_ids, interest_rates, amounts, tags)
+        record = self.persistence.log_record(self.key, change)
+        with self.persistence.lock(self.key):
+            assets_list = self._get_existing(asset_ids)
+            read_models = self._read_models(assets_list)
+            changed = read_models.changing(_rows_of(assets_list, asset_ids))
+            change.apply(assets_list)
+            read_models.updated(changed)
+            return self._store(
+                assets_list, read_models, changed.rows, record
+            ).avg_interest_rate
+
+    def remove_assets(self, asset_ids: Sequence[str]) -> float:
+        change = RemoveAssets(asset_ids)
+        record = self.persistence.log_record(self.key, change)
+        with self.persistence.lock(self.key):
+            assets_list = self._get_existing(asset_ids)
+            read_models = self._read_models(assets_list)
+            # Rows past the new end go; the freed ones take the last rows
+            changed = read_models.changing(
+                _rows_of(assets_list, list(dict.fromkeys(asset_ids)))
+            )
+            change.apply(assets_list)
+            read_models.removed(changed)
+            return self._store(
+                assets_list, read_models, changed.rows, record
+            ).avg_interest_rate
+
+    def _store(
+        self,
+        assets_list: AssetsList,
+        read_models: AssetsListReadModels,
+        changed_rows: Iterable[int] | None = None,
+        record: LogRecord | None = None,
+        chunks: tuple[VersionChunk, ...] | None = None,
+    ) -> AssetsList:
+        with self.persistence.lock(self.key):
+            self.persistence.set(self.key, assets_list, record)
+            self.read_models.put(
+                self.key, self.persistence.get_version(self.key), read_models
+            )
+            if self.history is not None:
+                self.history.record(
+                    self.key,
+                    assets_list,
+                    self.persistence.get_version(self.key),
+                    changed_rows,
+                    chunks,
+                )
+            if self.rollups is not None:
+                self.rollups.record(self.key, assets_list.avg_interest_rate)
         return assets_list
+
+    def _read_models(self, assets_list: AssetsList) -> AssetsListReadModels:
+        # Called with the key locked, so that the version matches the list
+        version = self.persistence.get_version(self.key)
+        read_models = self.read_models.get(self.key, assets_list, version)
+        if read_models is None:
+            read_models = self._new_read_models(assets_list)
+            self.read_models.put(self.key, version, read_models)
+        return read_models
+
+    def _new_read_models(self, assets_list: AssetsList) -> AssetsListReadModels:
+        return AssetsListReadModels(assets_list, histogram_spec=self.histogram_spec)
+
+    def _history(self) -> AssetsListHistory:
+        if self.history is None or not self.history.enabled:
+            raise HistoryUnavailableError("memory")
+        return self.history
+
+    def _get_existing(self, asset_ids: Sequence[str]) -> AssetsList:
+        assets_list = self.persistence.get(self.key)
+        if assets_list is None:
+            raise AssetNotFoundError(list(asset_ids))
+        return assets_list
+
+
+def _rows_of(assets_list: AssetsList, asset_ids: Sequence[str]) -> list[int]:
+    return [
+        row
+        for asset_id in asset_ids
+        if (row := assets_list.row_of(asset_id)) is not None
+    ]
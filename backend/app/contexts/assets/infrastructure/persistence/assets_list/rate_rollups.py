@@ -0,0 +1,78 @@
+import threading
+import time
+from collections.abc import Callable
+
+from app.contexts.assets.domain.services.rate_rollups.series import (
+    Resolution,
+    RollupPoint,
+    RollupSeries,
+)
+
+
+class _Rollups:
+    __slots__ = ("last_timestamp", "lock", "series")
+
+    def __init__(self) -> None:
+        self.series = {
+            resolution: RollupSeries(resolution.seconds) for resolution in Resolution
+        }
+        self.last_timestamp = 0.0
+        self.lock = threading.Lock()
+
+
+class AverageRateRollups:
+    """Minute, hour and day rollups of the average interest rate of every
+    assets list, by storage key.
+
+    Each write records the average it leaves into the current bucket of all
+    three resolutions, so recording costs the same whatever the number of past
+    writes and reading a range costs the number of buckets returned. Buckets
+    older than the retention of their resolution are dropped as new ones open.
+    """
+
+    def __init__(
+        self,
+        minute_retention_seconds: float = 7 * 86400,
+        hour_retention_seconds: float = 90 * 86400,
+        day_retention_seconds: float = 5 * 365 * 86400,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.retention = {
+            Resolution.MINUTE: minute_retention_seconds,
+            Resolution.HOUR: hour_retention_seconds,
+            Resolution.DAY: day_retention_seconds,
+        }
+        self.clock = clock
+        self._rollups: dict[str, _Rollups] = {}
+        self._lock = threading.Lock()
+
+    def record(self, key: str, avg_interest_rate: float) -> None:
+        rollups = self._rollups.get(key)
+        if rollups is None:
+            with self._lock:
+                rollups = self._rollups.setdefault(key, _Rollups())
+        with rollups.lock:
+            # Keep the times ascending if the clock steps back
+            timestamp = rollups.last_timestamp = max(
+                self.clock(), rollups.last_timestamp
+            )
+            for resolution, series in rollups.series.items():
+                opened = len(series)
+                series.add(timestamp, avg_interest_rate)
+                if len(series) != opened:
+                    series.prune(timestamp - self.retention[resolution])
+
+    def points(
+        self,
+        key: str,
+        resolution: Resolution,
+        start: float | None = None,
+        end: float | None = None,
+    ) -> list[RollupPoint]:
+        """The ``resolution`` buckets of ``key`` overlapping ``[start, end]``
+        (Unix times), oldest first."""
+        rollups = self._rollups.get(key)
+        if rollups is None:
+            return []
+        with rollups.lock:
+            return rollups.series[resolution].points(start, end)
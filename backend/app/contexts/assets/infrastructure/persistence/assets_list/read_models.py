@@ -0,0 +1,44 @@
+import threading
+from typing import NamedTuple
+
+from app.contexts.assets.domain.entities.assets_list import AssetsList
+from app.contexts.assets.domain.entities.assets_list_read_models import (
+    AssetsListReadModels,
+)
+
+
+class _Entry(NamedTuple):
+    version: int
+    read_models: AssetsListReadModels
+
+
+class AssetsListReadModelStore:
+    """Read models of every assets list, by storage key, filed under the
+    version of the list they were derived from.
+
+    A repository folds its own writes into the models of the version they
+    change and files them under the version they leave. Models filed under any
+    other version or list, e.g. before a list was restored from a snapshot or
+    replayed from the write-ahead log, are never handed out; the list gets new
+    ones, built on first read.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self, key: str, assets_list: AssetsList, version: int
+    ) -> AssetsListReadModels | None:
+        entry = self._entries.get(key)
+        if (
+            entry is None
+            or entry.version != version
+            or entry.read_models.assets_list is not assets_list
+        ):
+            return None
+        return entry.read_models
+
+    def put(self, key: str, version: int, read_models: AssetsListReadModels) -> None:
+        with self._lock:
+            self._entries[key] = _Entry(version, read_models)
@@ -0,0 +1,343 @@
+import asyncio
+import itertools
+import json
+import logging
+import math
+import mmap
+import os
+import struct
+import tempfile
+from collections.abc import Iterator, Mapping, Sequence
+from datetime import datetime
+from pathlib import Path
+from typing import overload
+from urllib.parse import quote, unquote
+
+import numpy as np
+from numpy.typing import NDArray
+
+from app.contexts.assets.domain.entities.assets_list import AssetsList
+from app.contexts.assets.domain.services.rate_groups.group_tables import TagColumn
+from app.contexts.shared.infrastructure.in_memory_database import InMemoryDatabase
+
+# magic, id length, created_at length, asset count, avg interest rate, id blob
+# size, whether an amounts column follows the rates, the weighted average
+# interest rate (NaN for None) and the size of the JSON list of tag names and
+# values
+_HEADER = struct.Struct("<8sIIQdQQdQ")
+_MAGIC = b"ASSETS03"
+_SUFFIX = ".snapshot"
+
+logger = logging.getLogger(__name__)
+
+
+class MappedIdColumn(Sequence[str]):
+    """Asset ids decoded on access from a snapshot's offsets and UTF-8 blob."""
+
+    __slots__ = ("_blob", "_offsets")
+
+    def __init__(self, offsets: NDArray[np.int64], blob: memoryview):
+        self._offsets = offsets
+        self._blob = blob
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        if isinstance(index, slice):
+            return [self[row] for row in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("asset id index out of range")
+        start, end = self._offsets[index], self._offsets[index + 1]
+        return str(self._blob[start:end], "utf-8")
+
+    def __iter__(self) -> Iterator[str]:
+        blob, offsets = self._blob, self._offsets.tolist()
+        for start, end in itertools.pairwise(offsets):
+            yield str(blob[start:end], "utf-8")
+
+
+class AssetsListSnapshotStore:
+    """Binary, memory-mappable snapshots of assets lists, one file per key.
+
+    A snapshot is a small header, the list id and ``created_at``, then the
+    columns as written in memory: int64 id offsets, float64 interest rates, the
+    float64 amounts if the list has any, the int32 codes of every tag and the
+    UTF-8 id blob, followed by the tags' names and values as JSON. Loading maps
+    the file and wraps the columns without parsing or copying them, so a
+    restart costs one ``mmap`` per list. Only this format is read: ``load``
+    rejects any other file, such as a snapshot from before amounts and tags,
+    and ``load_all`` logs and skips it.
+    """
+
+    def __init__(self, directory: str | os.PathLike[str]):
+        self.directory = Path(directory)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / (quote(key, safe="") + _SUFFIX)
+
+    def write(self, key: str, assets_list: AssetsList) -> None:
+        """Write the snapshot of ``key`` atomically."""
+        self.write_columns(
+            key,
+            assets_list.id,
+            assets_list.created_at,
+            assets_list.asset_ids,
+            assets_list.interest_rates,
+            assets_list.avg_interest_rate,
+            assets_list.amounts,
+            assets_list.weighted_avg_interest_rate,
+            assets_list.tag_columns,
+        )
+
+    def write_columns(
+        self,
+        key: str,
+        list_id: str,
+        created_at: datetime,
+        asset_ids: Sequence[str],
+        interest_rates: NDArray[np.float64],
+        avg_interest_rate: float,
+        amounts: NDArray[np.float64] | None = None,
+        weighted_avg_interest_rate: float | None = None,
+        tag_columns: Mapping[str, TagColumn] | None = None,
+    ) -> None:
+        parts = _encode_columns(
+            list_id,
+            created_at,
+            asset_ids,
+            interest_rates,
+            avg_interest_rate,
+            amounts,
+            weighted_avg_interest_rate,
+            tag_columns,
+        )
+        self.directory.mkdir(parents=True, exist_ok=True)
+        descriptor, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.writelines(parts)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temporary, self._path(key))
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+    def load(self, key: str) -> AssetsList | None:
+        path = self._path(key)
+        return self._load(path) if path.exists() else None
+
+    def load_all(self) -> dict[str, AssetsList]:
+        """Every readable snapshot, by key; the others are logged and left in
+        place, so that one bad file does not keep the rest from loading."""
+        if not self.directory.is_dir():
+            return {}
+        assets_lists = {}
+        for path in self.directory.glob("*" + _SUFFIX):
+            try:
+                assets_lists[unquote(path.name.removesuffix(_SUFFIX))] = self._load(
+                    path
+                )
+            except (OSError, ValueError) as e:
+                logger.warning("Skipping unreadable snapshot %s: %s", path, e)
+        return assets_lists
+
+    def _load(self, path: Path) -> AssetsList:
+        with path.open("rb") as file:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return decode_assets_list(mapped)
+        except ValueError:
+            raise ValueError(f"{path} is not an assets list snapshot") from None
+
+
+class AssetsListSnapshotter:
+    """Keeps snapshots of an in-memory database's assets lists up to date.
+
+    ``snapshot`` only rewrites lists whose version changed since the last run.
+    Their columns are copied under the shard lock and written outside it, so
+    writers are held up for the copy only.
+    """
+
+    def __init__(
+        self,
+        database: InMemoryDatabase[AssetsList],
+        store: AssetsListSnapshotStore,
+    ):
+        self.database = database
+        self.store = store
+        self._written_versions: dict[str, int] = {}
+
+    def restore(self) -> int:
+        """Load every stored snapshot into the database; return how many."""
+        snapshots = self.store.load_all()
+        for key, assets_list in snapshots.items():
+            self.database.set(key, assets_list)
+            self._written_versions[key] = self.database.get_version(key)
+        return len(snapshots)
+
+    def snapshot(self) -> int:
+        """Write the lists changed since the last snapshot; return how many."""
+        written = 0
+        for key, version in self.database.versions().items():
+            if self._written_versions.get(key) == version:
+                continue
+            with self.database.lock(key):
+                assets_list = self.database.get(key)
+                if assets_list is None:
+                    continue
+                version = self.database.get_version(key)
+                columns = (
+                    assets_list.id,
+                    assets_list.created_at,
+                    list(assets_list.asset_ids),
+                    assets_list.interest_rates.copy(),
+                    assets_list.avg_interest_rate,
+                    None if assets_list.amounts is None else assets_list.amounts.copy(),
+                    assets_list.weighted_avg_interest_rate,
+                    {
+                        name: column.copy()
+                        for name, column in assets_list.tag_columns.items()
+                    },
+                )
+            self.store.write_columns(key, *columns)
+            self._written_versions[key] = version
+            written += 1
+        return written
+
+    async def run_periodically(self, interval_seconds: float) -> None:
+        while True:
+            await asyncio.sleep(interval_seconds)
+            await asyncio.to_thread(self.snapshot)
+
+
+def encode_assets_list(assets_list: AssetsList) -> bytes:
+    """``assets_list`` in the snapshot format, as one buffer."""
+    return b"".join(
+        _encode_columns(
+            assets_list.id,
+            assets_list.created_at,
+            assets_list.asset_ids,
+            assets_list.interest_rates,
+            assets_list.avg_interest_rate,
+            assets_list.amounts,
+            assets_list.weighted_avg_interest_rate,
+            assets_list.tag_columns,
+        )
+    )
+
+
+def decode_assets_list(mapped: mmap.mmap | bytes) -> AssetsList:
+    """The assets list encoded in ``mapped``, wrapping its columns in place."""
+    if mapped[: len(_MAGIC)] != _MAGIC:
+        raise ValueError("not an assets list snapshot")
+    (
+        _,
+        id_length,
+        created_at_length,
+        count,
+        avg,
+        blob_length,
+        has_amounts,
+        weighted_avg,
+        tags_length,
+    ) = _HEADER.unpack_from(mapped)
+    position = _HEADER.size
+    list_id = mapped[position : position + id_length].decode()
+    position += id_length
+    created_at = datetime.fromisoformat(
+        mapped[position : position + created_at_length].decode()
+    )
+    position += created_at_length
+    position += _padding(position)
+
+    offsets = np.frombuffer(mapped, np.int64, count + 1, position)
+    position += offsets.nbytes
+    interest_rates = np.frombuffer(mapped, "<f8", count, position)
+    position += interest_rates.nbytes
+    amounts = None
+    if has_amounts:
+        amounts = np.frombuffer(mapped, "<f8", count, position)
+        position += amounts.nbytes
+    tags = []
+    if tags_length:
+        tags_start = len(mapped) - tags_length
+        tags = json.loads(mapped[tags_start:].decode())
+    tag_columns = {}
+    for name, values in tags:
+        codes = np.frombuffer(mapped, "<i4", count, position)
+        position += codes.nbytes
+        tag_columns[name] = TagColumn(values, codes)
+    blob = memoryview(mapped)[position : position + blob_length]
+
+    return AssetsList.from_trusted_columns(
+        MappedIdColumn(offsets, blob),
+        interest_rates,
+        avg,
+        amounts=amounts,
+        weighted_avg_interest_rate=(None if math.isnan(weighted_avg) else weighted_avg),
+        tag_columns=tag_columns,
+        id=list_id,
+        created_at=created_at,
+    )
+
+
+def _encode_columns(
+    list_id: str,
+    created_at: datetime,
+    asset_ids: Sequence[str],
+    interest_rates: NDArray[np.float64],
+    avg_interest_rate: float,
+    amounts: NDArray[np.float64] | None = None,
+    weighted_avg_interest_rate: float | None = None,
+    tag_columns: Mapping[str, TagColumn] | None = None,
+) -> list[bytes]:
+    encoded_ids = [asset_id.encode() for asset_id in asset_ids]
+    offsets = np.zeros(len(encoded_ids) + 1, dtype=np.int64)
+    np.cumsum(
+        np.fromiter(map(len, encoded_ids), np.int64, len(encoded_ids)),
+        out=offsets[1:],
+    )
+    blob = b"".join(encoded_ids)
+    tag_columns = tag_columns or {}
+    tags = json.dumps(
+        [[name, column.values] for name, column in tag_columns.items()]
+    ).encode()
+    meta = list_id.encode() + created_at.isoformat().encode()
+    header = _HEADER.pack(
+        _MAGIC,
+        len(list_id.encode()),
+        len(created_at.isoformat().encode()),
+        len(encoded_ids),
+        avg_interest_rate,
+        len(blob),
+        amounts is not None,
+        math.nan if weighted_avg_interest_rate is None else weighted_avg_interest_rate,
+        len(tags),
+    )
+
+    parts = [
+        header + meta + bytes(_padding(len(header) + len(meta))),
+        offsets.tobytes(),
+        np.ascontiguousarray(interest_rates, "<f8").tobytes(),
+    ]
+    if amounts is not None:
+        parts.append(np.ascontiguousarray(amounts, "<f8").tobytes())
+    for column in tag_columns.values():
+        parts.append(np.ascontiguousarray(column.codes, "<i4").tobytes())
+    parts += (blob, tags)
+    return parts
+
+
+def _padding(size: int) -> int:
+    # Keeps the numeric columns 8-byte aligned within the mapping
+    return -size % 8
@@ -0,0 +1,750 @@
+import math
+import sqlite3
+from collections.abc import Iterable, Sequence
+from datetime import datetime
+from itertools import repeat
+from typing import NamedTuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from app.contexts.assets.domain.entities.asset import Asset
+from app.contexts.assets.domain.entities.assets_list import AssetsList
+from app.contexts.assets.domain.entities.assets_list_read_models import (
+    AssetsListReadModels,
+)
+from app.contexts.assets.domain.entities.assets_list_version import (
+    AssetsListVersion,
+)
+from app.contexts.assets.domain.entities.errors import (
+    AssetNotFoundError,
+    DuplicateAssetIdError,
+    HistoryUnavailableError,
+)
+from app.contexts.assets.domain.repositories.assets_list_repository import (
+    AssetsListRepository,
+)
+from app.contexts.assets.domain.services.interest_rate_avg_calculator.errors import (
+    EmptyListError,
+)
+from app.contexts.assets.domain.services.interest_rate_avg_calculator.running_mean import (
+    positive_weights,
+)
+from app.contexts.assets.domain.services.rate_groups.group_tables import (
+    RateGroup,
+    TagValues,
+    build_group_tables,
+    encode_tags,
+    tag_values,
+)
+from app.contexts.assets.domain.services.rate_histogram.histograms import (
+    HistogramSpec,
+    RateHistograms,
+)
+from app.contexts.assets.domain.services.rate_index.sorted_rate_index import (
+    RateRange,
+    SortedRateIndex,
+)
+from app.contexts.assets.domain.services.rate_rollups.series import (
+    Resolution,
+    RollupPoint,
+)
+from app.contexts.assets.domain.services.rate_statistics.sketches import (
+    RateSketch,
+    RateStatistics,
+)
+from app.contexts.assets.domain.services.what_if.scenarios import (
+    ScenarioDeltas,
+    ScenarioOutcomes,
+    evaluate_scenarios,
+)
+from app.contexts.shared.infrastructure.sqlite_database import SqliteDatabase
+
+# SQLite's default limit of host parameters per statement is 32766
+_MAX_IN_PARAMETERS = 30_000
+
+
+class SqliteAssetsListRepository(AssetsListRepository):
+    """Durable assets lists in SQLite.
+
+    Assets are bulk-written with ``executemany`` inside one transaction. The
+    count, rate sum and average of every list are kept in ``assets_lists`` and
+    updated in the same transaction as the assets, so reading the average is a
+    primary-key lookup. So are the sum of the assets' amounts and of their
+    amount-weighted rates, for the weighted average; a missing amount is NULL.
+
+    The serialized ``RateSketch`` of every list is stored next to them for the
+    rate statistics. Added rates are folded into it; updates and removals clear
+    it, and the next statistics read rebuilds it from the assets. Its
+    ``RateHistograms`` are stored the same way, and every write moves the
+    changed rates between their buckets.
+
+    Assets are also indexed by rate, so range aggregates scan only the matching
+    index entries and the lowest or highest rates are read off its ends. What-if
+    scenarios read the stored count and rate sum and the rates of the assets
+    they refer to from one snapshot.
+
+    Tags are rows of ``asset_tags``, and ``rate_groups`` holds the count and rate
+    sum of every tag value. A save writes the aggregate's group tables; other
+    writes shift the rows of the groups their assets leave and join.
+    """
+
+    storage_key = "assets_list"
+
+    schema = """
+        CREATE TABLE IF NOT EXISTS assets_lists (
+            storage_key TEXT PRIMARY KEY,
+            id TEXT NOT NULL,
+            created_at TEXT NOT NULL,
+            asset_count INTEGER NOT NULL,
+            rate_sum REAL NOT NULL,
+            avg_interest_rate REAL NOT NULL,
+            weighted_count INTEGER NOT NULL DEFAULT 0,
+            weight_sum REAL NOT NULL DEFAULT 0,
+            weighted_rate_sum REAL NOT NULL DEFAULT 0,
+            weighted_avg_interest_rate REAL,
+            rate_sketch BLOB,
+            rate_histograms BLOB,
+            version INTEGER NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS assets (
+            storage_key TEXT NOT NULL,
+            asset_id TEXT NOT NULL,
+            interest_rate REAL NOT NULL,
+            amount REAL,
+            PRIMARY KEY (storage_key, asset_id)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS assets_by_rate
+            ON assets (storage_key, interest_rate);
+        CREATE TABLE IF NOT EXISTS asset_tags (
+            storage_key TEXT NOT NULL,
+            asset_id TEXT NOT NULL,
+            tag TEXT NOT NULL,
+            value TEXT NOT NULL,
+            PRIMARY KEY (storage_key, asset_id, tag)
+        ) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS rate_groups (
+            storage_key TEXT NOT NULL,
+            tag TEXT NOT NULL,
+            value TEXT NOT NULL,
+            asset_count INTEGER NOT NULL,
+            rate_sum REAL NOT NULL,
+            PRIMARY KEY (storage_key, tag, value)
+        ) WITHOUT ROWID;
+    """
+
+    def __init__(self, database: SqliteDatabase, portfolio_id: str | None = None):
+        self.database = database
+        self.portfolio_id = portfolio_id
+        # The unscoped repository keeps the original single-portfolio key
+        self.key = (
+            self.storage_key
+            if portfolio_id is None
+            else f"portfolios/{portfolio_id}/{self.storage_key}"
+        )
+
+    def get_average_interest_rate(self) -> float | None:
+        row = self.database.connection.execute(
+            "SELECT avg_interest_rate FROM assets_lists WHERE storage_key = ?",
+            (self.key,),
+        ).fetchone()
+        return row[0] if row else None
+
+    def get_weighted_average_interest_rate(self) -> float | None:
+        row = self.database.connection.execute(
+            "SELECT weighted_avg_interest_rate FROM assets_lists WHERE storage_key = ?",
+            (self.key,),
+        ).fetchone()
+        return row[0] if row else None
+
+    def get_rate_statistics(self) -> RateStatistics | None:
+        row = self.database.connection.execute(
+            "SELECT rate_sketch FROM assets_lists WHERE storage_key = ?", (self.key,)
+        ).fetchone()
+        if row is None:
+            return None
+        if row[0] is not None:
+            return RateSketch.from_bytes(row[0]).statistics()
+
+        with self.database.transaction() as connection:
+            rate_sketch = RateSketch.from_values(self._select_rates(connection))
+            # Not a change of the list, so its version stays
+            connection.execute(
+                "UPDATE assets_lists SET rate_sketch = ? WHERE storage_key = ?",
+                (rate_sketch.to_bytes(), self.key),
+            )
+        return rate_sketch.statistics()
+
+    def get_rate_histograms(self) -> RateHistograms | None:
+        row = self.database.connection.execute(
+            "SELECT rate_histograms FROM assets_lists WHERE storage_key = ?",
+            (self.key,),
+        ).fetchone()
+        if row is None:
+            return None
+        if row[0] is not None:
+            return RateHistograms.from_bytes(row[0])
+
+        with self.database.transaction() as connection:
+            rate_histograms = HistogramSpec().build(
+                SortedRateIndex.from_rates(self._select_rates(connection))
+            )
+            connection.execute(
+                "UPDATE assets_lists SET rate_histograms = ? WHERE storage_key = ?",
+                (_serialized(rate_histograms), self.key),
+            )
+        return rate_histograms
+
+    def get_rate_groups(self, tag: str) -> list[RateGroup]:
+        return [
+            RateGroup(value, asset_count, rate_sum)
+            for value, asset_count, rate_sum in self.database.connection.execute(
+                "SELECT value, asset_count, rate_sum FROM rate_groups "
+                "WHERE storage_key = ? AND tag = ? ORDER BY value",
+                (self.key, tag),
+            )
+        ]
+
+    def evaluate_scenarios(self, deltas: ScenarioDeltas) -> ScenarioOutcomes:
+        with self.database.snapshot() as connection:
+            asset_count, rate_sum = self._read_aggregate(connection) or (0, 0.0)
+            rows = self._select_rows(connection, list(deltas.asset_ids()))
+        stored_rates = {
+            asset_id: interest_rate for asset_id, (interest_rate, _) in rows.items()
+        }
+        return evaluate_scenarios(deltas, asset_count, rate_sum, stored_rates)
+
+    def get_asset(self, asset_id: str) -> Asset | None:
+        rows = self._select_assets("AND assets.asset_id = ?", asset_id)
+        return rows[0] if rows else None
+
+    def get_rate_range(self, min_rate: float, max_rate: float) -> RateRange:
+        count, rate_sum = self.database.connection.execute(
+            "SELECT COUNT(*), TOTAL(interest_rate) FROM assets "
+            "WHERE storage_key = ? AND interest_rate BETWEEN ? AND ?",
+            (self.key, min_rate, max_rate),
+        ).fetchone()
+        return RateRange(count, rate_sum)
+
+    def get_lowest_rate_assets(self, k: int) -> list[Asset]:
+        return self._select_assets("ORDER BY assets.interest_rate LIMIT ?", k)
+
+    def get_highest_rate_assets(self, k: int) -> list[Asset]:
+        return self._select_assets("ORDER BY assets.interest_rate DESC LIMIT ?", k)
+
+    def get_version(self) -> int:
+        row = self.database.connection.execute(
+            "SELECT version FROM assets_lists WHERE storage_key = ?", (self.key,)
+        ).fetchone()
+        return row[0] if row else 0
+
+    def get_history(self) -> list[AssetsListVersion]:
+        raise HistoryUnavailableError("sqlite")
+
+    def get_rate_series(
+        self,
+        resolution: Resolution,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> list[RollupPoint]:
+        raise HistoryUnavailableError("sqlite")
+
+    def get_past_version(
+        self, version: int | None = None, at: datetime | None = None
+    ) -> AssetsListVersion | None:
+        raise HistoryUnavailableError("sqlite")
+
+    def save(
+        self, assets_list: AssetsList, read_models: AssetsListReadModels | None = None
+    ) -> AssetsList:
+        with self.database.transaction() as connection:
+            self._replace(connection, assets_list, read_models)
+        return assets_list
+
+    def add_assets(
+        self,
+        asset_ids: Sequence[str],
+        interest_rates: NDArray[np.float64],
+        amounts: NDArray[np.float64] | None = None,
+        tags: TagValues | None = None,
+    ) -> float:
+        _check_aligned(asset_ids, interest_rates, amounts, tags)
+        AssetsList.validate_unique_asset_ids(asset_ids)
+        with self.database.transaction() as connection:
+            if self._read_aggregate(connection) is None:
+                assets_list = AssetsList.from_columns(
+                    asset_ids,
+                    interest_rates,
+                    amounts=amounts,
+                    tag_columns=encode_tags(tags or {}, len(asset_ids)),
+                )
+                self._replace(connection, assets_list)
+                return assets_list.avg_interest_rate
+
+            existing = list(self._select_rows(connection, asset_ids))
+            if existing:
+                raise DuplicateAssetIdError(existing)
+            self._insert_assets(connection, asset_ids, interest_rates, amounts)
+            if tags:
+                self._upsert_tags(connection, asset_ids, tags)
+                self._shift_groups(connection, _group_rows(tags, interest_rates))
+            return self._shift_aggregate(
+                connection,
+                len(asset_ids),
+                float(np.sum(interest_rates)),
+                _weighted_sums(interest_rates, amounts),
+                self._folded_rate_sketch(connection, interest_rates),
+                self._shifted_histograms(connection, added=interest_rates),
+            )
+
+    def update_assets(
+        self,
+        asset_ids: Sequence[str],
+        interest_rates: NDArray[np.float64],
+        amounts: NDArray[np.float64] | None = None,
+        tags: TagValues | None = None,
+    ) -> float:
+        _check_aligned(asset_ids, interest_rates, amounts, tags)
+        AssetsList.validate_unique_asset_ids(asset_ids)
+        with self.database.transaction() as connection:
+            old_rates, old_amounts = self._select_existing_rows(connection, asset_ids)
+            new_amounts = (
+                old_amounts
+                if amounts is None
+                else np.where(np.isnan(amounts), old_amounts, amounts)
+            )
+            connection.executemany(
+                "UPDATE assets SET interest_rate = ?, amount = ? "
+                "WHERE storage_key = ? AND asset_id = ?",
+                zip(
+                    interest_rates.tolist(),
+                    _nullable(new_amounts),
+                    repeat(self.key),
+                    asset_ids,
+                ),
+            )
+            stored_tags = self._select_tags(connection, asset_ids)
+            if stored_tags or tags:
+                if tags:
+                    self._upsert_tags(connection, asset_ids, tags)
+                old_tags = [stored_tags.get(asset_id, {}) for asset_id in asset_ids]
+                new_tags = [
+                    {**old, **given}
+                    for old, given in zip(old_tags, _given_tags(len(asset_ids), tags))
+                ]
+                # Every group of the assets changes, as their rates do
+                self._shift_groups(
+                    connection, _group_rows(tag_values(old_tags), old_rates, sign=-1)
+                )
+                self._shift_groups(
+                    connection, _group_rows(tag_values(new_tags), interest_rates)
+                )
+            old_weighted = _weighted_sums(old_rates, old_amounts)
+            new_weighted = _weighted_sums(interest_rates, new_amounts)
+            return self._shift_aggregate(
+                connection,
+                0,
+                float(np.sum(interest_rates)) - float(np.sum(old_rates)),
+                new_weighted.minus(old_weighted),
+                None,
+                self._shifted_histograms(
+                    connection, removed=old_rates, added=interest_rates
+                ),
+            )
+
+    def remove_assets(self, asset_ids: Sequence[str]) -> float:
+        asset_ids = list(dict.fromkeys(asset_ids))
+        with self.database.transaction() as connection:
+            old_rates, old_amounts = self._select_existing_rows(connection, asset_ids)
+            aggregate = self._read_aggregate(connection)
+            if aggregate is not None and len(asset_ids) >= aggregate[0]:
+                raise EmptyListError()
+            stored_tags = self._select_tags(connection, asset_ids)
+            connection.executemany(
+                "DELETE FROM assets WHERE storage_key = ? AND asset_id = ?",
+                zip(repeat(self.key), asset_ids),
+            )
+            if stored_tags:
+                connection.executemany(
+                    "DELETE FROM asset_tags WHERE storage_key = ? AND asset_id = ?",
+                    zip(repeat(self.key), stored_tags),
+                )
+                old_tags = [stored_tags.get(asset_id, {}) for asset_id in asset_ids]
+                self._shift_groups(
+                    connection, _group_rows(tag_values(old_tags), old_rates, sign=-1)
+                )
+            return self._shift_aggregate(
+                connection,
+                -len(asset_ids),
+                -float(np.sum(old_rates)),
+                _WeightedSums(0, 0.0, 0.0).minus(
+                    _weighted_sums(old_rates, old_amounts)
+                ),
+                None,
+                self._shifted_histograms(connection, removed=old_rates),
+            )
+
+    def _replace(
+        self,
+        connection: sqlite3.Connection,
+        assets_list: AssetsList,
+        read_models: AssetsListReadModels | None = None,
+    ) -> None:
+        if read_models is None:
+            read_models = AssetsListReadModels(assets_list)
+        connection.execute("DELETE FROM assets WHERE storage_key = ?", (self.key,))
+        self._insert_assets(
+            connection,
+            assets_list.asset_ids,
+            assets_list.interest_rates,
+            assets_list.amounts,
+        )
+        connection.execute("DELETE FROM asset_tags WHERE storage_key = ?", (self.key,))
+        connection.execute("DELETE FROM rate_groups WHERE storage_key = ?", (self.key,))
+        tag_columns = assets_list.tag_columns
+        if tag_columns:
+            self._upsert_tags(
+                connection,
+                assets_list.asset_ids,
+                {name: column.decoded() for name, column in tag_columns.items()},
+            )
+            self._shift_groups(
+                connection,
+                (
+                    (name, group.value, group.asset_count, group.rate_sum)
+                    for name in tag_columns
+                    for group in read_models.group_rates(name)
+                ),
+            )
+        weighted = _weighted_sums(assets_list.interest_rates, assets_list.amounts)
+        connection.execute(
+            """
+            INSERT INTO assets_lists (
+                storage_key, id, created_at, asset_count, rate_sum,
+                avg_interest_rate, weighted_count, weight_sum, weighted_rate_sum,
+                weighted_avg_interest_rate, rate_sketch, rate_histograms, version
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1)
+            ON CONFLICT (storage_key) DO UPDATE SET
+                id = excluded.id,
+                created_at = excluded.created_at,
+                asset_count = excluded.asset_count,
+                rate_sum = excluded.rate_sum,
+                avg_interest_rate = excluded.avg_interest_rate,
+                weighted_count = excluded.weighted_count,
+                weight_sum = excluded.weight_sum,
+                weighted_rate_sum = excluded.weighted_rate_sum,
+                weighted_avg_interest_rate = excluded.weighted_avg_interest_rate,
+                rate_sketch = excluded.rate_sketch,
+                rate_histograms = excluded.rate_histograms,
+                version = assets_lists.version + 1
+            """,
+            (
+                self.key,
+                assets_list.id,
+                assets_list.created_at.isoformat(),
+                assets_list.count,
+                float(np.sum(assets_list.interest_rates)),
+                assets_list.avg_interest_rate,
+                *weighted,
+                assets_list.weighted_avg_interest_rate,
+                read_models.rate_sketch.to_bytes(),
+                _serialized(read_models.rate_histograms),
+            ),
+        )
+
+    def _insert_assets(
+        self,
+        connection: sqlite3.Connection,
+        asset_ids: Sequence[str],
+        interest_rates: NDArray[np.float64],
+        amounts: NDArray[np.float64] | None,
+    ) -> None:
+        connection.executemany(
+            "INSERT INTO assets (storage_key, asset_id, interest_rate, amount) "
+            "VALUES (?, ?, ?, ?)",
+            zip(
+                repeat(self.key),
+                asset_ids,
+                interest_rates.tolist(),
+                repeat(None) if amounts is None else _nullable(amounts),
+            ),
+        )
+
+    def _upsert_tags(
+        self,
+        connection: sqlite3.Connection,
+        asset_ids: Sequence[str],
+        tags: TagValues,
+    ) -> None:
+        connection.executemany(
+            "INSERT INTO asset_tags (storage_key, asset_id, tag, value) "
+            "VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (storage_key, asset_id, tag) DO UPDATE SET value = excluded.value",
+            (
+                (self.key, asset_id, name, value)
+                for name, values in tags.items()
+                for asset_id, value in zip(asset_ids, values)
+                if value is not None
+            ),
+        )
+
+    def _shift_groups(
+        self,
+        connection: sqlite3.Connection,
+        group_rows: Iterable[tuple[str, str, int, float]],
+    ) -> None:
+        """Add (tag, value, count, rate sum) deltas to the rows of their groups,
+        dropping the groups left empty."""
+        connection.executemany(
+            "INSERT INTO rate_groups (storage_key, tag, value, asset_count, rate_sum) "
+            "VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT (storage_key, tag, value) DO UPDATE SET "
+            "asset_count = asset_count + excluded.asset_count, "
+            "rate_sum = rate_sum + excluded.rate_sum",
+            ((self.key, *group_row) for group_row in group_rows),
+        )
+        connection.execute(
+            "DELETE FROM rate_groups WHERE storage_key = ? AND asset_count <= 0",
+            (self.key,),
+        )
+
+    def _read_aggregate(
+        self, connection: sqlite3.Connection
+    ) -> tuple[int, float] | None:
+        row = connection.execute(
+            "SELECT asset_count, rate_sum FROM assets_lists WHERE storage_key = ?",
+            (self.key,),
+        ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def _shift_aggregate(
+        self,
+        connection: sqlite3.Connection,
+        count_delta: int,
+        sum_delta: float,
+        weighted_delta: "_WeightedSums",
+        rate_sketch: bytes | None,
+        rate_histograms: bytes | None,
+    ) -> float:
+        row = connection.execute(
+            """
+            UPDATE assets_lists SET
+                asset_count = asset_count + :count_delta,
+                rate_sum = rate_sum + :sum_delta,
+                avg_interest_rate =
+                    (rate_sum + :sum_delta) / (asset_count + :count_delta),
+                weighted_count = weighted_count + :weighted_count_delta,
+                weight_sum = weight_sum + :weight_sum_delta,
+                weighted_rate_sum = weighted_rate_sum + :weighted_rate_sum_delta,
+                weighted_avg_interest_rate = CASE
+                    WHEN weighted_count + :weighted_count_delta > 0
+                    THEN (weighted_rate_sum + :weighted_rate_sum_delta)
+                        / (weight_sum + :weight_sum_delta)
+                END,
+                rate_sketch = :rate_sketch,
+                rate_histograms = :rate_histograms,
+                version = version + 1
+            WHERE storage_key = :key
+            RETURNING avg_interest_rate
+            """,
+            {
+                "count_delta": count_delta,
+                "sum_delta": sum_delta,
+                "weighted_count_delta": weighted_delta.weighted_count,
+                "weight_sum_delta": weighted_delta.weight_sum,
+                "weighted_rate_sum_delta": weighted_delta.weighted_rate_sum,
+                "rate_sketch": rate_sketch,
+                "rate_histograms": rate_histograms,
+                "key": self.key,
+            },
+        ).fetchone()
+        return float(row[0])
+
+    def _folded_rate_sketch(
+        self, connection: sqlite3.Connection, interest_rates: NDArray[np.float64]
+    ) -> bytes | None:
+        """The stored sketch with ``interest_rates`` added; None if none is."""
+        row = connection.execute(
+            "SELECT rate_sketch FROM assets_lists WHERE storage_key = ?", (self.key,)
+        ).fetchone()
+        if row[0] is None:
+            return None
+        rate_sketch = RateSketch.from_bytes(row[0])
+        rate_sketch.add_many(interest_rates)
+        return rate_sketch.to_bytes()
+
+    def _shifted_histograms(
+        self,
+        connection: sqlite3.Connection,
+        removed: NDArray[np.float64] | None = None,
+        added: NDArray[np.float64] | None = None,
+    ) -> bytes | None:
+        """The stored histograms with rates moved out of and into their buckets;
+        None if none are stored."""
+        row = connection.execute(
+            "SELECT rate_histograms FROM assets_lists WHERE storage_key = ?",
+            (self.key,),
+        ).fetchone()
+        if row[0] is None:
+            return None
+        rate_histograms = RateHistograms.from_bytes(row[0])
+        if removed is not None:
+            rate_histograms.remove_many(removed)
+        if added is not None:
+            rate_histograms.add_many(added)
+        return rate_histograms.to_bytes()
+
+    def _select_rates(self, connection: sqlite3.Connection) -> NDArray[np.float64]:
+        return np.fromiter(
+            (
+                interest_rate
+                for (interest_rate,) in connection.execute(
+                    "SELECT interest_rate FROM assets WHERE storage_key = ?",
+                    (self.key,),
+                )
+            ),
+            dtype=np.float64,
+        )
+
+    def _select_assets(self, clauses: str, parameter: object) -> list[Asset]:
+        """Assets of the list filtered or ordered by ``clauses``, which take one
+        ``parameter``."""
+        connection = self.database.connection
+        rows = connection.execute(
+            "SELECT assets.asset_id, assets.interest_rate, assets.amount, "
+            "assets_lists.created_at FROM assets JOIN assets_lists "
+            "USING (storage_key) WHERE assets.storage_key = ? " + clauses,
+            (self.key, parameter),
+        ).fetchall()
+        tags = self._select_tags(connection, [row[0] for row in rows])
+        return [
+            Asset(
+                id=asset_id,
+                interest_rate=interest_rate,
+                amount=amount,
+                tags=tags.get(asset_id),
+                created_at=datetime.fromisoformat(created_at),
+            )
+            for asset_id, interest_rate, amount, created_at in rows
+        ]
+
+    def _select_tags(
+        self, connection: sqlite3.Connection, asset_ids: Sequence[str]
+    ) -> dict[str, dict[str, str]]:
+        """Tags of those of ``asset_ids`` that carry any."""
+        tags: dict[str, dict[str, str]] = {}
+        for start in range(0, len(asset_ids), _MAX_IN_PARAMETERS):
+            batch = asset_ids[start : start + _MAX_IN_PARAMETERS]
+            placeholders = ", ".join("?" * len(batch))
+            for asset_id, name, value in connection.execute(
+                "SELECT asset_id, tag, value FROM asset_tags "
+                f"WHERE storage_key = ? AND asset_id IN ({placeholders})",
+                (self.key, *batch),
+            ):
+                tags.setdefault(asset_id, {})[name] = value
+        return tags
+
+    def _select_rows(
+        self, connection: sqlite3.Connection, asset_ids: Sequence[str]
+    ) -> dict[str, tuple[float, float | None]]:
+        rows: dict[str, tuple[float, float | None]] = {}
+        for start in range(0, len(asset_ids), _MAX_IN_PARAMETERS):
+            batch = asset_ids[start : start + _MAX_IN_PARAMETERS]
+            placeholders = ", ".join("?" * len(batch))
+            for asset_id, interest_rate, amount in connection.execute(
+                "SELECT asset_id, interest_rate, amount FROM assets "
+                f"WHERE storage_key = ? AND asset_id IN ({placeholders})",
+                (self.key, *batch),
+            ):
+                rows[asset_id] = (interest_rate, amount)
+        return rows
+
+    def _select_existing_rows(
+        self, connection: sqlite3.Connection, asset_ids: Sequence[str]
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """Rates and amounts (NaN for NULL) of ``asset_ids``, in their order."""
+        rows = self._select_rows(connection, asset_ids)
+        if len(rows) != len(asset_ids):
+            raise AssetNotFoundError(
+                [asset_id for asset_id in asset_ids if asset_id not in rows]
+            )
+        values = np.array(
+            [rows[asset_id] for asset_id in asset_ids], dtype=np.float64
+        ).reshape(-1, 2)
+        return values[:, 0].copy(), values[:, 1].copy()
+
+
+class _WeightedSums(NamedTuple):
+    weighted_count: int
+    weight_sum: float
+    weighted_rate_sum: float
+
+    def minus(self, other: "_WeightedSums") -> "_WeightedSums":
+        return _WeightedSums(
+            self.weighted_count - other.weighted_count,
+            self.weight_sum - other.weight_sum,
+            self.weighted_rate_sum - other.weighted_rate_sum,
+        )
+
+
+def _weighted_sums(
+    interest_rates: NDArray[np.float64], amounts: NDArray[np.float64] | None
+) -> _WeightedSums:
+    if amounts is None:
+        return _WeightedSums(0, 0.0, 0.0)
+    weights = positive_weights(amounts)
+    return _WeightedSums(
+        int(np.count_nonzero(weights)),
+        float(np.sum(weights)),
+        float(np.dot(interest_rates, weights)),
+    )
+
+
+def _group_rows(
+    tags: TagValues, interest_rates: NDArray[np.float64], sign: int = 1
+) -> list[tuple[str, str, int, float]]:
+    """(tag, value, count, rate sum) of every group of the given assets, negated
+    for a ``sign`` of -1."""
+    tag_columns = encode_tags(tags, len(interest_rates))
+    group_tables = build_group_tables(
+        tag_columns, np.asarray(interest_rates, dtype=np.float64)
+    )
+    return [
+        (name, group.value, sign * group.asset_count, sign * group.rate_sum)
+        for name, table in group_tables.items()
+        for group in table.groups(tag_columns[name].values)
+    ]
+
+
+def _given_tags(count: int, tags: TagValues | None) -> list[dict[str, str]]:
+    # The tag values given for each of ``count`` assets, by name
+    asset_tags: list[dict[str, str]] = [{} for _ in range(count)]
+    for name, values in (tags or {}).items():
+        for given, value in zip(asset_tags, values):
+            if value is not None:
+                given[name] = value
+    return asset_tags
+
+
+def _serialized(rate_histograms: RateHistograms | None) -> bytes | None:
+    return None if rate_histograms is None else rate_histograms.to_bytes()
+
+
+def _nullable(amounts: NDArray[np.float64]) -> list[float | None]:
+    return [None if math.isnan(amount) else amount for amount in amounts.tolist()]
+
+
+def _check_aligned(
+    asset_ids: Sequence[str],
+    interest_rates: NDArray[np.float64],
+    amounts: NDArray[np.float64] | None = None,
+    tags: TagValues | None = None,
+) -> None:
+    if len(asset_ids) != len(interest_rates):
+        raise ValueError("asset_ids and interest_rates must be aligned columns")
+    if amounts is not None and len(amounts) != len(interest_rates):
+        raise ValueError("amounts must be aligned with the other columns")
+    for name, values in (tags or {}).items():
+        if len(values) != len(interest_rates):
+            raise ValueError(f"tag {name!r} must be aligned with the other columns")
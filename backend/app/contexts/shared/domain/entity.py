@@ -1,11 +1,57 @@
-import uuid
 from datetime import datetime
+from typing import ClassVar
 
-from pydantic import BaseModel, ConfigDict, Field
+from app.contexts.shared.domain.ids import id_timestamp, new_id
 
 
-class Entity(BaseModel):
-    model_config = ConfigDict(frozen=True)
+class Entity:
+    """Base of the domain entities: an id and a creation time.
 
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
-    created_at: datetime = Field(default_factory=datetime.now)
+    Entities are slotted and carry no ``__dict__``; their attributes are read-only
+    properties and equality compares the values of ``_fields``. Input is
+    validated at the API edge by the pydantic DTOs, not here.
+
+    A generated id already encodes when it was made, so an entity built without
+    an id stores no timestamp of its own and ``created_at`` is read back from the
+    id. Entities held by an aggregate are handed the aggregate's ``created_at``.
+    """
+
+    __slots__ = ("_created_at", "_id")
+
+    _fields: ClassVar[tuple[str, ...]] = ("id", "created_at")
+
+    def __init__(self, *, id: str | None = None, created_at: datetime | None = None):
+        if id is None:
+            id = new_id()
+        elif created_at is None:
+            created_at = datetime.now()
+        self._id = id
+        self._created_at = created_at
+
+    @property
+    def id(self) -> str:
+        return self._id
+
+    @property
+    def created_at(self) -> datetime:
+        if self._created_at is None:
+            created_at = id_timestamp(self._id)
+            assert created_at is not None
+            return created_at
+        return self._created_at
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(
+            getattr(self, field) == getattr(other, field) for field in self._fields
+        )
+
+    def __hash__(self) -> int:
+        return hash((type(self), self._id))
+
+    def __repr__(self) -> str:
+        values = ", ".join(
+            f"{field}={getattr(self, field)!r}" for field in self._fields
+        )
+        return f"{type(self).__name__}({values})"
@@ -0,0 +1,73 @@
+import os
+import threading
+import time
+from datetime import datetime
+
+# Crockford's base32, as used by ULIDs: no I, L, O or U
+_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+# Every 10-bit group as two characters, so an id takes 13 lookups to encode
+_PAIRS = [first + second for first in _ALPHABET for second in _ALPHABET]
+_DECODE = {character: value for value, character in enumerate(_ALPHABET)}
+_RANDOM_BITS = 80
+_TIMESTAMP_LENGTH = 10
+_LENGTH = 26
+
+
+class MonotonicIdGenerator:
+    """ULID-style ids: 48 bits of Unix milliseconds, then 80 random bits.
+
+    The 26 character Crockford base32 strings sort by creation time, so the time
+    an id was made can be read back from it (see ``id_timestamp``). Ids made in
+    the same millisecond, or after the clock stepped back, increment the random
+    part of the previous one instead of drawing a new one, so they keep sorting
+    in generation order.
+    """
+
+    __slots__ = ("_lock", "_milliseconds", "_prefix", "_randomness")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._milliseconds = -1
+        self._randomness = 0
+        self._prefix = ""
+
+    def __call__(self) -> str:
+        with self._lock:
+            milliseconds = time.time_ns() // 1_000_000
+            if milliseconds > self._milliseconds:
+                randomness = int.from_bytes(os.urandom(_RANDOM_BITS // 8))
+            else:
+                milliseconds = self._milliseconds
+                randomness = self._randomness + 1
+                if randomness >> _RANDOM_BITS:
+                    # The random part overflowed; borrow the next millisecond
+                    milliseconds += 1
+                    randomness = 0
+            if milliseconds != self._milliseconds:
+                self._prefix = _encode(milliseconds, _TIMESTAMP_LENGTH // 2)
+            self._milliseconds = milliseconds
+            self._randomness = randomness
+            prefix = self._prefix
+        return prefix + _encode(randomness, _RANDOM_BITS // 10)
+
+
+def _encode(value: int, pairs: int) -> str:
+    return "".join(
+        [_PAIRS[(value >> shift) & 1023] for shift in range(10 * pairs - 10, -1, -10)]
+    )
+
+
+def id_timestamp(entity_id: str) -> datetime | None:
+    """Creation time encoded in an id from ``new_id``; None for other ids."""
+    if len(entity_id) != _LENGTH:
+        return None
+    milliseconds = 0
+    for character in entity_id[:_TIMESTAMP_LENGTH]:
+        value = _DECODE.get(character)
+        if value is None:
+            return None
+        milliseconds = milliseconds << 5 | value
+    return datetime.fromtimestamp(milliseconds / 1000)
+
+
+new_id = MonotonicIdGenerator()
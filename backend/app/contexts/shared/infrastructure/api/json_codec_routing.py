@@ -0,0 +1,43 @@
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+
+from app.contexts.shared.infrastructure.json_codec import JsonCodec
+
+
+def json_codec_response_class(codec: JsonCodec) -> type[JSONResponse]:
+    """A ``JSONResponse`` rendering its content with ``codec``, to be used as the
+    app's ``default_response_class``."""
+
+    class JsonCodecResponse(JSONResponse):
+        def render(self, content: Any) -> bytes:
+            return codec.encode(content)
+
+    return JsonCodecResponse
+
+
+class JsonCodecRequest(Request):
+    """Decodes JSON bodies with the codec the app keeps in ``state.json_codec``."""
+
+    async def json(self) -> Any:
+        codec: JsonCodec | None = getattr(self.app.state, "json_codec", None)
+        if codec is None:
+            return await super().json()
+        if not hasattr(self, "_json"):
+            self._json = codec.decode(await self.body())
+        return self._json
+
+
+class JsonCodecRoute(APIRoute):
+    """Route whose body parameters are decoded by the app's JSON codec."""
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            return await handler(JsonCodecRequest(request.scope, request.receive))
+
+        return route_handler
@@ -1,14 +1,193 @@
-from typing import Generic, TypeVar
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import AbstractContextManager
+from types import TracebackType
+from typing import Any
 
-T = TypeVar("T")
+from app.contexts.shared.infrastructure.write_ahead_log import (
+    LogRecord,
+    WriteAheadLog,
+)
 
 
-class InMemoryDatabase(Generic[T]):
-    def __init__(self):
+class _ShardLock:
+    """Reentrant lock of a shard.
+
+    A log record appended under it is committed once its outermost holder
+    released it, so writers wait for the fsync without holding up the next
+    writer of the shard, whose record can then share that fsync.
+    """
+
+    __slots__ = ("_local", "_lock")
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        # Per thread: how deep it holds the lock, and what to commit on release
+        self._local = threading.local()
+
+    def __enter__(self) -> bool:
+        self._lock.acquire()
+        self._local.depth = getattr(self._local, "depth", 0) + 1
+        return True
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        local = self._local
+        local.depth -= 1
+        pending = None
+        if local.depth == 0:
+            pending, local.pending = getattr(local, "pending", None), None
+        self._lock.release()
+        if pending is not None:
+            log, sequence = pending
+            log.commit(sequence)
+
+    def commit_on_release(self, log: WriteAheadLog[Any], sequence: int) -> None:
+        self._local.pending = (log, sequence)
+
+
+class Change[T](ABC):
+    """A write to a key of an ``InMemoryDatabase``, as its log records it."""
+
+    __slots__ = ()
+
+    @abstractmethod
+    def apply(self, value: T | None) -> T:
+        """The value this change leaves at a key holding ``value`` (None when
+        unset); it may change ``value`` in place."""
+
+
+class SetValue[T](Change[T]):
+    """Replaces the whole value."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: T):
+        self.value = value
+
+    def apply(self, value: T | None) -> T:
+        return self.value
+
+
+class _Shard[T]:
+    __slots__ = ("data", "lock", "versions")
+
+    def __init__(self) -> None:
         self.data: dict[str, T] = {}
+        self.versions: dict[str, int] = {}
+        self.lock = _ShardLock()
+
+
+class InMemoryDatabase[T]:
+    """Key-value store split into independently locked shards.
+
+    Keys are spread over the shards by hash, so writers to different keys rarely
+    share a lock. Reads are plain dict lookups and take no lock.
+
+    Once a write-ahead log is attached, ``set`` also appends the change it
+    makes to it and returns when the record is on disk; concurrent writers
+    share fsyncs (see ``WriteAheadLog``). A write is visible to readers slightly
+    before it is durable.
+    """
+
+    def __init__(self, shard_count: int = 64):
+        self.shards: list[_Shard[T]] = [_Shard() for _ in range(shard_count)]
+        self.log: WriteAheadLog[Change[T]] | None = None
+
+    def _shard(self, key: str) -> _Shard[T]:
+        return self.shards[hash(key) % len(self.shards)]
 
     def get(self, key: str) -> T | None:
-        return self.data.get(key)
+        return self._shard(key).data.get(key)
+
+    def set(self, key: str, value: T, record: LogRecord | None = None) -> None:
+        """Store ``value`` at ``key``.
+
+        With a log attached, ``record`` is the change that led to ``value``, from
+        ``log_record``; without one, the whole value is logged.
+        """
+        if record is None:
+            record = self.log_record(key, SetValue(value))
+        shard = self._shard(key)
+        with shard.lock:
+            self._put(shard, key, value)
+            # The value goes in before its record, so that a checkpoint taken
+            # after the record sees it
+            if self.log is not None and record is not None:
+                shard.lock.commit_on_release(self.log, self.log.append(record))
+
+    def log_record(self, key: str, change: Change[T]) -> LogRecord | None:
+        """``change`` to ``key`` encoded for the attached log; None without one.
+
+        Callers encode their change before taking the shard lock, so that other
+        writers of the shard do not wait for it, and pass the record to ``set``.
+        """
+        log = self.log
+        return None if log is None else log.record(key, change)
+
+    def get_version(self, key: str) -> int:
+        """Number of writes to ``key`` so far; 0 if it was never set."""
+        return self._shard(key).versions.get(key, 0)
+
+    def versions(self) -> dict[str, int]:
+        """Write counter of every stored key."""
+        versions: dict[str, int] = {}
+        for shard in self.shards:
+            with shard.lock:
+                versions.update(shard.versions)
+        return versions
+
+    def lock(self, key: str) -> AbstractContextManager[bool]:
+        """Lock of the shard holding ``key``, for read-modify-write sequences."""
+        return self._shard(key).lock
+
+    def attach_log(self, log: WriteAheadLog[Change[T]]) -> int:
+        """Replay ``log`` into the database, then log every write to it;
+        return the number of writes replayed.
+
+        Values the database held before, such as restored snapshots, are then
+        checkpointed, so that the changes logged next apply to a logged value.
+        """
+        restored = len(self) > 0
+        replayed = 0
+        for key, change in log.replay():
+            shard = self._shard(key)
+            with shard.lock:
+                self._put(shard, key, change.apply(shard.data.get(key)))
+            replayed += 1
+        log.open()
+        self.log = log
+        if restored:
+            self.checkpoint_log()
+        return replayed
+
+    def checkpoint_log(self) -> None:
+        """Compact the attached log down to the current value of every key."""
+        log = self.log
+        if log is None:
+            return
+
+        def latest() -> Iterator[tuple[LogRecord, int]]:
+            for key in self.versions():
+                # Encoded under the lock, as writers change values in place and
+                # append their records under it
+                with self.lock(key):
+                    value = self.get(key)
+                    sequence = log.appended
+                    record = None if value is None else log.record(key, SetValue(value))
+                if record is not None:
+                    yield record, sequence
+
+        log.checkpoint(latest)
+
+    def _put(self, shard: _Shard[T], key: str, value: T) -> None:
+        shard.data[key] = value
+        shard.versions[key] = shard.versions.get(key, 0) + 1
 
-    def set(self, key: str, value: T) -> None:
-        self.data[key] = value
+    def __len__(self) -> int:
+        return sum(len(shard.data) for shard in self.shards)
@@ -0,0 +1,127 @@
+import functools
+import json
+from abc import ABC, abstractmethod
+from operator import attrgetter
+from typing import Any
+
+import msgspec
+import numpy as np
+from numpy.typing import NDArray
+
+RecordColumns = tuple[list[str], NDArray[np.float64]]
+
+
+class JsonCodec(ABC):
+    """Encodes response bodies and decodes request bodies.
+
+    ``decode`` raises ``json.JSONDecodeError`` on malformed input, as FastAPI
+    expects from ``Request.json``. Codecs hold no state, so they can be sent to
+    a process pool along with the bodies they should decode.
+    """
+
+    @abstractmethod
+    def encode(self, value: Any) -> bytes: ...
+
+    @abstractmethod
+    def decode(self, data: bytes) -> Any: ...
+
+    def decode_columns(
+        self, data: bytes, key: str, id_field: str, value_field: str
+    ) -> RecordColumns | None:
+        """Decode ``{key: [{id_field: str, value_field: number}, ...]}`` into an id
+        list and a float64 column, skipping per-record objects.
+
+        Returns None unless every record is well-typed and has no other field,
+        so callers can fall back to their DTO validation for the error details
+        and for any other field.
+        """
+        try:
+            records = self.decode(data)[key]
+            asset_ids = [record[id_field] for record in records]
+            values = [record[value_field] for record in records]
+        except (ValueError, TypeError, KeyError):
+            return None
+        if (
+            not all(type(asset_id) is str for asset_id in asset_ids)
+            or not all(type(value) is float or type(value) is int for value in values)
+            or any(len(record) != 2 for record in records)
+        ):
+            return None
+        return asset_ids, np.array(values, dtype=np.float64)
+
+
+class StdlibJsonCodec(JsonCodec):
+    def encode(self, value: Any) -> bytes:
+        return json.dumps(
+            value, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+        ).encode()
+
+    def decode(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonJsonCodec(JsonCodec):
+    """orjson, an optional dependency (the "orjson" extra)."""
+
+    def __init__(self) -> None:
+        import orjson  # noqa: F401
+
+    def encode(self, value: Any) -> bytes:
+        import orjson
+
+        return orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY)
+
+    def decode(self, data: bytes) -> Any:
+        import orjson
+
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(data)
+
+
+class MsgspecJsonCodec(JsonCodec):
+    """msgspec; record columns are decoded straight into typed structs in C."""
+
+    _encoder = msgspec.json.Encoder()
+
+    def encode(self, value: Any) -> bytes:
+        return self._encoder.encode(value)
+
+    def decode(self, data: bytes) -> Any:
+        try:
+            return msgspec.json.decode(data)
+        except msgspec.DecodeError as e:
+            raise json.JSONDecodeError(str(e), _text(data), 0) from e
+
+    def decode_columns(
+        self, data: bytes, key: str, id_field: str, value_field: str
+    ) -> RecordColumns | None:
+        try:
+            records = getattr(
+                _records_decoder(key, id_field, value_field).decode(data), key
+            )
+        except msgspec.DecodeError:
+            return None
+        return (
+            list(map(attrgetter(id_field), records)),
+            np.fromiter(
+                map(attrgetter(value_field), records),
+                dtype=np.float64,
+                count=len(records),
+            ),
+        )
+
+
+@functools.cache
+def _records_decoder(
+    key: str, id_field: str, value_field: str
+) -> msgspec.json.Decoder[Any]:
+    # Records with any other field fail to decode, and take the DTO path
+    record = msgspec.defstruct(
+        "Record", [(id_field, str), (value_field, float)], forbid_unknown_fields=True
+    )
+    records = list[record]  # type: ignore[valid-type]
+    return msgspec.json.Decoder(msgspec.defstruct("Records", [(key, records)]))
+
+
+def _text(data: bytes) -> str:
+    return data.decode(errors="replace")
@@ -0,0 +1,63 @@
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+
+class SqliteDatabase:
+    """SQLite database file shared through one connection per thread.
+
+    Connections run in WAL mode, so readers never block the writer, with
+    ``synchronous=NORMAL``, which is durable across application crashes in WAL.
+    ``schema`` is applied once, by the first connection opened.
+    """
+
+    def __init__(self, path: str, schema: str = "", busy_timeout_ms: int = 5000):
+        self.path = path
+        self.schema = schema
+        self.busy_timeout_ms = busy_timeout_ms
+        self._local = threading.local()
+        self._schema_lock = threading.Lock()
+        self._schema_applied = False
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        connection: sqlite3.Connection | None = getattr(self._local, "connection", None)
+        if connection is None:
+            # Transactions are managed explicitly through ``transaction()``
+            connection = sqlite3.connect(self.path, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+            self._apply_schema(connection)
+            self._local.connection = connection
+        return connection
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run the block in a single write transaction, rolled back on error."""
+        connection = self.connection
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    @contextmanager
+    def snapshot(self) -> Iterator[sqlite3.Connection]:
+        """Run the block's reads against one snapshot of the database, without
+        taking the write lock."""
+        connection = self.connection
+        connection.execute("BEGIN DEFERRED")
+        try:
+            yield connection
+        finally:
+            connection.execute("COMMIT")
+
+    def _apply_schema(self, connection: sqlite3.Connection) -> None:
+        with self._schema_lock:
+            if not self._schema_applied:
+                connection.executescript(self.schema)
+                self._schema_applied = True
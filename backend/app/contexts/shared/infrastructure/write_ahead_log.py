@@ -0,0 +1,300 @@
+import os
+import re
+import struct
+import tempfile
+import threading
+import zlib
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+from typing import BinaryIO, NamedTuple
+
+# CRC32 of the key, value and sequence number, sequence number, key size, value
+# size
+_HEADER = struct.Struct("<IQIQ")
+_SEQUENCE = struct.Struct("<Q")
+_SEGMENT = re.compile(r"(\d{20})\.wal")
+_CHECKPOINT = re.compile(r"checkpoint\.(\d{20})\.wal")
+
+
+class LogRecord(NamedTuple):
+    """An encoded write; it is numbered when appended."""
+
+    key: bytes
+    value: bytes
+    # CRC32 of the key then the value
+    checksum: int
+
+
+class WriteAheadLog[T]:
+    """Append-only log of the writes to a key-value store.
+
+    Records go to numbered segment files; each is a header (a CRC32, the
+    sequence number, the key and value sizes) followed by the key and the
+    encoded value, which is whatever describes the write. ``record`` encodes
+    one, so callers can do it before taking their locks; ``append`` only writes
+    it to the file buffer and numbers it, after every record logged before,
+    restarts included; ``commit`` makes it durable with group commit: one
+    committer at a time fsyncs everything appended so far, and whoever arrives
+    meanwhile waits for that fsync or the next one, so concurrent writes share
+    a single fsync.
+
+    ``checkpoint`` compacts the log: appends move to a new segment, the latest
+    value of every key is written to a checkpoint naming that segment, and the
+    older segments and checkpoints are deleted. ``replay`` reads the latest
+    checkpoint then the segments from the one it names, stopping at a record
+    torn by a crash. A checkpointed value carries the sequence number it is
+    current as of, and replay skips the key's records it already includes, so
+    writes may be logged as changes to the previous value.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        encode: Callable[[T], bytes],
+        decode: Callable[[bytes], T],
+    ):
+        self.directory = Path(directory)
+        self.encode = encode
+        self.decode = decode
+        self._file: BinaryIO | None = None
+        self._segment = 0
+        # Guards the file and the appended sequence number
+        self._lock = threading.Lock()
+        self._appended = 0
+        # Guards the durable sequence number and who is syncing
+        self._synced = threading.Condition()
+        self._durable = 0
+        self._syncing = False
+
+    @property
+    def appended(self) -> int:
+        """Sequence number of the last appended record."""
+        return self._appended
+
+    def replay(self) -> Iterator[tuple[str, T]]:
+        """The logged writes, oldest first, from the latest checkpoint on."""
+        checkpoint, first_segment = self._latest_checkpoint()
+        checkpointed: dict[str, int] = {}
+        if checkpoint is not None:
+            for key, sequence, value in self._read(checkpoint):
+                checkpointed[key] = sequence
+                yield key, self.decode(value)
+        for number, path in self._segments():
+            if number >= first_segment:
+                for key, sequence, value in self._read(path):
+                    # Older records are part of the checkpointed value
+                    if sequence > checkpointed.get(key, 0):
+                        yield key, self.decode(value)
+
+    def open(self) -> None:
+        """Start appending to a new segment, after the existing ones."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        segments = self._segments()
+        checkpoint, checkpoint_segment = self._latest_checkpoint()
+        last = max([number for number, _ in segments] + [checkpoint_segment - 1])
+        paths = [path for _, path in segments]
+        if checkpoint is not None:
+            paths.append(checkpoint)
+        with self._lock:
+            self._appended = max(
+                [self._appended] + [_last_sequence(path) for path in paths]
+            )
+            self._open_segment(last + 1)
+
+    def record(self, key: str, value: T) -> LogRecord:
+        """The record of ``value`` at ``key``, to ``append``."""
+        encoded_key, encoded = key.encode(), self.encode(value)
+        return LogRecord(
+            encoded_key, encoded, zlib.crc32(encoded, zlib.crc32(encoded_key))
+        )
+
+    def append(self, record: LogRecord) -> int:
+        """Write ``record``; return its sequence number, to ``commit`` once the
+        caller released its locks."""
+        with self._lock:
+            if self._file is None:
+                raise RuntimeError("the write-ahead log is not open")
+            self._appended += 1
+            _write(self._file, record, self._appended)
+            return self._appended
+
+    def commit(self, sequence: int) -> None:
+        """Return once the record ``sequence`` and all before it are on disk."""
+        with self._synced:
+            while self._durable < sequence and self._syncing:
+                self._synced.wait()
+            if self._durable >= sequence:
+                return
+            self._syncing = True
+        synced = 0
+        try:
+            with self._lock:
+                appended = self._flush()
+            # Other threads keep appending meanwhile; their records wait for
+            # the next turn
+            if self._file is not None:
+                os.fsync(self._file.fileno())
+            synced = appended
+        finally:
+            self._end_sync_turn(synced)
+
+    def checkpoint(self, latest: Callable[[], Iterable[tuple[LogRecord, int]]]) -> None:
+        """Replace the log up to now with the values from ``latest``.
+
+        ``latest`` is called once appends moved to a new segment; it must give
+        the record of every key's value as of that point or later, along with
+        the sequence number of the key's last record the value includes, such
+        as ``appended`` read under the lock of the key's writers.
+        """
+        self._take_sync_turn()
+        synced = 0
+        try:
+            with self._lock:
+                if self._file is None:
+                    raise RuntimeError("the write-ahead log is not open")
+                synced = self._flush()
+                os.fsync(self._file.fileno())
+                self._file.close()
+                self._open_segment(self._segment + 1)
+                first_segment = self._segment
+        finally:
+            self._end_sync_turn(synced)
+
+        descriptor, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                for record, sequence in latest():
+                    _write(file, record, sequence)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(
+                temporary, self.directory / f"checkpoint.{first_segment:020d}.wal"
+            )
+        except BaseException:
+            os.unlink(temporary)
+            raise
+        _sync_directory(self.directory)
+
+        for path in self.directory.iterdir():
+            segment = _SEGMENT.fullmatch(path.name)
+            checkpoint = _CHECKPOINT.fullmatch(path.name)
+            match = segment or checkpoint
+            if match is not None and int(match[1]) < first_segment:
+                path.unlink()
+
+    def close(self) -> None:
+        self._take_sync_turn()
+        synced = 0
+        try:
+            with self._lock:
+                if self._file is not None:
+                    synced = self._flush()
+                    os.fsync(self._file.fileno())
+                    self._file.close()
+                    self._file = None
+        finally:
+            self._end_sync_turn(synced)
+
+    def _take_sync_turn(self) -> None:
+        # Keeps the segment from being synced and swapped at the same time
+        with self._synced:
+            while self._syncing:
+                self._synced.wait()
+            self._syncing = True
+
+    def _end_sync_turn(self, synced: int) -> None:
+        with self._synced:
+            self._syncing = False
+            self._durable = max(self._durable, synced)
+            self._synced.notify_all()
+
+    def _flush(self) -> int:
+        # With ``_lock`` held: hand the buffered records to the OS
+        if self._file is not None:
+            self._file.flush()
+        return self._appended
+
+    def _open_segment(self, number: int) -> None:
+        # With ``_lock`` held
+        self._segment = number
+        # Stays open until the next segment or ``close``
+        self._file = open(self.directory / f"{number:020d}.wal", "ab")  # noqa: SIM115
+        _sync_directory(self.directory)
+
+    def _segments(self) -> list[tuple[int, Path]]:
+        if not self.directory.is_dir():
+            return []
+        return sorted(
+            (int(match[1]), path)
+            for path in self.directory.iterdir()
+            if (match := _SEGMENT.fullmatch(path.name))
+        )
+
+    def _latest_checkpoint(self) -> tuple[Path | None, int]:
+        if not self.directory.is_dir():
+            return None, 0
+        checkpoints = sorted(
+            (int(match[1]), path)
+            for path in self.directory.iterdir()
+            if (match := _CHECKPOINT.fullmatch(path.name))
+        )
+        if not checkpoints:
+            return None, 0
+        first_segment, path = checkpoints[-1]
+        return path, first_segment
+
+    def _read(self, path: Path) -> Iterator[tuple[str, int, bytes]]:
+        with path.open("rb") as file:
+            while True:
+                header = file.read(_HEADER.size)
+                if len(header) < _HEADER.size:
+                    break
+                checksum, sequence, key_size, value_size = _HEADER.unpack(header)
+                key = file.read(key_size)
+                value = file.read(value_size)
+                if (
+                    len(key) < key_size
+                    or len(value) < value_size
+                    or checksum
+                    != (_checksum(zlib.crc32(value, zlib.crc32(key)), sequence))
+                ):
+                    # The tail of a write cut short by a crash
+                    break
+                yield key.decode(), sequence, value
+
+
+def _write(file: BinaryIO, record: LogRecord, sequence: int) -> None:
+    file.write(
+        _HEADER.pack(
+            _checksum(record.checksum, sequence),
+            sequence,
+            len(record.key),
+            len(record.value),
+        )
+    )
+    file.write(record.key)
+    file.write(record.value)
+
+
+def _checksum(body_checksum: int, sequence: int) -> int:
+    return zlib.crc32(_SEQUENCE.pack(sequence), body_checksum)
+
+
+def _last_sequence(path: Path) -> int:
+    # Reads the headers only; records need not be in order in a checkpoint
+    last = 0
+    with path.open("rb") as file:
+        while len(header := file.read(_HEADER.size)) == _HEADER.size:
+            _, sequence, key_size, value_size = _HEADER.unpack(header)
+            last = max(last, sequence)
+            file.seek(key_size + value_size, os.SEEK_CUR)
+    return last
+
+
+def _sync_directory(directory: Path) -> None:
+    # Makes a created or renamed file's name durable
+    descriptor = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
@@ -1,15 +1,118 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
 from dependency_injector import containers, providers
 
 from app.contexts.assets.containers.assets_services import AssetsServicesContainer
 from app.contexts.assets.domain.entities.assets_list import AssetsList
-from app.contexts.shared.infrastructure.in_memory_database import InMemoryDatabase
+from app.contexts.assets.infrastructure.persistence.assets_list.changes import (
+    decode_assets_list_change,
+    encode_assets_list_change,
+)
+from app.contexts.assets.infrastructure.persistence.assets_list.history import (
+    AssetsListHistory,
+)
+from app.contexts.assets.infrastructure.persistence.assets_list.rate_rollups import (
+    AverageRateRollups,
+)
+from app.contexts.assets.infrastructure.persistence.assets_list.read_models import (
+    AssetsListReadModelStore,
+)
+from app.contexts.assets.infrastructure.persistence.assets_list.snapshot_store import (
+    AssetsListSnapshotStore,
+    AssetsListSnapshotter,
+)
+from app.contexts.assets.infrastructure.persistence.assets_list.sqlite_repository import (
+    SqliteAssetsListRepository,
+)
+from app.contexts.shared.infrastructure.in_memory_database import (
+    Change,
+    InMemoryDatabase,
+)
+from app.contexts.shared.infrastructure.json_codec import (
+    MsgspecJsonCodec,
+    OrjsonJsonCodec,
+    StdlibJsonCodec,
+)
+from app.contexts.shared.infrastructure.sqlite_database import SqliteDatabase
+from app.contexts.shared.infrastructure.write_ahead_log import WriteAheadLog
 
 
 class Container(containers.DeclarativeContainer):
     config = providers.Configuration()
 
-    assets_list_in_memory_database = providers.Singleton(InMemoryDatabase[AssetsList])
+    # Runs blocking calls and work on shared aggregates off the event loop
+    executor = providers.Singleton(
+        ThreadPoolExecutor,
+        max_workers=config.executor_max_workers,
+        thread_name_prefix="assets-worker",
+    )
+    # Runs pure, GIL-bound functions such as request parsing; a process pool
+    # keeps them from stalling the event loop altogether
+    cpu_executor = providers.Selector(
+        config.cpu_executor_kind,
+        process=providers.Singleton(
+            ProcessPoolExecutor,
+            max_workers=config.cpu_executor_max_workers,
+            mp_context=providers.Callable(multiprocessing.get_context, "spawn"),
+        ),
+        thread=providers.Singleton(
+            ThreadPoolExecutor,
+            max_workers=config.cpu_executor_max_workers,
+            thread_name_prefix="assets-cpu",
+        ),
+    )
+
+    # Encodes responses and decodes request bodies
+    json_codec = providers.Selector(
+        config.json_codec,
+        msgspec=providers.Singleton(MsgspecJsonCodec),
+        orjson=providers.Singleton(OrjsonJsonCodec),
+        stdlib=providers.Singleton(StdlibJsonCodec),
+    )
+
+    assets_list_in_memory_database = providers.Singleton(
+        InMemoryDatabase[AssetsList], shard_count=config.database_shard_count
+    )
+    # Attached to the in-memory database at startup when ``wal_dir`` is set
+    assets_list_write_ahead_log = providers.Singleton(
+        WriteAheadLog[Change[AssetsList]],
+        config.wal_dir,
+        encode=encode_assets_list_change,
+        decode=decode_assets_list_change,
+    )
+    assets_list_history = providers.Singleton(
+        AssetsListHistory,
+        max_versions=config.history_max_versions,
+        max_age_seconds=config.history_max_age_seconds,
+        chunk_size=config.history_chunk_size,
+    )
+    average_rate_rollups = providers.Singleton(
+        AverageRateRollups,
+        minute_retention_seconds=config.rollup_minute_retention_seconds,
+        hour_retention_seconds=config.rollup_hour_retention_seconds,
+        day_retention_seconds=config.rollup_day_retention_seconds,
+    )
+    assets_list_read_models = providers.Singleton(AssetsListReadModelStore)
+    assets_list_sqlite_database = providers.Singleton(
+        SqliteDatabase,
+        path=config.sqlite_path,
+        schema=SqliteAssetsListRepository.schema,
+    )
+    assets_list_snapshotter = providers.Singleton(
+        AssetsListSnapshotter,
+        database=assets_list_in_memory_database,
+        store=providers.Singleton(AssetsListSnapshotStore, config.snapshot_dir),
+    )
 
     assets_list_services = providers.Container(
-        AssetsServicesContainer, persistence=assets_list_in_memory_database
+        AssetsServicesContainer,
+        config=config,
+        persistence=assets_list_in_memory_database,
+        history=assets_list_history,
+        rollups=average_rate_rollups,
+        read_models=assets_list_read_models,
+        sqlite_database=assets_list_sqlite_database,
+        executor=executor,
+        cpu_executor=cpu_executor,
     )
@@ -9,6 +9,43 @@ class Config(BaseSettings):
     debug: bool = Field(default=False)
     log_level: str = Field(default="INFO")
     environment: str = Field()  # development, production, testing
+    json_codec: str = Field(default="msgspec")  # msgspec, orjson, stdlib
+    assets_list_backend: str = Field(default="memory")  # memory, sqlite
+    sqlite_path: str = Field(default="assets.db")
+    database_shard_count: int = Field(default=64, gt=0)  # in-memory store shards
+    # Portfolios whose encoded GET /interest_rate body is kept
+    interest_rate_cache_max_entries: int = Field(default=1024, gt=0)
+    ingest_chunk_size: int = Field(default=10_000, gt=0)  # rows per streamed chunk
+    csv_import_max_errors: int = Field(default=100, gt=0)  # rows reported per import
+    avg_calculator_engine: str = Field(default="auto")  # auto, python, numpy, fsum
+    # Lists from this size on are averaged with NumPy; None: calibrated per process
+    avg_calculator_numpy_min_size: int | None = Field(default=None, gt=0)
+    executor_max_workers: int | None = Field(default=None, gt=0)  # None: per CPUs
+    cpu_executor_kind: str = Field(default="process")  # process, thread
+    cpu_executor_max_workers: int | None = Field(default=None, gt=0)
+    # Uploads of at least this many assets are reduced on all cores
+    parallel_reduction_min_size: int = Field(default=1_000_000, gt=0)
+    parallel_reduction_chunk_size: int = Field(default=250_000, gt=0)
+    # Past this many distinct ids, the duplicate check spills to temporary files
+    duplicate_check_max_ids_in_memory: int = Field(default=2_000_000, gt=0)
+    duplicate_check_spill_dir: str | None = Field(default=None)  # None: system temp
+    # Buckets of the fixed-width and of the quantile rate histograms
+    histogram_bucket_count: int = Field(default=20, gt=0)
+    histogram_quantile_count: int = Field(default=10, gt=0)
+    # Past versions of every in-memory list kept for point-in-time reads; 0: none
+    history_max_versions: int = Field(default=0, ge=0)
+    # Versions older than this are dropped too; None: only the count limits them
+    history_max_age_seconds: float | None = Field(default=7 * 24 * 3600, gt=0)
+    history_chunk_size: int = Field(default=1024, gt=0)  # rows shared as one
+    # How long the minute, hour and day rollups of the average rate are kept
+    rollup_minute_retention_seconds: float = Field(default=7 * 86400, gt=0)
+    rollup_hour_retention_seconds: float = Field(default=90 * 86400, gt=0)
+    rollup_day_retention_seconds: float = Field(default=5 * 365 * 86400, gt=0)
+    snapshot_dir: str | None = Field(default=None)  # unset disables snapshots
+    snapshot_interval_seconds: float = Field(default=60.0, gt=0)
+    wal_dir: str | None = Field(default=None)  # unset disables the write-ahead log
+    # How often the log is compacted down to the latest value of every list
+    wal_checkpoint_interval_seconds: float = Field(default=300.0, gt=0)
 
 
 config = Config()  # type: ignore
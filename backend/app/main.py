@@ -1,8 +1,26 @@
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.contexts.assets.domain.entities.assets_list import AssetsList
+from app.contexts.assets.domain.services.interest_rate_avg_calculator.calibration import (
+    calibrated_numpy_min_size,
+)
+from app.contexts.assets.infrastructure.api.routes import (
+    portfolio_router as portfolio_assets_router,
+)
 from app.contexts.assets.infrastructure.api.routes import router as assets_router
+from app.contexts.assets.infrastructure.persistence.assets_list.snapshot_store import (
+    AssetsListSnapshotter,
+)
 from app.contexts.health.infrastructure.api.routes import router as health_router
+from app.contexts.shared.infrastructure.api.json_codec_routing import (
+    json_codec_response_class,
+)
+from app.contexts.shared.infrastructure.in_memory_database import InMemoryDatabase
 from app.core.containers.container import Container
 from app.core.settings.config import config
 
@@ -11,14 +29,85 @@ class ContainerizedFastAPI(FastAPI):
     container: Container
 
 
+@contextlib.asynccontextmanager
+async def lifespan(app: "ContainerizedFastAPI") -> AsyncIterator[None]:
+    async with contextlib.AsyncExitStack() as stack:
+        # Let in-flight offloaded work finish before exiting
+        stack.callback(app.container.executor().shutdown)
+        stack.callback(app.container.cpu_executor().shutdown)
+
+        # Measure the calculator's engine crossover before the first request
+        if app.container.config.avg_calculator_numpy_min_size() is None:
+            await asyncio.to_thread(calibrated_numpy_min_size)
+
+        # Warm restart from the last snapshots, then keep them fresh while serving
+        if app.container.config.snapshot_dir():
+            snapshotter = app.container.assets_list_snapshotter()
+            snapshotter.restore()
+            task = asyncio.create_task(
+                snapshotter.run_periodically(
+                    app.container.config.snapshot_interval_seconds()
+                )
+            )
+            stack.push_async_callback(_stop_snapshots, task, snapshotter)
+
+        # Replay the write-ahead log over the snapshots, then log every write
+        # and compact the log now and then
+        if app.container.config.wal_dir():
+            database = app.container.assets_list_in_memory_database()
+            await asyncio.to_thread(
+                database.attach_log, app.container.assets_list_write_ahead_log()
+            )
+            task = asyncio.create_task(
+                _checkpoint_periodically(
+                    database, app.container.config.wal_checkpoint_interval_seconds()
+                )
+            )
+            stack.push_async_callback(_stop_checkpoints, task, database)
+
+        yield
+
+
+async def _stop_snapshots(
+    task: "asyncio.Task[None]", snapshotter: AssetsListSnapshotter
+) -> None:
+    task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await task
+    await asyncio.to_thread(snapshotter.snapshot)
+
+
+async def _checkpoint_periodically(
+    database: InMemoryDatabase[AssetsList], interval_seconds: float
+) -> None:
+    while True:
+        await asyncio.sleep(interval_seconds)
+        await asyncio.to_thread(database.checkpoint_log)
+
+
+async def _stop_checkpoints(
+    task: "asyncio.Task[None]", database: InMemoryDatabase[AssetsList]
+) -> None:
+    task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await task
+    if database.log is not None:
+        await asyncio.to_thread(database.log.close)
+
+
 def create_app():
     # Initialize the container
     container = Container()
     container.config.from_pydantic(config)
 
-    # Create the app
-    app = ContainerizedFastAPI()
+    # Create the app, encoding responses and decoding request bodies with the
+    # configured JSON codec
+    json_codec = container.json_codec()
+    app = ContainerizedFastAPI(
+        lifespan=lifespan, default_response_class=json_codec_response_class(json_codec)
+    )
     app.container = container
+    app.state.json_codec = json_codec
 
     # Configure CORS
     app.add_middleware(
@@ -42,6 +131,7 @@ def create_app():
     # Include the routers
     app.include_router(health_router)
     app.include_router(assets_router)
+    app.include_router(portfolio_assets_router)
 
     return app
 
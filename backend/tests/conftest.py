@@ -3,8 +3,13 @@ from fastapi.testclient import TestClient
 
 from app.main import app
 
+# Worker processes would be spawned anew for every test; threads parse the same way
+app.container.config.cpu_executor_kind.override("thread")
+
 
 @pytest.fixture(scope="function")
 def test_client() -> TestClient:
     print("Creating test client")
+    # Start every test from empty singletons (e.g. the in-memory database)
+    app.container.reset_singletons()
     return TestClient(app)
@@ -0,0 +1,125 @@
+from fastapi.testclient import TestClient
+
+base_url = ""
+
+
+def _save(test_client: TestClient, *rates: float) -> None:
+    assets = [{"id": f"id_{i}", "interest_rate": rate} for i, rate in enumerate(rates)]
+    response = test_client.post(f"{base_url}/asset", json={"assets": assets})
+    assert response.status_code == 200
+
+
+def _average(test_client: TestClient) -> float:
+    response = test_client.get(f"{base_url}/interest_rate")
+    return float(response.json()["average_interest_rate"])
+
+
+class TestAssetItems:
+    """Integration tests for the incremental asset endpoints."""
+
+    def test_add_assets(self, test_client: TestClient):
+        """Test adding a batch of assets to the stored list."""
+        _save(test_client, 5, 10)
+
+        response = test_client.post(
+            f"{base_url}/asset/items",
+            json={"assets": [{"id": "id_new", "interest_rate": 15}]},
+        )
+
+        assert response.status_code == 200
+        assert _average(test_client) == 10.0
+
+    def test_add_existing_asset(self, test_client: TestClient):
+        """Test that adding an id already stored is rejected."""
+        _save(test_client, 5, 10)
+
+        response = test_client.post(
+            f"{base_url}/asset/items",
+            json={"assets": [{"id": "id_0", "interest_rate": 15}]},
+        )
+
+        assert response.status_code == 422
+        assert "id_0" in response.json()["detail"]
+        assert _average(test_client) == 7.5
+
+    def test_update_assets(self, test_client: TestClient):
+        """Test updating a batch of stored assets."""
+        _save(test_client, 5, 10, 15)
+
+        response = test_client.patch(
+            f"{base_url}/asset/items",
+            json={
+                "assets": [
+                    {"id": "id_0", "interest_rate": 20},
+                    {"id": "id_1", "interest_rate": 30},
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        assert _average(test_client) == 65 / 3
+
+    def test_update_single_asset(self, test_client: TestClient):
+        """Test updating the rate of a single stored asset."""
+        _save(test_client, 5, 10)
+
+        response = test_client.put(
+            f"{base_url}/asset/items/id_1", json={"interest_rate": 20}
+        )
+
+        assert response.status_code == 200
+        assert _average(test_client) == 12.5
+
+    def test_update_missing_asset(self, test_client: TestClient):
+        """Test that updating an unknown asset returns 404."""
+        _save(test_client, 5, 10)
+
+        response = test_client.put(
+            f"{base_url}/asset/items/missing", json={"interest_rate": 20}
+        )
+
+        assert response.status_code == 404
+        assert "missing" in response.json()["detail"]
+
+    def test_remove_assets(self, test_client: TestClient):
+        """Test removing a batch of stored assets."""
+        _save(test_client, 5, 10, 15, 20)
+
+        response = test_client.delete(
+            f"{base_url}/asset/items", params={"ids": ["id_0", "id_3"]}
+        )
+
+        assert response.status_code == 200
+        assert _average(test_client) == 12.5
+
+    def test_remove_single_asset(self, test_client: TestClient):
+        """Test removing a single stored asset."""
+        _save(test_client, 5, 10, 15)
+
+        response = test_client.delete(f"{base_url}/asset/items/id_2")
+
+        assert response.status_code == 200
+        assert _average(test_client) == 7.5
+
+    def test_remove_last_asset(self, test_client: TestClient):
+        """Test that the stored list cannot be emptied."""
+        _save(test_client, 5)
+
+        response = test_client.delete(f"{base_url}/asset/items/id_0")
+
+        assert response.status_code == 422
+        assert _average(test_client) == 5.0
+
+    def test_malformed_body_is_rejected(self, test_client: TestClient):
+        """Test that the JSON codec reports malformed bodies as validation errors."""
+        _save(test_client, 5)
+
+        response = test_client.post(
+            f"{base_url}/asset/items",
+            content=b'{"assets": [',
+            headers={"content-type": "application/json"},
+        )
+
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["type"] == "json_invalid"
+        assert _average(test_client) == 5.0
@@ -0,0 +1,74 @@
+from fastapi.testclient import TestClient
+
+base_url = ""
+
+
+class TestEvaluateScenarios:
+    """Integration tests for the ``POST /interest_rate/what_if`` endpoint."""
+
+    def test_scenarios_without_assets_start_empty(self, test_client: TestClient):
+        """Test that scenarios against a missing list only count their adds."""
+        # Act
+        response = test_client.post(
+            f"{base_url}/interest_rate/what_if",
+            json={"scenarios": [{"add": [{"id": "id_1", "interest_rate": 4}]}, {}]},
+        )
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json() == {
+            "scenarios": [
+                {"asset_count": 1, "average_interest_rate": 4.0},
+                {"asset_count": 0, "average_interest_rate": None},
+            ]
+        }
+
+    def test_thousands_of_scenarios_leave_the_list_alone(self, test_client: TestClient):
+        """Test every scenario's average, with the stored average unchanged."""
+        # Arrange
+        assets = [{"id": f"id_{i}", "interest_rate": i} for i in range(10)]
+        test_client.post(f"{base_url}/asset", json={"assets": assets})
+        scenarios = [
+            {
+                "add": [{"id": f"new_{i}", "interest_rate": i % 100}],
+                "remove": [f"id_{i % 10}"],
+            }
+            for i in range(5_000)
+        ]
+
+        # Act
+        response = test_client.post(
+            f"{base_url}/interest_rate/what_if", json={"scenarios": scenarios}
+        )
+
+        # Assert
+        assert response.status_code == 200
+        outcomes = response.json()["scenarios"]
+        assert len(outcomes) == 5_000
+        assert outcomes[123] == {"asset_count": 10, "average_interest_rate": 6.5}
+        average = test_client.get(f"{base_url}/interest_rate").json()
+        assert average["average_interest_rate"] == 4.5
+
+    def test_unknown_removals_are_rejected(self, test_client: TestClient):
+        """Test that removing an asset that is not stored is a 404."""
+        # Arrange
+        test_client.post(
+            f"{base_url}/asset", json={"assets": [{"id": "id_1", "interest_rate": 1}]}
+        )
+
+        # Act
+        response = test_client.post(
+            f"{base_url}/interest_rate/what_if",
+            json={"scenarios": [{"remove": ["missing"]}]},
+        )
+
+        # Assert
+        assert response.status_code == 404
+
+    def test_scenarios_are_required(self, test_client: TestClient):
+        """Test that a request without scenarios is a validation error."""
+        response = test_client.post(
+            f"{base_url}/interest_rate/what_if", json={"scenarios": []}
+        )
+
+        assert response.status_code == 422
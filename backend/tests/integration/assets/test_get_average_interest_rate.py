@@ -196,3 +196,166 @@ class TestGetAverageInterestRate:
         response_data = response.json()
         # Should be the average of the second set: (20 + 30) / 2 = 25
         assert response_data["average_interest_rate"] == 25.0
+
+    def test_get_average_interest_rate_returns_etag(self, test_client: TestClient):
+        """Test that a matching If-None-Match gets a 304 without a body."""
+        response = test_client.get(f"{base_url}/interest_rate")
+        etag = response.headers["etag"]
+
+        cached_response = test_client.get(
+            f"{base_url}/interest_rate", headers={"If-None-Match": etag}
+        )
+
+        assert cached_response.status_code == 304
+        assert cached_response.headers["etag"] == etag
+        assert cached_response.content == b""
+
+    def test_get_average_interest_rate_etag_changes_on_save(
+        self, test_client: TestClient
+    ):
+        """Test that saving assets invalidates the previous ETag."""
+        etag = test_client.get(f"{base_url}/interest_rate").headers["etag"]
+        save_response = test_client.post(
+            f"{base_url}/asset", json={"assets": [{"id": "id_1", "interest_rate": 7}]}
+        )
+        assert save_response.status_code == 200
+
+        response = test_client.get(
+            f"{base_url}/interest_rate", headers={"If-None-Match": etag}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert response.json()["average_interest_rate"] == 7.0
+
+    def test_get_average_interest_rate_etag_changes_on_update(
+        self, test_client: TestClient
+    ):
+        """Test that incremental updates invalidate the previous ETag."""
+        test_client.post(
+            f"{base_url}/asset", json={"assets": [{"id": "id_1", "interest_rate": 7}]}
+        )
+        etag = test_client.get(f"{base_url}/interest_rate").headers["etag"]
+        test_client.put(f"{base_url}/asset/items/id_1", json={"interest_rate": 9})
+
+        response = test_client.get(
+            f"{base_url}/interest_rate", headers={"If-None-Match": etag}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["average_interest_rate"] == 9.0
+
+
+class TestGetWeightedAverageInterestRate:
+    """Integration tests for the amount-weighted average interest rate."""
+
+    def test_weighted_average_after_saving_amounts(self, test_client: TestClient):
+        """Test that saved amounts weigh the rates and missing ones are skipped."""
+        test_client.post(
+            f"{base_url}/asset",
+            json={
+                "assets": [
+                    {"id": "id_1", "interest_rate": 5, "amount": 100},
+                    {"id": "id_2", "interest_rate": 10},
+                    {"id": "id_3", "interest_rate": 15, "amount": 300},
+                ]
+            },
+        )
+
+        response = test_client.get(f"{base_url}/interest_rate")
+
+        assert response.json() == {
+            "average_interest_rate": 10.0,
+            "weighted_average_interest_rate": 12.5,
+        }
+
+    def test_weighted_average_follows_item_changes(self, test_client: TestClient):
+        """Test that incremental writes refresh the weighted average."""
+        test_client.post(
+            f"{base_url}/asset",
+            json={"assets": [{"id": "id_1", "interest_rate": 5, "amount": 100}]},
+        )
+        test_client.post(
+            f"{base_url}/asset/items",
+            json={"assets": [{"id": "id_2", "interest_rate": 20, "amount": 100}]},
+        )
+        # The amount is kept when only the rate changes
+        test_client.put(f"{base_url}/asset/items/id_1", json={"interest_rate": 10})
+        test_client.put(
+            f"{base_url}/asset/items/id_2", json={"interest_rate": 20, "amount": 400}
+        )
+
+        response = test_client.get(f"{base_url}/interest_rate")
+
+        assert response.json()["weighted_average_interest_rate"] == 18.0
+
+    def test_negative_amount_is_rejected(self, test_client: TestClient):
+        """Test that an amount cannot be negative."""
+        response = test_client.post(
+            f"{base_url}/asset",
+            json={"assets": [{"id": "id_1", "interest_rate": 5, "amount": -1}]},
+        )
+
+        assert response.status_code == 422
+
+
+class TestGetInterestRateStatistics:
+    """Integration tests for the interest rate statistics endpoint."""
+
+    def test_statistics_when_no_assets_exist(self, test_client: TestClient):
+        """Test that an empty portfolio has a zero count and no statistics."""
+        response = test_client.get(f"{base_url}/interest_rate/statistics")
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "asset_count": 0,
+            "min": None,
+            "max": None,
+            "mean": None,
+            "std": None,
+            "median": None,
+            "p90": None,
+            "p99": None,
+        }
+
+    def test_statistics_after_saving_assets(self, test_client: TestClient):
+        """Test that the saved rates are described and item changes followed."""
+        test_client.post(
+            f"{base_url}/asset",
+            json={
+                "assets": [{"id": f"id_{i}", "interest_rate": i} for i in range(1, 101)]
+            },
+        )
+
+        response = test_client.get(f"{base_url}/interest_rate/statistics")
+
+        assert response.status_code == 200
+        statistics = response.json()
+        assert statistics["asset_count"] == 100
+        assert (statistics["min"], statistics["max"]) == (1.0, 100.0)
+        assert statistics["mean"] == 50.5
+        assert statistics["median"] == 50.5
+        assert statistics["p90"] == 90.5
+        assert round(statistics["std"], 3) == 28.866
+
+        test_client.delete(f"{base_url}/asset/items/id_100")
+        response = test_client.get(f"{base_url}/interest_rate/statistics")
+
+        assert response.json()["max"] == 99.0
+
+    def test_statistics_are_scoped_to_the_portfolio(self, test_client: TestClient):
+        """Test that every portfolio has statistics of its own."""
+        test_client.post(
+            "/portfolios/p1/asset",
+            json={"assets": [{"id": "id_1", "interest_rate": 4}]},
+        )
+
+        response = test_client.get("/portfolios/p1/interest_rate/statistics")
+
+        assert response.json()["median"] == 4.0
+        assert (
+            test_client.get(f"{base_url}/interest_rate/statistics").json()[
+                "asset_count"
+            ]
+            == 0
+        )
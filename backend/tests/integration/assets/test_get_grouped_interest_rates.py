@@ -0,0 +1,83 @@
+from fastapi.testclient import TestClient
+
+base_url = ""
+
+
+class TestGetGroupedInterestRates:
+    """Integration tests for the ``GET /interest_rate/groups`` endpoint."""
+
+    def test_groups_without_assets_are_empty(self, test_client: TestClient):
+        """Test that there are no groups before a list is saved."""
+        response = test_client.get(f"{base_url}/interest_rate/groups?by=region")
+
+        assert response.status_code == 200
+        assert response.json() == {"tag": "region", "groups": []}
+
+    def test_groups_follow_incremental_changes(self, test_client: TestClient):
+        """Test the saved groups, then an added and an updated asset."""
+        # Arrange
+        assets = [
+            {"id": "id_1", "interest_rate": 5, "tags": {"region": "eu"}},
+            {"id": "id_2", "interest_rate": 10, "tags": {"region": "us"}},
+            {"id": "id_3", "interest_rate": 15},
+        ]
+        test_client.post(f"{base_url}/asset", json={"assets": assets})
+        test_client.post(
+            f"{base_url}/asset/items",
+            json={
+                "assets": [{"id": "id_4", "interest_rate": 9, "tags": {"region": "eu"}}]
+            },
+        )
+        test_client.patch(
+            f"{base_url}/asset/items",
+            json={
+                "assets": [
+                    {"id": "id_3", "interest_rate": 15, "tags": {"region": "us"}}
+                ]
+            },
+        )
+
+        # Act
+        response = test_client.get(f"{base_url}/interest_rate/groups?by=region")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json() == {
+            "tag": "region",
+            "groups": [
+                {"value": "eu", "asset_count": 2, "average_interest_rate": 7.0},
+                {"value": "us", "asset_count": 2, "average_interest_rate": 12.5},
+            ],
+        }
+        asset = test_client.get(f"{base_url}/asset/items/id_3").json()
+        assert asset["tags"] == {"region": "us"}
+
+    def test_single_asset_update_retags_it(self, test_client: TestClient):
+        """Test that PUT moves an asset to the group of its new tag value."""
+        # Arrange
+        assets = [
+            {"id": "id_1", "interest_rate": 5, "tags": {"region": "eu"}},
+            {"id": "id_2", "interest_rate": 10, "tags": {"region": "us"}},
+        ]
+        test_client.post(f"{base_url}/asset", json={"assets": assets})
+
+        # Act
+        response = test_client.put(
+            f"{base_url}/asset/items/id_1",
+            json={"interest_rate": 7, "tags": {"region": "us"}},
+        )
+
+        # Assert
+        assert response.status_code == 200
+        groups = test_client.get(f"{base_url}/interest_rate/groups?by=region").json()
+        assert groups["groups"] == [
+            {"value": "us", "asset_count": 2, "average_interest_rate": 8.5}
+        ]
+        asset = test_client.get(f"{base_url}/asset/items/id_1").json()
+        assert asset["tags"] == {"region": "us"}
+
+    def test_tag_is_required(self, test_client: TestClient):
+        """Test that the tag to group by must be given."""
+        response = test_client.get(f"{base_url}/interest_rate/groups")
+
+        assert response.status_code == 422
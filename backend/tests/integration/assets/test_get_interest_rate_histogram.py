@@ -0,0 +1,45 @@
+from fastapi.testclient import TestClient
+
+base_url = ""
+
+
+class TestGetInterestRateHistogram:
+    """Integration tests for the ``GET /interest_rate/histogram`` endpoint."""
+
+    def test_histogram_without_assets_is_null(self, test_client: TestClient):
+        """Test that there is no histogram before a list is saved."""
+        response = test_client.get(f"{base_url}/interest_rate/histogram")
+
+        assert response.status_code == 200
+        assert response.json() == {"fixed_width": None, "quantile": None}
+
+    def test_histogram_follows_incremental_changes(self, test_client: TestClient):
+        """Test the saved buckets, then an added rate moved into them."""
+        # Arrange
+        assets = [
+            {"id": f"id_{i}", "interest_rate": rate}
+            for i, rate in enumerate([0, 5, 10, 15, 20])
+        ]
+        test_client.post(f"{base_url}/asset", json={"assets": assets})
+        test_client.post(
+            f"{base_url}/asset/items",
+            json={"assets": [{"id": "id_5", "interest_rate": 19}]},
+        )
+
+        # Act
+        response = test_client.get(f"{base_url}/interest_rate/histogram")
+
+        # Assert
+        assert response.status_code == 200
+        fixed_width = response.json()["fixed_width"]
+        assert len(fixed_width["buckets"]) == 20
+        assert fixed_width["buckets"][-1] == {
+            "low": 19.0,
+            "high": 20.0,
+            "asset_count": 2,
+            "average_interest_rate": 19.5,
+        }
+        assert fixed_width["buckets"][1]["average_interest_rate"] is None
+        assert (fixed_width["below"], fixed_width["above"]) == (0, 0)
+        quantile = response.json()["quantile"]
+        assert sum(bucket["asset_count"] for bucket in quantile["buckets"]) == 6
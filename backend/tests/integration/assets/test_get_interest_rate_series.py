@@ -0,0 +1,76 @@
+from fastapi.testclient import TestClient
+
+base_url = ""
+
+
+class TestGetInterestRateSeries:
+    """Integration tests for the ``GET /interest_rate/series`` endpoint."""
+
+    def test_series_follows_the_writes(self, test_client: TestClient):
+        """Test that saves and edits show up in the current bucket."""
+        # Arrange
+        assets = [
+            {"id": "id_1", "interest_rate": 5},
+            {"id": "id_2", "interest_rate": 15},
+        ]
+        test_client.post(f"{base_url}/asset", json={"assets": assets})
+        test_client.post(
+            f"{base_url}/asset/items",
+            json={"assets": [{"id": "id_3", "interest_rate": 40}]},
+        )
+
+        # Act
+        response = test_client.get(
+            f"{base_url}/interest_rate/series", params={"resolution": "day"}
+        )
+
+        # Assert
+        assert response.status_code == 200
+        body = response.json()
+        assert body["resolution"] == "day"
+        [point] = body["points"]
+        assert (point["min"], point["max"], point["last"], point["write_count"]) == (
+            10.0,
+            20.0,
+            20.0,
+            2,
+        )
+        assert point["mean"] == 15.0
+
+    def test_range_before_any_write_is_empty(self, test_client: TestClient):
+        """Test that a range ending before the writes has no points."""
+        # Arrange
+        test_client.post(
+            f"{base_url}/asset", json={"assets": [{"id": "id_1", "interest_rate": 5}]}
+        )
+
+        # Act
+        response = test_client.get(
+            f"{base_url}/interest_rate/series",
+            params={"resolution": "minute", "end": "2000-01-01T00:00:00Z"},
+        )
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["points"] == []
+
+    def test_rejects_inverted_range(self, test_client: TestClient):
+        """Test that a start after the end is a validation error."""
+        # Act
+        response = test_client.get(
+            f"{base_url}/interest_rate/series",
+            params={"start": "2026-01-02T00:00:00Z", "end": "2026-01-01T00:00:00Z"},
+        )
+
+        # Assert
+        assert response.status_code == 422
+
+    def test_rejects_unknown_resolution(self, test_client: TestClient):
+        """Test that only minute, hour and day buckets are offered."""
+        # Act
+        response = test_client.get(
+            f"{base_url}/interest_rate/series", params={"resolution": "week"}
+        )
+
+        # Assert
+        assert response.status_code == 422
@@ -0,0 +1,102 @@
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+base_url = ""
+
+
+class TestAssetsListHistory:
+    """Integration tests for the ``/history`` endpoints."""
+
+    @pytest.fixture(autouse=True)
+    def keep_versions(self):
+        """Turn on the history, which is off by default."""
+        with app.container.config.history_max_versions.override(10):
+            yield
+
+    def _write_versions(self, test_client: TestClient) -> None:
+        assets = [
+            {"id": "id_1", "interest_rate": 5},
+            {"id": "id_2", "interest_rate": 15},
+        ]
+        test_client.post(f"{base_url}/asset", json={"assets": assets})
+        test_client.post(
+            f"{base_url}/asset/items",
+            json={"assets": [{"id": "id_3", "interest_rate": 40}]},
+        )
+
+    def test_history_lists_every_write(self, test_client: TestClient):
+        """Test that each save and edit shows up as a version."""
+        # Arrange
+        self._write_versions(test_client)
+
+        # Act
+        response = test_client.get(f"{base_url}/history")
+
+        # Assert
+        assert response.status_code == 200
+        versions = response.json()["versions"]
+        assert [
+            (
+                version["version"],
+                version["asset_count"],
+                version["average_interest_rate"],
+            )
+            for version in versions
+        ] == [(1, 2, 10.0), (2, 3, 20.0)]
+
+    def test_past_average_and_assets(self, test_client: TestClient):
+        """Test reading a past version by number and the latest one by time."""
+        # Arrange
+        self._write_versions(test_client)
+        later = (datetime.now() + timedelta(minutes=1)).isoformat()
+
+        # Act
+        average = test_client.get(f"{base_url}/history/interest_rate?version=1")
+        assets = test_client.get(
+            f"{base_url}/history/assets", params={"at": later, "offset": 1, "limit": 5}
+        )
+
+        # Assert
+        assert average.status_code == 200
+        assert average.json()["average_interest_rate"] == 10.0
+        assert assets.status_code == 200
+        assert assets.json()["version"] == 2
+        assert [asset["id"] for asset in assets.json()["assets"]] == ["id_2", "id_3"]
+
+    def test_unknown_versions_are_not_found(self, test_client: TestClient):
+        """Test that a version that was never written or not kept is a 404."""
+        self._write_versions(test_client)
+
+        response = test_client.get(f"{base_url}/history/interest_rate?version=9")
+
+        assert response.status_code == 404
+
+    def test_version_and_time_are_exclusive(self, test_client: TestClient):
+        """Test that a point in time is given one way only."""
+        response = test_client.get(
+            f"{base_url}/history/assets",
+            params={"version": 1, "at": datetime.now().isoformat()},
+        )
+
+        assert response.status_code == 422
+
+
+class TestAssetsListHistoryOff:
+    """Integration tests for the ``/history`` endpoints with the default config."""
+
+    def test_history_is_unavailable(self, test_client: TestClient):
+        """Test that no versions are kept unless configured."""
+        # Arrange
+        test_client.post(
+            f"{base_url}/asset", json={"assets": [{"id": "id_1", "interest_rate": 5}]}
+        )
+
+        # Act
+        response = test_client.get(f"{base_url}/history")
+
+        # Assert
+        assert response.status_code == 501
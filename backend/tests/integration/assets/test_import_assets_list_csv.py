@@ -0,0 +1,57 @@
+from fastapi.testclient import TestClient
+
+base_url = ""
+
+
+class TestImportAssetsListCsv:
+    """Integration tests for the CSV import endpoint."""
+
+    def test_import_csv(self, test_client: TestClient):
+        """Test importing a CSV export spanning many chunks."""
+        body = "id,interest_rate\n" + "".join(f"id_{i},{i}\n" for i in range(25_001))
+
+        response = test_client.post(
+            f"{base_url}/asset/csv",
+            content=body.encode(),
+            headers={"Content-Type": "text/csv"},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["message"] == "Assets list saved successfully"
+        response = test_client.get(f"{base_url}/interest_rate")
+        assert response.json()["average_interest_rate"] == 12_500.0
+
+    def test_import_csv_reports_invalid_rows(self, test_client: TestClient):
+        """Test that invalid rows are listed by line and nothing is saved."""
+        test_client.post(f"{base_url}/asset/csv", content=b"id,interest_rate\nid_1,5\n")
+
+        response = test_client.post(
+            f"{base_url}/asset/csv",
+            content=b"id,interest_rate\nid_1,1\nid_2,abc\nid_3,3\nid_4\n",
+        )
+
+        assert response.status_code == 422
+        assert response.json()["detail"] == [
+            {"line": 3, "msg": "interest_rate: 'abc' is not a number"},
+            {"line": 5, "msg": "expected 2 fields, got 1"},
+        ]
+        response = test_client.get(f"{base_url}/interest_rate")
+        assert response.json()["average_interest_rate"] == 5.0
+
+    def test_import_csv_with_duplicate_ids(self, test_client: TestClient):
+        """Test that the duplicate id rule of a one-shot save applies."""
+        response = test_client.post(
+            f"{base_url}/asset/csv",
+            content=b"id,interest_rate\nduplicate_id,5\nduplicate_id,10\n",
+        )
+
+        assert response.status_code == 422
+        assert "duplicate_id" in response.json()["detail"]
+
+    def test_import_csv_without_rows(self, test_client: TestClient):
+        """Test that a header-only file is rejected as an empty list."""
+        response = test_client.post(
+            f"{base_url}/asset/csv", content=b"id,interest_rate\n"
+        )
+
+        assert response.status_code == 422
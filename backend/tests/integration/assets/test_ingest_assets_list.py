@@ -0,0 +1,74 @@
+from fastapi.testclient import TestClient
+
+base_url = ""
+
+
+def _ndjson(*lines: str) -> bytes:
+    return "\n".join(lines).encode()
+
+
+class TestIngestAssetsList:
+    """Integration tests for the NDJSON ingest endpoint."""
+
+    def test_ingest_assets_list_with_valid_data(self, test_client: TestClient):
+        """Test streaming a valid NDJSON assets list."""
+        body = _ndjson(
+            '{"id": "id_1", "interest_rate": 5}',
+            '{"id": "id_2", "interest_rate": 10}',
+            "",
+            '{"id": "id_3", "interest_rate": 15}',
+        )
+
+        response = test_client.post(
+            f"{base_url}/asset/ndjson",
+            content=body,
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["message"] == "Assets list saved successfully"
+
+        response = test_client.get(f"{base_url}/interest_rate")
+        assert response.json()["average_interest_rate"] == 10.0
+
+    def test_ingest_assets_list_spanning_many_chunks(self, test_client: TestClient):
+        """Test that a stream larger than the chunk size is fully ingested."""
+        body = _ndjson(
+            *(f'{{"id": "id_{i}", "interest_rate": {i}}}' for i in range(25_001))
+        )
+
+        response = test_client.post(f"{base_url}/asset/ndjson", content=body)
+
+        assert response.status_code == 200
+        response = test_client.get(f"{base_url}/interest_rate")
+        assert response.json()["average_interest_rate"] == 12_500.0
+
+    def test_ingest_assets_list_reports_invalid_line(self, test_client: TestClient):
+        """Test that a malformed record is reported with its line number."""
+        body = _ndjson(
+            '{"id": "id_1", "interest_rate": 5}',
+            '{"id": "id_2", "interest_rate": "not_a_number"}',
+        )
+
+        response = test_client.post(f"{base_url}/asset/ndjson", content=body)
+
+        assert response.status_code == 422
+        assert "line 2" in response.json()["detail"]
+
+    def test_ingest_assets_list_with_duplicate_ids(self, test_client: TestClient):
+        """Test that duplicate ids in the stream are rejected."""
+        body = _ndjson(
+            '{"id": "duplicate_id", "interest_rate": 5}',
+            '{"id": "duplicate_id", "interest_rate": 10}',
+        )
+
+        response = test_client.post(f"{base_url}/asset/ndjson", content=body)
+
+        assert response.status_code == 422
+        assert "duplicate_id" in response.json()["detail"]
+
+    def test_ingest_assets_list_with_empty_body(self, test_client: TestClient):
+        """Test that an empty stream is rejected."""
+        response = test_client.post(f"{base_url}/asset/ndjson", content=b"")
+
+        assert response.status_code == 422
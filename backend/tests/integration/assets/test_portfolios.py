@@ -0,0 +1,94 @@
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+base_url = ""
+
+
+class TestPortfolios:
+    """Integration tests for the portfolio-scoped endpoints."""
+
+    def test_portfolios_are_stored_independently(self, test_client: TestClient):
+        """Test that saving one portfolio does not replace another one."""
+        first = test_client.post(
+            f"{base_url}/portfolios/p1/asset",
+            json={"assets": [{"id": "id_1", "interest_rate": 5}]},
+        )
+        second = test_client.post(
+            f"{base_url}/portfolios/p2/asset",
+            json={"assets": [{"id": "id_1", "interest_rate": 15}]},
+        )
+
+        assert first.status_code == 200
+        assert second.status_code == 200
+        p1 = test_client.get(f"{base_url}/portfolios/p1/interest_rate").json()
+        p2 = test_client.get(f"{base_url}/portfolios/p2/interest_rate").json()
+        assert p1["average_interest_rate"] == 5.0
+        assert p2["average_interest_rate"] == 15.0
+
+    def test_portfolio_is_separate_from_unscoped_routes(self, test_client: TestClient):
+        """Test that the unscoped routes keep addressing the default portfolio."""
+        test_client.post(
+            f"{base_url}/asset", json={"assets": [{"id": "id_1", "interest_rate": 7}]}
+        )
+
+        response = test_client.get(f"{base_url}/portfolios/p1/interest_rate")
+
+        assert response.status_code == 200
+        assert response.json()["average_interest_rate"] is None
+        default = test_client.get(f"{base_url}/interest_rate").json()
+        assert default["average_interest_rate"] == 7.0
+
+    def test_portfolio_incremental_updates(self, test_client: TestClient):
+        """Test that item endpoints only touch the addressed portfolio."""
+        test_client.post(
+            f"{base_url}/portfolios/p1/asset",
+            json={"assets": [{"id": "id_1", "interest_rate": 5}]},
+        )
+
+        add_response = test_client.post(
+            f"{base_url}/portfolios/p1/asset/items",
+            json={"assets": [{"id": "id_2", "interest_rate": 15}]},
+        )
+        missing_response = test_client.delete(
+            f"{base_url}/portfolios/p2/asset/items/id_1"
+        )
+
+        assert add_response.status_code == 200
+        assert missing_response.status_code == 404
+        p1 = test_client.get(f"{base_url}/portfolios/p1/interest_rate").json()
+        assert p1["average_interest_rate"] == 10.0
+
+    def test_portfolio_etags_are_independent(self, test_client: TestClient):
+        """Test that writing to one portfolio keeps another one's ETag valid."""
+        test_client.post(
+            f"{base_url}/portfolios/p1/asset",
+            json={"assets": [{"id": "id_1", "interest_rate": 5}]},
+        )
+        etag = test_client.get(f"{base_url}/portfolios/p1/interest_rate").headers[
+            "etag"
+        ]
+        test_client.post(
+            f"{base_url}/portfolios/p2/asset",
+            json={"assets": [{"id": "id_1", "interest_rate": 15}]},
+        )
+
+        response = test_client.get(
+            f"{base_url}/portfolios/p1/interest_rate",
+            headers={"If-None-Match": etag},
+        )
+
+        assert response.status_code == 304
+
+    def test_unknown_portfolios_are_not_cached(self, test_client: TestClient):
+        """Test that reading many unknown portfolio ids keeps no cache entries."""
+        # Act
+        responses = [
+            test_client.get(f"{base_url}/portfolios/unknown_{index}/interest_rate")
+            for index in range(50)
+        ]
+
+        # Assert
+        assert all(response.status_code == 200 for response in responses)
+        cache = app.container.assets_list_services.interest_rate_response_cache()
+        assert len(cache._cached) == 0
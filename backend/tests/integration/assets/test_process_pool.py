@@ -0,0 +1,81 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+base_url = ""
+
+
+class TestProcessPool:
+    """Integration tests for uploads parsed and reduced on worker processes."""
+
+    @pytest.fixture(autouse=True)
+    def process_pool(self):
+        """Run the CPU executor as a process pool and reduce every list in
+        parallel, in chunks of two rows."""
+        config = app.container.config
+        with (
+            config.cpu_executor_kind.override("process"),
+            config.cpu_executor_max_workers.override(2),
+            config.parallel_reduction_min_size.override(1),
+            config.parallel_reduction_chunk_size.override(2),
+        ):
+            yield
+            app.container.cpu_executor().shutdown()
+        app.container.reset_singletons()
+
+    def test_save_assets_list(self, test_client: TestClient):
+        """Test that a list parsed and reduced by workers is saved whole."""
+        assets = [{"id": f"id_{i}", "interest_rate": i} for i in range(5)]
+
+        response = test_client.post(f"{base_url}/asset", json={"assets": assets})
+
+        assert response.status_code == 200
+        assert isinstance(app.container.cpu_executor(), ProcessPoolExecutor)
+        response = test_client.get(f"{base_url}/interest_rate")
+        assert response.json()["average_interest_rate"] == 2.0
+        response = test_client.get(f"{base_url}/interest_rate/statistics")
+        assert response.json()["max"] == 4.0
+
+    def test_save_assets_list_with_duplicate_ids(self, test_client: TestClient):
+        """Test that duplicates across the workers' chunks are reported."""
+        assets = [
+            {"id": asset_id, "interest_rate": 1}
+            for asset_id in ["id_1", "id_2", "id_3", "id_4", "id_1"]
+        ]
+
+        response = test_client.post(f"{base_url}/asset", json={"assets": assets})
+
+        assert response.status_code == 422
+        assert "id_1" in response.json()["detail"]
+
+    def test_invalid_payload_comes_back_from_a_worker(self, test_client: TestClient):
+        """Test that a validation error raised by a worker keeps its details."""
+        response = test_client.post(
+            f"{base_url}/asset",
+            json={"assets": [{"id": "id_1", "interest_rate": "not a number"}]},
+        )
+
+        assert response.status_code == 422
+        error = response.json()["detail"][0]
+        assert error["loc"] == ["body", "assets", 0, "interest_rate"]
+
+    def test_streamed_uploads_report_invalid_records(self, test_client: TestClient):
+        """Test that NDJSON and CSV errors raised by workers keep their lines."""
+        ndjson = test_client.post(
+            f"{base_url}/asset/ndjson",
+            content=b'{"id": "id_1", "interest_rate": 5}\n{"id": "id_2"}\n',
+        )
+        csv = test_client.post(
+            f"{base_url}/asset/csv",
+            content=b"id,interest_rate\nid_1,1\nid_2,abc\n",
+        )
+
+        assert ndjson.status_code == 422
+        assert "line 2" in ndjson.json()["detail"]
+        assert csv.status_code == 422
+        assert csv.json()["detail"] == [
+            {"line": 3, "msg": "interest_rate: 'abc' is not a number"}
+        ]
@@ -0,0 +1,77 @@
+from fastapi.testclient import TestClient
+
+base_url = ""
+
+
+def _save(test_client: TestClient, *rates: float) -> None:
+    assets = [{"id": f"id_{i}", "interest_rate": rate} for i, rate in enumerate(rates)]
+    response = test_client.post(f"{base_url}/asset", json={"assets": assets})
+    assert response.status_code == 200
+
+
+class TestQueryAssets:
+    """Integration tests for the asset query endpoints."""
+
+    def test_get_asset_by_id(self, test_client: TestClient):
+        """Test looking up a stored asset and an unknown one."""
+        _save(test_client, 5, 10)
+
+        response = test_client.get(f"{base_url}/asset/items/id_1")
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "id": "id_1",
+            "interest_rate": 10.0,
+            "amount": None,
+            "tags": {},
+        }
+        assert test_client.get(f"{base_url}/asset/items/missing").status_code == 404
+
+    def test_interest_rate_range(self, test_client: TestClient):
+        """Test counting and averaging the rates within inclusive bounds."""
+        _save(test_client, 5, 10, 15, 20)
+
+        response = test_client.get(
+            f"{base_url}/interest_rate/range",
+            params={"min_rate": 10, "max_rate": 15},
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"asset_count": 2, "average_interest_rate": 12.5}
+
+    def test_empty_interest_rate_range(self, test_client: TestClient):
+        """Test that a range without rates, or without a list, has no average."""
+        response = test_client.get(
+            f"{base_url}/interest_rate/range", params={"min_rate": 0, "max_rate": 1}
+        )
+
+        assert response.json() == {"asset_count": 0, "average_interest_rate": None}
+
+    def test_inverted_range_is_rejected(self, test_client: TestClient):
+        """Test that a lower bound above the upper bound is a validation error."""
+        response = test_client.get(
+            f"{base_url}/interest_rate/range", params={"min_rate": 2, "max_rate": 1}
+        )
+
+        assert response.status_code == 422
+
+    def test_lowest_and_highest_rates(self, test_client: TestClient):
+        """Test that the extreme rates follow incremental changes."""
+        _save(test_client, 5, 20, 10, 15)
+        test_client.put(f"{base_url}/asset/items/id_1", json={"interest_rate": 1})
+
+        lowest = test_client.get(f"{base_url}/interest_rate/lowest", params={"k": 2})
+        highest = test_client.get(f"{base_url}/interest_rate/highest", params={"k": 1})
+
+        assert [asset["id"] for asset in lowest.json()["assets"]] == ["id_1", "id_0"]
+        assert highest.json() == {
+            "assets": [
+                {"id": "id_3", "interest_rate": 15.0, "amount": None, "tags": {}}
+            ]
+        }
+
+    def test_k_is_validated(self, test_client: TestClient):
+        """Test that k must be positive."""
+        response = test_client.get(f"{base_url}/interest_rate/lowest", params={"k": 0})
+
+        assert response.status_code == 422
@@ -1,3 +1,6 @@
+import msgspec
+import numpy as np
+import pytest
 from app.main import app
 from fastapi.testclient import TestClient
 
@@ -339,3 +342,114 @@ class TestSaveAssetsList:
         assert response.status_code == 200
         response_data = response.json()
         assert response_data["message"] == "Assets list saved successfully"
+
+    def test_save_assets_list_invalid_payload_reports_body_location(
+        self, test_client: TestClient
+    ):
+        """Test that body errors keep FastAPI's validation error format."""
+        response = test_client.post(
+            f"{base_url}/asset",
+            json={"assets": [{"id": "id_1", "interest_rate": "not a number"}]},
+        )
+
+        assert response.status_code == 422
+        error = response.json()["detail"][0]
+        assert error["loc"] == ["body", "assets", 0, "interest_rate"]
+
+    def test_save_assets_list_coerces_like_the_dto(self, test_client: TestClient):
+        """Test that bodies off the fast decoding path keep the DTO's coercion."""
+        response = test_client.post(
+            f"{base_url}/asset",
+            json={"assets": [{"id": "id_1", "interest_rate": "5.5"}]},
+        )
+
+        assert response.status_code == 200
+        response = test_client.get(f"{base_url}/interest_rate")
+        assert response.json() == {
+            "average_interest_rate": 5.5,
+            "weighted_average_interest_rate": None,
+        }
+
+    def test_save_assets_list_body_is_documented(self, test_client: TestClient):
+        """Test that the request body schema is still published in OpenAPI."""
+        openapi = test_client.get("/openapi.json").json()
+
+        body = openapi["paths"]["/asset"]["post"]["requestBody"]
+        schema = body["content"]["application/json"]["schema"]
+        assert schema["title"] == "SaveAssetsListRequest"
+        assert schema["properties"]["assets"]["items"]["$ref"] in {
+            f"#/components/schemas/{name}" for name in openapi["components"]["schemas"]
+        }
+
+
+class TestSaveAssetsListBinaryFormats:
+    """Integration tests for the binary ``POST /asset`` bodies."""
+
+    def test_save_msgpack_columns(self, test_client: TestClient):
+        """Test saving an id column and a float64 rates column as MessagePack."""
+        body = msgspec.msgpack.encode(
+            {
+                "id": ["id_1", "id_2", "id_3"],
+                "interest_rate": np.array([5.0, 10.0, 15.0]).tobytes(),
+            }
+        )
+
+        response = test_client.post(
+            f"{base_url}/asset",
+            content=body,
+            headers={"content-type": "application/msgpack"},
+        )
+
+        assert response.status_code == 200
+        response = test_client.get(f"{base_url}/interest_rate")
+        assert response.json() == {
+            "average_interest_rate": 10.0,
+            "weighted_average_interest_rate": None,
+        }
+
+    def test_save_arrow_stream(self, test_client: TestClient):
+        """Test saving an Arrow IPC stream."""
+        pa = pytest.importorskip("pyarrow")
+        table = pa.table({"id": ["id_1", "id_2"], "interest_rate": [5.0, 15.0]})
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+
+        response = test_client.post(
+            f"{base_url}/asset",
+            content=sink.getvalue().to_pybytes(),
+            headers={"content-type": "application/vnd.apache.arrow.stream"},
+        )
+
+        assert response.status_code == 200
+        response = test_client.get(f"{base_url}/interest_rate")
+        assert response.json() == {
+            "average_interest_rate": 10.0,
+            "weighted_average_interest_rate": None,
+        }
+
+    def test_binary_uploads_follow_the_list_rules(self, test_client: TestClient):
+        """Test that duplicate ids and empty lists are rejected as for JSON."""
+        headers = {"content-type": "application/msgpack"}
+
+        duplicates = test_client.post(
+            f"{base_url}/asset",
+            content=msgspec.msgpack.encode(
+                {"id": ["id_1", "id_1"], "interest_rate": [5.0, 10.0]}
+            ),
+            headers=headers,
+        )
+        empty = test_client.post(
+            f"{base_url}/asset",
+            content=msgspec.msgpack.encode({"id": [], "interest_rate": b""}),
+            headers=headers,
+        )
+        invalid = test_client.post(
+            f"{base_url}/asset", content=b"\xc1", headers=headers
+        )
+
+        assert duplicates.status_code == 422
+        assert "id_1" in duplicates.json()["detail"]
+        assert empty.status_code == 422
+        assert invalid.status_code == 422
+        assert invalid.json()["detail"][0]["loc"] == ["body"]
@@ -0,0 +1,43 @@
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+base_url = ""
+
+
+class TestSnapshots:
+    """Integration tests for warm restarts from assets list snapshots."""
+
+    def test_restart_serves_the_last_snapshot(self, tmp_path):
+        """Test that a restarted app serves the lists saved before shutdown."""
+        app.container.reset_singletons()
+        with app.container.config.snapshot_dir.override(str(tmp_path)):
+            with TestClient(app) as client:
+                client.post(
+                    f"{base_url}/portfolios/p1/asset",
+                    json={"assets": [{"id": "id_1", "interest_rate": 5}]},
+                )
+                client.post(
+                    f"{base_url}/asset",
+                    json={
+                        "assets": [
+                            {"id": "id_1", "interest_rate": 5},
+                            {"id": "id_2", "interest_rate": 15},
+                        ]
+                    },
+                )
+
+            # Simulate a new worker: the in-memory database starts empty
+            app.container.reset_singletons()
+            with TestClient(app) as client:
+                default = client.get(f"{base_url}/interest_rate").json()
+                p1 = client.get(f"{base_url}/portfolios/p1/interest_rate").json()
+                added = client.post(
+                    f"{base_url}/asset/items",
+                    json={"assets": [{"id": "id_3", "interest_rate": 25}]},
+                )
+
+        assert default["average_interest_rate"] == 10.0
+        assert p1["average_interest_rate"] == 5.0
+        assert added.status_code == 200
+        app.container.reset_singletons()
@@ -0,0 +1,49 @@
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+base_url = ""
+
+
+class TestWriteAheadLog:
+    """Integration tests for restarts from the write-ahead log."""
+
+    def test_restart_replays_every_write(self, tmp_path):
+        """Test that a restarted app serves the lists as its last writes left."""
+        app.container.reset_singletons()
+        with app.container.config.wal_dir.override(str(tmp_path)):
+            with TestClient(app) as client:
+                client.post(
+                    f"{base_url}/asset",
+                    json={
+                        "assets": [
+                            {"id": "id_1", "interest_rate": 5},
+                            {"id": "id_2", "interest_rate": 15},
+                        ]
+                    },
+                )
+                client.post(
+                    f"{base_url}/asset/items",
+                    json={"assets": [{"id": "id_3", "interest_rate": 40}]},
+                )
+                client.post(
+                    f"{base_url}/portfolios/p1/asset",
+                    json={"assets": [{"id": "id_1", "interest_rate": 5}]},
+                )
+
+            # Simulate a new worker: the in-memory database starts empty
+            app.container.reset_singletons()
+            with TestClient(app) as client:
+                default = client.get(f"{base_url}/interest_rate").json()
+                p1 = client.get(f"{base_url}/portfolios/p1/interest_rate").json()
+                asset = client.get(f"{base_url}/asset/items/id_3")
+                updated = client.patch(
+                    f"{base_url}/asset/items",
+                    json={"assets": [{"id": "id_3", "interest_rate": 10}]},
+                )
+
+        assert default["average_interest_rate"] == 20.0
+        assert p1["average_interest_rate"] == 5.0
+        assert asset.json()["interest_rate"] == 40.0
+        assert updated.status_code == 200
+        app.container.reset_singletons()
@@ -0,0 +1,77 @@
+import asyncio
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from app.contexts.assets.application.add_assets import AddAssetsService
+from app.contexts.assets.application.remove_assets import RemoveAssetsService
+from app.contexts.assets.application.update_assets import UpdateAssetsService
+from app.contexts.assets.domain.repositories.async_assets_list_repository import (
+    AsyncAssetsListRepository,
+)
+from app.contexts.assets.domain.services.interest_rate_avg_calculator.errors import (
+    EmptyListError,
+)
+
+
+class TestEditAssetsServices:
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.mock_repository = Mock(spec=AsyncAssetsListRepository)
+        self.mock_repository.add_assets.return_value = 1.0
+        self.mock_repository.update_assets.return_value = 2.0
+        self.mock_repository.remove_assets.return_value = 3.0
+
+    def test_add_assets_delegates_to_repository(self):
+        """Test that new assets are handed to the repository as columns."""
+        # Arrange
+        service = AddAssetsService(assets_list_repository=self.mock_repository)
+        interest_rates = np.array([1.0])
+
+        # Act
+        average = asyncio.run(service(["id_1"], interest_rates))
+
+        # Assert
+        assert average == 1.0
+        self.mock_repository.add_assets.assert_awaited_once_with(
+            ["id_1"], interest_rates, None, None
+        )
+
+    def test_update_assets_delegates_to_repository(self):
+        """Test that updated rates are handed to the repository as columns."""
+        # Arrange
+        service = UpdateAssetsService(assets_list_repository=self.mock_repository)
+        interest_rates = np.array([2.0])
+
+        # Act
+        average = asyncio.run(service(["id_1"], interest_rates))
+
+        # Assert
+        assert average == 2.0
+        self.mock_repository.update_assets.assert_awaited_once_with(
+            ["id_1"], interest_rates, None, None
+        )
+
+    def test_remove_assets_delegates_to_repository(self):
+        """Test that removed ids are handed to the repository."""
+        # Arrange
+        service = RemoveAssetsService(assets_list_repository=self.mock_repository)
+
+        # Act
+        average = asyncio.run(service(["id_1"]))
+
+        # Assert
+        assert average == 3.0
+        self.mock_repository.remove_assets.assert_awaited_once_with(["id_1"])
+
+    def test_empty_batches_raise_empty_list_error(self):
+        """Test that empty batches never reach the repository."""
+        with pytest.raises(EmptyListError):
+            asyncio.run(AddAssetsService(self.mock_repository)([], np.empty(0)))
+        with pytest.raises(EmptyListError):
+            asyncio.run(UpdateAssetsService(self.mock_repository)([], np.empty(0)))
+        with pytest.raises(EmptyListError):
+            asyncio.run(RemoveAssetsService(self.mock_repository)([]))
+
+        assert self.mock_repository.method_calls == []
@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import Mock
 
 import pytest
@@ -5,15 +6,15 @@ import pytest
 from app.contexts.assets.application.get_average_interest_rate import (
     GetAverageInterestRateService,
 )
-from app.contexts.assets.domain.repositories.assets_list_repository import (
-    AssetsListRepository,
+from app.contexts.assets.domain.repositories.async_assets_list_repository import (
+    AsyncAssetsListRepository,
 )
 
 
 class TestGetAverageInterestRateService:
     def setup_method(self):
         """Set up test fixtures before each test method."""
-        self.mock_repository = Mock(spec=AssetsListRepository)
+        self.mock_repository = Mock(spec=AsyncAssetsListRepository)
         self.service = GetAverageInterestRateService(
             assets_list_repository=self.mock_repository,
         )
@@ -25,7 +26,7 @@ class TestGetAverageInterestRateService:
         self.mock_repository.get_average_interest_rate.return_value = expected_avg_rate
 
         # Act
-        result = self.service()
+        result = asyncio.run(self.service())
 
         # Assert
         assert result == expected_avg_rate
@@ -37,7 +38,7 @@ class TestGetAverageInterestRateService:
         self.mock_repository.get_average_interest_rate.return_value = 7.25
 
         # Act
-        self.service()
+        asyncio.run(self.service())
 
         # Assert
         self.mock_repository.get_average_interest_rate.assert_called_once()
@@ -49,7 +50,7 @@ class TestGetAverageInterestRateService:
         self.mock_repository.get_average_interest_rate.return_value = repository_value
 
         # Act
-        result = self.service()
+        result = asyncio.run(self.service())
 
         # Assert
         assert result == repository_value
@@ -62,7 +63,7 @@ class TestGetAverageInterestRateService:
         self.mock_repository.get_average_interest_rate.return_value = expected_avg_rate
 
         # Act
-        result = self.service()
+        result = asyncio.run(self.service())
 
         # Assert
         assert result == expected_avg_rate
@@ -76,7 +77,7 @@ class TestGetAverageInterestRateService:
         self.mock_repository.get_average_interest_rate.return_value = expected_avg_rate
 
         # Act
-        result = self.service()
+        result = asyncio.run(self.service())
 
         # Assert
         assert result == expected_avg_rate
@@ -90,7 +91,7 @@ class TestGetAverageInterestRateService:
         self.mock_repository.get_average_interest_rate.return_value = expected_avg_rate
 
         # Act
-        result = self.service()
+        result = asyncio.run(self.service())
 
         # Assert
         assert result == expected_avg_rate
@@ -104,7 +105,7 @@ class TestGetAverageInterestRateService:
         self.mock_repository.get_average_interest_rate.return_value = expected_avg_rate
 
         # Act
-        result = self.service()
+        result = asyncio.run(self.service())
 
         # Assert
         assert result == expected_avg_rate
@@ -120,7 +121,7 @@ class TestGetAverageInterestRateService:
 
         # Act & Assert
         with pytest.raises(Exception, match="Repository error"):
-            self.service()
+            asyncio.run(self.service())
 
         # Verify repository was called
         self.mock_repository.get_average_interest_rate.assert_called_once()
@@ -136,8 +137,8 @@ class TestGetAverageInterestRateService:
         ]
 
         # Act
-        first_result = self.service()
-        second_result = self.service()
+        first_result = asyncio.run(self.service())
+        second_result = asyncio.run(self.service())
 
         # Assert
         assert first_result == first_call_value
@@ -150,9 +151,21 @@ class TestGetAverageInterestRateService:
         self.mock_repository.get_average_interest_rate.return_value = 3.14
 
         # Act
-        result = self.service()
+        result = asyncio.run(self.service())
 
         # Assert
         assert result == 3.14
         # Verify the repository method was called with no arguments
         self.mock_repository.get_average_interest_rate.assert_called_once_with()
+
+    def test_get_weighted_average_interest_rate(self):
+        """Test that the weighted average is read through the repository too."""
+        # Arrange
+        self.mock_repository.get_weighted_average_interest_rate.return_value = 12.5
+
+        # Act
+        result = asyncio.run(self.service.weighted())
+
+        # Assert
+        assert result == 12.5
+        self.mock_repository.get_weighted_average_interest_rate.assert_awaited_once_with()
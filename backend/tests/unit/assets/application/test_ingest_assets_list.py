@@ -0,0 +1,63 @@
+import asyncio
+from unittest.mock import ANY, Mock
+
+import numpy as np
+import pytest
+
+from app.contexts.assets.application.ingest_assets_list import (
+    IngestAssetsListService,
+)
+from app.contexts.assets.domain.entities.assets_list import AssetsList
+from app.contexts.assets.domain.entities.errors import DuplicateAssetIdError
+from app.contexts.assets.domain.repositories.async_assets_list_repository import (
+    AsyncAssetsListRepository,
+)
+from app.contexts.assets.domain.services.interest_rate_avg_calculator.errors import (
+    EmptyListError,
+)
+
+
+async def _chunks(*chunks):
+    for asset_ids, interest_rates in chunks:
+        yield asset_ids, np.array(interest_rates, dtype=np.float64), None, None
+
+
+class TestIngestAssetsListService:
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.mock_repository = Mock(spec=AsyncAssetsListRepository)
+        self.mock_repository.save.side_effect = lambda assets_list, read_models: (
+            assets_list
+        )
+        self.service = IngestAssetsListService(
+            assets_list_repository=self.mock_repository,
+        )
+
+    def test_ingest_saves_all_chunks_once(self):
+        """Test that all chunks end up in a single saved assets list."""
+        # Act
+        result = asyncio.run(
+            self.service(_chunks((["id_1", "id_2"], [5, 10]), (["id_3"], [15])))
+        )
+
+        # Assert
+        assert isinstance(result, AssetsList)
+        assert result.count == 3
+        assert result.avg_interest_rate == 10.0
+        self.mock_repository.save.assert_called_once_with(result, ANY)
+        read_models = self.mock_repository.save.call_args.args[1]
+        assert read_models.assets_list is result
+
+    def test_ingest_with_duplicate_ids_does_not_save(self):
+        """Test that a stream with duplicate ids is rejected as a whole."""
+        with pytest.raises(DuplicateAssetIdError):
+            asyncio.run(self.service(_chunks((["id_1"], [5]), (["id_1"], [10]))))
+
+        self.mock_repository.save.assert_not_called()
+
+    def test_ingest_empty_stream_does_not_save(self):
+        """Test that an empty stream raises EmptyListError."""
+        with pytest.raises(EmptyListError):
+            asyncio.run(self.service(_chunks()))
+
+        self.mock_repository.save.assert_not_called()
@@ -1,12 +1,21 @@
-from unittest.mock import Mock
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import ANY, Mock
 
+import numpy as np
 import pytest
 from app.contexts.assets.application.save_assets_list import SaveAssetsListService
 from app.contexts.assets.domain.entities.asset import Asset
 from app.contexts.assets.domain.entities.assets_list import AssetsList
 from app.contexts.assets.domain.entities.errors import DuplicateAssetIdError
-from app.contexts.assets.domain.repositories.assets_list_repository import (
-    AssetsListRepository,
+from app.contexts.assets.domain.repositories.async_assets_list_repository import (
+    AsyncAssetsListRepository,
+)
+from app.contexts.assets.domain.services.columns_reduction.service import (
+    ColumnsReductionService,
+)
+from app.contexts.assets.domain.services.duplicate_ids_finder.service import (
+    DuplicateIdsFinderService,
 )
 from app.contexts.assets.domain.services.interest_rate_avg_calculator.errors import (
     EmptyListError,
@@ -15,12 +24,15 @@ from app.contexts.assets.domain.services.interest_rate_avg_calculator.errors imp
 from app.contexts.assets.domain.services.interest_rate_avg_calculator.service import (
     InterestRateAvgCalculatorService,
 )
+from app.contexts.assets.domain.services.rate_histogram.histograms import (
+    HistogramSpec,
+)
 
 
 class TestSaveAssetsListService:
     def setup_method(self):
         """Set up test fixtures before each test method."""
-        self.mock_repository = Mock(spec=AssetsListRepository)
+        self.mock_repository = Mock(spec=AsyncAssetsListRepository)
         self.mock_calculator = Mock(wraps=InterestRateAvgCalculatorService())
         self.service = SaveAssetsListService(
             assets_list_repository=self.mock_repository,
@@ -48,7 +60,7 @@ class TestSaveAssetsListService:
         self.mock_repository.save.return_value = expected_assets_list
 
         # Act
-        result = self.service(assets)
+        result = asyncio.run(self.service(assets))
 
         # Assert
         assert result == expected_assets_list
@@ -70,7 +82,7 @@ class TestSaveAssetsListService:
 
         # Act & Assert
         with pytest.raises(EmptyListError):
-            self.service(assets)
+            asyncio.run(self.service(assets))
 
         # Verify calculator was called but repository was not
         self.mock_calculator.assert_called_once()
@@ -83,7 +95,7 @@ class TestSaveAssetsListService:
 
         # Act & Assert
         with pytest.raises(InvalidListError):
-            self.service(assets)
+            asyncio.run(self.service(assets))
 
         # Verify calculator was called (it handles the None check and raises the exception)
         # but repository was not called
@@ -99,7 +111,7 @@ class TestSaveAssetsListService:
         self.mock_repository.save.return_value = Mock()
 
         # Act
-        self.service(assets)
+        asyncio.run(self.service(assets))
 
         # Assert
         self.mock_repository.save.assert_called_once()
@@ -118,7 +130,7 @@ class TestSaveAssetsListService:
         self.mock_repository.save.return_value = Mock()
 
         # Act
-        self.service(assets)
+        asyncio.run(self.service(assets))
 
         # Assert
         self.mock_calculator.assert_called_once()
@@ -142,7 +154,7 @@ class TestSaveAssetsListService:
         self.mock_repository.save.return_value = expected_assets_list
 
         # Act
-        result = self.service(assets)
+        result = asyncio.run(self.service(assets))
 
         # Assert
         assert result == expected_assets_list
@@ -165,7 +177,7 @@ class TestSaveAssetsListService:
         self.mock_repository.save.return_value = expected_assets_list
 
         # Act
-        result = self.service(assets)
+        result = asyncio.run(self.service(assets))
 
         # Assert
         assert result == expected_assets_list
@@ -184,7 +196,7 @@ class TestSaveAssetsListService:
         self.mock_repository.save.return_value = Mock()
 
         # Act
-        self.service(assets=assets)
+        asyncio.run(self.service(assets=assets))
 
         # Assert
         # Verify that the calculator was called with properly created Asset entities
@@ -207,7 +219,7 @@ class TestSaveAssetsListService:
 
         # Act & Assert
         with pytest.raises(DuplicateAssetIdError) as exc_info:
-            self.service(assets)
+            asyncio.run(self.service(assets))
 
         # Verify the error contains the duplicate ID
         assert "duplicate_id" in str(exc_info.value)
@@ -230,7 +242,7 @@ class TestSaveAssetsListService:
 
         # Act & Assert
         with pytest.raises(DuplicateAssetIdError) as exc_info:
-            self.service(assets)
+            asyncio.run(self.service(assets))
 
         # Verify the error contains both duplicate IDs
         assert "id_1" in str(exc_info.value)
@@ -252,7 +264,7 @@ class TestSaveAssetsListService:
 
         # Act & Assert
         with pytest.raises(DuplicateAssetIdError) as exc_info:
-            self.service(assets)
+            asyncio.run(self.service(assets))
 
         # Verify the error contains the duplicate ID
         assert "same_id" in str(exc_info.value)
@@ -261,3 +273,115 @@ class TestSaveAssetsListService:
         # Verify calculator was called but repository was not
         self.mock_calculator.assert_called_once()
         self.mock_repository.save.assert_not_called()
+
+
+class TestSaveAssetsListServiceColumns:
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.mock_repository = Mock(spec=AsyncAssetsListRepository)
+        self.mock_repository.save.side_effect = lambda assets_list, read_models: (
+            assets_list
+        )
+        self.mock_calculator = Mock(wraps=InterestRateAvgCalculatorService())
+        self.service = SaveAssetsListService(
+            assets_list_repository=self.mock_repository,
+            interest_rate_avg_calculator_service=self.mock_calculator,
+        )
+
+    def test_save_columns_success(self):
+        """Test that the columns are averaged and the list is awaited into storage."""
+        # Arrange
+        asset_ids = ["id_1", "id_2"]
+        interest_rates = np.array([5.0, 15.0])
+
+        # Act
+        result = asyncio.run(self.service.save_columns(asset_ids, interest_rates))
+
+        # Assert
+        assert result.avg_interest_rate == 10.0
+        assert list(result.asset_ids) == asset_ids
+        assert np.shares_memory(result.interest_rates, interest_rates)
+        self.mock_calculator.assert_called_once_with(interest_rates)
+        self.mock_repository.save.assert_awaited_once_with(result, ANY)
+        read_models = self.mock_repository.save.call_args.args[1]
+        assert read_models.assets_list is result
+
+    def test_save_columns_errors(self):
+        """Test that empty and duplicate columns are rejected before saving."""
+        # Act & Assert
+        with pytest.raises(EmptyListError):
+            asyncio.run(self.service.save_columns([], np.empty(0)))
+        with pytest.raises(DuplicateAssetIdError):
+            asyncio.run(
+                self.service.save_columns(["id_1", "id_1"], np.array([1.0, 2.0]))
+            )
+        self.mock_repository.save.assert_not_called()
+
+    def test_save_columns_checks_the_ids_before_indexing_the_rates(self):
+        """Test that duplicate ids are rejected before the rates are bucketed."""
+        # Arrange
+        histogram_spec = Mock(spec=HistogramSpec)
+        self.service.histogram_spec = histogram_spec
+
+        # Act
+        with pytest.raises(DuplicateAssetIdError):
+            asyncio.run(
+                self.service.save_columns(["id_1", "id_1"], np.array([1.0, 2.0]))
+            )
+
+        # Assert
+        histogram_spec.build.assert_not_called()
+
+    def test_save_columns_reduces_large_lists_in_parallel(self):
+        """Test that lists above the threshold are checked by the reduction."""
+        # Arrange
+        executor = ThreadPoolExecutor(2)
+        self.service.columns_reduction_service = ColumnsReductionService(
+            executor, min_size=3, chunk_size=2
+        )
+
+        # Act
+        result = asyncio.run(
+            self.service.save_columns(
+                ["id_1", "id_2", "id_3"], np.array([5.0, 10.0, 15.0])
+            )
+        )
+        with pytest.raises(DuplicateAssetIdError) as exc_info:
+            asyncio.run(
+                self.service.save_columns(
+                    ["id_1", "id_2", "id_1"], np.array([5.0, 10.0, 15.0])
+                )
+            )
+        executor.shutdown()
+
+        # Assert
+        assert result.avg_interest_rate == 10.0
+        assert result.get_asset("id_2").interest_rate == 10.0
+        read_models = self.mock_repository.save.call_args_list[0].args[1]
+        assert read_models.lowest_rate_assets(1)[0].id == "id_1"
+        assert exc_info.value.duplicate_ids == ["id_1"]
+
+    def test_save_columns_checks_large_lists_with_bounded_memory(self, tmp_path):
+        """Test that lists past the in-memory limit are checked by spilling."""
+        # Arrange
+        self.service.duplicate_ids_finder_service = DuplicateIdsFinderService(
+            max_ids_in_memory=2, spill_directory=str(tmp_path)
+        )
+
+        # Act
+        result = asyncio.run(
+            self.service.save_columns(
+                ["id_1", "id_2", "id_3"], np.array([5.0, 10.0, 15.0])
+            )
+        )
+        with pytest.raises(DuplicateAssetIdError) as exc_info:
+            asyncio.run(
+                self.service.save_columns(
+                    ["id_1", "id_2", "id_3", "id_2"], np.array([5.0, 10.0, 15.0, 1.0])
+                )
+            )
+
+        # Assert
+        assert result.avg_interest_rate == 10.0
+        assert result.row_of("id_3") == 2
+        assert exc_info.value.duplicate_ids == ["id_2"]
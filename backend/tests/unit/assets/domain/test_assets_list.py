@@ -0,0 +1,265 @@
+import numpy as np
+import pytest
+
+from app.contexts.assets.domain.entities.asset import Asset
+from app.contexts.assets.domain.entities.assets_list import AssetsList
+from app.contexts.assets.domain.entities.errors import (
+    AssetNotFoundError,
+    DuplicateAssetIdError,
+)
+from app.contexts.assets.domain.services.interest_rate_avg_calculator.errors import (
+    EmptyListError,
+)
+
+
+class TestAssetsList:
+    """Test cases for the columnar AssetsList aggregate."""
+
+    def test_assets_are_stored_as_columns(self):
+        """Test that assets are split into an id list and a float64 rate array."""
+        # Arrange
+        assets = [Asset(id="id_1", interest_rate=5), Asset(id="id_2", interest_rate=10)]
+
+        # Act
+        assets_list = AssetsList(assets=assets, avg_interest_rate=7.5)
+
+        # Assert
+        assert list(assets_list.asset_ids) == ["id_1", "id_2"]
+        assert assets_list.interest_rates.dtype == np.float64
+        assert assets_list.interest_rates.flags["C_CONTIGUOUS"]
+        assert assets_list.interest_rates.tolist() == [5.0, 10.0]
+        assert assets_list.count == 2
+        assert assets_list.avg_interest_rate == 7.5
+
+    def test_from_columns(self):
+        """Test building the aggregate directly from its columns."""
+        # Act
+        assets_list = AssetsList.from_columns(
+            ["id_1", "id_2", "id_3"], np.array([1, 2, 3]), avg_interest_rate=2.0
+        )
+
+        # Assert
+        assert assets_list.interest_rates.dtype == np.float64
+        assert assets_list.row_of("id_3") == 2
+        assert assets_list.row_of("missing") is None
+
+    def test_from_columns_rejects_misaligned_columns(self):
+        """Test that id and rate columns must have the same length."""
+        with pytest.raises(ValueError):
+            AssetsList.from_columns(["id_1"], [1.0, 2.0], avg_interest_rate=1.5)
+
+    def test_from_columns_rejects_duplicate_ids(self):
+        """Test that the duplicate check runs on the id column."""
+        with pytest.raises(DuplicateAssetIdError) as exc_info:
+            AssetsList.from_columns(
+                ["id_1", "id_2", "id_1", "id_2", "id_1"],
+                [1, 2, 3, 4, 5],
+                avg_interest_rate=3.0,
+            )
+
+        assert exc_info.value.duplicate_ids == ["id_1", "id_2"]
+
+    def test_assets_view_materializes_rows_lazily(self):
+        """Test that the assets view rebuilds Asset rows sharing the list timestamp."""
+        # Arrange
+        assets_list = AssetsList.from_columns(
+            ["id_1", "id_2", "id_3"], [1.0, 2.0, 3.0], avg_interest_rate=2.0
+        )
+
+        # Act
+        view = assets_list.assets
+
+        # Assert
+        assert len(view) == 3
+        assert view[-1] == Asset(
+            id="id_3", interest_rate=3.0, created_at=assets_list.created_at
+        )
+        assert [asset.id for asset in view[:2]] == ["id_1", "id_2"]
+        assert all(asset.created_at == assets_list.created_at for asset in view)
+        with pytest.raises(IndexError):
+            view[3]
+
+    def test_get_asset_by_id(self):
+        """Test looking up a single asset through the id index."""
+        # Arrange
+        assets_list = AssetsList.from_columns(
+            ["id_1", "id_2"], [4.0, 8.0], avg_interest_rate=6.0
+        )
+
+        # Act & Assert
+        asset = assets_list.get_asset("id_2")
+        assert asset is not None
+        assert asset.interest_rate == 8.0
+        assert assets_list.get_asset("missing") is None
+
+
+class TestAssetsListMutations:
+    """Test cases for incremental changes to an AssetsList."""
+
+    def setup_method(self):
+        self.assets_list = AssetsList.from_columns(
+            ["id_1", "id_2", "id_3"], [5.0, 10.0, 15.0]
+        )
+
+    def test_average_defaults_to_running_mean(self):
+        """Test that the average is derived from the columns when not given."""
+        assert self.assets_list.avg_interest_rate == 10.0
+        assert self.assets_list.rate_sum == 30.0
+
+    def test_add_assets(self):
+        """Test that added assets are appended and the average refreshed."""
+        # Act
+        for i in range(4, 100):
+            self.assets_list.add_assets([f"id_{i}"], np.array([float(i * 5)]))
+
+        # Assert
+        assert self.assets_list.count == 99
+        assert self.assets_list.avg_interest_rate == pytest.approx(250.0)
+        assert self.assets_list.row_of("id_99") == 98
+        assert self.assets_list.interest_rates[-1] == 495.0
+
+    def test_add_existing_asset_raises_duplicate_error(self):
+        """Test that adding an id already in the list is rejected untouched."""
+        with pytest.raises(DuplicateAssetIdError) as exc_info:
+            self.assets_list.add_assets(["id_4", "id_2"], np.array([1.0, 2.0]))
+
+        assert exc_info.value.duplicate_ids == ["id_2"]
+        assert self.assets_list.count == 3
+        assert self.assets_list.row_of("id_4") is None
+
+    def test_update_assets(self):
+        """Test that updated rates replace the old ones in the average."""
+        # Act
+        self.assets_list.update_assets(["id_3", "id_1"], np.array([30.0, 0.0]))
+
+        # Assert
+        assert self.assets_list.interest_rates.tolist() == [0.0, 10.0, 30.0]
+        assert self.assets_list.avg_interest_rate == pytest.approx(40.0 / 3)
+        assert self.assets_list.rate_sum == pytest.approx(40.0)
+
+    def test_update_missing_asset_raises_not_found(self):
+        """Test that updating unknown ids is rejected untouched."""
+        with pytest.raises(AssetNotFoundError) as exc_info:
+            self.assets_list.update_assets(["id_1", "missing"], np.array([1.0, 2.0]))
+
+        assert exc_info.value.missing_ids == ["missing"]
+        assert self.assets_list.avg_interest_rate == 10.0
+
+    def test_remove_assets_moves_last_row_into_gap(self):
+        """Test that removal keeps the columns dense and the index consistent."""
+        # Act
+        self.assets_list.remove_assets(["id_1"])
+
+        # Assert
+        assert list(self.assets_list.asset_ids) == ["id_3", "id_2"]
+        assert self.assets_list.interest_rates.tolist() == [15.0, 10.0]
+        assert self.assets_list.row_of("id_3") == 0
+        assert self.assets_list.row_of("id_1") is None
+        assert self.assets_list.avg_interest_rate == 12.5
+
+    def test_remove_all_assets_raises_empty_list_error(self):
+        """Test that the list cannot be emptied through removals."""
+        with pytest.raises(EmptyListError):
+            self.assets_list.remove_assets(["id_1", "id_2", "id_3"])
+
+        assert self.assets_list.count == 3
+
+    def test_remove_missing_asset_raises_not_found(self):
+        """Test that removing unknown ids is rejected untouched."""
+        with pytest.raises(AssetNotFoundError):
+            self.assets_list.remove_assets(["id_1", "missing"])
+
+        assert self.assets_list.count == 3
+
+
+class TestAssetsListWeightedAverage:
+    """Test cases for the amount-weighted average of an AssetsList."""
+
+    def setup_method(self):
+        self.assets_list = AssetsList.from_columns(
+            ["id_1", "id_2", "id_3"],
+            [5.0, 10.0, 15.0],
+            amounts=[100.0, np.nan, 300.0],
+        )
+
+    def test_missing_amounts_weigh_nothing(self):
+        """Test that only assets with an amount count in the weighted average."""
+        assert self.assets_list.weighted_avg_interest_rate == 12.5
+        assert self.assets_list.avg_interest_rate == 10.0
+        assert self.assets_list.assets[1].amount is None
+        assert self.assets_list.assets[2].amount == 300.0
+
+    def test_list_without_amounts_has_no_weighted_average(self):
+        """Test that a list without amounts has neither the column nor an average."""
+        # Act
+        assets_list = AssetsList(assets=[Asset(id="id_1", interest_rate=5.0)])
+
+        # Assert
+        assert assets_list.amounts is None
+        assert assets_list.weighted_avg_interest_rate is None
+
+    def test_changes_refresh_the_weighted_average(self):
+        """Test that adding, updating and removing keep both sums in step."""
+        # Act
+        self.assets_list.add_assets(
+            ["id_4", "id_5"], np.array([20.0, 1.0]), np.array([600.0, np.nan])
+        )
+        self.assets_list.update_assets(
+            ["id_2", "id_3"], np.array([10.0, 30.0]), np.array([1000.0, np.nan])
+        )
+        self.assets_list.remove_assets(["id_4"])
+
+        # Assert
+        amounts = self.assets_list.amounts
+        assert amounts is not None
+        rates = self.assets_list.interest_rates
+        weights = np.nan_to_num(amounts)
+        assert self.assets_list.get_asset("id_3").amount == 300.0
+        assert self.assets_list.weighted_avg_interest_rate == pytest.approx(
+            float(np.dot(rates, weights) / weights.sum())
+        )
+
+    def test_first_amount_allocates_the_column(self):
+        """Test that a list without amounts gains the column on the first one."""
+        # Arrange
+        assets_list = AssetsList.from_columns(["id_1", "id_2"], [5.0, 10.0])
+
+        # Act
+        assets_list.update_assets(["id_2"], np.array([10.0]), np.array([50.0]))
+
+        # Assert
+        amounts = assets_list.amounts
+        assert amounts is not None
+        assert np.isnan(amounts[0]) and amounts[1] == 50.0
+        assert assets_list.weighted_avg_interest_rate == 10.0
+
+    def test_removing_every_weighted_asset_clears_the_average(self):
+        """Test that the weighted average is undefined once no amount is left."""
+        # Act
+        self.assets_list.remove_assets(["id_1", "id_3"])
+
+        # Assert
+        assert self.assets_list.weighted_avg_interest_rate is None
+        assert self.assets_list.avg_interest_rate == 10.0
+
+
+class TestAssetsListTags:
+    """Test cases for the tag columns of an AssetsList."""
+
+    def test_tags_of_the_assets(self):
+        """Test that asset tags are kept per row, untagged rows left out."""
+        # Arrange
+        assets = [
+            Asset(id="id_1", interest_rate=5, tags={"region": "eu"}),
+            Asset(id="id_2", interest_rate=10, tags={"region": "us"}),
+            Asset(id="id_3", interest_rate=15, tags={"region": "eu"}),
+            Asset(id="id_4", interest_rate=20),
+        ]
+
+        # Act
+        assets_list = AssetsList(assets=assets)
+
+        # Assert
+        assert assets_list.tag_columns["region"].decoded() == ["eu", "us", "eu", None]
+        assert assets_list.get_asset("id_3").tags == {"region": "eu"}
+        assert assets_list.get_asset("id_4").tags == {}
@@ -0,0 +1,166 @@
+import math
+
+import numpy as np
+import pytest
+
+from app.contexts.assets.domain.entities.assets_list_builder import (
+    AssetsListBuilder,
+)
+from app.contexts.assets.domain.entities.errors import DuplicateAssetIdError
+from app.contexts.assets.domain.services.interest_rate_avg_calculator.errors import (
+    EmptyListError,
+)
+from app.contexts.assets.domain.services.interest_rate_avg_calculator.running_mean import (
+    RunningMean,
+    RunningWeightedMean,
+)
+
+
+class TestRunningMean:
+    """Test cases for RunningMean."""
+
+    def test_mean_of_single_values_and_chunks(self):
+        """Test that single values and chunks are folded into the same mean."""
+        # Arrange
+        running_mean = RunningMean()
+
+        # Act
+        running_mean.add(5)
+        running_mean.add_many(np.array([10.0, 15.0]))
+
+        # Assert
+        assert running_mean.count == 3
+        assert running_mean.mean == 10.0
+
+    def test_compensated_sum_keeps_small_values(self):
+        """Test that small values are not lost next to a large running total."""
+        # Arrange
+        running_mean = RunningMean()
+        values = [1e16, 1.0, -1e16] * 1000
+
+        # Act
+        for value in values:
+            running_mean.add(value)
+
+        # Assert
+        assert running_mean.total == math.fsum(values)
+
+    def test_mean_of_empty_stream_raises_empty_list_error(self):
+        """Test that an empty stream has no mean."""
+        with pytest.raises(EmptyListError):
+            _ = RunningMean().mean
+
+
+class TestRunningWeightedMean:
+    """Test cases for RunningWeightedMean."""
+
+    def test_weighted_mean_of_chunks(self):
+        """Test that rates are weighted by their positive amounts."""
+        # Arrange
+        running_mean = RunningWeightedMean()
+
+        # Act
+        running_mean.add_many(np.array([5.0, 10.0]), np.array([100.0, np.nan]))
+        running_mean.add_many(np.array([15.0, 20.0]), np.array([300.0, 0.0]))
+
+        # Assert
+        assert running_mean.count == 2
+        assert running_mean.total_weight == 400.0
+        assert running_mean.mean == 12.5
+
+    def test_mean_without_weights_is_none(self):
+        """Test that removing every weight leaves no weighted mean."""
+        # Arrange
+        running_mean = RunningWeightedMean()
+        running_mean.add_many(np.array([5.0]), np.array([0.1]))
+
+        # Act
+        running_mean.remove_many(np.array([5.0]), np.array([0.1]))
+
+        # Assert
+        assert running_mean.mean is None
+
+
+class TestAssetsListBuilder:
+    """Test cases for AssetsListBuilder."""
+
+    def test_build_from_several_chunks(self):
+        """Test assembling an assets list from several chunks."""
+        # Arrange
+        builder = AssetsListBuilder()
+        builder.initial_capacity = 2
+
+        # Act
+        builder.extend(["id_1", "id_2"], np.array([5.0, 10.0]))
+        builder.extend(["id_3"], np.array([15.0]))
+        builder.extend(["id_4", "id_5"], np.array([20.0, 25.0]))
+        assets_list = builder.build()
+
+        # Assert
+        assert list(assets_list.asset_ids) == ["id_1", "id_2", "id_3", "id_4", "id_5"]
+        assert assets_list.interest_rates.tolist() == [5.0, 10.0, 15.0, 20.0, 25.0]
+        assert assets_list.avg_interest_rate == 15.0
+        assert assets_list.row_of("id_4") == 3
+
+    def test_duplicates_across_chunks_are_reported(self):
+        """Test that duplicates spanning chunks are all reported once."""
+        # Arrange
+        builder = AssetsListBuilder()
+        builder.extend(["id_1", "id_2"], np.array([1.0, 2.0]))
+        builder.extend(["id_2", "id_1", "id_2"], np.array([3.0, 4.0, 5.0]))
+
+        # Act & Assert
+        with pytest.raises(DuplicateAssetIdError) as exc_info:
+            builder.build()
+
+        assert exc_info.value.duplicate_ids == ["id_2", "id_1"]
+
+    def test_build_without_chunks_raises_empty_list_error(self):
+        """Test that an empty stream cannot be built."""
+        with pytest.raises(EmptyListError):
+            AssetsListBuilder().build()
+
+    def test_extend_rejects_misaligned_columns(self):
+        """Test that chunk columns must have the same length."""
+        with pytest.raises(ValueError):
+            AssetsListBuilder().extend(["id_1"], np.array([1.0, 2.0]))
+
+    def test_amounts_of_later_chunks_are_aligned(self):
+        """Test that earlier rows without amounts are filled in as missing."""
+        # Arrange
+        builder = AssetsListBuilder()
+
+        # Act
+        builder.extend(["id_1"], np.array([5.0]))
+        builder.extend(["id_2", "id_3"], np.array([10.0, 15.0]), np.array([1.0, 3.0]))
+        assets_list = builder.build()
+
+        # Assert
+        amounts = assets_list.amounts
+        assert amounts is not None
+        assert np.isnan(amounts[0]) and amounts[1:].tolist() == [1.0, 3.0]
+        assert assets_list.weighted_avg_interest_rate == 13.75
+
+    def test_growing_leaves_earlier_buffers_alone(self):
+        """Test that growing copies into new buffers rather than resizing the
+        ones a caller may still hold a view of."""
+        # Arrange
+        builder = AssetsListBuilder()
+        builder.initial_capacity = 2
+        builder.extend(
+            ["id_1", "id_2"],
+            np.array([5.0, 10.0]),
+            np.array([1.0, 2.0]),
+            {"desk": ["a", "b"]},
+        )
+        first = builder.build()
+
+        # Act
+        builder.extend(["id_3"], np.array([15.0]), tags={"desk": ["a"]})
+        assets_list = builder.build()
+
+        # Assert
+        assert first.interest_rates.tolist() == [5.0, 10.0]
+        assert first.tag_columns["desk"].decoded() == ["a", "b"]
+        assert assets_list.amounts.tolist()[:2] == [1.0, 2.0]
+        assert assets_list.tag_columns["desk"].decoded() == ["a", "b", "a"]
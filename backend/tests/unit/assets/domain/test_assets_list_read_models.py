@@ -0,0 +1,218 @@
+import numpy as np
+import pytest
+
+from app.contexts.assets.domain.entities.asset import Asset
+from app.contexts.assets.domain.entities.assets_list import AssetsList
+from app.contexts.assets.domain.entities.assets_list_read_models import (
+    AssetsListReadModels,
+)
+from app.contexts.assets.domain.services.rate_histogram.histograms import (
+    HistogramSpec,
+)
+
+
+class TestAssetsListReadModels:
+    """Test cases for the read models derived from an AssetsList."""
+
+    def setup_method(self):
+        self.assets_list = AssetsList.from_columns(
+            ["id_1", "id_2", "id_3"], [5.0, 10.0, 15.0]
+        )
+        self.read_models = AssetsListReadModels(self.assets_list)
+
+    def test_statistics_of_the_rates(self):
+        """Test that the sketch built on first use describes the rates."""
+        # Act
+        statistics = self.read_models.rate_statistics()
+
+        # Assert
+        assert statistics is not None
+        assert statistics.asset_count == 3
+        assert (statistics.min, statistics.max, statistics.median) == (5.0, 15.0, 10.0)
+        assert statistics.std == pytest.approx(np.std([5.0, 10.0, 15.0]))
+
+    def test_added_rates_are_folded_into_the_sketch(self):
+        """Test that additions keep the same sketch up to date."""
+        # Arrange
+        rate_sketch = self.read_models.rate_sketch
+
+        # Act
+        self.assets_list.add_assets(["id_4"], np.array([40.0]))
+        self.read_models.added(slice(3, 4))
+
+        # Assert
+        statistics = self.read_models.rate_statistics()
+        assert self.read_models.rate_sketch is rate_sketch
+        assert statistics is not None
+        assert (statistics.asset_count, statistics.max) == (4, 40.0)
+
+    def test_updates_and_removals_rebuild_the_sketch(self):
+        """Test that statistics follow rates that were changed or taken out."""
+        # Arrange
+        rate_sketch = self.read_models.rate_sketch
+
+        # Act
+        changed = self.read_models.changing([2])
+        self.assets_list.update_assets(["id_3"], np.array([1.0]))
+        self.read_models.updated(changed)
+        changed = self.read_models.changing([0])
+        self.assets_list.remove_assets(["id_1"])
+        self.read_models.removed(changed)
+
+        # Assert
+        statistics = self.read_models.rate_statistics()
+        assert self.read_models.rate_sketch is not rate_sketch
+        assert statistics is not None
+        assert (statistics.asset_count, statistics.min, statistics.max) == (
+            2,
+            1.0,
+            10.0,
+        )
+
+
+class TestAssetsListReadModelsRateQueries:
+    """Test cases for the rate range and top-k queries of the read models."""
+
+    def setup_method(self):
+        self.assets_list = AssetsList.from_columns(
+            ["id_1", "id_2", "id_3", "id_4"], [5.0, 20.0, 10.0, 15.0]
+        )
+        self.read_models = AssetsListReadModels(self.assets_list)
+
+    def test_range_and_extremes(self):
+        """Test that queries are answered from the sorted index."""
+        # Act & Assert
+        rate_range = self.read_models.rate_range(8.0, 16.0)
+        assert (rate_range.asset_count, rate_range.avg_interest_rate) == (2, 12.5)
+        assert [asset.id for asset in self.read_models.lowest_rate_assets(2)] == [
+            "id_1",
+            "id_3",
+        ]
+        assert [asset.id for asset in self.read_models.highest_rate_assets(1)] == [
+            "id_2"
+        ]
+
+    def test_changes_rebuild_the_index(self):
+        """Test that queries follow added, updated and removed rates."""
+        # Arrange
+        rate_index = self.read_models.rate_index
+
+        # Act
+        self.assets_list.add_assets(["id_5"], np.array([1.0]))
+        self.read_models.added(slice(4, 5))
+        changed = self.read_models.changing([1])
+        self.assets_list.update_assets(["id_2"], np.array([12.0]))
+        self.read_models.updated(changed)
+        changed = self.read_models.changing([3])
+        self.assets_list.remove_assets(["id_4"])
+        self.read_models.removed(changed)
+
+        # Assert
+        assert self.read_models.rate_index is not rate_index
+        assert [asset.id for asset in self.read_models.highest_rate_assets(4)] == [
+            "id_2",
+            "id_3",
+            "id_1",
+            "id_5",
+        ]
+        assert self.read_models.rate_range(10.0, 20.0).asset_count == 2
+
+
+class TestAssetsListReadModelsRateHistograms:
+    """Test cases for the histograms kept in the read models."""
+
+    def test_histograms_follow_the_writes(self):
+        """Test that adds, updates and removals move rates between buckets."""
+        # Arrange
+        assets_list = AssetsList.from_columns(
+            ["id_1", "id_2", "id_3", "id_4"], [0.0, 5.0, 10.0, 20.0]
+        )
+        read_models = AssetsListReadModels(assets_list)
+        histograms = read_models.rate_histograms
+        assert histograms is not None
+        fixed_width = histograms.fixed_width
+        assert fixed_width.counts.sum() == 4
+
+        # Act
+        assets_list.add_assets(["id_5"], np.array([30.0]))
+        read_models.added(slice(4, 5))
+        changed = read_models.changing([0])
+        assets_list.update_assets(["id_1"], np.array([19.0]))
+        read_models.updated(changed)
+        changed = read_models.changing([1])
+        assets_list.remove_assets(["id_2"])
+        read_models.removed(changed)
+
+        # Assert
+        assert read_models.rate_histograms is histograms
+        assert fixed_width.counts.sum() == 3
+        assert fixed_width.counts[-1] == 2
+        assert fixed_width.sums[-1] == 39.0
+        assert fixed_width.above == 1
+
+    def test_histograms_are_built_per_spec(self):
+        """Test that histograms built on first use follow the given spec."""
+        # Arrange
+        assets_list = AssetsList.from_columns(["id_1", "id_2"], [1.0, 2.0])
+
+        # Act
+        read_models = AssetsListReadModels(
+            assets_list, histogram_spec=HistogramSpec(bucket_count=3)
+        )
+
+        # Assert
+        assert len(read_models.rate_histograms.fixed_width.counts) == 3
+
+
+class TestAssetsListReadModelsRateGroups:
+    """Test cases for the interest rates grouped by tag in the read models."""
+
+    def test_groups_from_asset_tags(self):
+        """Test that tagged assets are grouped by value, untagged ones left out."""
+        # Arrange
+        assets = [
+            Asset(id="id_1", interest_rate=5, tags={"region": "eu"}),
+            Asset(id="id_2", interest_rate=10, tags={"region": "us"}),
+            Asset(id="id_3", interest_rate=15, tags={"region": "eu"}),
+            Asset(id="id_4", interest_rate=20),
+        ]
+
+        # Act
+        read_models = AssetsListReadModels(AssetsList(assets=assets))
+
+        # Assert
+        assert [
+            (group.value, group.asset_count, group.avg_interest_rate)
+            for group in read_models.group_rates("region")
+        ] == [("eu", 2, 10.0), ("us", 1, 10.0)]
+        assert read_models.group_rates("tier") == []
+
+    def test_groups_follow_the_writes(self):
+        """Test that adds, updates and removals only move the touched rows."""
+        # Arrange
+        assets_list = AssetsList.from_columns(["id_1", "id_2"], [5.0, 10.0])
+        read_models = AssetsListReadModels(assets_list)
+        tables = read_models.rate_groups
+        assets_list.add_assets(
+            ["id_3", "id_4"], np.array([15.0, 20.0]), tags={"region": ["eu", "us"]}
+        )
+        read_models.added(slice(2, 4))
+
+        # Act
+        changed = read_models.changing([0, 2])
+        assets_list.update_assets(
+            ["id_1", "id_3"], np.array([7.0, 17.0]), tags={"region": ["us", None]}
+        )
+        read_models.updated(changed)
+        changed = read_models.changing([3])
+        assets_list.remove_assets(["id_4"])
+        read_models.removed(changed)
+
+        # Assert
+        assert read_models.rate_groups is tables
+        assert [tuple(group) for group in read_models.group_rates("region")] == [
+            ("eu", 1, 17.0),
+            ("us", 1, 7.0),
+        ]
+        rebuilt = AssetsListReadModels(assets_list)
+        assert rebuilt.group_rates("region") == read_models.group_rates("region")
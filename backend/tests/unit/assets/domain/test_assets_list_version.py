@@ -0,0 +1,97 @@
+from datetime import datetime
+
+import numpy as np
+
+from app.contexts.assets.domain.entities.assets_list import AssetsList
+from app.contexts.assets.domain.entities.assets_list_version import (
+    AssetsListVersion,
+)
+from app.contexts.assets.domain.services.rate_groups.group_tables import encode_tags
+
+
+class TestAssetsListVersion:
+    def setup_method(self):
+        self.assets_list = AssetsList.from_columns(
+            [f"id_{i}" for i in range(10)], np.arange(10.0)
+        )
+        self.first = self._version(1)
+
+    def _version(
+        self, version: int, previous=None, changed_rows=None
+    ) -> AssetsListVersion:
+        return AssetsListVersion.of(
+            self.assets_list,
+            version,
+            datetime(2026, 1, 1, 0, version),
+            chunk_size=4,
+            previous=previous,
+            changed_rows=changed_rows,
+        )
+
+    def test_reads_back_the_assets(self):
+        """Test the averages and rows of a version, page by page."""
+        # Act
+        assets = self.first.assets(offset=3, limit=2)
+
+        # Assert
+        assert (self.first.asset_count, self.first.avg_interest_rate) == (10, 4.5)
+        assert [(asset.id, asset.interest_rate) for asset in assets] == [
+            ("id_3", 3.0),
+            ("id_4", 4.0),
+        ]
+        assert len(self.first.chunks) == 3
+
+    def test_update_copies_only_the_changed_chunk(self):
+        """Test that the untouched chunks are shared with the previous version."""
+        # Act
+        self.assets_list.update_assets(["id_5"], np.array([50.0]))
+        second = self._version(
+            2, self.first, changed_rows=[self.assets_list.row_of("id_5")]
+        )
+
+        # Assert
+        assert second.chunks[0] is self.first.chunks[0]
+        assert second.chunks[1] is not self.first.chunks[1]
+        assert second.chunks[2] is self.first.chunks[2]
+        assert self.first.assets(5, 1)[0].interest_rate == 5.0
+        assert second.assets(5, 1)[0].interest_rate == 50.0
+
+    def test_removal_rebuilds_the_moved_and_truncated_chunks(self):
+        """Test that rows moved into freed slots and a shorter tail are copied."""
+        # Act
+        rows = [self.assets_list.row_of("id_1")]
+        self.assets_list.remove_assets(["id_1"])
+        second = self._version(2, self.first, changed_rows=rows)
+
+        # Assert
+        assert second.chunks[1] is self.first.chunks[1]
+        assert [asset.id for asset in second.assets()] == [
+            "id_0",
+            "id_9",
+            *(f"id_{i}" for i in range(2, 9)),
+        ]
+
+    def test_saved_list_is_viewed_until_changed(self):
+        """Test that a whole list is shared as it is, and copied by its next
+        change rather than changed under its version."""
+        # Arrange
+        self.assets_list = AssetsList.from_columns(
+            [f"id_{i}" for i in range(10)],
+            np.arange(10.0),
+            amounts=[np.nan] * 8 + [1.0, 2.0],
+            tag_columns=encode_tags({"region": ["eu"] + [None] * 9}, 10),
+        )
+        rates = self.assets_list.interest_rates
+
+        # Act
+        version = self._version(1)
+        self.assets_list.update_assets(
+            ["id_0"], np.array([7.0]), tags={"region": ["us"]}
+        )
+
+        # Assert
+        assert np.shares_memory(version.chunks[0].interest_rates, rates)
+        first_asset, *_, last_asset = version.assets()
+        assert (first_asset.interest_rate, first_asset.tags) == (0.0, {"region": "eu"})
+        assert last_asset.amount == 2.0
+        assert self.assets_list.get_asset("id_0").tags == {"region": "us"}
@@ -0,0 +1,152 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+import pytest
+
+from app.contexts.assets.domain.services.columns_reduction.service import (
+    ColumnsReductionService,
+    _reduce_chunk,
+    _SharedColumns,
+    hash_ids,
+)
+from app.contexts.assets.domain.services.rate_statistics.sketches import RateSketch
+
+
+def _columns(asset_ids):
+    return asset_ids, np.arange(len(asset_ids), dtype=np.float64)
+
+
+def _launch_own_tracker():
+    # Worker initializer: the next registration starts a tracker for this worker
+    resource_tracker._resource_tracker._fd = None
+
+
+def _reduce_then_stop_tracker(names, start, stop):
+    partial = _reduce_chunk(names, start, stop)
+    # Stopping waits for the tracker to unlink what is still registered
+    resource_tracker._resource_tracker._stop()
+    return partial
+
+
+class TestColumnsReductionService:
+    @pytest.fixture(autouse=True)
+    def setup_service(self):
+        """Set up a service that reduces every list of 4+ assets in chunks of 3."""
+        self.executor = ThreadPoolExecutor(2)
+        self.service = ColumnsReductionService(self.executor, min_size=4, chunk_size=3)
+        yield
+        self.executor.shutdown()
+
+    def test_sums_unique_columns(self):
+        """Test that partial sums and counts are merged over all chunks."""
+        # Act
+        summary = self.service(*_columns([f"id_{i}" for i in range(10)]))
+
+        # Assert
+        assert summary.asset_count == 10
+        assert summary.rate_sum == 45.0
+        assert summary.duplicate_ids == []
+        assert (
+            summary.rate_sketch.statistics()
+            == RateSketch.from_values(np.arange(10, dtype=np.float64)).statistics()
+        )
+
+    def test_sorts_the_rates_across_chunks(self):
+        """Test that the rows sorted per chunk merge into one rate order."""
+        # Arrange
+        rates = np.array([9.0, 3.0, 7.0, 3.0, 1.0, 8.0, 3.0, 0.0])
+
+        # Act
+        summary = self.service([f"id_{i}" for i in range(8)], rates)
+
+        # Assert
+        assert summary.rate_index.rows.tolist() == [7, 4, 1, 3, 6, 2, 5, 0]
+        assert summary.rate_index.sorted_rates.tolist() == sorted(rates.tolist())
+
+    def test_finds_duplicates_across_chunks_in_first_seen_order(self):
+        """Test that duplicates are exact and reported like the sequential check."""
+        # Arrange
+        asset_ids = ["b", "a", "", "c", "ñ", "a", "d", "", "b", "ñ", "a"]
+
+        # Act
+        summary = self.service(*_columns(asset_ids))
+
+        # Assert
+        assert summary.duplicate_ids == ["b", "a", "", "ñ"]
+        assert (
+            summary.duplicate_ids
+            == ColumnsReductionService()(*_columns(asset_ids)).duplicate_ids
+        )
+
+    def test_small_lists_and_nul_ids_use_the_sequential_path(self):
+        """Test the fallbacks that never reach the executor."""
+        # Arrange
+        executor = ThreadPoolExecutor(1)
+        executor.shutdown()
+        service = ColumnsReductionService(executor, min_size=4, chunk_size=3)
+
+        # Act
+        small = service(*_columns(["a", "a"]))
+        with_nul = service(*_columns(["a\0b", "a", "b", "a\0b"]))
+
+        # Assert
+        assert small.duplicate_ids == ["a"]
+        assert with_nul.duplicate_ids == ["a\0b"]
+        assert not service.applies_to(3)
+        assert not ColumnsReductionService(None).applies_to(10**9)
+
+    def test_reduces_on_a_process_pool(self):
+        """Test that worker processes read the columns from shared memory."""
+        # Arrange
+        context = multiprocessing.get_context("spawn")
+        asset_ids = [f"id_{i}" for i in range(1_000)] + ["id_7"]
+
+        # Act
+        with ProcessPoolExecutor(2, mp_context=context) as executor:
+            summary = ColumnsReductionService(executor, min_size=1, chunk_size=300)(
+                *_columns(asset_ids)
+            )
+
+        # Assert
+        assert summary.asset_count == 1_001
+        assert summary.rate_sum == sum(range(1_001))
+        assert summary.duplicate_ids == ["id_7"]
+        assert summary.rate_index.rows.tolist() == list(range(1_001))
+
+    def test_workers_with_their_own_tracker_leave_the_segments(self):
+        """Test that a worker's resource tracker never unlinks shared columns."""
+        # Arrange
+        context = multiprocessing.get_context("spawn")
+
+        with _SharedColumns(b"a\0b\0c", np.array([1.0, 2.0, 3.0])) as shared:
+            # Act
+            with ProcessPoolExecutor(
+                1, mp_context=context, initializer=_launch_own_tracker
+            ) as executor:
+                count, rate_sum, _ = executor.submit(
+                    _reduce_then_stop_tracker, shared.names, 0, 3
+                ).result()
+
+            # Assert
+            assert (count, rate_sum) == (3, 6.0)
+            SharedMemory(name=shared.names.rates).close()
+
+
+class TestHashIds:
+    def test_equal_ids_hash_equally(self):
+        """Test that hashes depend on the id bytes only, not on their position."""
+        # Arrange
+        blob = np.frombuffer(b"ab\0xyz\0ab\0\0ba", np.uint8)
+        starts = np.array([0, 3, 7, 10, 11])
+        ends = np.array([2, 6, 9, 10, 13])
+
+        # Act
+        hashes = hash_ids(blob, starts, ends)
+
+        # Assert
+        assert hashes[0] == hashes[2]
+        assert len(set(hashes[[0, 1, 3, 4]].tolist())) == 4
+        assert hash_ids(blob, starts[2:3], ends[2:3])[0] == hashes[0]
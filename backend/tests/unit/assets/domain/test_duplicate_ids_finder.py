@@ -0,0 +1,69 @@
+import os
+import random
+from collections import Counter
+
+import pytest
+
+from app.contexts.assets.domain.services.duplicate_ids_finder.service import (
+    DuplicateIdsFinderService,
+)
+
+
+def _expected(asset_ids):
+    return [asset_id for asset_id, seen in Counter(asset_ids).items() if seen > 1]
+
+
+class TestDuplicateIdsFinderService:
+    def test_unique_ids_have_no_duplicates(self):
+        """Test that unique ids are confirmed without reporting anything."""
+        # Act & Assert
+        assert DuplicateIdsFinderService()(["id_1", "id_2", "id_3"]) == []
+        assert DuplicateIdsFinderService()([]) == []
+
+    def test_duplicates_are_in_first_seen_order(self):
+        """Test that duplicates are ordered by their first occurrence."""
+        # Arrange
+        asset_ids = ["a", "b", "b", "c", "a", "a"]
+
+        # Act & Assert
+        assert DuplicateIdsFinderService()(asset_ids) == ["a", "b"]
+        assert DuplicateIdsFinderService()(iter(asset_ids)) == ["a", "b"]
+
+    @pytest.mark.parametrize("max_ids_in_memory", [1, 2, 5])
+    def test_spilling_finds_the_exact_duplicates(self, tmp_path, max_ids_in_memory):
+        """Test that spilled partitions give the same answer as counting in memory."""
+        # Arrange
+        rng = random.Random(max_ids_in_memory)
+        service = DuplicateIdsFinderService(
+            max_ids_in_memory=max_ids_in_memory,
+            partitions=3,
+            spill_directory=str(tmp_path),
+        )
+
+        for _ in range(50):
+            asset_ids = [
+                rng.choice("abcdefghij") * rng.randint(0, 2) + "ñ" * rng.randint(0, 1)
+                for _ in range(rng.randint(0, 40))
+            ]
+
+            # Act & Assert
+            assert service.spills(len(asset_ids)) == (
+                len(asset_ids) > max_ids_in_memory
+            )
+            assert service(asset_ids) == _expected(asset_ids)
+        assert os.listdir(tmp_path) == []
+
+    def test_oversized_partitions_are_split_again(self, tmp_path):
+        """Test that a single partition holding too many ids is re-partitioned."""
+        # Arrange
+        service = DuplicateIdsFinderService(
+            max_ids_in_memory=3, partitions=2, spill_directory=str(tmp_path)
+        )
+        asset_ids = [f"id_{i}" for i in range(20)] + ["id_4", "id_19", "id_4"]
+
+        # Act
+        duplicates = service(asset_ids)
+
+        # Assert
+        assert duplicates == ["id_4", "id_19"]
+        assert os.listdir(tmp_path) == []
@@ -1,6 +1,15 @@
+import numpy as np
 import pytest
 
 from app.contexts.assets.domain.entities.asset import Asset
+from app.contexts.assets.domain.services.interest_rate_avg_calculator.calibration import (
+    calibrate_numpy_min_size,
+)
+from app.contexts.assets.domain.services.interest_rate_avg_calculator.engines import (
+    FsumAverageEngine,
+    NumpyAverageEngine,
+    PythonAverageEngine,
+)
 from app.contexts.assets.domain.services.interest_rate_avg_calculator.errors import (
     EmptyListError,
     InvalidListError,
@@ -112,3 +121,118 @@ class TestInterestRateAvgCalculatorService:
             self.calculator(assets)
 
         assert str(exc_info.value) == "A valid assets list is required"
+
+    def test_calculate_average_from_rates_array(self):
+        """Test calculating the average directly from a float64 rates column."""
+        # Arrange
+        interest_rates = np.array([5.0, 10.0, 15.0])
+
+        # Act
+        result = self.calculator(interest_rates)
+
+        # Assert
+        assert result == 10.0
+        assert isinstance(result, float)
+
+    def test_raises_empty_list_error_with_empty_array(self):
+        """Test that EmptyListError is raised for an empty rates column."""
+        with pytest.raises(EmptyListError):
+            self.calculator(np.empty(0))
+
+    def test_raises_invalid_list_error_with_non_1d_array(self):
+        """Test that InvalidListError is raised for a non one-dimensional column."""
+        with pytest.raises(InvalidListError):
+            self.calculator(np.ones((2, 2)))
+
+
+class TestWeightedMean:
+    """Test cases for the amount-weighted average."""
+
+    def setup_method(self):
+        self.calculator = InterestRateAvgCalculatorService()
+
+    def test_weights_rates_by_amount(self):
+        """Test that missing amounts weigh nothing."""
+        # Act
+        result = self.calculator.weighted_mean(
+            np.array([5.0, 10.0, 15.0]), np.array([100.0, np.nan, 300.0])
+        )
+
+        # Assert
+        assert result == 12.5
+
+    def test_without_weights_is_none(self):
+        """Test that rates without any positive amount have no weighted mean."""
+        assert (
+            self.calculator.weighted_mean(np.array([5.0]), np.array([np.nan])) is None
+        )
+
+    def test_rejects_misaligned_columns(self):
+        """Test that every rate needs an amount slot."""
+        with pytest.raises(InvalidListError):
+            self.calculator.weighted_mean(np.array([5.0]), np.array([1.0, 2.0]))
+
+
+class TestAverageEngines:
+    """Test cases for the pluggable engines and their size-based dispatch."""
+
+    @pytest.mark.parametrize("engine", ["auto", "python", "numpy", "fsum"])
+    def test_engines_agree_on_assets_and_columns(self, engine):
+        """Test that every engine averages both input kinds alike."""
+        # Arrange
+        calculator = InterestRateAvgCalculatorService(engine=engine)
+        rates = [5.0, 10.0, 15.0, 2.5]
+
+        # Act & Assert
+        assert calculator([Asset(interest_rate=rate) for rate in rates]) == 8.125
+        assert calculator(np.array(rates)) == 8.125
+
+    @pytest.mark.parametrize("engine", ["auto", "python", "numpy", "fsum"])
+    def test_engines_keep_the_list_errors(self, engine):
+        """Test that empty and invalid inputs fail the same way on any engine."""
+        calculator = InterestRateAvgCalculatorService(engine=engine)
+
+        with pytest.raises(EmptyListError):
+            calculator([])
+        with pytest.raises(InvalidListError):
+            calculator(None)
+        with pytest.raises(InvalidListError):
+            calculator(np.ones((2, 2)))
+
+    def test_fsum_engine_rounds_the_sum_exactly(self):
+        """Test that the fsum engine survives catastrophic cancellation."""
+        # Arrange
+        rates = np.array([1e16, 1.0, -1e16, 2.0])
+
+        # Act
+        result = InterestRateAvgCalculatorService(engine="fsum")(rates)
+
+        # Assert
+        assert result == 0.75
+
+    def test_auto_dispatches_by_size(self):
+        """Test that small inputs use Python and larger ones NumPy."""
+        # Arrange
+        calculator = InterestRateAvgCalculatorService(numpy_min_size=64)
+
+        # Act & Assert
+        assert isinstance(calculator.engine_for(63), PythonAverageEngine)
+        assert isinstance(calculator.engine_for(64), NumpyAverageEngine)
+        assert isinstance(
+            InterestRateAvgCalculatorService(engine="fsum").engine_for(10**6),
+            FsumAverageEngine,
+        )
+
+    def test_unknown_engine_is_rejected(self):
+        """Test that a misconfigured engine fails fast."""
+        with pytest.raises(ValueError):
+            InterestRateAvgCalculatorService(engine="gpu")
+
+    def test_calibration_finds_a_crossover(self):
+        """Test that the calibration benchmark yields a power of two threshold."""
+        # Act
+        size = calibrate_numpy_min_size(max_size=1 << 8, repeat=1)
+
+        # Assert
+        assert 1 <= size <= 1 << 9
+        assert size & (size - 1) == 0
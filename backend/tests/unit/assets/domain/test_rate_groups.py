@@ -0,0 +1,110 @@
+import numpy as np
+
+from app.contexts.assets.domain.services.rate_groups.group_tables import (
+    GroupTable,
+    RateGroup,
+    TagColumn,
+    build_group_tables,
+    encode_tags,
+    tag_values,
+)
+
+
+class TestTagColumn:
+    def test_values_are_numbered_in_order_of_appearance(self):
+        """Test the codes of a column, -1 standing for a missing tag."""
+        # Act
+        column = TagColumn.from_values(["eu", "us", None, "eu"])
+
+        # Assert
+        assert column.values == ["eu", "us"]
+        assert column.codes.tolist() == [0, 1, -1, 0]
+        assert column.decoded() == ["eu", "us", None, "eu"]
+        assert column.value_at(2) is None
+
+    def test_encode_keeps_existing_codes(self):
+        """Test that encoding more values only numbers the new ones."""
+        # Arrange
+        column = TagColumn.from_values(["eu", "us"])
+
+        # Act
+        codes = column.encode(["asia", "us", "asia"])
+
+        # Assert
+        assert codes.tolist() == [2, 1, 2]
+        assert column.values == ["eu", "us", "asia"]
+
+    def test_tag_values_from_asset_tags(self):
+        """Test that per-asset mappings become aligned columns."""
+        # Act
+        columns = tag_values([{"region": "eu"}, {}, {"region": "us", "tier": "a"}])
+
+        # Assert
+        assert columns == {"region": ["eu", None, "us"], "tier": [None, None, "a"]}
+
+
+class TestGroupTable:
+    def setup_method(self):
+        rng = np.random.default_rng(5)
+        values = [f"v{i}" for i in range(8)] + [None]
+        self.tags = [values[i] for i in rng.integers(0, len(values), 5_000)]
+        self.rates = rng.normal(5.0, 2.0, 5_000)
+
+    def _naive(self, tags, rates):
+        groups: dict[str, list[float]] = {}
+        for tag, rate in zip(tags, rates.tolist()):
+            if tag is not None:
+                groups.setdefault(tag, []).append(rate)
+        return {value: (len(group), sum(group)) for value, group in groups.items()}
+
+    def _groups(self, column: TagColumn, table: GroupTable):
+        return {
+            group.value: (group.asset_count, group.rate_sum)
+            for group in table.groups(column.values)
+        }
+
+    def test_bincount_matches_a_naive_group_by(self):
+        """Test that the vectorized tables agree with a loop over the rows."""
+        # Act
+        columns = encode_tags({"region": self.tags}, len(self.tags))
+        table = build_group_tables(columns, self.rates)["region"]
+
+        # Assert
+        expected = self._naive(self.tags, self.rates)
+        groups = self._groups(columns["region"], table)
+        assert groups.keys() == expected.keys()
+        for value, (count, rate_sum) in expected.items():
+            assert groups[value][0] == count
+            assert np.isclose(groups[value][1], rate_sum)
+
+    def test_incremental_changes_match_a_rebuild(self):
+        """Test that folding rows in and out equals building from scratch."""
+        # Arrange
+        column = TagColumn.from_values(self.tags[:4_000])
+        table = GroupTable.from_codes(column.codes, self.rates[:4_000], 9)
+
+        # Act
+        table.add_many(column.encode(self.tags[4_000:]), self.rates[4_000:])
+        table.remove_many(column.codes[:1_000], self.rates[:1_000])
+
+        # Assert
+        rebuilt = self._naive(self.tags[1_000:], self.rates[1_000:])
+        groups = self._groups(column, table)
+        assert groups.keys() == rebuilt.keys()
+        for value, (count, rate_sum) in rebuilt.items():
+            assert groups[value][0] == count
+            assert np.isclose(groups[value][1], rate_sum)
+
+    def test_new_values_grow_the_table(self):
+        """Test that a value first seen in a change gets its own group."""
+        # Arrange
+        column = TagColumn.from_values(["eu"])
+        table = GroupTable.from_codes(column.codes, np.array([4.0]), 1)
+
+        # Act
+        table.add_many(column.encode(["us", None]), np.array([6.0, 9.0]))
+        table.remove_many(column.codes, np.array([4.0]))
+
+        # Assert
+        assert table.groups(column.values) == [RateGroup("us", 1, 6.0)]
+        assert RateGroup("us", 1, 6.0).avg_interest_rate == 6.0
@@ -0,0 +1,116 @@
+import numpy as np
+import pytest
+
+from app.contexts.assets.domain.services.rate_histogram.histograms import (
+    HistogramSpec,
+    RateHistogram,
+    RateHistograms,
+)
+from app.contexts.assets.domain.services.rate_index.sorted_rate_index import (
+    SortedRateIndex,
+)
+
+
+class TestRateHistogram:
+    def setup_method(self):
+        self.rates = np.random.default_rng(3).normal(5.0, 2.0, 10_000)
+        self.index = SortedRateIndex.from_rates(self.rates)
+
+    def test_fixed_width_matches_numpy(self):
+        """Test that counts and sums agree with ``np.histogram``."""
+        # Act
+        histogram = RateHistogram.fixed_width(self.index, 20)
+
+        # Assert
+        counts, edges = np.histogram(self.rates, bins=20)
+        sums, _ = np.histogram(self.rates, bins=edges, weights=self.rates)
+        assert np.allclose(histogram.edges, edges)
+        assert histogram.counts.tolist() == counts.tolist()
+        assert np.allclose(histogram.sums, sums)
+        assert (histogram.below, histogram.above) == (0, 0)
+
+    def test_quantile_buckets_are_even(self):
+        """Test that quantile buckets hold about as many rates each."""
+        # Act
+        histogram = RateHistogram.quantiles(self.index, 10)
+
+        # Assert
+        assert histogram.counts.sum() == len(self.rates)
+        assert np.all(np.abs(histogram.counts - 1_000) <= 1)
+        assert np.allclose(
+            histogram.edges, np.quantile(self.rates, np.linspace(0, 1, 11))
+        )
+
+    def test_equal_rates_share_one_bucket(self):
+        """Test that a single distinct rate makes one zero-width bucket."""
+        # Act
+        histogram = RateHistogram.fixed_width(
+            SortedRateIndex.from_rates(np.array([2.0, 2.0])), 5
+        )
+
+        # Assert
+        assert histogram.edges.tolist() == [2.0, 2.0]
+        assert (histogram.counts.tolist(), histogram.sums.tolist()) == ([2], [4.0])
+
+    def test_incremental_changes_match_a_recount(self):
+        """Test that folding rates in and out equals counting the new rates."""
+        # Arrange
+        histogram = RateHistogram.fixed_width(self.index, 20)
+        added = np.random.default_rng(4).uniform(0.0, 8.0, 500)
+
+        # Act
+        histogram.remove_many(self.rates[:1_000])
+        histogram.add_many(added)
+
+        # Assert
+        rates = np.concatenate([self.rates[1_000:], added])
+        expected = RateHistogram.from_index(
+            SortedRateIndex.from_rates(rates), histogram.edges
+        )
+        assert histogram.counts.tolist() == expected.counts.tolist()
+        assert np.allclose(histogram.sums, expected.sums)
+
+    def test_rates_outside_the_edges_are_counted_apart(self):
+        """Test that added rates beyond the edges go below or above."""
+        # Arrange
+        histogram = RateHistogram.fixed_width(
+            SortedRateIndex.from_rates(np.array([1.0, 2.0, 3.0])), 2
+        )
+
+        # Act
+        histogram.add_many(np.array([0.5, 3.0, 9.0, 9.5]))
+        histogram.remove_many(np.array([9.0]))
+
+        # Assert
+        assert histogram.counts.tolist() == [1, 3]
+        assert (histogram.below, histogram.above) == (1, 1)
+
+
+class TestRateHistograms:
+    def test_bytes_round_trip(self):
+        """Test that both histograms are restored exactly."""
+        # Arrange
+        histograms = HistogramSpec(bucket_count=7, quantile_count=4).build(
+            SortedRateIndex.from_rates(np.arange(100.0))
+        )
+        assert histograms is not None
+        histograms.add_many(np.array([-5.0]))
+
+        # Act
+        restored = RateHistograms.from_bytes(histograms.to_bytes())
+
+        # Assert
+        for histogram, copy in zip(histograms, restored):
+            assert histogram.edges.tolist() == copy.edges.tolist()
+            assert histogram.counts.tolist() == copy.counts.tolist()
+            assert histogram.sums.tolist() == copy.sums.tolist()
+            assert (histogram.below, histogram.above) == (copy.below, copy.above)
+
+    def test_no_histograms_without_rates(self):
+        """Test that an empty index has no histograms."""
+        assert HistogramSpec().build(SortedRateIndex.from_rates(np.empty(0))) is None
+
+    def test_mismatched_columns_are_rejected(self):
+        """Test that edges must bound every bucket."""
+        with pytest.raises(ValueError):
+            RateHistogram(np.zeros(2), np.zeros(2, np.int64), np.zeros(2))
@@ -0,0 +1,63 @@
+import pytest
+
+from app.contexts.assets.domain.services.rate_rollups.series import (
+    Resolution,
+    RollupPoint,
+    RollupSeries,
+)
+
+
+class TestRollupSeries:
+    def test_values_are_bucketed_on_the_epoch(self):
+        """Test that values sharing a bucket are folded into one point."""
+        # Arrange
+        series = RollupSeries(Resolution.MINUTE.seconds)
+
+        # Act
+        series.add(125.0, 4.0)
+        series.add(150.0, 10.0)
+        series.add(179.0, 7.0)
+        series.add(180.0, 3.0)
+
+        # Assert
+        assert series.points() == [
+            RollupPoint(120.0, 4.0, 10.0, 7.0, 7.0, 3),
+            RollupPoint(180.0, 3.0, 3.0, 3.0, 3.0, 1),
+        ]
+
+    def test_range_reads_return_the_overlapping_buckets(self):
+        """Test that a range keeps the buckets it starts and ends in."""
+        # Arrange
+        series = RollupSeries(60)
+        for minute in range(10):
+            series.add(minute * 60.0 + 1, float(minute))
+
+        # Act
+        points = series.points(start=150.0, end=300.0)
+
+        # Assert
+        assert [point.start for point in points] == [120.0, 180.0, 240.0, 300.0]
+        assert series.points(start=1000.0) == []
+
+    def test_prune_drops_the_buckets_ended_before(self):
+        """Test that only buckets ending at or before the cutoff go."""
+        # Arrange
+        series = RollupSeries(60)
+        for minute in range(5):
+            series.add(minute * 60.0, 1.0)
+
+        # Act
+        series.prune(150.0)
+
+        # Assert
+        assert [point.start for point in series.points()] == [120.0, 180.0, 240.0]
+
+    def test_rejects_values_out_of_order(self):
+        """Test that a value older than the last bucket is an error."""
+        # Arrange
+        series = RollupSeries(60)
+        series.add(120.0, 1.0)
+
+        # Act / Assert
+        with pytest.raises(ValueError):
+            series.add(59.0, 2.0)
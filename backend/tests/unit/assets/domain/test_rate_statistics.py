@@ -0,0 +1,134 @@
+import numpy as np
+import pytest
+
+from app.contexts.assets.domain.services.rate_statistics.sketches import (
+    Moments,
+    RateSketch,
+    TDigest,
+)
+
+
+def _rank_errors(values, statistics):
+    # How far the estimated quantiles are from their ranks in the data
+    return [
+        abs(float(np.mean(values <= estimate)) - q)
+        for q, estimate in (
+            (0.5, statistics.median),
+            (0.9, statistics.p90),
+            (0.99, statistics.p99),
+        )
+    ]
+
+
+class TestMoments:
+    def test_matches_numpy_over_chunks(self):
+        """Test that chunked folds give the exact mean, std and extremes."""
+        # Arrange
+        values = np.random.default_rng(1).normal(5.0, 2.0, 10_000)
+        moments = Moments()
+
+        # Act
+        for chunk in np.array_split(values, 7):
+            moments.add_many(chunk)
+
+        # Assert
+        assert moments.count == 10_000
+        assert moments.mean == pytest.approx(np.mean(values), rel=1e-12)
+        assert moments.std == pytest.approx(np.std(values), rel=1e-12)
+        assert (moments.min, moments.max) == (values.min(), values.max())
+
+    def test_empty_moments_have_no_std(self):
+        """Test that nothing is derived from an empty stream."""
+        assert np.isnan(Moments().std)
+
+
+class TestTDigest:
+    def test_keeps_a_bounded_number_of_centroids(self):
+        """Test that the digest size does not grow with the values."""
+        # Arrange
+        digest = TDigest(compression=100)
+
+        # Act
+        digest.add_many(np.random.default_rng(2).random(200_000))
+
+        # Assert
+        means, weights = digest.centroids()
+        assert len(means) <= 60
+        assert weights.sum() == 200_000
+        assert np.all(np.diff(means) >= 0)
+
+    def test_small_inputs_are_exact(self):
+        """Test that a digest of few values keeps every one of them."""
+        # Arrange
+        digest = TDigest()
+        digest.add_many(np.array([15.0, 5.0, 10.0]))
+
+        # Act & Assert
+        assert digest.quantile(0.5, 5.0, 15.0) == 10.0
+        assert digest.quantile(0.0, 5.0, 15.0) == 5.0
+
+
+class TestRateSketch:
+    @pytest.mark.parametrize(
+        "values",
+        [
+            np.random.default_rng(3).normal(5.0, 2.0, 100_000),
+            np.random.default_rng(4).lognormal(1.0, 1.0, 100_000),
+        ],
+    )
+    def test_quantiles_are_accurate(self, values):
+        """Test that median, p90 and p99 land close to their ranks."""
+        # Act
+        statistics = RateSketch.from_values(values).statistics()
+
+        # Assert
+        assert statistics is not None
+        assert max(_rank_errors(values, statistics)) < 0.002
+        assert statistics.asset_count == len(values)
+        assert statistics.std == pytest.approx(np.std(values))
+
+    def test_merged_chunks_match_one_sketch(self):
+        """Test that sketches of chunks merge into a sketch of the whole."""
+        # Arrange
+        values = np.random.default_rng(5).normal(3.0, 1.0, 50_000)
+        merged = RateSketch()
+
+        # Act
+        for chunk in np.array_split(values, 5):
+            merged.merge(RateSketch.from_values(chunk))
+
+        # Assert
+        statistics = merged.statistics()
+        assert statistics is not None
+        assert statistics.mean == pytest.approx(np.mean(values))
+        assert statistics.std == pytest.approx(np.std(values))
+        assert max(_rank_errors(values, statistics)) < 0.002
+
+    def test_round_trips_through_bytes(self):
+        """Test that a serialized sketch gives the same statistics back."""
+        # Arrange
+        sketch = RateSketch.from_values(np.random.default_rng(6).random(10_000))
+
+        # Act
+        restored = RateSketch.from_bytes(sketch.to_bytes())
+
+        # Assert
+        assert restored.statistics() == sketch.statistics()
+
+    def test_adding_refreshes_the_statistics(self):
+        """Test that statistics read before an addition are not served after."""
+        # Arrange
+        sketch = RateSketch.from_values(np.array([1.0, 2.0]))
+        assert sketch.statistics() is not None
+
+        # Act
+        sketch.add_many(np.array([9.0]))
+
+        # Assert
+        statistics = sketch.statistics()
+        assert statistics is not None
+        assert (statistics.asset_count, statistics.max) == (3, 9.0)
+
+    def test_empty_sketch_has_no_statistics(self):
+        """Test that an empty sketch reports nothing."""
+        assert RateSketch().statistics() is None
@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from app.contexts.assets.domain.services.rate_index.sorted_rate_index import (
+    RateRange,
+    SortedRateIndex,
+)
+
+
+class TestSortedRateIndex:
+    def setup_method(self):
+        self.rates = np.array([15.0, 5.0, 10.0, 5.0, 20.0])
+        self.index = SortedRateIndex.from_rates(self.rates)
+
+    @pytest.mark.parametrize(
+        ("min_rate", "max_rate", "expected"),
+        [
+            (5.0, 10.0, RateRange(3, 20.0)),
+            (6.0, 15.0, RateRange(2, 25.0)),
+            (-1.0, 100.0, RateRange(5, 55.0)),
+            (11.0, 14.0, RateRange(0, 0.0)),
+            (20.0, 5.0, RateRange(0, 0.0)),
+        ],
+    )
+    def test_range_counts_and_sums_inclusive_bounds(self, min_rate, max_rate, expected):
+        """Test that both bounds are included and empty ranges sum to nothing."""
+        assert self.index.range(min_rate, max_rate) == expected
+
+    def test_range_matches_a_scan(self):
+        """Test that prefix sums agree with filtering every rate."""
+        # Arrange
+        rates = np.random.default_rng(7).normal(5.0, 2.0, 10_000)
+        index = SortedRateIndex.from_rates(rates)
+
+        # Act
+        rate_range = index.range(4.0, 6.5)
+
+        # Assert
+        selected = rates[(rates >= 4.0) & (rates <= 6.5)]
+        assert rate_range.asset_count == len(selected)
+        assert rate_range.rate_sum == pytest.approx(selected.sum(), rel=1e-12)
+        assert rate_range.avg_interest_rate == pytest.approx(selected.mean())
+
+    def test_sorted_runs_merge_into_the_order_of_a_full_sort(self):
+        """Test that merging chunks sorted apart keeps ties in row order."""
+        # Arrange
+        rates = np.random.default_rng(7).integers(0, 50, 1_000).astype(np.float64)
+        rows = np.concatenate(
+            [
+                start + np.argsort(rates[start : start + 300], kind="stable")
+                for start in range(0, len(rates), 300)
+            ]
+        )
+
+        # Act
+        index = SortedRateIndex.from_sorted_runs(rates, rows)
+
+        # Assert
+        expected = SortedRateIndex.from_rates(rates)
+        assert index.rows.tolist() == expected.rows.tolist()
+        assert index.prefix_sums.tolist() == expected.prefix_sums.tolist()
+
+    def test_lowest_and_highest_rows(self):
+        """Test that the ends of the order give the extreme rates' rows."""
+        assert self.index.lowest_rows(3).tolist() == [1, 3, 2]
+        assert self.index.highest_rows(2).tolist() == [4, 0]
+        assert len(self.index.highest_rows(10)) == 5
+
+    def test_empty_range_has_no_average(self):
+        """Test that the average of no rates is undefined."""
+        assert RateRange(0, 0.0).avg_interest_rate is None
@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+
+from app.contexts.assets.domain.entities.errors import (
+    AssetNotFoundError,
+    DuplicateAssetIdError,
+)
+from app.contexts.assets.domain.services.what_if.scenarios import (
+    ScenarioDeltas,
+    evaluate_scenarios,
+)
+
+
+class TestEvaluateScenarios:
+    def setup_method(self):
+        self.stored_rates = {f"id_{i}": float(i) for i in range(10)}
+
+    def test_matches_applying_each_scenario(self):
+        """Test the vectorized outcomes against applying scenarios one by one."""
+        # Arrange
+        rng = np.random.default_rng(11)
+        scenarios = [
+            (
+                {f"new_{s}_{i}": float(rng.normal(5, 2)) for i in range(s % 4)},
+                [f"id_{i}" for i in rng.choice(10, s % 3, replace=False)],
+            )
+            for s in range(1_000)
+        ]
+        deltas = ScenarioDeltas(
+            len(scenarios),
+            [s for s, (added, _) in enumerate(scenarios) for _ in added],
+            [asset_id for added, _ in scenarios for asset_id in added],
+            [rate for added, _ in scenarios for rate in added.values()],
+            [s for s, (_, removed) in enumerate(scenarios) for _ in removed],
+            [asset_id for _, removed in scenarios for asset_id in removed],
+        )
+
+        # Act
+        outcomes = evaluate_scenarios(deltas, 10, 45.0, self.stored_rates)
+
+        # Assert
+        for s, (added, removed) in enumerate(scenarios):
+            rates = {**self.stored_rates, **added}
+            for asset_id in removed:
+                del rates[asset_id]
+            assert outcomes.asset_counts[s] == len(rates)
+            assert np.isclose(
+                outcomes.avg_interest_rates[s], sum(rates.values()) / len(rates)
+            )
+
+    def test_emptied_list_has_no_average(self):
+        """Test that a scenario removing every asset has a NaN average."""
+        # Arrange
+        deltas = ScenarioDeltas(2, [], [], [], [0, 0], ["id_0", "id_1"])
+
+        # Act
+        outcomes = evaluate_scenarios(deltas, 2, 1.0, {"id_0": 0.0, "id_1": 1.0})
+
+        # Assert
+        assert outcomes.asset_counts.tolist() == [0, 2]
+        assert np.isnan(outcomes.avg_interest_rates[0])
+        assert outcomes.avg_interest_rates[1] == 0.5
+
+    def test_rejects_removing_unknown_assets(self):
+        """Test that every scenario may only remove stored assets."""
+        deltas = ScenarioDeltas(2, [], [], [], [0, 1], ["id_1", "missing"])
+
+        with pytest.raises(AssetNotFoundError) as exc_info:
+            evaluate_scenarios(deltas, 10, 45.0, self.stored_rates)
+
+        assert exc_info.value.missing_ids == ["missing"]
+
+    @pytest.mark.parametrize(
+        ("added", "removed"),
+        [
+            ([(0, "id_1")], []),
+            ([(0, "new"), (0, "new")], []),
+            ([], [(0, "id_1"), (0, "id_1")]),
+            ([(1, "id_1")], [(0, "id_1")]),
+        ],
+    )
+    def test_rejects_duplicate_ids(self, added, removed):
+        """Test that an id can only be added where it is free, and removed once."""
+        deltas = ScenarioDeltas(
+            2,
+            [s for s, _ in added],
+            [asset_id for _, asset_id in added],
+            [1.0] * len(added),
+            [s for s, _ in removed],
+            [asset_id for _, asset_id in removed],
+        )
+
+        with pytest.raises(DuplicateAssetIdError):
+            evaluate_scenarios(deltas, 10, 45.0, self.stored_rates)
+
+    def test_replacing_an_asset_in_the_same_scenario(self):
+        """Test that a removed id may be added back with another rate."""
+        # Arrange
+        deltas = ScenarioDeltas(1, [0], ["id_9"], [0.0], [0], ["id_9"])
+
+        # Act
+        outcomes = evaluate_scenarios(deltas, 10, 45.0, self.stored_rates)
+
+        # Assert
+        assert outcomes.asset_counts.tolist() == [10]
+        assert outcomes.avg_interest_rates.tolist() == [3.6]
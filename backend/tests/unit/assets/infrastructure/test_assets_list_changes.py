@@ -0,0 +1,148 @@
+import numpy as np
+import pytest
+
+from app.contexts.assets.domain.entities.assets_list import AssetsList
+from app.contexts.assets.infrastructure.persistence.assets_list.changes import (
+    AddAssets,
+    RemoveAssets,
+    UpdateAssets,
+    decode_assets_list_change,
+    encode_assets_list_change,
+)
+from app.contexts.assets.infrastructure.persistence.assets_list.in_memory_repository import (
+    InMemoryAssetsListRepository,
+)
+from app.contexts.shared.infrastructure.in_memory_database import (
+    Change,
+    InMemoryDatabase,
+    SetValue,
+)
+from app.contexts.shared.infrastructure.write_ahead_log import WriteAheadLog
+
+
+def make_log(directory) -> WriteAheadLog[Change[AssetsList]]:
+    return WriteAheadLog[Change[AssetsList]](
+        directory, encode=encode_assets_list_change, decode=decode_assets_list_change
+    )
+
+
+class TestAssetsListChanges:
+    """Test cases for the assets list changes logged ahead of the database."""
+
+    @pytest.fixture(autouse=True)
+    def setup_repository(self, tmp_path):
+        """Set up a repository over a database logging to a fresh directory."""
+        self.directory = tmp_path / "wal"
+        self.database = InMemoryDatabase[AssetsList](shard_count=4)
+        self.database.attach_log(make_log(self.directory))
+        self.repository = InMemoryAssetsListRepository(self.database)
+        yield
+        if self.database.log is not None:
+            self.database.log.close()
+
+    def restart(self) -> InMemoryAssetsListRepository:
+        self.database.log.close()
+        self.database = InMemoryDatabase[AssetsList](shard_count=4)
+        self.database.attach_log(make_log(self.directory))
+        return InMemoryAssetsListRepository(self.database)
+
+    def logged_bytes(self) -> int:
+        return sum(path.stat().st_size for path in self.directory.glob("0*.wal"))
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            AddAssets(["c"], np.array([3.0]), np.array([np.nan]), {"desk": ["x"]}),
+            UpdateAssets(["a"], np.array([7.0])),
+            RemoveAssets(["b"]),
+        ],
+    )
+    def test_changes_encode_to_bytes_and_back(self, change):
+        """Test that a decoded change leaves the list the original one does."""
+        # Arrange
+        expected = AssetsList.from_columns(["a", "b"], [1.0, 2.0], amounts=[1.0, 1.0])
+        actual = AssetsList.from_columns(["a", "b"], [1.0, 2.0], amounts=[1.0, 1.0])
+
+        # Act
+        decoded = decode_assets_list_change(encode_assets_list_change(change))
+
+        # Assert
+        assert type(decoded) is type(change)
+        change.apply(expected)
+        decoded.apply(actual)
+        assert list(actual.asset_ids) == list(expected.asset_ids)
+        assert actual.interest_rates.tolist() == expected.interest_rates.tolist()
+        assert actual.weighted_avg_interest_rate == expected.weighted_avg_interest_rate
+
+    def test_single_row_update_logs_the_row_only(self):
+        """Test that updating one asset of a large list logs a small record."""
+        # Arrange
+        asset_ids = [f"id_{i}" for i in range(100_000)]
+        self.repository.save(
+            AssetsList.from_columns(asset_ids, np.arange(100_000, dtype=np.float64))
+        )
+        saved = self.logged_bytes()
+
+        # Act
+        self.repository.update_assets(["id_7"], np.array([0.5]))
+
+        # Assert
+        assert saved > 1_000_000
+        assert self.logged_bytes() - saved < 100
+
+    def test_row_changes_are_replayed_on_restart(self):
+        """Test that a restart replays the saved list, then every row change."""
+        # Arrange
+        self.repository.add_assets(["a", "b"], np.array([1.0, 2.0]))
+        self.repository.add_assets(
+            ["c"], np.array([3.0]), np.array([10.0]), {"desk": ["x"]}
+        )
+        self.repository.update_assets(["a"], np.array([5.0]))
+        self.repository.remove_assets(["b"])
+
+        # Act
+        repository = self.restart()
+        repository.update_assets(["c"], np.array([4.0]))
+
+        # Assert
+        assert repository.get_asset("a").interest_rate == 5.0
+        assert repository.get_asset("b") is None
+        assert repository.get_rate_groups("desk")[0].asset_count == 1
+        assert repository.get_average_interest_rate() == 4.5
+        assert self.database.get_version(repository.key) == 5
+
+    def test_changes_apply_to_the_logged_list_over_a_newer_snapshot(self, tmp_path):
+        """Test that rows added to a restored list replay onto that list, even
+        once a later snapshot already holds them."""
+        # Arrange
+        directory = tmp_path / "restored"
+        database = InMemoryDatabase[AssetsList](shard_count=4)
+        database.set("assets_list", AssetsList.from_columns(["a", "b"], [1.0, 2.0]))
+        database.attach_log(make_log(directory))
+        InMemoryAssetsListRepository(database).add_assets(["c"], np.array([3.0]))
+        database.log.close()
+
+        # Act
+        restarted = InMemoryDatabase[AssetsList](shard_count=4)
+        restarted.set("assets_list", database.get("assets_list"))
+        restarted.attach_log(make_log(directory))
+        restarted.log.close()
+
+        # Assert
+        assert list(restarted.get("assets_list").asset_ids) == ["a", "b", "c"]
+
+    def test_checkpoint_logs_the_whole_list(self):
+        """Test that a compacted log replays one full list per key."""
+        # Arrange
+        self.repository.add_assets(["a", "b"], np.array([1.0, 2.0]))
+        self.repository.remove_assets(["a"])
+
+        # Act
+        self.database.checkpoint_log()
+        self.database.log.close()
+
+        # Assert
+        [(key, change)] = list(make_log(self.directory).replay())
+        assert key == self.repository.key
+        assert isinstance(change, SetValue)
+        assert list(change.value.asset_ids) == ["b"]
@@ -0,0 +1,165 @@
+import msgspec
+import numpy as np
+import pytest
+
+from app.contexts.assets.infrastructure.api.binary_payloads import (
+    ARROW_STREAM_MEDIA_TYPE,
+    parse_arrow_columns,
+    parse_msgpack_columns,
+)
+from app.contexts.assets.infrastructure.api.errors import InvalidPayloadError
+from app.contexts.assets.infrastructure.api.payloads import (
+    parse_save_assets_list_body,
+)
+
+
+def arrow_stream(**columns) -> bytes:
+    pa = pytest.importorskip("pyarrow")
+    table = pa.table(columns)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    stream: bytes = sink.getvalue().to_pybytes()
+    return stream
+
+
+class TestParseMsgpackColumns:
+    def test_parses_binary_rate_column(self):
+        """Test that a float64 ``bin`` column is adopted as the rates."""
+        # Arrange
+        body = msgspec.msgpack.encode(
+            {"id": ["id_1", "id_2"], "interest_rate": np.array([5.0, 15.5]).tobytes()}
+        )
+
+        # Act
+        asset_ids, interest_rates, *_ = parse_msgpack_columns(body)
+
+        # Assert
+        assert asset_ids == ["id_1", "id_2"]
+        assert interest_rates.dtype == np.float64
+        assert interest_rates.tolist() == [5.0, 15.5]
+
+    def test_parses_array_rate_column(self):
+        """Test that rates may also be sent as an array of numbers."""
+        # Act
+        asset_ids, interest_rates, *_ = parse_msgpack_columns(
+            msgspec.msgpack.encode({"id": ["id_1", "id_2"], "interest_rate": [5, 2.5]})
+        )
+
+        # Assert
+        assert asset_ids == ["id_1", "id_2"]
+        assert interest_rates.tolist() == [5.0, 2.5]
+
+    def test_parses_optional_amount_column(self):
+        """Test that nil amounts become NaN next to the given ones."""
+        # Act
+        _, _, amounts, _ = parse_msgpack_columns(
+            msgspec.msgpack.encode(
+                {"id": ["id_1", "id_2"], "interest_rate": [5, 2.5], "amount": [None, 3]}
+            )
+        )
+
+        # Assert
+        assert amounts is not None
+        assert np.isnan(amounts[0]) and amounts[1] == 3.0
+
+    @pytest.mark.parametrize(
+        "columns",
+        [
+            {"id": ["id_1"], "interest_rate": [1.0, 2.0]},
+            {"id": ["id_1"], "interest_rate": [1.0], "amount": [-1.0]},
+            {"id": ["id_1"], "interest_rate": b"\0" * 7},
+            {"id": [1], "interest_rate": [1.0]},
+            {"id": ["id_1"]},
+        ],
+    )
+    def test_rejects_invalid_columns(self, columns):
+        """Test that malformed or misaligned columns are validation errors."""
+        with pytest.raises(InvalidPayloadError):
+            parse_msgpack_columns(msgspec.msgpack.encode(columns))
+
+    def test_dispatched_by_media_type(self):
+        """Test that the ``POST /asset`` parser picks the format by media type."""
+        # Arrange
+        body = msgspec.msgpack.encode({"id": ["id_1"], "interest_rate": [5.0]})
+
+        # Act
+        asset_ids, *_ = parse_save_assets_list_body(
+            body, media_type="application/msgpack"
+        )
+
+        # Assert
+        assert asset_ids == ["id_1"]
+
+
+class TestParseArrowColumns:
+    def test_parses_stream(self):
+        """Test that an Arrow IPC stream becomes an id list and a rates column."""
+        # Arrange
+        body = arrow_stream(id=["id_1", "id_2"], interest_rate=[5.0, 15.5])
+
+        # Act
+        asset_ids, interest_rates, *_ = parse_save_assets_list_body(
+            body, media_type=ARROW_STREAM_MEDIA_TYPE
+        )
+
+        # Assert
+        assert asset_ids == ["id_1", "id_2"]
+        assert interest_rates.dtype == np.float64
+        assert interest_rates.tolist() == [5.0, 15.5]
+
+    def test_integer_rates_are_cast(self):
+        """Test that an integer rate column is read as float64."""
+        # Act
+        _, interest_rates, *_ = parse_arrow_columns(
+            arrow_stream(id=["id_1"], interest_rate=[5])
+        )
+
+        # Assert
+        assert interest_rates.dtype == np.float64
+
+    def test_null_amounts_become_nan(self):
+        """Test that an amount column with nulls is read as missing amounts."""
+        # Act
+        _, _, amounts, _ = parse_arrow_columns(
+            arrow_stream(
+                id=["id_1", "id_2"], interest_rate=[5.0, 1.0], amount=[1, None]
+            )
+        )
+
+        # Assert
+        assert amounts is not None
+        assert amounts[0] == 1.0 and np.isnan(amounts[1])
+
+    def test_rejects_missing_columns(self):
+        """Test that a stream without the rate column is rejected."""
+        # Act
+        with pytest.raises(InvalidPayloadError) as exc_info:
+            parse_arrow_columns(arrow_stream(id=["id_1"], rate=[1.0]))
+
+        # Assert
+        assert exc_info.value.errors[0]["loc"] == ("interest_rate",)
+        assert exc_info.value.errors[0]["type"] == "missing"
+
+    def test_rejects_mistyped_columns(self):
+        """Test that every mistyped column is reported at once."""
+        # Act
+        with pytest.raises(InvalidPayloadError) as exc_info:
+            parse_arrow_columns(arrow_stream(id=[1, 2], interest_rate=["a", "b"]))
+
+        # Assert
+        assert [error["loc"] for error in exc_info.value.errors] == [
+            ("id",),
+            ("interest_rate",),
+        ]
+
+    def test_rejects_null_values(self):
+        """Test that nulls are not mistaken for rates."""
+        with pytest.raises(InvalidPayloadError):
+            parse_arrow_columns(arrow_stream(id=["id_1"], interest_rate=[None]))
+
+    def test_rejects_bytes_that_are_not_a_stream(self):
+        """Test that a body that is not Arrow IPC is a validation error."""
+        pytest.importorskip("pyarrow")
+        with pytest.raises(InvalidPayloadError):
+            parse_arrow_columns(b"not arrow")
@@ -0,0 +1,169 @@
+import asyncio
+import pickle
+
+import numpy as np
+import pytest
+
+from app.contexts.assets.infrastructure.api.csv_records import iter_csv_asset_chunks
+from app.contexts.assets.infrastructure.api.errors import InvalidRecordsError
+
+
+async def _stream(data: bytes, piece_size: int):
+    for start in range(0, len(data), piece_size):
+        yield data[start : start + piece_size]
+
+
+def parse_chunks(data: bytes, piece_size: int, chunk_size: int, max_errors: int):
+    async def collect():
+        return [
+            chunk
+            async for chunk in iter_csv_asset_chunks(
+                _stream(data, piece_size), chunk_size, max_errors, block_size=1
+            )
+        ]
+
+    return asyncio.run(collect())
+
+
+def parse(data: bytes, piece_size: int = 7, chunk_size: int = 2, max_errors=100):
+    return [
+        (list(asset_ids), interest_rates.tolist())
+        for asset_ids, interest_rates, *_ in parse_chunks(
+            data, piece_size, chunk_size, max_errors
+        )
+    ]
+
+
+class TestIterCsvAssetChunks:
+    def test_parses_fixed_size_chunks(self):
+        """Test that rows come out in chunks whatever the network pieces."""
+        # Arrange
+        data = b"id,interest_rate\r\nid_1,5\r\nid_2,10.5\r\n\r\nid_3,15\r\nid_4,-1"
+
+        # Act
+        chunks = parse(data)
+
+        # Assert
+        assert chunks == [
+            (["id_1", "id_2"], [5.0, 10.5]),
+            (["id_3", "id_4"], [15.0, -1.0]),
+        ]
+
+    def test_header_picks_the_columns(self):
+        """Test that columns are found by name and others ignored."""
+        # Arrange
+        data = "\ufeffname, interest_rate ,id\nA,1,id_1\nB,2,id_2\n".encode()
+
+        # Act
+        chunks = parse(data, chunk_size=10)
+
+        # Assert
+        assert chunks == [(["id_1", "id_2"], [1.0, 2.0])]
+
+    def test_optional_amount_column(self):
+        """Test that amounts are read, an empty field meaning no amount."""
+        # Arrange
+        data = b"id,interest_rate,amount\nid_1,5,100\nid_2,10,\nid_3,15,2.5\n"
+
+        # Act
+        chunks = parse_chunks(data, piece_size=7, chunk_size=2, max_errors=100)
+
+        # Assert
+        amounts = [amount for chunk in chunks for amount in chunk.amounts.tolist()]
+        assert amounts[0] == 100.0 and np.isnan(amounts[1]) and amounts[2] == 2.5
+
+    def test_rejects_invalid_amounts(self):
+        """Test that unreadable and negative amounts are reported by line."""
+        # Arrange
+        data = b"id,interest_rate,amount\nid_1,5,x\nid_2,10,-1\n"
+
+        # Act
+        with pytest.raises(InvalidRecordsError) as exc_info:
+            parse(data, chunk_size=10)
+
+        # Assert
+        assert [
+            (error.line_number, error.reason) for error in exc_info.value.errors
+        ] == [
+            (2, "amount: 'x' is not a number"),
+            (3, "amount: '-1' is negative"),
+        ]
+
+    def test_quoted_fields_may_span_pieces_and_lines(self):
+        """Test that a record is never cut inside a quoted field."""
+        # Arrange
+        data = b'id,interest_rate\n"multi\nline ""id""",5\n"id,2",6\n'
+
+        # Act
+        chunks = parse(data, piece_size=3, chunk_size=10)
+
+        # Assert
+        assert chunks == [(['multi\nline "id"', "id,2"], [5.0, 6.0])]
+
+    def test_reports_every_invalid_row_with_its_line(self):
+        """Test that all invalid rows are listed and nothing is yielded after."""
+        # Arrange
+        data = b"id,interest_rate\nid_1,5\nid_2,abc\nid_3\n\nid_4,7\nid_5,x\n"
+
+        # Act
+        with pytest.raises(InvalidRecordsError) as exc_info:
+            parse(data, chunk_size=10)
+
+        # Assert
+        assert [
+            (error.line_number, error.reason) for error in exc_info.value.errors
+        ] == [
+            (3, "interest_rate: 'abc' is not a number"),
+            (4, "expected 2 fields, got 1"),
+            (7, "interest_rate: 'x' is not a number"),
+        ]
+        assert not exc_info.value.truncated
+
+    def test_stops_after_max_errors(self):
+        """Test that the import gives up once enough rows were rejected."""
+        # Arrange
+        data = b"id,interest_rate\n" + b"id,x\n" * 50
+
+        # Act
+        with pytest.raises(InvalidRecordsError) as exc_info:
+            parse(data, max_errors=3)
+
+        # Assert
+        assert [error.line_number for error in exc_info.value.errors] == [2, 3, 4]
+        assert exc_info.value.truncated
+
+    @pytest.mark.parametrize(
+        ("data", "line"),
+        [
+            (b"\n\nname,interest_rate\nid_1,5\n", 3),
+            (b"id,interest_rate\nid_1,5\n\xff\xfe,1\n", 3),
+        ],
+    )
+    def test_unreadable_input_is_reported(self, data, line):
+        """Test that a bad header or encoding ends the import at its line."""
+        with pytest.raises(InvalidRecordsError) as exc_info:
+            parse(data)
+
+        assert exc_info.value.errors[-1].line_number == line
+
+    def test_empty_stream_yields_nothing(self):
+        """Test that an empty or header-only file has no chunks."""
+        assert parse(b"") == []
+        assert parse(b"id,interest_rate\n") == []
+
+    def test_errors_survive_pickling(self):
+        """Test that a worker process can hand the rejected rows back."""
+        # Arrange
+        data = b"id,interest_rate\n" + b"id,x\n" * 5
+        with pytest.raises(InvalidRecordsError) as exc_info:
+            parse(data, max_errors=2)
+
+        # Act
+        error = pickle.loads(pickle.dumps(exc_info.value))
+
+        # Assert
+        assert [(e.line_number, e.reason) for e in error.errors] == [
+            (2, "interest_rate: 'x' is not a number"),
+            (3, "interest_rate: 'x' is not a number"),
+        ]
+        assert error.truncated
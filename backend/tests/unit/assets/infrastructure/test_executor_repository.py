@@ -0,0 +1,85 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from app.contexts.assets.domain.entities.assets_list import AssetsList
+from app.contexts.assets.domain.entities.errors import AssetNotFoundError
+from app.contexts.assets.infrastructure.persistence.assets_list.executor_repository import (
+    ExecutorAssetsListRepository,
+)
+from app.contexts.assets.infrastructure.persistence.assets_list.in_memory_repository import (
+    InMemoryAssetsListRepository,
+)
+from app.contexts.shared.infrastructure.in_memory_database import InMemoryDatabase
+
+
+class _ThreadRecordingRepository(InMemoryAssetsListRepository):
+    """In-memory repository that records the thread of every call."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.threads: dict[str, str] = {}
+
+    def save(self, assets_list, read_models=None):
+        self.threads["save"] = threading.current_thread().name
+        return super().save(assets_list, read_models)
+
+    def get_average_interest_rate(self):
+        self.threads["read"] = threading.current_thread().name
+        return super().get_average_interest_rate()
+
+
+class TestExecutorAssetsListRepository:
+    @pytest.fixture(autouse=True)
+    def setup_repository(self):
+        """Set up an in-memory repository behind a one-thread executor."""
+        self.executor = ThreadPoolExecutor(1, thread_name_prefix="offloaded")
+        self.repository = _ThreadRecordingRepository(InMemoryDatabase[AssetsList]())
+        yield
+        self.executor.shutdown()
+
+    def test_writes_run_on_the_executor(self):
+        """Test that writes leave the event loop thread."""
+        # Arrange
+        repository = ExecutorAssetsListRepository(self.repository, self.executor)
+
+        # Act
+        asyncio.run(repository.save(AssetsList.from_columns(["id_1"], [5.0])))
+
+        # Assert
+        assert self.repository.threads["save"].startswith("offloaded")
+
+    def test_reads_are_inline_unless_offloaded(self):
+        """Test that reads only use the executor when asked to."""
+        # Arrange
+        inline = ExecutorAssetsListRepository(self.repository, self.executor)
+        offloaded = ExecutorAssetsListRepository(
+            self.repository, self.executor, offload_reads=True
+        )
+
+        # Act
+        asyncio.run(inline.get_average_interest_rate())
+        inline_thread = self.repository.threads["read"]
+        asyncio.run(offloaded.get_average_interest_rate())
+
+        # Assert
+        assert inline_thread == threading.main_thread().name
+        assert self.repository.threads["read"].startswith("offloaded")
+
+    def test_results_and_errors_are_passed_through(self):
+        """Test that return values and domain errors reach the caller."""
+        # Arrange
+        repository = ExecutorAssetsListRepository(self.repository, self.executor)
+        asyncio.run(repository.save(AssetsList.from_columns(["id_1"], [5.0])))
+
+        # Act
+        average = asyncio.run(repository.add_assets(["id_2"], np.array([15.0])))
+
+        # Assert
+        assert average == 10.0
+        assert asyncio.run(repository.get_version()) == 2
+        with pytest.raises(AssetNotFoundError):
+            asyncio.run(repository.remove_assets(["missing"]))
@@ -0,0 +1,121 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from app.contexts.assets.domain.entities.assets_list import AssetsList
+from app.contexts.assets.domain.entities.errors import HistoryUnavailableError
+from app.contexts.assets.infrastructure.persistence.assets_list.history import (
+    AssetsListHistory,
+)
+from app.contexts.assets.infrastructure.persistence.assets_list.in_memory_repository import (
+    InMemoryAssetsListRepository,
+)
+from app.contexts.shared.infrastructure.in_memory_database import InMemoryDatabase
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = datetime(2026, 1, 1, 12, 0)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def advance(self, minutes: int) -> None:
+        self.now += timedelta(minutes=minutes)
+
+
+class TestAssetsListHistory:
+    @pytest.fixture(autouse=True)
+    def setup_history(self):
+        """Set up a repository recording its writes at controlled times."""
+        self.clock = _Clock()
+        self.history = AssetsListHistory(
+            max_versions=10, chunk_size=2, clock=self.clock
+        )
+        self.repository = InMemoryAssetsListRepository(
+            InMemoryDatabase[AssetsList](), history=self.history
+        )
+        self.repository.save(
+            AssetsList.from_columns(["id_1", "id_2", "id_3"], [5.0, 10.0, 15.0])
+        )
+        self.clock.advance(60)
+        self.repository.add_assets(["id_4"], np.array([30.0]))
+        self.clock.advance(60)
+        self.repository.update_assets(["id_1"], np.array([25.0]))
+
+    def test_every_write_is_a_version(self):
+        """Test that versions follow the repository's write counter."""
+        # Act
+        versions = self.repository.get_history()
+
+        # Assert
+        assert [version.version for version in versions] == [1, 2, 3]
+        assert [version.avg_interest_rate for version in versions] == [10.0, 15.0, 20.0]
+        assert self.repository.get_past_version().version == 3
+
+    def test_point_in_time_reads(self):
+        """Test reads by version number and by time."""
+        # Act
+        by_version = self.repository.get_past_version(version=2)
+        by_time = self.repository.get_past_version(at=datetime(2026, 1, 1, 13, 30))
+
+        # Assert
+        assert by_version is not None and by_time is not None
+        assert by_version is by_time
+        assert [asset.id for asset in by_time.assets()] == [
+            "id_1",
+            "id_2",
+            "id_3",
+            "id_4",
+        ]
+        assert self.repository.get_past_version(at=datetime(2026, 1, 1, 11)) is None
+        assert self.repository.get_past_version(version=7) is None
+
+    def test_versions_share_untouched_chunks(self):
+        """Test that a write only copies the chunks of its rows."""
+        # Act
+        first, second, third = self.repository.get_history()
+
+        # Assert
+        assert second.chunks[0] is first.chunks[0]
+        assert third.chunks[0] is not second.chunks[0]
+        assert third.chunks[1] is second.chunks[1]
+        assert first.assets()[0].interest_rate == 5.0
+
+    def test_retention_by_count_and_age(self):
+        """Test that the oldest versions are pruned, never the latest."""
+        # Arrange
+        history = AssetsListHistory(
+            max_versions=2, max_age_seconds=3600, clock=self.clock
+        )
+        assets_list = AssetsList.from_columns(["id_1"], [1.0])
+
+        # Act
+        for version in range(1, 4):
+            history.record("key", assets_list, version)
+        kept_by_count = [version.version for version in history.versions("key")]
+        self.clock.advance(120)
+        history.record("key", assets_list, 4)
+
+        # Assert
+        assert kept_by_count == [2, 3]
+        assert [version.version for version in history.versions("key")] == [4]
+
+    def test_history_is_off_by_default(self):
+        """Test that no versions are kept without a retention."""
+        # Arrange
+        history = AssetsListHistory()
+        repository = InMemoryAssetsListRepository(
+            InMemoryDatabase[AssetsList](), history=history
+        )
+
+        # Act
+        repository.save(AssetsList.from_columns(["id_1"], [1.0]))
+
+        # Assert
+        assert history.versions(repository.key) == []
+        with pytest.raises(HistoryUnavailableError):
+            repository.get_history()
+        with pytest.raises(HistoryUnavailableError):
+            InMemoryAssetsListRepository(InMemoryDatabase[AssetsList]()).get_history()
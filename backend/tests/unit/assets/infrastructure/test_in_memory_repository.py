@@ -0,0 +1,47 @@
+import numpy as np
+
+from app.contexts.assets.domain.entities.assets_list import AssetsList
+from app.contexts.assets.domain.services.what_if.scenarios import ScenarioDeltas
+from app.contexts.assets.infrastructure.persistence.assets_list.in_memory_repository import (
+    InMemoryAssetsListRepository,
+)
+from app.contexts.shared.infrastructure.in_memory_database import InMemoryDatabase
+
+
+class TestInMemoryAssetsListRepository:
+    """Test cases for the queries of the in-memory repository."""
+
+    def setup_method(self):
+        self.repository = InMemoryAssetsListRepository(InMemoryDatabase[AssetsList]())
+
+    def test_scenarios_leave_the_list_unchanged(self):
+        """Test the outcome of each scenario, with the list left as it was."""
+        # Arrange
+        self.repository.save(
+            AssetsList.from_columns(["id_1", "id_2", "id_3"], [5.0, 10.0, 15.0])
+        )
+        self.repository.update_assets(["id_2"], np.array([10.0]))
+        deltas = ScenarioDeltas(
+            3, [0, 2], ["id_4", "id_5"], [30.0, 0.0], [1, 2], ["id_3", "id_1"]
+        )
+
+        # Act
+        outcomes = self.repository.evaluate_scenarios(deltas)
+
+        # Assert
+        assert outcomes.asset_counts.tolist() == [4, 2, 3]
+        assert outcomes.avg_interest_rates.tolist() == [15.0, 7.5, 25.0 / 3]
+        assert self.repository.get_average_interest_rate() == 10.0
+        assert self.repository.get_asset("id_3").interest_rate == 15.0
+
+    def test_scenarios_of_a_missing_list(self):
+        """Test that scenarios against a missing list start from an empty one."""
+        # Arrange
+        deltas = ScenarioDeltas(1, [0], ["id_1"], [4.0], [], [])
+
+        # Act
+        outcomes = self.repository.evaluate_scenarios(deltas)
+
+        # Assert
+        assert outcomes.asset_counts.tolist() == [1]
+        assert outcomes.avg_interest_rates.tolist() == [4.0]
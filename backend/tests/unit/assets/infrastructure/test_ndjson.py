@@ -0,0 +1,55 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.contexts.assets.infrastructure.api.errors import InvalidRecordError
+from app.contexts.assets.infrastructure.api.ndjson import iter_ndjson_asset_chunks
+
+
+async def _stream(data: bytes, piece_size: int):
+    for start in range(0, len(data), piece_size):
+        yield data[start : start + piece_size]
+
+
+def parse(data: bytes, piece_size: int = 5, chunk_size: int = 2):
+    async def collect():
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return [
+                (list(chunk.asset_ids), chunk.interest_rates.tolist())
+                async for chunk in iter_ndjson_asset_chunks(
+                    _stream(data, piece_size), chunk_size, executor
+                )
+            ]
+
+    return asyncio.run(collect())
+
+
+class TestIterNdjsonAssetChunks:
+    def test_parses_lines_in_chunks(self):
+        """Test that lines are parsed a chunk at a time, blank ones skipped."""
+        # Arrange
+        data = (
+            b'{"id": "id_1", "interest_rate": 5}\n'
+            b'{"id": "id_2", "interest_rate": 10}\n'
+            b"\n"
+            b'{"id": "id_3", "interest_rate": 15}'
+        )
+
+        # Act
+        chunks = parse(data)
+
+        # Assert
+        assert chunks == [(["id_1", "id_2"], [5.0, 10.0]), (["id_3"], [15.0])]
+
+    def test_reports_the_line_of_a_later_chunk(self):
+        """Test that line numbers carry on across chunks."""
+        # Arrange
+        data = b'{"id": "id_1", "interest_rate": 5}\n\n\n{"id": "id_2"}\n'
+
+        # Act
+        with pytest.raises(InvalidRecordError) as exc_info:
+            parse(data)
+
+        # Assert
+        assert exc_info.value.line_number == 4
@@ -0,0 +1,74 @@
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+
+from app.contexts.assets.infrastructure.api.errors import InvalidPayloadError
+from app.contexts.assets.infrastructure.api.payloads import (
+    parse_save_assets_list_body,
+)
+from app.contexts.shared.infrastructure.json_codec import MsgspecJsonCodec
+
+
+class TestParseSaveAssetsListBody:
+    def test_parses_body_into_columns(self):
+        """Test that a valid body becomes an id list and a rates column."""
+        # Act
+        asset_ids, interest_rates, amounts, tags = parse_save_assets_list_body(
+            b'{"assets": [{"id": "id_1", "interest_rate": 5}, '
+            b'{"id": "id_2", "interest_rate": 15.5}]}'
+        )
+
+        # Assert
+        assert asset_ids == ["id_1", "id_2"]
+        assert interest_rates.dtype == np.float64
+        assert interest_rates.tolist() == [5.0, 15.5]
+        assert amounts is None and tags is None
+
+    def test_codec_leaves_amounts_and_tags_to_the_dto(self):
+        """Test that records with other fields than the id and rate keep them."""
+        # Act
+        asset_ids, interest_rates, amounts, tags = parse_save_assets_list_body(
+            b'{"assets": [{"id": "amount", "interest_rate": 5}, '
+            b'{"id": "tags", "interest_rate": 1, "amount": 100, '
+            b'"tags": {"desk": "rates"}}]}',
+            MsgspecJsonCodec(),
+        )
+
+        # Assert
+        assert asset_ids == ["amount", "tags"]
+        assert interest_rates.tolist() == [5.0, 1.0]
+        assert amounts is not None
+        assert amounts[1] == 100.0
+        assert tags is not None
+
+    def test_invalid_body_raises_picklable_error(self):
+        """Test that validation errors survive the trip back from a worker."""
+        # Act
+        with pytest.raises(InvalidPayloadError) as exc_info:
+            parse_save_assets_list_body(b'{"assets": [{"id": "id_1"}]}')
+        error = pickle.loads(pickle.dumps(exc_info.value))
+
+        # Assert
+        assert error.errors[0]["loc"] == ("assets", 0, "interest_rate")
+        assert error.errors[0]["type"] == "missing"
+
+    def test_parses_in_a_worker_process(self):
+        """Test that the parser runs on a spawned process pool."""
+        # Arrange
+        context = multiprocessing.get_context("spawn")
+
+        # Act
+        with ProcessPoolExecutor(1, mp_context=context) as executor:
+            asset_ids, interest_rates, *_ = executor.submit(
+                parse_save_assets_list_body,
+                b'{"assets": [{"id": "id_1", "interest_rate": 5}]}',
+            ).result()
+            with pytest.raises(InvalidPayloadError):
+                executor.submit(parse_save_assets_list_body, b"not json").result()
+
+        # Assert
+        assert asset_ids == ["id_1"]
+        assert interest_rates.tolist() == [5.0]
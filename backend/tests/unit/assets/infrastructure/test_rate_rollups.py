@@ -0,0 +1,120 @@
+from datetime import UTC, datetime
+
+import numpy as np
+import pytest
+
+from app.contexts.assets.domain.entities.assets_list import AssetsList
+from app.contexts.assets.domain.entities.errors import HistoryUnavailableError
+from app.contexts.assets.domain.services.rate_rollups.series import Resolution
+from app.contexts.assets.infrastructure.persistence.assets_list.in_memory_repository import (
+    InMemoryAssetsListRepository,
+)
+from app.contexts.assets.infrastructure.persistence.assets_list.rate_rollups import (
+    AverageRateRollups,
+)
+from app.contexts.shared.infrastructure.in_memory_database import InMemoryDatabase
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = datetime(2026, 1, 1, 12, 0, tzinfo=UTC).timestamp()
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class TestAverageRateRollups:
+    @pytest.fixture(autouse=True)
+    def setup_rollups(self):
+        """Set up a repository rolling up its writes at controlled times."""
+        self.clock = _Clock()
+        self.rollups = AverageRateRollups(
+            minute_retention_seconds=3600, clock=self.clock
+        )
+        self.repository = InMemoryAssetsListRepository(
+            InMemoryDatabase[AssetsList](), rollups=self.rollups
+        )
+
+    def test_every_write_feeds_the_rollups(self):
+        """Test that saves and edits record the average they leave."""
+        # Arrange
+        self.repository.save(AssetsList.from_columns(["id_1", "id_2"], [5.0, 15.0]))
+        self.clock.advance(10)
+        self.repository.add_assets(["id_3"], np.array([40.0]))
+        self.clock.advance(60)
+        self.repository.update_assets(["id_3"], np.array([10.0]))
+
+        # Act
+        minutes = self.repository.get_rate_series(Resolution.MINUTE)
+        hours = self.repository.get_rate_series(Resolution.HOUR)
+
+        # Assert
+        assert [
+            (point.min, point.max, point.mean, point.last, point.value_count)
+            for point in minutes
+        ] == [(10.0, 20.0, 15.0, 20.0, 2), (10.0, 10.0, 10.0, 10.0, 1)]
+        assert [(point.mean, point.value_count) for point in hours] == [(40.0 / 3, 3)]
+
+    def test_range_is_given_as_datetimes(self):
+        """Test that the range selects buckets by their start."""
+        # Arrange
+        for _ in range(3):
+            self.repository.save(AssetsList.from_columns(["id_1"], [5.0]))
+            self.clock.advance(60)
+
+        # Act
+        points = self.repository.get_rate_series(
+            Resolution.MINUTE,
+            start=datetime(2026, 1, 1, 12, 1, 30, tzinfo=UTC),
+        )
+
+        # Assert
+        assert [
+            datetime.fromtimestamp(point.start, UTC).minute for point in points
+        ] == [
+            1,
+            2,
+        ]
+
+    def test_old_buckets_are_dropped_per_resolution(self):
+        """Test that minutes past their retention go while hours stay."""
+        # Arrange
+        self.repository.save(AssetsList.from_columns(["id_1"], [5.0]))
+        self.clock.advance(2 * 3600)
+
+        # Act
+        self.repository.save(AssetsList.from_columns(["id_1"], [7.0]))
+
+        # Assert
+        assert [
+            point.last for point in self.repository.get_rate_series(Resolution.MINUTE)
+        ] == [7.0]
+        assert [
+            point.last for point in self.repository.get_rate_series(Resolution.HOUR)
+        ] == [5.0, 7.0]
+
+    def test_clock_stepping_back_stays_in_order(self):
+        """Test that a write at an earlier time lands in the latest bucket."""
+        # Arrange
+        self.clock.advance(120)
+        self.rollups.record("key", 1.0)
+        self.clock.advance(-120)
+
+        # Act
+        self.rollups.record("key", 3.0)
+
+        # Assert
+        [point] = self.rollups.points("key", Resolution.MINUTE)
+        assert (point.value_count, point.last) == (2, 3.0)
+
+    def test_unavailable_without_rollups(self):
+        """Test that a repository built without rollups says so."""
+        # Arrange
+        repository = InMemoryAssetsListRepository(InMemoryDatabase[AssetsList]())
+
+        # Act / Assert
+        with pytest.raises(HistoryUnavailableError):
+            repository.get_rate_series(Resolution.HOUR)
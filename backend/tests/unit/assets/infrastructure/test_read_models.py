@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+from app.contexts.assets.domain.entities.assets_list import AssetsList
+from app.contexts.assets.domain.entities.assets_list_read_models import (
+    AssetsListReadModels,
+)
+from app.contexts.assets.domain.entities.errors import AssetNotFoundError
+from app.contexts.assets.domain.services.rate_statistics.sketches import RateSketch
+from app.contexts.assets.infrastructure.persistence.assets_list.in_memory_repository import (
+    InMemoryAssetsListRepository,
+)
+from app.contexts.assets.infrastructure.persistence.assets_list.read_models import (
+    AssetsListReadModelStore,
+)
+from app.contexts.shared.infrastructure.in_memory_database import InMemoryDatabase
+
+
+class TestAssetsListReadModelStore:
+    """Test cases for the read models kept next to the stored assets lists."""
+
+    @pytest.fixture(autouse=True)
+    def setup_repository(self):
+        """Set up a repository keeping its read models in a shared store."""
+        self.database = InMemoryDatabase[AssetsList]()
+        self.store = AssetsListReadModelStore()
+        self.repository = InMemoryAssetsListRepository(
+            self.database, read_models=self.store
+        )
+
+    def stored_read_models(self):
+        assets_list = self.database.get(self.repository.key)
+        version = self.database.get_version(self.repository.key)
+        return self.store.get(self.repository.key, assets_list, version)
+
+    def test_saved_read_models_are_kept(self):
+        """Test that the models handed over on save answer the reads."""
+        # Arrange
+        assets_list = AssetsList.from_columns(["a", "b"], [1.0, 3.0])
+        rate_sketch = RateSketch.from_values(assets_list.interest_rates)
+
+        # Act
+        self.repository.save(
+            assets_list, AssetsListReadModels(assets_list, rate_sketch=rate_sketch)
+        )
+
+        # Assert
+        assert self.repository.get_rate_statistics().max == 3.0
+        assert self.stored_read_models().rate_sketch is rate_sketch
+
+    def test_writes_fold_into_the_models_of_the_next_version(self):
+        """Test that a write files the models it folded under its version."""
+        # Arrange
+        self.repository.add_assets(["a", "b"], np.array([1.0, 3.0]))
+        self.repository.get_rate_statistics()
+        rate_sketch = self.stored_read_models().rate_sketch
+
+        # Act
+        self.repository.add_assets(["c"], np.array([8.0]))
+
+        # Assert
+        assert self.stored_read_models().rate_sketch is rate_sketch
+        statistics = self.repository.get_rate_statistics()
+        assert (statistics.asset_count, statistics.max) == (3, 8.0)
+
+    def test_lists_changed_elsewhere_get_new_models(self):
+        """Test that a list set without the repository, as on restart, is not
+        answered from the models of the list it replaced."""
+        # Arrange
+        self.repository.add_assets(["a", "b"], np.array([1.0, 3.0]))
+        self.repository.get_rate_statistics()
+
+        # Act
+        self.database.set(self.repository.key, AssetsList.from_columns(["c"], [20.0]))
+
+        # Assert
+        statistics = self.repository.get_rate_statistics()
+        assert (statistics.asset_count, statistics.max) == (1, 20.0)
+
+    def test_failed_writes_leave_the_models(self):
+        """Test that an update of unknown ids leaves the statistics alone."""
+        # Arrange
+        self.repository.add_assets(["a", "b"], np.array([1.0, 3.0]))
+        before = self.repository.get_rate_statistics()
+
+        # Act
+        with pytest.raises(AssetNotFoundError):
+            self.repository.update_assets(["a", "z"], np.array([5.0, 6.0]))
+
+        # Assert
+        assert self.repository.get_rate_statistics() == before
@@ -0,0 +1,123 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, Mock
+
+from app.contexts.assets.domain.repositories.async_assets_list_repository import (
+    AsyncAssetsListRepository,
+)
+from app.contexts.assets.infrastructure.api.response_cache import (
+    InterestRateResponseCache,
+    etag_matches,
+)
+
+
+class TestInterestRateResponseCache:
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.mock_repository = AsyncMock(spec=AsyncAssetsListRepository)
+        self.mock_repository.get_version.return_value = 1
+        self.mock_service = AsyncMock(return_value=10.0)
+        self.mock_service.weighted.return_value = None
+        self.mock_service_factory = Mock(return_value=self.mock_service)
+        self.cache = InterestRateResponseCache(
+            get_average_interest_rate_service_factory=self.mock_service_factory,
+        )
+
+    def get(self, portfolio_id=None):
+        return asyncio.run(self.cache.get(self.mock_repository, portfolio_id))
+
+    def test_encodes_response_once_per_version(self):
+        """Test that the body is only rebuilt when the repository version changes."""
+        # Act
+        first = self.get()
+        second = self.get()
+
+        # Assert
+        assert second is first
+        assert json.loads(first.body) == {
+            "average_interest_rate": 10.0,
+            "weighted_average_interest_rate": None,
+        }
+        self.mock_service.assert_awaited_once()
+
+    def test_new_version_rebuilds_body_and_etag(self):
+        """Test that a write invalidates the cached body and its ETag."""
+        # Arrange
+        first = self.get()
+        self.mock_repository.get_version.return_value = 2
+        self.mock_service.return_value = 12.5
+
+        # Act
+        second = self.get()
+
+        # Assert
+        assert json.loads(second.body) == {
+            "average_interest_rate": 12.5,
+            "weighted_average_interest_rate": None,
+        }
+        assert second.etag != first.etag
+
+    def test_entries_are_kept_per_portfolio(self):
+        """Test that each portfolio gets its own cached body."""
+        # Act
+        self.get("portfolio_1")
+        self.get("portfolio_2")
+        self.get("portfolio_1")
+
+        # Assert
+        self.mock_service_factory.assert_called_with(
+            assets_list_repository=self.mock_repository
+        )
+        assert self.mock_service.await_count == 2
+
+    def test_reads_go_through_the_async_repository(self):
+        """Test that a fresh entry costs one awaited version check."""
+        # Arrange
+        self.get()
+
+        # Act
+        self.get()
+
+        # Assert
+        assert self.mock_repository.get_version.await_count == 2
+        self.mock_service.assert_awaited_once()
+
+    def test_portfolios_without_a_list_are_not_cached(self):
+        """Test that reads of unknown portfolio ids leave no entries behind."""
+        # Arrange
+        self.mock_repository.get_version.return_value = 0
+        self.mock_service.return_value = None
+
+        # Act
+        for index in range(100):
+            response = self.get(f"unknown_{index}")
+
+        # Assert
+        assert json.loads(response.body)["average_interest_rate"] is None
+        assert len(self.cache._cached) == 0
+
+    def test_entries_are_bounded_by_recent_use(self):
+        """Test that many stored portfolios keep only the recently read ones."""
+        # Arrange
+        self.cache.max_entries = 3
+        self.get("portfolio_0")
+
+        # Act
+        for index in range(1, 50):
+            self.get("portfolio_0")
+            self.get(f"portfolio_{index}")
+
+        # Assert
+        assert list(self.cache._cached) == [
+            "portfolio_48",
+            "portfolio_0",
+            "portfolio_49",
+        ]
+
+    def test_etag_matches(self):
+        """Test If-None-Match parsing for lists, weak tags and wildcards."""
+        assert etag_matches('"abc"', '"abc"')
+        assert etag_matches('"x", W/"abc"', '"abc"')
+        assert etag_matches("*", '"abc"')
+        assert not etag_matches('"x"', '"abc"')
+        assert not etag_matches(None, '"abc"')
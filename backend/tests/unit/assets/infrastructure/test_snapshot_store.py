@@ -0,0 +1,198 @@
+import numpy as np
+import pytest
+
+from app.contexts.assets.domain.entities.assets_list import AssetsList
+from app.contexts.assets.domain.entities.assets_list_read_models import (
+    AssetsListReadModels,
+)
+from app.contexts.assets.infrastructure.persistence.assets_list.in_memory_repository import (
+    InMemoryAssetsListRepository,
+)
+from app.contexts.assets.infrastructure.persistence.assets_list.snapshot_store import (
+    AssetsListSnapshotStore,
+    AssetsListSnapshotter,
+    MappedIdColumn,
+    decode_assets_list,
+    encode_assets_list,
+)
+from app.contexts.shared.infrastructure.in_memory_database import InMemoryDatabase
+
+
+class TestAssetsListSnapshotStore:
+    @pytest.fixture(autouse=True)
+    def setup_store(self, tmp_path):
+        """Set up a snapshot store in a fresh directory for each test."""
+        self.store = AssetsListSnapshotStore(tmp_path / "snapshots")
+        self.assets_list = AssetsList.from_columns(
+            ["id_1", "id_2", "ñandú"], [5.0, 10.0, 15.0]
+        )
+
+    def test_round_trip_keeps_the_aggregate(self):
+        """Test that a loaded snapshot equals the list that was written."""
+        # Arrange
+        self.store.write("portfolios/a/assets_list", self.assets_list)
+
+        # Act
+        loaded = self.store.load("portfolios/a/assets_list")
+
+        # Assert
+        assert loaded == self.assets_list
+        assert loaded.avg_interest_rate == 10.0
+        assert loaded.get_asset("ñandú").interest_rate == 15.0
+
+    def test_loaded_columns_are_memory_mapped(self):
+        """Test that loading maps the columns instead of rebuilding them."""
+        # Arrange
+        self.store.write("assets_list", self.assets_list)
+
+        # Act
+        loaded = self.store.load("assets_list")
+
+        # Assert
+        assert isinstance(loaded.asset_ids, MappedIdColumn)
+        assert not loaded.interest_rates.flags.writeable
+
+    def test_mutating_a_loaded_list_copies_its_columns(self):
+        """Test that changes go to writable copies, leaving the file intact."""
+        # Arrange
+        self.store.write("assets_list", self.assets_list)
+        loaded = self.store.load("assets_list")
+
+        # Act
+        loaded.update_assets(["id_1"], np.array([20.0]))
+        loaded.remove_assets(["id_2"])
+
+        # Assert
+        assert loaded.avg_interest_rate == 17.5
+        assert self.store.load("assets_list") == self.assets_list
+
+    def test_round_trip_keeps_the_amounts(self):
+        """Test that amounts and the weighted average survive a snapshot."""
+        # Arrange
+        assets_list = AssetsList.from_columns(
+            ["id_1", "id_2"], [5.0, 15.0], amounts=[100.0, np.nan]
+        )
+        self.store.write("assets_list", assets_list)
+
+        # Act
+        loaded = self.store.load("assets_list")
+        loaded.update_assets(["id_2"], np.array([15.0]), np.array([100.0]))
+
+        # Assert
+        assert loaded.weighted_avg_interest_rate == 10.0
+        assert self.store.load("assets_list") == assets_list
+
+    def test_round_trip_keeps_the_tags(self):
+        """Test that tag columns and their groups survive a snapshot."""
+        # Arrange
+        assets_list = AssetsList.from_columns(
+            ["id_1", "id_2", "id_3"], [5.0, 10.0, 15.0]
+        )
+        assets_list.update_assets(
+            ["id_1", "id_3"], np.array([5.0, 15.0]), tags={"région": ["eu", "us"]}
+        )
+        self.store.write("assets_list", assets_list)
+
+        # Act
+        loaded = self.store.load("assets_list")
+        loaded.update_assets(["id_2"], np.array([10.0]), tags={"région": ["eu"]})
+
+        # Assert
+        read_models = AssetsListReadModels(loaded)
+        assert [tuple(group) for group in read_models.group_rates("région")] == [
+            ("eu", 2, 15.0),
+            ("us", 1, 15.0),
+        ]
+        assert self.store.load("assets_list") == assets_list
+
+    def test_load_all_and_missing_key(self):
+        """Test that every stored key is loaded and unknown keys are None."""
+        # Arrange
+        self.store.write("assets_list", self.assets_list)
+        self.store.write("portfolios/a/assets_list", self.assets_list)
+
+        # Act
+        loaded = self.store.load_all()
+
+        # Assert
+        assert set(loaded) == {"assets_list", "portfolios/a/assets_list"}
+        assert self.store.load("portfolios/b/assets_list") is None
+
+    def test_lists_encode_to_bytes_and_back(self):
+        """Test that the snapshot format also round-trips in memory."""
+        # Arrange
+        assets_list = AssetsList.from_columns(
+            ["id_1", "id_2"], [5.0, 15.0], amounts=[100.0, np.nan]
+        )
+
+        # Act
+        decoded = decode_assets_list(encode_assets_list(assets_list))
+
+        # Assert
+        assert decoded == assets_list
+        assert decoded.weighted_avg_interest_rate == 5.0
+
+    def test_rejects_files_that_are_not_snapshots(self):
+        """Test that a foreign file is not mistaken for a snapshot."""
+        # Arrange
+        self.store.directory.mkdir(parents=True)
+        (self.store.directory / "assets_list.snapshot").write_bytes(b"\0" * 64)
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            self.store.load("assets_list")
+
+    def test_load_all_skips_unreadable_snapshots(self, caplog):
+        """Test that a bad file is logged and the other lists still load."""
+        # Arrange
+        self.store.write("assets_list", self.assets_list)
+        (self.store.directory / "old.snapshot").write_bytes(b"ASSETS02" + b"\0" * 64)
+        (self.store.directory / "empty.snapshot").write_bytes(b"")
+
+        # Act
+        loaded = self.store.load_all()
+
+        # Assert
+        assert set(loaded) == {"assets_list"}
+        assert len(caplog.records) == 2
+
+
+class TestAssetsListSnapshotter:
+    @pytest.fixture(autouse=True)
+    def setup_snapshotter(self, tmp_path):
+        """Set up a database with a snapshotter writing to a fresh directory."""
+        self.store = AssetsListSnapshotStore(tmp_path)
+        self.database = InMemoryDatabase[AssetsList](shard_count=4)
+        self.snapshotter = AssetsListSnapshotter(self.database, self.store)
+        self.repository = InMemoryAssetsListRepository(self.database)
+
+    def test_snapshot_writes_only_changed_lists(self):
+        """Test that unchanged lists are not rewritten."""
+        # Arrange
+        self.repository.save(AssetsList.from_columns(["id_1"], [5.0]))
+
+        # Act
+        first = self.snapshotter.snapshot()
+        second = self.snapshotter.snapshot()
+        self.repository.add_assets(["id_2"], np.array([15.0]))
+        third = self.snapshotter.snapshot()
+
+        # Assert
+        assert (first, second, third) == (1, 0, 1)
+        assert self.store.load("assets_list").avg_interest_rate == 10.0
+
+    def test_restore_fills_a_fresh_database(self):
+        """Test that a restarted database serves the snapshotted lists."""
+        # Arrange
+        self.repository.save(AssetsList.from_columns(["id_1", "id_2"], [5.0, 15.0]))
+        self.snapshotter.snapshot()
+        database = InMemoryDatabase[AssetsList](shard_count=4)
+
+        # Act
+        restored = AssetsListSnapshotter(database, self.store).restore()
+
+        # Assert
+        assert restored == 1
+        repository = InMemoryAssetsListRepository(database)
+        assert repository.get_average_interest_rate() == 10.0
+        assert repository.add_assets(["id_3"], np.array([25.0])) == 15.0
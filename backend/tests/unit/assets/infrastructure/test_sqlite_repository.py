@@ -0,0 +1,280 @@
+import numpy as np
+import pytest
+
+from app.contexts.assets.domain.entities.assets_list import AssetsList
+from app.contexts.assets.domain.entities.errors import (
+    AssetNotFoundError,
+    DuplicateAssetIdError,
+)
+from app.contexts.assets.domain.services.interest_rate_avg_calculator.errors import (
+    EmptyListError,
+)
+from app.contexts.assets.domain.services.what_if.scenarios import ScenarioDeltas
+from app.contexts.assets.infrastructure.persistence.assets_list.sqlite_repository import (
+    SqliteAssetsListRepository,
+)
+from app.contexts.shared.infrastructure.sqlite_database import SqliteDatabase
+from app.core.containers.container import Container
+
+
+class TestSqliteAssetsListRepository:
+    @pytest.fixture(autouse=True)
+    def setup_database(self, tmp_path):
+        """Set up a fresh database file for each test."""
+        self.database = SqliteDatabase(
+            str(tmp_path / "assets.db"), schema=SqliteAssetsListRepository.schema
+        )
+        self.repository = SqliteAssetsListRepository(self.database)
+        self.repository.save(
+            AssetsList.from_columns(["id_1", "id_2", "id_3"], [5.0, 10.0, 15.0])
+        )
+
+    def _stored_rates(self) -> dict[str, float]:
+        return dict(
+            self.database.connection.execute(
+                "SELECT asset_id, interest_rate FROM assets WHERE storage_key = ?",
+                (self.repository.key,),
+            ).fetchall()
+        )
+
+    def test_database_runs_in_wal_mode(self):
+        """Test that connections are opened in WAL journal mode."""
+        (journal_mode,) = self.database.connection.execute(
+            "PRAGMA journal_mode"
+        ).fetchone()
+
+        assert journal_mode == "wal"
+
+    def test_save_stores_assets_and_average(self):
+        """Test that a saved list is readable as a precomputed average."""
+        assert self.repository.get_average_interest_rate() == 10.0
+        assert self._stored_rates() == {"id_1": 5.0, "id_2": 10.0, "id_3": 15.0}
+        assert self.repository.get_version() == 1
+
+    def test_save_replaces_previous_list(self):
+        """Test that saving again replaces the stored assets."""
+        # Act
+        self.repository.save(AssetsList.from_columns(["id_9"], [1.0]))
+
+        # Assert
+        assert self._stored_rates() == {"id_9": 1.0}
+        assert self.repository.get_average_interest_rate() == 1.0
+        assert self.repository.get_version() == 2
+
+    def test_get_average_without_saved_list(self):
+        """Test that an unknown portfolio has no average and version 0."""
+        repository = SqliteAssetsListRepository(self.database, portfolio_id="p1")
+
+        assert repository.get_average_interest_rate() is None
+        assert repository.get_version() == 0
+
+    def test_add_update_remove_assets(self):
+        """Test that incremental writes keep the stored aggregate in sync."""
+        # Act & Assert
+        assert self.repository.add_assets(["id_4"], np.array([30.0])) == 15.0
+        assert self.repository.update_assets(["id_1"], np.array([25.0])) == 20.0
+        assert self.repository.remove_assets(["id_4", "id_2"]) == 20.0
+        assert self._stored_rates() == {"id_1": 25.0, "id_3": 15.0}
+        assert self.repository.get_average_interest_rate() == 20.0
+        assert self.repository.get_version() == 4
+
+    def test_weighted_average_follows_the_amounts(self):
+        """Test that amounts are stored and the weighted sums kept in sync."""
+        # Arrange
+        assert self.repository.get_weighted_average_interest_rate() is None
+
+        # Act & Assert
+        self.repository.add_assets(
+            ["id_4", "id_5"], np.array([20.0, 40.0]), np.array([100.0, np.nan])
+        )
+        assert self.repository.get_weighted_average_interest_rate() == 20.0
+        self.repository.update_assets(
+            ["id_1", "id_4"], np.array([5.0, 30.0]), np.array([300.0, np.nan])
+        )
+        assert self.repository.get_weighted_average_interest_rate() == 11.25
+        self.repository.remove_assets(["id_1", "id_4"])
+        assert self.repository.get_weighted_average_interest_rate() is None
+        assert self.repository.get_average_interest_rate() == pytest.approx(65 / 3)
+
+    def test_save_stores_amounts(self):
+        """Test that a saved list keeps its amounts, NULL where missing."""
+        # Act
+        self.repository.save(
+            AssetsList.from_columns(
+                ["id_1", "id_2"], [5.0, 15.0], amounts=[np.nan, 200.0]
+            )
+        )
+
+        # Assert
+        assert self.database.connection.execute(
+            "SELECT asset_id, amount FROM assets ORDER BY asset_id"
+        ).fetchall() == [("id_1", None), ("id_2", 200.0)]
+        assert self.repository.get_weighted_average_interest_rate() == 15.0
+
+    def test_rate_statistics_follow_the_writes(self):
+        """Test that the stored sketch is folded into or rebuilt after writes."""
+        # Arrange
+        assert (
+            SqliteAssetsListRepository(
+                self.database, portfolio_id="p1"
+            ).get_rate_statistics()
+            is None
+        )
+
+        # Act & Assert
+        statistics = self.repository.get_rate_statistics()
+        assert statistics is not None
+        assert (statistics.asset_count, statistics.median) == (3, 10.0)
+        self.repository.add_assets(["id_4"], np.array([40.0]))
+        statistics = self.repository.get_rate_statistics()
+        assert statistics is not None
+        assert (statistics.asset_count, statistics.max) == (4, 40.0)
+        self.repository.update_assets(["id_4"], np.array([1.0]))
+        statistics = self.repository.get_rate_statistics()
+        assert statistics is not None
+        assert (statistics.min, statistics.max) == (1.0, 15.0)
+        assert self.repository.get_version() == 3
+
+    def test_rate_histograms_follow_the_writes(self):
+        """Test that the stored histograms are adjusted by every write."""
+        # Act
+        self.repository.add_assets(["id_4"], np.array([12.0]))
+        self.repository.update_assets(["id_1"], np.array([14.0]))
+        self.repository.remove_assets(["id_3"])
+
+        # Assert
+        histograms = self.repository.get_rate_histograms()
+        assert histograms is not None
+        fixed_width = histograms.fixed_width
+        assert (fixed_width.edges[0], fixed_width.edges[-1]) == (5.0, 15.0)
+        assert fixed_width.counts.sum() == 3
+        assert fixed_width.sums.sum() == 36.0
+
+    def test_rate_groups_follow_the_writes(self):
+        """Test that the stored groups and tags are adjusted by every write."""
+        # Act
+        self.repository.add_assets(
+            ["id_4", "id_5"], np.array([12.0, 20.0]), tags={"region": ["eu", "us"]}
+        )
+        self.repository.update_assets(
+            ["id_1", "id_5"], np.array([6.0, 21.0]), tags={"region": ["eu", None]}
+        )
+        self.repository.remove_assets(["id_4"])
+
+        # Assert
+        assert [
+            tuple(group) for group in self.repository.get_rate_groups("region")
+        ] == [
+            ("eu", 1, 6.0),
+            ("us", 1, 21.0),
+        ]
+        asset = self.repository.get_asset("id_5")
+        assert asset is not None
+        assert asset.tags == {"region": "us"}
+        assert self.repository.get_rate_groups("tier") == []
+
+    def test_evaluate_scenarios_reads_the_stored_list(self):
+        """Test that scenarios use the stored rates without changing them."""
+        # Arrange
+        deltas = ScenarioDeltas(2, [0], ["id_4"], [20.0], [1], ["id_3"])
+
+        # Act
+        outcomes = self.repository.evaluate_scenarios(deltas)
+
+        # Assert
+        assert outcomes.asset_counts.tolist() == [4, 2]
+        assert outcomes.avg_interest_rates.tolist() == [12.5, 7.5]
+        assert self.repository.get_version() == 1
+        assert self._stored_rates() == {"id_1": 5.0, "id_2": 10.0, "id_3": 15.0}
+
+    def test_queries_use_the_stored_assets(self):
+        """Test the rate range, extreme rates and id lookups."""
+        # Act & Assert
+        assert self.repository.get_rate_range(6.0, 15.0) == (2, 25.0)
+        assert [asset.id for asset in self.repository.get_lowest_rate_assets(2)] == [
+            "id_1",
+            "id_2",
+        ]
+        highest = self.repository.get_highest_rate_assets(1)
+        assert [(asset.id, asset.interest_rate) for asset in highest] == [
+            ("id_3", 15.0)
+        ]
+        asset = self.repository.get_asset("id_2")
+        assert asset is not None
+        assert (asset.interest_rate, asset.amount) == (10.0, None)
+        assert self.repository.get_asset("missing") is None
+
+    def test_add_assets_creates_missing_list(self):
+        """Test that adding to an unknown portfolio creates its list."""
+        repository = SqliteAssetsListRepository(self.database, portfolio_id="p1")
+
+        assert repository.add_assets(["id_1"], np.array([3.0])) == 3.0
+        assert repository.get_average_interest_rate() == 3.0
+
+    def test_add_existing_asset_is_rolled_back(self):
+        """Test that rejected writes leave the stored list untouched."""
+        with pytest.raises(DuplicateAssetIdError) as exc_info:
+            self.repository.add_assets(["id_4", "id_1"], np.array([1.0, 2.0]))
+
+        assert exc_info.value.duplicate_ids == ["id_1"]
+        assert len(self._stored_rates()) == 3
+        assert self.repository.get_version() == 1
+
+    def test_update_missing_asset_raises_not_found(self):
+        """Test that unknown ids are reported."""
+        with pytest.raises(AssetNotFoundError) as exc_info:
+            self.repository.update_assets(["id_1", "missing"], np.array([1.0, 2.0]))
+
+        assert exc_info.value.missing_ids == ["missing"]
+        assert self.repository.get_average_interest_rate() == 10.0
+
+    def test_remove_all_assets_raises_empty_list_error(self):
+        """Test that the stored list cannot be emptied."""
+        with pytest.raises(EmptyListError):
+            self.repository.remove_assets(["id_1", "id_2", "id_3"])
+
+        assert len(self._stored_rates()) == 3
+
+    def test_container_selects_sqlite_backend(self, tmp_path):
+        """Test that the container swaps in SQLite through configuration."""
+        # Arrange
+        container = Container()
+        container.config.from_dict(
+            {
+                "assets_list_backend": "sqlite",
+                "sqlite_path": str(tmp_path / "container.db"),
+                "database_shard_count": 4,
+            }
+        )
+
+        # Act
+        repository = container.assets_list_services.assets_list_repository(
+            portfolio_id="p1"
+        )
+
+        # Assert
+        assert isinstance(repository, SqliteAssetsListRepository)
+        assert repository.key == "portfolios/p1/assets_list"
+
+    def test_async_repository_takes_the_portfolio_id(self, tmp_path):
+        """Test that the async view is scoped through its own parameter."""
+        # Arrange
+        container = Container()
+        container.config.from_dict(
+            {
+                "assets_list_backend": "sqlite",
+                "sqlite_path": str(tmp_path / "container.db"),
+                "database_shard_count": 4,
+                "executor_max_workers": 1,
+            }
+        )
+
+        # Act
+        repository = container.assets_list_services.async_assets_list_repository(
+            portfolio_id="p1"
+        )
+
+        # Assert
+        assert repository.offload_reads
+        assert repository.repository.key == "portfolios/p1/assets_list"
+        container.executor().shutdown()
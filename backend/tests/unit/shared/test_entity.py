@@ -0,0 +1,104 @@
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from app.contexts.assets.domain.entities.asset import Asset
+from app.contexts.assets.domain.entities.assets_list import AssetsList
+from app.contexts.shared.domain.ids import MonotonicIdGenerator, id_timestamp
+
+
+class TestMonotonicIdGenerator:
+    """Test cases for the ULID-style id generator."""
+
+    def test_ids_sort_in_generation_order(self):
+        """Test that ids keep their order within and across milliseconds."""
+        # Arrange
+        generate = MonotonicIdGenerator()
+
+        # Act
+        ids = [generate() for _ in range(10_000)]
+
+        # Assert
+        assert ids == sorted(ids)
+        assert len(set(ids)) == len(ids)
+        assert all(len(entity_id) == 26 for entity_id in ids)
+
+    def test_ids_stay_ordered_when_the_clock_steps_back(self):
+        """Test that an earlier clock reading reuses the last millisecond."""
+        # Arrange
+        generate = MonotonicIdGenerator()
+        with patch("time.time_ns", return_value=2_000_000_000_000_000):
+            first = generate()
+
+        # Act
+        with patch("time.time_ns", return_value=1_000_000_000_000_000):
+            second = generate()
+
+        # Assert
+        assert second > first
+        assert id_timestamp(second) == id_timestamp(first)
+
+    def test_id_timestamp(self):
+        """Test that the creation time is read back from generated ids only."""
+        # Arrange
+        before = datetime.now() - timedelta(milliseconds=1)
+
+        # Act
+        created_at = id_timestamp(MonotonicIdGenerator()())
+
+        # Assert
+        assert created_at is not None
+        assert before <= created_at <= datetime.now()
+        assert id_timestamp("id_1") is None
+        assert id_timestamp("not-a-ulid-but-26-chars-ok") is None
+
+
+class TestEntity:
+    """Test cases for the slotted domain entities."""
+
+    def test_entities_have_no_instance_dict(self):
+        """Test that entities only hold their slots."""
+        # Act
+        asset = Asset(id="id_1", interest_rate=5)
+        assets_list = AssetsList(assets=[asset])
+
+        # Assert
+        assert not hasattr(asset, "__dict__")
+        assert not hasattr(assets_list, "__dict__")
+        assert asset.interest_rate == 5.0
+
+    def test_generated_ids_carry_the_creation_time(self):
+        """Test that an entity without an id stores no separate timestamp."""
+        # Act
+        asset = Asset(interest_rate=5)
+
+        # Assert
+        assert asset._created_at is None
+        assert asset.created_at == id_timestamp(asset.id)
+
+    def test_value_equality(self):
+        """Test that entities of the same type compare by their field values."""
+        # Arrange
+        created_at = datetime(2024, 1, 1)
+
+        # Act
+        asset = Asset(id="id_1", interest_rate=5, created_at=created_at)
+
+        # Assert
+        assert asset == Asset(id="id_1", interest_rate=5.0, created_at=created_at)
+        assert asset != Asset(id="id_1", interest_rate=6.0, created_at=created_at)
+        assert hash(asset) == hash(Asset(id="id_1", interest_rate=6.0))
+        assert repr(asset) == (
+            "Asset(id='id_1', created_at=datetime.datetime(2024, 1, 1, 0, 0), "
+            "interest_rate=5.0, amount=None, tags={})"
+        )
+
+    def test_rows_share_the_aggregate_timestamp(self):
+        """Test that assets read from a list reuse its created_at object."""
+        # Arrange
+        assets_list = AssetsList.from_columns(["id_1", "id_2"], [1.0, 2.0])
+
+        # Act
+        first, second = assets_list.assets
+
+        # Assert
+        assert first.created_at is second.created_at
@@ -0,0 +1,160 @@
+import threading
+
+from app.contexts.shared.infrastructure.in_memory_database import (
+    Change,
+    InMemoryDatabase,
+    SetValue,
+)
+from app.contexts.shared.infrastructure.write_ahead_log import WriteAheadLog
+
+
+class Increment(Change[int]):
+    """Adds to an integer; logged as a signed number."""
+
+    def __init__(self, amount):
+        self.amount = amount
+
+    def apply(self, value):
+        return (value or 0) + self.amount
+
+
+def encode(change):
+    if isinstance(change, Increment):
+        return f"{change.amount:+d}".encode()
+    return str(change.value).encode()
+
+
+def decode(data):
+    return Increment(int(data)) if data[:1] in b"+-" else SetValue(int(data))
+
+
+def make_log(directory) -> WriteAheadLog[Change[int]]:
+    return WriteAheadLog[Change[int]](directory, encode=encode, decode=decode)
+
+
+class TestInMemoryDatabase:
+    """Test cases for the sharded InMemoryDatabase."""
+
+    def test_get_and_set(self):
+        """Test that values are stored and read back by key."""
+        # Arrange
+        database = InMemoryDatabase[int](shard_count=4)
+
+        # Act
+        database.set("a", 1)
+        database.set("b", 2)
+
+        # Assert
+        assert database.get("a") == 1
+        assert database.get("b") == 2
+        assert database.get("missing") is None
+        assert len(database) == 2
+
+    def test_versions_count_writes_per_key(self):
+        """Test that each key has its own write counter."""
+        # Arrange
+        database = InMemoryDatabase[int](shard_count=4)
+
+        # Act
+        database.set("a", 1)
+        database.set("a", 2)
+        database.set("b", 1)
+
+        # Assert
+        assert database.get_version("a") == 2
+        assert database.get_version("b") == 1
+        assert database.get_version("missing") == 0
+
+    def test_keys_are_spread_over_shards(self):
+        """Test that many keys land in more than one shard."""
+        # Arrange
+        database = InMemoryDatabase[int](shard_count=8)
+
+        # Act
+        for i in range(1000):
+            database.set(f"portfolio_{i}", i)
+
+        # Assert
+        assert all(shard.data for shard in database.shards)
+        assert len(database) == 1000
+
+    def test_lock_is_shared_by_keys_of_the_same_shard_only(self):
+        """Test that a held shard lock does not block other shards."""
+        # Arrange
+        database = InMemoryDatabase[int](shard_count=2)
+        keys = [f"key_{i}" for i in range(10)]
+        locked_key = keys[0]
+        other_key = next(
+            key for key in keys if database.lock(key) is not database.lock(locked_key)
+        )
+        written = threading.Event()
+
+        # Act
+        with database.lock(locked_key):
+            thread = threading.Thread(
+                target=lambda: (database.set(other_key, 1), written.set())
+            )
+            thread.start()
+            thread.join(timeout=1)
+
+        # Assert
+        assert written.is_set()
+
+    def test_logged_writes_survive_a_restart(self, tmp_path):
+        """Test that a new database replays the writes of the attached log."""
+        # Arrange
+        database = InMemoryDatabase[int](shard_count=4)
+        database.attach_log(make_log(tmp_path))
+        database.set("a", 1)
+        with database.lock("b"):
+            database.set("b", 2)
+            database.set("b", 3)
+        database.log.close()
+
+        # Act
+        restarted = InMemoryDatabase[int](shard_count=4)
+        replayed = restarted.attach_log(make_log(tmp_path))
+
+        # Assert
+        assert replayed == 3
+        assert (restarted.get("a"), restarted.get("b")) == (1, 3)
+        assert restarted.get_version("b") == 2
+
+    def test_checkpoint_keeps_the_current_values(self, tmp_path):
+        """Test that a compacted log replays one write per key."""
+        # Arrange
+        database = InMemoryDatabase[int](shard_count=4)
+        database.attach_log(make_log(tmp_path))
+        for value in range(10):
+            database.set("a", value)
+        database.set("b", 1)
+
+        # Act
+        database.checkpoint_log()
+        database.set("b", 2)
+        database.log.close()
+
+        # Assert
+        assert sorted(
+            (key, change.value) for key, change in make_log(tmp_path).replay()
+        ) == [("a", 9), ("b", 1), ("b", 2)]
+
+    def test_logged_changes_are_replayed_onto_the_values(self, tmp_path):
+        """Test that a change encoded ahead is logged instead of the value."""
+        # Arrange
+        database = InMemoryDatabase[int](shard_count=4)
+        database.attach_log(make_log(tmp_path))
+        database.set("a", 10)
+        record = database.log_record("a", Increment(5))
+        with database.lock("a"):
+            database.set("a", 15, record)
+        database.log.close()
+        [segment] = tmp_path.glob("0*.wal")
+
+        # Act
+        restarted = InMemoryDatabase[int](shard_count=4)
+        restarted.attach_log(make_log(tmp_path))
+
+        # Assert
+        assert segment.read_bytes().endswith(b"a+5")
+        assert restarted.get("a") == 15
@@ -0,0 +1,80 @@
+import json
+import pickle
+
+import pytest
+
+from app.contexts.shared.infrastructure.json_codec import (
+    MsgspecJsonCodec,
+    StdlibJsonCodec,
+)
+
+
+@pytest.fixture(params=[MsgspecJsonCodec, StdlibJsonCodec])
+def codec(request):
+    """Run every test against each bundled codec."""
+    return request.param()
+
+
+class TestJsonCodec:
+    """Test cases for the pluggable JSON codecs."""
+
+    def test_round_trip(self, codec):
+        """Test that encoded values decode back to equal values."""
+        # Arrange
+        value = {"average_interest_rate": 7.5, "message": "ñandú", "ids": [1, None]}
+
+        # Act
+        encoded = codec.encode(value)
+
+        # Assert
+        assert isinstance(encoded, bytes)
+        assert codec.decode(encoded) == value
+
+    def test_malformed_input_raises_json_decode_error(self, codec):
+        """Test that malformed bodies raise the error FastAPI handles."""
+        with pytest.raises(json.JSONDecodeError):
+            codec.decode(b'{"assets": [')
+
+    def test_decode_columns(self, codec):
+        """Test that well-typed records are decoded into id and rate columns."""
+        # Arrange
+        body = b'{"assets": [{"id": "a", "interest_rate": 5}, {"id": "b", "interest_rate": 2.5}]}'
+
+        # Act
+        columns = codec.decode_columns(body, "assets", "id", "interest_rate")
+
+        # Assert
+        assert columns is not None
+        asset_ids, interest_rates = columns
+        assert asset_ids == ["a", "b"]
+        assert interest_rates.tolist() == [5.0, 2.5]
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            b'{"assets": [{"id": 1, "interest_rate": 5}]}',
+            b'{"assets": [{"id": "a", "interest_rate": "5"}]}',
+            b'{"assets": [{"id": "a", "interest_rate": true}]}',
+            b'{"assets": [{"id": "a"}]}',
+            b'{"assets": [{"id": "a", "interest_rate": 5, "amount": 100}]}',
+            b'{"assets": [{"id": "a", "interest_rate": 5, "tags": {"x": "1"}}]}',
+            b'{"assets": {"id": "a"}}',
+            b'{"items": []}',
+            b"[1, 2]",
+            b'{"assets": [',
+        ],
+    )
+    def test_decode_columns_rejects_other_shapes(self, codec, body):
+        """Test that anything but well-typed records is left to the DTO."""
+        assert codec.decode_columns(body, "assets", "id", "interest_rate") is None
+
+    def test_codecs_can_be_sent_to_worker_processes(self, codec):
+        """Test that a codec survives pickling with its decoders."""
+        # Arrange
+        codec.decode_columns(b'{"assets": []}', "assets", "id", "interest_rate")
+
+        # Act
+        restored = pickle.loads(pickle.dumps(codec))
+
+        # Assert
+        assert restored.decode(b"[1]") == [1]
@@ -0,0 +1,146 @@
+import threading
+import time
+
+import pytest
+
+from app.contexts.shared.infrastructure import write_ahead_log
+from app.contexts.shared.infrastructure.write_ahead_log import WriteAheadLog
+
+
+def make_log(directory) -> WriteAheadLog[int]:
+    return WriteAheadLog[int](directory, encode=lambda v: str(v).encode(), decode=int)
+
+
+class TestWriteAheadLog:
+    """Test cases for the group-committed WriteAheadLog."""
+
+    @pytest.fixture(autouse=True)
+    def setup_log(self, tmp_path):
+        """Set up an open log in a fresh directory for each test."""
+        self.directory = tmp_path / "wal"
+        self.log = make_log(self.directory)
+        self.log.open()
+
+    def reopen(self) -> list[tuple[str, int]]:
+        self.log.close()
+        self.log = make_log(self.directory)
+        replayed = list(self.log.replay())
+        self.log.open()
+        return replayed
+
+    def test_committed_writes_are_replayed_in_order(self):
+        """Test that a new log over the same directory replays every write."""
+        # Arrange
+        for key, value in [("a", 1), ("b", 2), ("a", 3)]:
+            self.log.commit(self.log.append(self.log.record(key, value)))
+
+        # Act
+        replayed = self.reopen()
+
+        # Assert
+        assert replayed == [("a", 1), ("b", 2), ("a", 3)]
+
+    def test_replay_stops_at_a_torn_record(self):
+        """Test that a record cut short by a crash and what follows are ignored."""
+        # Arrange
+        self.log.commit(self.log.append(self.log.record("a", 1)))
+        self.log.commit(self.log.append(self.log.record("b", 22)))
+        self.log.close()
+        [segment] = list(self.directory.glob("0*.wal"))
+        segment.write_bytes(segment.read_bytes()[:-1])
+
+        # Act
+        replayed = list(make_log(self.directory).replay())
+
+        # Assert
+        assert replayed == [("a", 1)]
+
+    def test_checkpoint_replaces_the_older_segments(self):
+        """Test that compaction keeps the latest values and the later writes."""
+        # Arrange
+        for value in range(5):
+            self.log.commit(self.log.append(self.log.record("a", value)))
+
+        # Act
+        self.log.checkpoint(lambda: [(self.log.record("a", 4), 5)])
+        self.log.commit(self.log.append(self.log.record("b", 1)))
+
+        # Assert
+        assert sorted(path.name for path in self.directory.iterdir()) == [
+            "00000000000000000001.wal",
+            "checkpoint.00000000000000000001.wal",
+        ]
+        assert self.reopen() == [("a", 4), ("b", 1)]
+
+    def test_replay_skips_the_writes_a_checkpointed_value_includes(self):
+        """Test that a write logged after the segment switch is not replayed
+        twice when the checkpointed value already includes it."""
+        # Arrange
+        self.log.commit(self.log.append(self.log.record("a", 1)))
+
+        def latest():
+            # A writer gets in between the segment switch and the checkpoint
+            self.log.commit(self.log.append(self.log.record("a", 2)))
+            yield self.log.record("a", 2), self.log.appended
+            self.log.commit(self.log.append(self.log.record("a", 3)))
+
+        # Act
+        self.log.checkpoint(latest)
+
+        # Assert
+        assert self.reopen() == [("a", 2), ("a", 3)]
+
+    def test_reopening_after_a_checkpoint_appends_after_it(self):
+        """Test that writes after a restart are not skipped by the checkpoint."""
+        # Arrange
+        self.log.commit(self.log.append(self.log.record("a", 1)))
+        self.log.checkpoint(lambda: [(self.log.record("a", 1), 1)])
+        for path in self.directory.glob("0*.wal"):
+            path.unlink()
+        self.reopen()
+
+        # Act
+        self.log.commit(self.log.append(self.log.record("a", 2)))
+
+        # Assert
+        assert self.reopen() == [("a", 1), ("a", 2)]
+
+    def test_concurrent_commits_share_fsyncs(self, monkeypatch):
+        """Test that writers arriving during an fsync are synced together."""
+        # Arrange
+        fsyncs = []
+
+        def slow_fsync(descriptor):
+            fsyncs.append(descriptor)
+            time.sleep(0.05)
+
+        monkeypatch.setattr(write_ahead_log.os, "fsync", slow_fsync)
+        writer_count = 8
+        barrier = threading.Barrier(writer_count)
+
+        def write(value):
+            barrier.wait()
+            self.log.commit(self.log.append(self.log.record(f"key_{value}", value)))
+
+        # Act
+        threads = [
+            threading.Thread(target=write, args=(value,))
+            for value in range(writer_count)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        assert 1 <= len(fsyncs) < writer_count
+        assert len(self.reopen()) == writer_count
+
+    def test_append_requires_an_open_log(self):
+        """Test that writes to a closed log are refused."""
+        # Arrange
+        self.log.close()
+
+        # Act / Assert
+        with pytest.raises(RuntimeError):
+            self.log.append(self.log.record("a", 1))